@@ -2,6 +2,7 @@ from fastapi import APIRouter, Query, Request
 from fastapi.responses import HTMLResponse, RedirectResponse
 
 from app.backend.core.config import config
+from app.backend.core.executor import run_db, run_file
 from app.backend.core.logger import get_logger
 from app.backend.core.template_engine import render_template
 from app.backend.page_contexts.context_registry import PAGE_CONTEXT_PROVIDERS
@@ -26,8 +27,9 @@ async def display_dashboard(request: Request):
         "page_path": "dashboard",
         "data": {
             "title": "법규관련 데이터수집 현황",
-            "contact_unread_count": get_contact_unread_count(
-                config.UI_BASE_DIR + "/homepage-contact-unread.json"
+            "contact_unread_count": await run_file(
+                get_contact_unread_count,
+                config.UI_BASE_DIR + "/homepage-contact-unread.json",
             ),
         },
     }
@@ -43,8 +45,9 @@ async def display_search(request: Request):
         "page_path": "search",
         "data": {
             "title": "데이터 조회",
-            "contact_unread_count": get_contact_unread_count(
-                config.UI_BASE_DIR + "/homepage-contact-unread.json"
+            "contact_unread_count": await run_file(
+                get_contact_unread_count,
+                config.UI_BASE_DIR + "/homepage-contact-unread.json",
             ),
         },
     }
@@ -60,8 +63,9 @@ async def display_statistics(request: Request):
         "page_path": "statistics",
         "data": {
             "title": "통계 분석",
-            "contact_unread_count": get_contact_unread_count(
-                config.UI_BASE_DIR + "/homepage-contact-unread.json"
+            "contact_unread_count": await run_file(
+                get_contact_unread_count,
+                config.UI_BASE_DIR + "/homepage-contact-unread.json",
             ),
         },
     }
@@ -77,8 +81,9 @@ async def display_logs(request: Request):
         "page_path": "logs",
         "data": {
             "title": "로그 관리",
-            "contact_unread_count": get_contact_unread_count(
-                config.UI_BASE_DIR + "/homepage-contact-unread.json"
+            "contact_unread_count": await run_file(
+                get_contact_unread_count,
+                config.UI_BASE_DIR + "/homepage-contact-unread.json",
             ),
         },
     }
@@ -94,8 +99,9 @@ async def display_settings(request: Request):
         "page_path": "settings",
         "data": {
             "title": "시스템 설정",
-            "contact_unread_count": get_contact_unread_count(
-                config.UI_BASE_DIR + "/homepage-contact-unread.json"
+            "contact_unread_count": await run_file(
+                get_contact_unread_count,
+                config.UI_BASE_DIR + "/homepage-contact-unread.json",
             ),
         },
     }
@@ -131,10 +137,10 @@ async def page(
 
             if func_params > 0:
                 # context를 매개변수로 전달
-                data = await func(context) if is_async else func(context)
+                data = await func(context) if is_async else await run_db(func, context)
             else:
                 # 매개변수가 없는 기존 함수 호환성 유지
-                data = await func() if is_async else func()
+                data = await func() if is_async else await run_db(func)
 
             context["data"] = data
         except Exception as e:
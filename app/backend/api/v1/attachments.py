@@ -1,19 +1,177 @@
 """
 첨부파일 다운로드 API 엔드포인트
+
+크롤러가 저장한 첨부파일은 다시 바뀌지 않으므로 강한 ETag(inode·크기·mtime)와
+immutable Cache-Control 을 붙이고, If-None-Match 가 맞으면 304 를 돌려준다.
+Range(여러 구간 포함)·If-Range 는 FileResponse 가 처리한다 (이어받기).
+
+/attachments/bundle/... 는 게시글·페이지·수집일 범위의 첨부파일을 ZIP 하나로
+스트리밍한다. 아래의 {save_folder:path}/{filename} 경로보다 먼저 등록해야 한다.
+
+/attachments/batch 는 여러 게시글의 첨부파일 목록을 쿼리 한 번으로 돌려준다.
 """
-from fastapi import APIRouter, HTTPException, Path
-from fastapi.responses import FileResponse
-from pathlib import Path as PathlibPath
-from app.backend.core.config import config
+from urllib.parse import quote
+
+from fastapi import APIRouter, HTTPException, Path, Query, Request
+from fastapi.responses import FileResponse, StreamingResponse
+from pydantic import BaseModel, Field
+from app.backend.core.conditional import FileETag, not_modified
 from app.backend.core.logger import get_logger
+from app.backend.core.executor import run_db, run_file
+from app.backend.data.attachment_bundle import bundle_entries, iter_zip_stream
+from app.backend.data.attachment_file import (
+    inspect_attachment,
+    is_inline_type,
+    resolve_attachment_path,
+)
+from app.backend.data.db_util import attach_list_batch, bundle_attach_rows
 
 logger = get_logger(__name__)
 
 router = APIRouter(prefix="/attachments", tags=["attachments"])
 
 
-@router.get("/{save_folder:path}/{filename}")
-async def download_attachment(save_folder: str = Path(...), filename: str = Path(...)):
+DATE_PATTERN = r"^\d{4}-\d{2}-\d{2}$"
+
+# 배치 조회 한 번에 받을 최대 게시글 수
+MAX_BATCH_ITEMS = 1000
+
+
+class AttachmentKey(BaseModel):
+    """목록 행의 게시글 키 (site_code, page_code, real_seq)"""
+
+    site_code: str
+    page_code: str
+    real_seq: str
+
+
+class AttachmentBatchRequest(BaseModel):
+    items: list[AttachmentKey] = Field(..., max_length=MAX_BATCH_ITEMS)
+
+
+def attachment_item(row: dict) -> dict:
+    """첨부파일 행 → {"name", "url"}"""
+    save_file_name = row.get("save_file_name", "")
+    save_folder = row.get("save_folder", "")
+    return {
+        "name": save_file_name,
+        "url": f"/api/v1/attachments/{save_folder}/{save_file_name}",
+    }
+
+
+@router.post("/batch")
+async def get_attachments_batch(request: AttachmentBatchRequest):
+    """
+    여러 게시글의 첨부파일 목록 (행마다 /attachments/{site}/{page}/{seq} 를 부르지 않도록)
+
+    Returns:
+        {"count": 전체 첨부파일 수,
+         "items": {"site_code/page_code/real_seq": {"count", "items": [{"name", "url"}]}}}
+        첨부파일이 없는 게시글도 count 0 으로 포함
+    """
+    keys = [(item.site_code, item.page_code, item.real_seq) for item in request.items]
+    try:
+        rows = await run_db(attach_list_batch, keys)
+    except Exception as e:
+        logger.error(f"❌ 첨부파일 배치 조회 실패 ({len(keys)}건): {e}")
+        raise HTTPException(status_code=500, detail="첨부파일 목록 조회 중 오류가 발생했습니다")
+
+    result = {"/".join(key): {"count": 0, "items": []} for key in keys}
+    for row in rows:
+        entry = result["/".join((row["site_name"], row["page_id"], row["real_seq"]))]
+        entry["items"].append(attachment_item(row))
+        entry["count"] += 1
+    return {"count": len(rows), "items": result}
+
+
+async def _iter_in_file_pool(chunks):
+    """
+    동기 제너레이터를 file 스레드 풀에서 한 청크씩 꺼내는 async 제너레이터
+
+    StreamingResponse 에 동기 제너레이터를 그대로 넘기면 Starlette 의 기본
+    스레드 풀에서 돌아 FILE_EXECUTOR_WORKERS 제한을 벗어난다.
+    """
+    try:
+        while True:
+            chunk = await run_file(next, chunks, None)
+            if chunk is None:
+                break
+            yield chunk
+    finally:
+        # 클라이언트가 끊겨도 열린 첨부파일을 닫음
+        await run_file(chunks.close)
+
+
+async def _bundle_response(archive_name: str, **conditions) -> StreamingResponse:
+    """조건에 맞는 첨부파일을 ZIP 으로 스트리밍 (없으면 404)"""
+    try:
+        rows = await run_db(bundle_attach_rows, **conditions)
+    except Exception as e:
+        logger.error(f"❌ 첨부파일 묶음 조회 실패: {e}")
+        raise HTTPException(status_code=500, detail="첨부파일 목록 조회 중 오류가 발생했습니다")
+    if not rows:
+        raise HTTPException(status_code=404, detail="첨부파일이 없습니다")
+
+    entries = bundle_entries(rows)
+    logger.info(f"📦 첨부파일 묶음 다운로드: {archive_name} ({len(entries)}개)")
+    return StreamingResponse(
+        _iter_in_file_pool(iter_zip_stream(entries)),
+        media_type="application/zip",
+        headers={"Content-Disposition": f"attachment; filename*=UTF-8''{quote(archive_name)}"},
+    )
+
+
+@router.get("/bundle")
+async def download_bundle_by_date(
+    date_from: str = Query(..., pattern=DATE_PATTERN, description="수집 시작일 (YYYY-MM-DD)"),
+    date_to: str | None = Query(None, pattern=DATE_PATTERN, description="수집 종료일 (YYYY-MM-DD, 포함, 기본: 시작일)"),
+    sites: str = Query("", description="쉼표로 구분된 사이트 코드 목록 (기본: 전체)"),
+):
+    """
+    수집일 범위의 첨부파일 ZIP 묶음 (예: 이번 주 fss 전체)
+
+    Returns:
+        StreamingResponse: application/zip
+    """
+    site_names = [site.strip() for site in sites.split(",") if site.strip()]
+    date_to = date_to or date_from
+    name = "_".join(["attachments", *site_names, date_from, date_to]) + ".zip"
+    return await _bundle_response(name, date_from=date_from, date_to=date_to, site_names=site_names)
+
+
+@router.get("/bundle/{site_name}/{page_id}")
+async def download_bundle_by_page(
+    site_name: str,
+    page_id: str,
+    date_from: str | None = Query(None, pattern=DATE_PATTERN, description="수집 시작일 (YYYY-MM-DD)"),
+    date_to: str | None = Query(None, pattern=DATE_PATTERN, description="수집 종료일 (YYYY-MM-DD, 포함)"),
+):
+    """
+    페이지 하나의 첨부파일 ZIP 묶음 (date_from 을 주면 수집일 범위로 제한)
+
+    Returns:
+        StreamingResponse: application/zip
+    """
+    name = f"attachments_{site_name}_{page_id}.zip"
+    return await _bundle_response(
+        name, site_name=site_name, page_id=page_id, date_from=date_from, date_to=date_to
+    )
+
+
+@router.get("/bundle/{site_name}/{page_id}/{real_seq}")
+async def download_bundle_by_post(site_name: str, page_id: str, real_seq: str):
+    """
+    게시글 하나의 첨부파일 ZIP 묶음
+
+    Returns:
+        StreamingResponse: application/zip
+    """
+    name = f"attachments_{site_name}_{page_id}_{real_seq}.zip"
+    return await _bundle_response(name, site_name=site_name, page_id=page_id, real_seq=real_seq)
+
+
+@router.api_route("/{save_folder:path}/{filename}", methods=["GET", "HEAD"])
+async def download_attachment(request: Request, save_folder: str = Path(...), filename: str = Path(...)):
     """
     첨부파일 다운로드
 
@@ -22,24 +180,36 @@ async def download_attachment(save_folder: str = Path(...), filename: str = Path
         filename: 파일명
 
     Returns:
-        FileResponse: 첨부파일
+        FileResponse: 첨부파일 (PDF·이미지는 inline, 그 외는 attachment)
     """
     try:
         # 첨부파일 경로 구성
         # LAW_CRAWLER_DIR/Attaches/{save_folder}/{filename}
-        attach_base = PathlibPath(config.ATTACHS_DIR)
-        file_path = attach_base / save_folder / filename
+        file_path = resolve_attachment_path(save_folder, filename)
+        if file_path is None:
+            logger.error(f"❌ 첨부파일 디렉토리 밖의 경로 요청: {save_folder}/{filename}")
+            raise HTTPException(status_code=404, detail="첨부파일을 찾을 수 없습니다")
 
         logger.info(f"첨부파일 다운로드 요청: {file_path}")
 
-        if not file_path.exists():
+        info = await run_file(inspect_attachment, file_path)
+        if info is None:
             logger.error(f"❌ 첨부파일을 찾을 수 없습니다: {file_path}")
             raise HTTPException(status_code=404, detail="첨부파일을 찾을 수 없습니다")
+        stat_result, media_type = info
+
+        etag = FileETag(stat_result)
+        cached = not_modified(request, etag)
+        if cached is not None:
+            return cached
 
         return FileResponse(
             path=str(file_path),
             filename=filename,
-            media_type="application/octet-stream"
+            media_type=media_type,
+            headers=etag.headers(),
+            stat_result=stat_result,
+            content_disposition_type="inline" if is_inline_type(media_type) else "attachment",
         )
     except HTTPException:
         raise
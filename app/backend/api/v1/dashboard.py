@@ -2,15 +2,16 @@
 대시보드 API 엔드포인트
 """
 
-import os
-import re
 from pathlib import Path
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, Query, Request
 from app.backend.page_contexts.dashboard_context import (
     get_dashboard_metrics,
     get_dashboard_data,
 )
 from app.backend.data.db_util import attach_list
+from app.backend.data.crawler_health import get_crawler_health_checker
+from app.backend.core.executor import run_db, run_file
+from app.backend.core.conditional import db_etag, not_modified, etag_json
 from app.backend.core.logger import get_logger
 from app.backend.core.config import config
 
@@ -33,7 +34,7 @@ async def get_metrics():
         - error_count: 오류 발생 건수
     """
     try:
-        metrics = get_dashboard_metrics()
+        metrics = await run_db(get_dashboard_metrics)
         return metrics
     except Exception as e:
         logger.error(f"❌ 대시보드 메트릭 조회 실패: {e}")
@@ -49,6 +50,7 @@ async def get_metrics():
 
 @router.get("/data", response_model=list)
 async def get_data(
+    request: Request,
     period: str = Query("today", description="기간: today, 3days, 7days"),
 ):
     """
@@ -60,9 +62,14 @@ async def get_data(
     Returns:
         테이블 행 리스트
     """
+    etag = await run_db(db_etag, request)
+    cached = not_modified(request, etag)
+    if cached is not None:
+        return cached
+
     try:
-        data = get_dashboard_data(period)
-        return data
+        data = await run_db(get_dashboard_data, period)
+        return etag_json(data, etag)
     except Exception as e:
         logger.error(f"❌ 대시보드 데이터 조회 실패: {e}")
         return []
@@ -79,82 +86,41 @@ async def get_crawler_health():
         - error_message: 오류 메시지 (있는 경우만)
     """
     try:
-        if not config.CRAWLER_LOG_DIR:
-            return {
-                "healthy": "check",
-                "last_crawling_time": None,
-                "error_message": "로그 디렉토리가 설정되지 않았습니다."
-            }
-
-        log_dir = Path(config.CRAWLER_LOG_DIR)
-        if not log_dir.exists():
-            return {
-                "healthy": "check",
-                "last_crawling_time": None,
-                "error_message": "로그 디렉토리를 찾을 수 없습니다."
-            }
-
-        # 가장 최근 로그 파일 찾기 (law_crawler_*.log 패턴)
-        log_files = sorted(
-            log_dir.glob("law_crawler_*.log"),
-            key=lambda x: x.stat().st_mtime,
-            reverse=True
-        )
-
-        if not log_files:
-            return {
-                "healthy": "check",
-                "last_crawling_time": None,
-                "error_message": "로그 파일을 찾을 수 없습니다."
-            }
-
-        latest_log = log_files[0]
-        logger.info(f"최근 로그 파일: {latest_log}")
-
-        # 로그 파일 읽기
-        has_error = False
-        last_timestamp = None
-
-        try:
-            with open(latest_log, 'r', encoding='utf-8', errors='ignore') as f:
-                lines = f.readlines()
-
-                # 마지막 라인의 시각 추출
-                for line in reversed(lines):
-                    if line.strip():
-                        # 로그 형식: [시간] [로그레벨] 메시지
-                        # 예: 2025-01-30 10:30:45,123 - INFO - message
-                        match = re.match(r'(\d{4}-\d{2}-\d{2}\s\d{2}:\d{2}:\d{2})', line)
-                        if match:
-                            last_timestamp = match.group(1)
-                            break
-
-                # ERROR 검색
-                for line in lines:
-                    if 'ERROR' in line or 'Exception' in line:
-                        has_error = True
-                        break
-
-        except Exception as e:
-            logger.error(f"로그 파일 읽기 실패: {e}")
-            return {
-                "healthy": "check",
-                "last_crawling_time": None,
-                "error_message": f"로그 파일 읽기 실패: {str(e)}"
-            }
+        return await run_file(_check_crawler_health)
+    except Exception as e:
+        logger.error(f"크롤러 헬스 체크 실패: {e}")
+        return {
+            "healthy": "check",
+            "last_crawling_time": None,
+            "error_message": f"헬스 체크 실패: {str(e)}"
+        }
 
+
+def _check_crawler_health() -> dict:
+    """최근 크롤러 로그 파일의 새로 추가된 부분만 스캔해 헬스 상태 판단 (블로킹 파일 I/O)"""
+    if not config.CRAWLER_LOG_DIR:
         return {
-            "healthy": "check" if has_error else "ok",
-            "last_crawling_time": last_timestamp,
-            "error_detected": has_error
+            "healthy": "check",
+            "last_crawling_time": None,
+            "error_message": "로그 디렉토리가 설정되지 않았습니다."
         }
 
+    log_dir = Path(config.CRAWLER_LOG_DIR)
+    if not log_dir.exists():
+        return {
+            "healthy": "check",
+            "last_crawling_time": None,
+            "error_message": "로그 디렉토리를 찾을 수 없습니다."
+        }
+
+    try:
+        return get_crawler_health_checker().check(str(log_dir))
     except Exception as e:
-        logger.error(f"크롤러 헬스 체크 실패: {e}")
+        logger.error(f"로그 파일 읽기 실패: {e}")
         return {
             "healthy": "check",
             "last_crawling_time": None,
-            "error_message": f"헬스 체크 실패: {str(e)}"
+            "error_message": f"로그 파일 읽기 실패: {str(e)}"
         }
 
 
@@ -172,10 +138,10 @@ async def get_attachments(site_code: str, page_code: str, real_seq: str):
         첨부파일 목록
     """
     try:
-        attach_df = attach_list(site_code, page_code, real_seq)
+        attach_rows = await run_db(attach_list, site_code, page_code, real_seq)
         attachments_data = []
 
-        for _, attach_row in attach_df.iterrows():
+        for attach_row in attach_rows:
             save_file_name = attach_row.get("save_file_name", "")
             save_folder = attach_row.get("save_folder", "")
             attach_url = f"/api/v1/attachments/{save_folder}/{save_file_name}"
@@ -0,0 +1,186 @@
+"""
+진단(런타임 상태) API 엔드포인트
+"""
+from fastapi import APIRouter, Query
+from fastapi.responses import PlainTextResponse
+from app.backend.core.executor import executor_stats, run_db
+from app.backend.core.loop_monitor import get_loop_monitor
+from app.backend.core.metrics import get_metrics
+from app.backend.data.db_pool import get_pool
+from app.backend.data.result_cache import get_result_cache
+from app.backend.data.slow_query_log import get_slow_query_log
+from app.backend.core.logger import get_logger, logging_stats
+
+logger = get_logger(__name__)
+
+router = APIRouter(prefix="/diagnostics", tags=["diagnostics"])
+
+# Prometheus scrape 용 (/api/v1 접두사 없이 /metrics 로 등록)
+metrics_router = APIRouter(tags=["diagnostics"])
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+@router.get("/loop-lag", response_model=dict)
+async def get_loop_lag():
+    """
+    이벤트 루프 지연 및 블로킹 I/O 스레드 풀 상태 조회
+
+    Returns:
+        {
+            "loop_lag": {"samples", "last_ms", "avg_ms", "max_ms", "over_warn", ...},
+            "executors": {"db": {"max_workers", "threads", "queued"}, "file": {...}},
+            "db_pool": {"max_size", "open", "idle", "in_use", "created"}
+        }
+    """
+    return {
+        "loop_lag": get_loop_monitor().stats(),
+        "executors": executor_stats(),
+        "db_pool": get_pool().stats(),
+    }
+
+
+@router.post("/loop-lag/reset", response_model=dict)
+async def reset_loop_lag():
+    """이벤트 루프 지연 측정값 초기화 (부하 테스트 구간 측정용)"""
+    monitor = get_loop_monitor()
+    monitor.reset()
+    return monitor.stats()
+
+
+def _cache_stats() -> dict:
+    """결과 캐시 상태 (공유 캐시는 잠금과 SQLite 조회가 있어 run_db 로 호출)"""
+    return get_result_cache().stats()
+
+
+def _clear_cache() -> dict:
+    cache = get_result_cache()
+    cache.clear()
+    return cache.stats()
+
+
+@router.get("/cache", response_model=dict)
+async def get_cache_stats():
+    """
+    조회 결과 캐시 상태 조회
+
+    Returns:
+        {"size", "maxsize", "ttl", "hits", "misses", "hit_ratio", "evictions", "invalidations"}
+    """
+    return await run_db(_cache_stats)
+
+
+@router.post("/cache/clear", response_model=dict)
+async def clear_cache():
+    """조회 결과 캐시 비우기"""
+    return await run_db(_clear_cache)
+
+
+@router.get("/logging", response_model=dict)
+async def get_logging_stats():
+    """
+    로그 큐 상태 조회
+
+    Returns:
+        {"queued", "maxsize", "policy", "dropped", "sql_suppressed", "writer_running"}
+    """
+    return logging_stats()
+
+
+@router.get("/slow-queries", response_model=dict)
+async def get_slow_queries(
+    limit: int = Query(50, ge=1, le=1000, description="최대 건수 (최근 순)"),
+    query: str = Query(None, description="쿼리 이름 필터 (예: get_summary_list)"),
+):
+    """
+    느린 쿼리 기록 조회
+
+    Returns:
+        {"stats": {"threshold_ms", "maxlen", "size", "recorded"},
+         "entries": [{"time", "query", "sql", "params", "duration_ms", "rows",
+                      "plan", "full_scans", "request_id"}, ...]}
+    """
+    slow_log = get_slow_query_log()
+    return {"stats": slow_log.stats(), "entries": slow_log.entries(limit, query)}
+
+
+@router.post("/slow-queries/clear", response_model=dict)
+async def clear_slow_queries():
+    """느린 쿼리 기록 비우기"""
+    slow_log = get_slow_query_log()
+    slow_log.clear()
+    return slow_log.stats()
+
+
+@router.get("/timings", response_model=dict)
+async def get_timings():
+    """
+    라우트·쿼리·템플릿별 소요 시간 요약
+
+    Returns:
+        {"http_request_duration_seconds": [{"labels", "count", "sum", "avg"}, ...], ...}
+    """
+    return get_metrics().snapshot()
+
+
+@router.post("/timings/reset", response_model=dict)
+async def reset_timings():
+    """소요 시간 측정값 초기화 (부하 테스트 구간 측정용)"""
+    metrics = get_metrics()
+    metrics.reset()
+    return metrics.snapshot()
+
+
+def _runtime_samples(cache: dict):
+    """
+    조회 시점의 캐시(_cache_stats 결과)·커넥션 풀·이벤트 루프·스레드 풀·로그 큐 상태
+
+    Returns:
+        (게이지, 카운터) — 적중·미스·버린 레코드처럼 누적되는 값은 카운터
+    """
+    pool = get_pool().stats()
+    lag = get_loop_monitor().stats()
+    executors = executor_stats()
+    log_queue = logging_stats()
+    gauges = {
+        "result_cache_hit_ratio": ("조회 결과 캐시 적중률", cache["hit_ratio"]),
+        "result_cache_entries": ("조회 결과 캐시 항목 수", cache["size"]),
+        "db_pool_connections": (
+            "DB 커넥션 풀 상태별 커넥션 수",
+            [({"state": state}, pool[state]) for state in ("open", "idle", "in_use")],
+        ),
+        "db_pool_max_size": ("DB 커넥션 풀 최대 크기", pool["max_size"]),
+        "event_loop_lag_seconds": (
+            "이벤트 루프 지연(초)",
+            [({"stat": stat}, lag[f"{stat}_ms"] / 1000) for stat in ("last", "avg", "max")],
+        ),
+        "executor_queued_tasks": (
+            "스레드 풀 대기 작업 수",
+            [({"pool": kind}, stat["queued"]) for kind, stat in executors.items()],
+        ),
+    }
+    counters = {
+        "result_cache_hits_total": ("조회 결과 캐시 적중 수", cache["hits"]),
+        "result_cache_misses_total": ("조회 결과 캐시 미스 수", cache["misses"]),
+    }
+    if cache["shared"]:
+        counters["shared_cache_hits_total"] = ("워커 간 공유 캐시 적중 수", cache["shared"]["hits"])
+        counters["shared_cache_misses_total"] = ("워커 간 공유 캐시 미스 수", cache["shared"]["misses"])
+    if log_queue:
+        gauges["log_queue_records"] = ("로그 큐 대기 레코드 수", log_queue["queued"])
+        counters["log_dropped_records_total"] = ("큐가 가득 차 버린 로그 레코드 수", log_queue["dropped"])
+    return gauges, counters
+
+
+@metrics_router.get("/metrics", response_class=PlainTextResponse)
+async def get_prometheus_metrics():
+    """
+    Prometheus exposition 형식 측정값
+
+    라우트별 요청 시간, 쿼리별 조회 시간·행 수, 템플릿 렌더링 시간,
+    스레드 풀 작업 시간 히스토그램, 캐시·풀·루프 지연 게이지와 캐시 적중 카운터.
+    """
+    gauges, counters = _runtime_samples(await run_db(_cache_stats))
+    return PlainTextResponse(
+        get_metrics().render(gauges, counters), media_type=PROMETHEUS_CONTENT_TYPE
+    )
@@ -0,0 +1,44 @@
+"""
+게시글 상세 API 엔드포인트
+
+대시보드·검색 목록은 제목 등 헤드라인 필드와 평문 발췌문만 내려주고,
+summary HTML 은 행을 펼칠 때 /items/{id} 로 조회한다. 크롤러가 저장한
+게시글은 바뀌지 않으므로 id 별 응답은 immutable 로 캐시한다.
+"""
+
+from fastapi import APIRouter, HTTPException, Request
+from app.backend.core.conditional import ContentETag, etag_json, not_modified
+from app.backend.core.executor import run_db
+from app.backend.core.logger import get_logger
+from app.backend.data.db_util import get_summary_item
+
+logger = get_logger(__name__)
+
+router = APIRouter(prefix="/items", tags=["items"])
+
+
+@router.get("/{item_id}")
+async def get_item(request: Request, item_id: int):
+    """
+    게시글 summary HTML 조회
+
+    Args:
+        item_id: law_summary.id (목록 행의 "id")
+
+    Returns:
+        {"id": id, "summary": summary HTML}
+    """
+    try:
+        row = await run_db(get_summary_item, item_id)
+    except Exception as e:
+        logger.error(f"❌ 게시글 조회 실패 (id={item_id}): {e}")
+        raise HTTPException(status_code=500, detail="게시글 조회 중 오류가 발생했습니다")
+    if row is None:
+        raise HTTPException(status_code=404, detail="게시글을 찾을 수 없습니다")
+
+    summary = row["summary"] or ""
+    etag = ContentETag(summary)
+    cached = not_modified(request, etag)
+    if cached is not None:
+        return cached
+    return etag_json({"id": row["id"], "summary": summary}, etag)
@@ -1,15 +1,28 @@
 """
 로그 관리 API 엔드포인트
 """
-from fastapi import APIRouter, Query
+import asyncio
+import json
+import os
+import time
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
+from urllib.parse import quote
 from app.backend.page_contexts.logs_context import (
     get_available_dates,
     get_crawler_log,
     get_ui_log,
+    get_ui_log_path,
     get_crawler_log_files,
-    get_crawler_log_by_filename
+    get_crawler_log_by_filename,
+    resolve_crawler_log_file,
 )
+from app.backend.data.log_reader import iter_file_chunks
+from app.backend.data.log_follower import LogFollower
+from app.backend.data.log_index import LEVEL_ALIASES, query_log_index
+from app.backend.core.config import config
 from app.backend.core.logger import get_logger
+from app.backend.core.executor import run_file
 
 logger = get_logger(__name__)
 
@@ -28,26 +41,86 @@ async def get_dates(days: int = Query(7, description="과거 며칠의 날짜를
         [{"date": "2025-01-01", "label": "2025-01-01"}, ...]
     """
     try:
-        dates = get_available_dates(days)
+        dates = await run_file(get_available_dates, days)
         return dates
     except Exception as e:
         logger.error(f"❌ 로그 날짜 조회 실패: {e}")
         return []
 
 
+@router.get("/query", response_model=dict)
+async def query_crawler_logs(
+    level: str | None = Query(None, description="로그 레벨 (쉼표로 여러 개, 예: ERROR,CRITICAL)"),
+    site: str | None = Query(None, description="사이트 코드"),
+    date_from: str | None = Query(None, pattern=r"^\d{4}-\d{2}-\d{2}$", description="시작일 (YYYY-MM-DD)"),
+    date_to: str | None = Query(None, pattern=r"^\d{4}-\d{2}-\d{2}$", description="종료일 (YYYY-MM-DD, 포함)"),
+    q: str | None = Query(None, description="본문 부분 문자열"),
+    limit: int = Query(100, ge=1, le=500, description="최대 행 수"),
+    cursor: str | None = Query(None, description="이전 응답의 next_cursor"),
+):
+    """
+    색인된 크롤러 로그 조회 (최신순)
+
+    Args:
+        level: 로그 레벨
+        site: 사이트 코드
+        date_from / date_to: 기간
+        q: 본문 부분 문자열
+        limit: 최대 행 수
+        cursor: 다음 페이지 커서
+
+    Returns:
+        {"rows": [{"ts", "level", "site", "page", "filename", "offset", "message"}, ...],
+         "next_cursor": "..." | null}
+    """
+    levels = None
+    if level:
+        # 색인과 같이 WARN → WARNING, FATAL → CRITICAL 로 맞춤
+        levels = [v.strip().upper() for v in level.split(",") if v.strip()]
+        levels = [LEVEL_ALIASES.get(v, v) for v in levels]
+    try:
+        return await run_file(
+            query_log_index,
+            config.LOG_INDEX_DB_PATH,
+            config.CRAWLER_LOG_DIR,
+            levels=levels,
+            site=site,
+            date_from=date_from,
+            date_to=date_to,
+            keyword=q,
+            limit=limit,
+            cursor=cursor,
+        )
+    except Exception as e:
+        logger.error(f"❌ 크롤러 로그 조회 실패: {e}")
+        return {"rows": [], "next_cursor": None}
+
+
 @router.get("/crawler", response_model=dict)
-async def get_crawler(date: str = Query(..., description="로그 날짜 (YYYY-MM-DD)")):
+async def get_crawler(
+    date: str = Query(..., description="로그 날짜 (YYYY-MM-DD)"),
+    offset: int | None = Query(None, ge=0, description="이 바이트 오프셋부터 앞으로 읽기"),
+    limit: int | None = Query(None, ge=1, le=10000, description="최대 줄 수 (기본: LOG_PAGE_LINES)"),
+    before: int | None = Query(None, ge=0, description="이 바이트 오프셋 직전까지 읽기 (offset 이 없을 때)"),
+):
     """
     크롤러 로그 조회
 
     Args:
         date: 로그 날짜 (예: 2025-01-01)
+        offset: 바이트 오프셋 (응답의 end 를 넘기면 다음 페이지)
+        limit: 최대 줄 수
+        before: 바이트 오프셋 (응답의 start 를 넘기면 이전 페이지)
+
+        offset/before 가 모두 없으면 마지막 limit 줄 (tail)
 
     Returns:
-        {"content": "로그 내용", "path": "파일경로", "filename": "파일명"}
+        {"content": "로그 내용", "path": "파일경로", "filename": "파일명",
+         "start": 첫 줄 오프셋, "end": 마지막 줄 다음 오프셋, "size": 파일 크기,
+         "has_before": bool, "has_after": bool}
     """
     try:
-        log_data = get_crawler_log(date)
+        log_data = await run_file(get_crawler_log, date, offset, limit, before)
         return log_data
     except Exception as e:
         logger.error(f"❌ 크롤러 로그 조회 실패: {e}")
@@ -59,15 +132,28 @@ async def get_crawler(date: str = Query(..., description="로그 날짜 (YYYY-MM
 
 
 @router.get("/ui", response_model=dict)
-async def get_ui():
+async def get_ui(
+    offset: int | None = Query(None, ge=0, description="이 바이트 오프셋부터 앞으로 읽기"),
+    limit: int | None = Query(None, ge=1, le=10000, description="최대 줄 수 (기본: LOG_PAGE_LINES)"),
+    before: int | None = Query(None, ge=0, description="이 바이트 오프셋 직전까지 읽기 (offset 이 없을 때)"),
+):
     """
     UI 로그 조회
 
+    Args:
+        offset: 바이트 오프셋 (응답의 end 를 넘기면 다음 페이지)
+        limit: 최대 줄 수
+        before: 바이트 오프셋 (응답의 start 를 넘기면 이전 페이지)
+
+        offset/before 가 모두 없으면 마지막 limit 줄 (tail)
+
     Returns:
-        {"content": "로그 내용", "path": "파일경로", "filename": "파일명"}
+        {"content": "로그 내용", "path": "파일경로", "filename": "파일명",
+         "start": 첫 줄 오프셋, "end": 마지막 줄 다음 오프셋, "size": 파일 크기,
+         "has_before": bool, "has_after": bool}
     """
     try:
-        log_data = get_ui_log()
+        log_data = await run_file(get_ui_log, offset, limit, before)
         return log_data
     except Exception as e:
         logger.error(f"❌ UI 로그 조회 실패: {e}")
@@ -87,7 +173,7 @@ async def get_crawler_files():
         [{"filename": "law_crawler_2025-10-23.log", "path": "전체경로", "modified_time": "2025-10-23 10:00:00"}, ...]
     """
     try:
-        files = get_crawler_log_files()
+        files = await run_file(get_crawler_log_files)
         return files
     except Exception as e:
         logger.error(f"❌ 크롤러 로그 파일 목록 조회 실패: {e}")
@@ -95,18 +181,30 @@ async def get_crawler_files():
 
 
 @router.get("/crawler/file", response_model=dict)
-async def get_crawler_file(filename: str = Query(..., description="로그 파일명")):
+async def get_crawler_file(
+    filename: str = Query(..., description="로그 파일명"),
+    offset: int | None = Query(None, ge=0, description="이 바이트 오프셋부터 앞으로 읽기"),
+    limit: int | None = Query(None, ge=1, le=10000, description="최대 줄 수 (기본: LOG_PAGE_LINES)"),
+    before: int | None = Query(None, ge=0, description="이 바이트 오프셋 직전까지 읽기 (offset 이 없을 때)"),
+):
     """
     크롤러 로그 파일 내용 조회
 
     Args:
         filename: 로그 파일명
+        offset: 바이트 오프셋 (응답의 end 를 넘기면 다음 페이지)
+        limit: 최대 줄 수
+        before: 바이트 오프셋 (응답의 start 를 넘기면 이전 페이지)
+
+        offset/before 가 모두 없으면 마지막 limit 줄 (tail)
 
     Returns:
-        {"content": "로그 내용", "path": "파일경로", "filename": "파일명"}
+        {"content": "로그 내용", "path": "파일경로", "filename": "파일명",
+         "start": 첫 줄 오프셋, "end": 마지막 줄 다음 오프셋, "size": 파일 크기,
+         "has_before": bool, "has_after": bool}
     """
     try:
-        log_data = get_crawler_log_by_filename(filename)
+        log_data = await run_file(get_crawler_log_by_filename, filename, offset, limit, before)
         return log_data
     except Exception as e:
         logger.error(f"❌ 크롤러 로그 파일 조회 실패: {e}")
@@ -115,3 +213,145 @@ async def get_crawler_file(filename: str = Query(..., description="로그 파일
             "path": "",
             "filename": ""
         }
+
+
+def _stream_log_file(log_file: str, filename: str) -> StreamingResponse:
+    """로그 파일 전체를 청크 단위 text/plain 다운로드로 응답"""
+    return StreamingResponse(
+        iter_file_chunks(log_file),
+        media_type="text/plain; charset=utf-8",
+        headers={"Content-Disposition": f"attachment; filename*=UTF-8''{quote(filename)}"},
+    )
+
+
+@router.get("/crawler/file/download")
+async def download_crawler_file(filename: str = Query(..., description="로그 파일명")):
+    """
+    크롤러 로그 파일 다운로드 (메모리에 올리지 않고 스트리밍)
+
+    Args:
+        filename: 로그 파일명
+
+    Returns:
+        StreamingResponse: text/plain 로그 파일
+    """
+    log_file = await run_file(resolve_crawler_log_file, filename)
+    if log_file is None:
+        raise HTTPException(status_code=404, detail="해당 로그 파일이 없습니다")
+    return _stream_log_file(log_file, filename)
+
+
+@router.get("/ui/download")
+async def download_ui_log():
+    """
+    UI 로그 파일 다운로드 (메모리에 올리지 않고 스트리밍)
+
+    Returns:
+        StreamingResponse: text/plain 로그 파일
+    """
+    log_file = get_ui_log_path()
+    if not await run_file(os.path.isfile, log_file):
+        raise HTTPException(status_code=404, detail="UI 로그가 없습니다")
+    return _stream_log_file(log_file, os.path.basename(log_file))
+
+
+def _sse_event(event: str, data: dict, event_id=None) -> str:
+    """Server-Sent Events 프레임 하나"""
+    frame = f"event: {event}\n"
+    if event_id is not None:
+        frame += f"id: {event_id}\n"
+    return frame + f"data: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+def _stream_offset(request: Request, offset):
+    """시작 오프셋 (없으면 EventSource 재연결 시 보내는 Last-Event-ID)"""
+    if offset is not None:
+        return offset
+    last_event_id = request.headers.get("last-event-id")
+    if last_event_id and last_event_id.isdigit():
+        return int(last_event_id)
+    return None
+
+
+async def _follow_log(request: Request, follower: LogFollower):
+    """
+    LOG_STREAM_INTERVAL 마다 새 줄을 모아 한 이벤트로 보내는 SSE 제너레이터
+
+    이벤트 id 는 다음 읽을 바이트 오프셋이라 재연결하면 그 위치부터 이어진다.
+    """
+    yield _sse_event("ready", {"offset": follower.offset}, follower.offset)
+    last_sent = time.monotonic()
+    while not await request.is_disconnected():
+        await asyncio.sleep(config.LOG_STREAM_INTERVAL)
+        try:
+            batch = await run_file(follower.poll)
+        except Exception as e:
+            logger.error(f"❌ 로그 추적 실패 ({follower.path}): {e}")
+            yield _sse_event("error", {"message": str(e)})
+            break
+
+        if batch["lines"] or batch["rotated"]:
+            yield _sse_event("lines", batch, batch["offset"])
+            last_sent = time.monotonic()
+        elif time.monotonic() - last_sent >= config.LOG_STREAM_HEARTBEAT:
+            # 프록시가 유휴 연결을 끊지 않도록 주석 프레임
+            yield ": keep-alive\n\n"
+            last_sent = time.monotonic()
+
+
+def _event_stream(request: Request, follower: LogFollower) -> StreamingResponse:
+    return StreamingResponse(
+        _follow_log(request, follower),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.get("/crawler/stream")
+async def stream_crawler_log(
+    request: Request,
+    filename: str | None = Query(None, description="로그 파일명 (기본: 가장 최근 파일)"),
+    offset: int | None = Query(None, ge=0, description="시작 바이트 오프셋 (기본: 현재 파일 끝)"),
+):
+    """
+    크롤러 로그 실시간 추적 (Server-Sent Events, tail -f)
+
+    Args:
+        filename: 로그 파일명
+        offset: 시작 바이트 오프셋 (보통 /crawler/file 응답의 end)
+
+    Returns:
+        text/event-stream
+        - ready: {"offset"}
+        - lines: {"lines": [...], "offset": 다음 오프셋, "rotated": 회전 감지 여부}
+    """
+    if filename is None:
+        files = await run_file(get_crawler_log_files)
+        if not files:
+            raise HTTPException(status_code=404, detail="크롤러 로그 파일이 없습니다")
+        filename = files[0]["filename"]
+
+    log_file = await run_file(resolve_crawler_log_file, filename)
+    if log_file is None:
+        raise HTTPException(status_code=404, detail="해당 로그 파일이 없습니다")
+
+    follower = await run_file(LogFollower, log_file, _stream_offset(request, offset))
+    return _event_stream(request, follower)
+
+
+@router.get("/ui/stream")
+async def stream_ui_log(
+    request: Request,
+    offset: int | None = Query(None, ge=0, description="시작 바이트 오프셋 (기본: 현재 파일 끝)"),
+):
+    """
+    UI 로그 실시간 추적 (Server-Sent Events, tail -f)
+
+    Args:
+        offset: 시작 바이트 오프셋 (보통 /ui 응답의 end)
+
+    Returns:
+        text/event-stream (/crawler/stream 과 같은 이벤트)
+    """
+    follower = await run_file(LogFollower, get_ui_log_path(), _stream_offset(request, offset))
+    return _event_stream(request, follower)
@@ -1,10 +1,12 @@
 """
 데이터 조회 API 엔드포인트
 """
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, Query, Request
 from app.backend.page_contexts.search_context import get_sites_list, search_data
 from app.backend.data.db_util import attach_list
 from app.backend.core.logger import get_logger
+from app.backend.core.executor import run_db
+from app.backend.core.conditional import db_etag, not_modified, etag_json
 
 logger = get_logger(__name__)
 
@@ -12,16 +14,21 @@ router = APIRouter(prefix="/search", tags=["search"])
 
 
 @router.get("/sites", response_model=list)
-async def get_sites():
+async def get_sites(request: Request):
     """
     사이트 목록 조회
 
     Returns:
         [{"code": "code1", "name": "사이트명1"}, ...]
     """
+    etag = await run_db(db_etag, request)
+    cached = not_modified(request, etag)
+    if cached is not None:
+        return cached
+
     try:
-        sites = get_sites_list()
-        return sites
+        sites = await run_db(get_sites_list)
+        return etag_json(sites, etag)
     except Exception as e:
         logger.error(f"❌ 사이트 목록 조회 실패: {e}")
         return []
@@ -32,7 +39,8 @@ async def search_results(
     sites: str = Query("", description="쉼표로 구분된 사이트 코드 목록"),
     keyword: str = Query("", description="검색 키워드"),
     page: int = Query(1, description="페이지 번호 (1부터 시작)", ge=1),
-    pagesize: int = Query(10, description="페이지당 항목 수", ge=10, le=100)
+    pagesize: int = Query(10, description="페이지당 항목 수", ge=10, le=100),
+    cursor: str = Query(None, description="이전 응답의 next_cursor (다음 페이지 keyset 조회)")
 ):
     """
     키워드 기반 데이터 검색 (페이징 지원)
@@ -42,6 +50,7 @@ async def search_results(
         keyword: 검색 키워드 (선택사항)
         page: 페이지 번호 (기본값: 1)
         pagesize: 페이지당 항목 수 (기본값: 30, 범위: 10-100)
+        cursor: 다음 페이지 커서 (선택사항, page 와 함께 전달)
 
     Returns:
         {
@@ -49,12 +58,16 @@ async def search_results(
             "total": 전체 항목 수,
             "page": 현재 페이지,
             "pagesize": 페이지당 항목 수,
-            "total_pages": 전체 페이지 수
+            "total_pages": 전체 페이지 수,
+            "next_cursor": 다음 페이지 커서
         }
     """
     try:
         site_list = [s.strip() for s in sites.split(",") if s.strip()] if sites else []
-        results = search_data(site_names=site_list, keyword=keyword, page=page, pagesize=pagesize)
+        results = await run_db(
+            search_data,
+            site_names=site_list, keyword=keyword, page=page, pagesize=pagesize, cursor=cursor
+        )
         return results
     except Exception as e:
         logger.error(f"❌ 데이터 검색 실패: {e}")
@@ -63,7 +76,8 @@ async def search_results(
             "total": 0,
             "page": page,
             "pagesize": pagesize,
-            "total_pages": 0
+            "total_pages": 0,
+            "next_cursor": None
         }
 
 
@@ -81,10 +95,10 @@ async def get_attachments(site_code: str, page_code: str, real_seq: str):
         첨부파일 목록
     """
     try:
-        attach_df = attach_list(site_code, page_code, real_seq)
+        attach_rows = await run_db(attach_list, site_code, page_code, real_seq)
         attachments_data = []
 
-        for _, attach_row in attach_df.iterrows():
+        for attach_row in attach_rows:
             save_file_name = attach_row.get("save_file_name", "")
             attach_url = f"/api/v1/attachments/{site_code}/{page_code}/{real_seq}/{save_file_name}"
 
@@ -1,7 +1,7 @@
 """
 설정 API 엔드포인트
 """
-from fastapi import APIRouter
+from fastapi import APIRouter, Request
 from app.backend.page_contexts.settings_context import (
     get_system_info,
     get_info_content,
@@ -9,6 +9,8 @@ from app.backend.page_contexts.settings_context import (
     get_site_list_html
 )
 from app.backend.core.logger import get_logger
+from app.backend.core.executor import run_db, run_file
+from app.backend.core.conditional import db_etag, not_modified, etag_json
 
 logger = get_logger(__name__)
 
@@ -29,7 +31,7 @@ async def get_system_info_endpoint():
         }
     """
     try:
-        info = get_system_info()
+        info = await run_file(get_system_info)
         return info
     except Exception as e:
         logger.error(f"❌ 시스템 정보 조회 실패: {e}")
@@ -47,7 +49,7 @@ async def get_info():
         {"content": "마크다운 내용"}
     """
     try:
-        content = get_info_content()
+        content = await run_file(get_info_content)
         return {"content": content}
     except Exception as e:
         logger.error(f"❌ 시스템 소개 로드 실패: {e}")
@@ -63,7 +65,7 @@ async def get_history():
         {"items": [{"date": "2025-10-23", "version": "v1.0.0", "description": "..."}]}
     """
     try:
-        items = get_history_content()
+        items = await run_file(get_history_content)
         return {"items": items}
     except Exception as e:
         logger.error(f"❌ 시스템 히스토리 로드 실패: {e}")
@@ -71,16 +73,21 @@ async def get_history():
 
 
 @router.get("/sites", response_model=dict)
-async def get_sites():
+async def get_sites(request: Request):
     """
     대상 사이트 목록 조회
 
     Returns:
         {"html": "<table>...</table>"}
     """
+    etag = await run_db(db_etag, request)
+    cached = not_modified(request, etag)
+    if cached is not None:
+        return cached
+
     try:
-        html = get_site_list_html()
-        return {"html": html}
+        html = await run_db(get_site_list_html)
+        return etag_json({"html": html}, etag)
     except Exception as e:
         logger.error(f"❌ 사이트 목록 조회 실패: {e}")
         return {"html": f"로드 실패: {e}"}
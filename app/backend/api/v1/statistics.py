@@ -1,7 +1,7 @@
 """
 통계 분석 API 엔드포인트
 """
-from fastapi import APIRouter
+from fastapi import APIRouter, Request
 from app.backend.page_contexts.statistics_context import (
     get_statistics_metrics,
     get_site_statistics,
@@ -10,6 +10,8 @@ from app.backend.page_contexts.statistics_context import (
     get_collection_period_info
 )
 from app.backend.core.logger import get_logger
+from app.backend.core.executor import run_db
+from app.backend.core.conditional import db_etag, not_modified, etag_json
 
 logger = get_logger(__name__)
 
@@ -17,7 +19,7 @@ router = APIRouter(prefix="/statistics", tags=["statistics"])
 
 
 @router.get("/metrics", response_model=dict)
-async def get_metrics():
+async def get_metrics(request: Request):
     """
     통계 메트릭 조회
 
@@ -27,9 +29,14 @@ async def get_metrics():
         - today_pages: 오늘 수집 페이지 수
         - total_attachments: 전체 첨부파일 수
     """
+    etag = await run_db(db_etag, request)
+    cached = not_modified(request, etag)
+    if cached is not None:
+        return cached
+
     try:
-        metrics = get_statistics_metrics()
-        return metrics
+        metrics = await run_db(get_statistics_metrics)
+        return etag_json(metrics, etag)
     except Exception as e:
         logger.error(f"❌ 통계 메트릭 조회 실패: {e}")
         return {
@@ -41,64 +48,84 @@ async def get_metrics():
 
 
 @router.get("/sites", response_model=list)
-async def get_sites_stats():
+async def get_sites_stats(request: Request):
     """
     사이트별 수집 통계 조회 (차트용)
 
     Returns:
         [{"site": "사이트명", "count": 100}, ...]
     """
+    etag = await run_db(db_etag, request)
+    cached = not_modified(request, etag)
+    if cached is not None:
+        return cached
+
     try:
-        stats = get_site_statistics()
-        return stats
+        stats = await run_db(get_site_statistics)
+        return etag_json(stats, etag)
     except Exception as e:
         logger.error(f"❌ 사이트 통계 조회 실패: {e}")
         return []
 
 
 @router.get("/files", response_model=list)
-async def get_files_stats():
+async def get_files_stats(request: Request):
     """
     사이트별 첨부파일 통계 조회
 
     Returns:
         [{"site": "사이트명", "file_count": 50}, ...]
     """
+    etag = await run_db(db_etag, request)
+    cached = not_modified(request, etag)
+    if cached is not None:
+        return cached
+
     try:
-        stats = get_site_file_statistics()
-        return stats
+        stats = await run_db(get_site_file_statistics)
+        return etag_json(stats, etag)
     except Exception as e:
         logger.error(f"❌ 첨부파일 통계 조회 실패: {e}")
         return []
 
 
 @router.get("/detail", response_model=list)
-async def get_detail_stats():
+async def get_detail_stats(request: Request):
     """
     사이트·페이지별 상세 통계 조회
 
     Returns:
         [{"site": "사이트", "page": "페이지", "posts": 100, "files": 50}, ...]
     """
+    etag = await run_db(db_etag, request)
+    cached = not_modified(request, etag)
+    if cached is not None:
+        return cached
+
     try:
-        stats = get_detail_statistics()
-        return stats
+        stats = await run_db(get_detail_statistics)
+        return etag_json(stats, etag)
     except Exception as e:
         logger.error(f"❌ 상세 통계 조회 실패: {e}")
         return []
 
 
 @router.get("/collection-period", response_model=dict)
-async def get_collection_period():
+async def get_collection_period(request: Request):
     """
     데이터 수집 기간 조회
 
     Returns:
         {"first_date": "2024-01-15", "last_date": "2025-01-23"}
     """
+    etag = await run_db(db_etag, request)
+    cached = not_modified(request, etag)
+    if cached is not None:
+        return cached
+
     try:
-        period = get_collection_period_info()
-        return period
+        period = await run_db(get_collection_period_info)
+        return etag_json(period, etag)
     except Exception as e:
         logger.error(f"❌ 수집 기간 조회 실패: {e}")
         return {
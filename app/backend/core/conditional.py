@@ -0,0 +1,162 @@
+"""
+JSON API 조건부 응답 (ETag / Last-Modified → 304 Not Modified)
+
+대시보드·통계·사이트 목록 API 는 DB 가 바뀌지 않는 한 같은 JSON 을
+돌려준다. DB 변경 토큰(결과 캐시의 버전 토큰)과 요청 경로·쿼리, 오늘
+날짜로 강한 ETag 를 만들고, 클라이언트가 보낸 If-None-Match 와 같으면
+본문 없이 304 를 반환한다.
+
+화면은 fetch() 를 그대로 쓰므로 Cache-Control: no-cache 를 받은 브라우저
+HTTP 캐시가 If-None-Match 를 붙여 재검증하고 304 면 저장한 본문을 쓴다.
+JS 쪽에 별도 캐시를 두지 않는다.
+
+버전 토큰 중 PRAGMA data_version 은 커넥션(프로세스)마다 값이 달라서
+ETag 에는 DB / -wal 파일의 mtime·크기와 MAX(id) 만 사용한다. 그래야
+여러 워커가 같은 DB 를 볼 때도 같은 ETag 가 나온다.
+
+사용 예:
+    etag = await run_db(db_etag, request)
+    cached = not_modified(request, etag)
+    if cached is not None:
+        return cached
+    ...
+    return etag_json(data, etag)
+"""
+
+import hashlib
+import time
+from datetime import date, datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+
+from fastapi import Request
+from fastapi.responses import JSONResponse, Response
+
+from app.backend.data.result_cache import get_result_cache
+
+# 매 요청 재검증 (캐시는 하되 쓰기 전에 ETag 로 확인)
+CACHE_CONTROL = "no-cache"
+# 저장 후 바뀌지 않는 파일·게시글 요약: 1년간 재검증 없이 사용
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+class DbETag:
+    """DB 변경 토큰에서 만든 ETag 와 Last-Modified 값"""
+
+    __slots__ = ("value", "last_modified")
+
+    def __init__(self, value: str, last_modified: datetime = None):
+        self.value = value
+        self.last_modified = last_modified
+
+    def headers(self) -> dict:
+        headers = {"ETag": self.value, "Cache-Control": CACHE_CONTROL}
+        if self.last_modified is not None:
+            headers["Last-Modified"] = format_datetime(self.last_modified, usegmt=True)
+        return headers
+
+
+def db_etag(request: Request):
+    """
+    요청에 대한 ETag 계산 (DB 상태를 알 수 없으면 None)
+
+    블로킹 I/O(버전 토큰 조회)가 있으므로 run_db 로 호출한다.
+    """
+    version = get_result_cache().current_version()
+    if version is None:
+        return None
+    _, db_stamp, wal_stamp, max_ids = version
+
+    source = repr((
+        db_stamp,
+        wal_stamp,
+        max_ids,
+        request.url.path,
+        sorted(request.query_params.multi_items()),
+        # 'today' 같은 기간은 날짜가 바뀌면 결과도 바뀐다
+        date.today().isoformat(),
+    ))
+    digest = hashlib.sha1(source.encode("utf-8")).hexdigest()
+
+    # Last-Modified 는 초 단위라서 같은 초 안의 후속 쓰기를 구분하지 못한다.
+    # 마지막 쓰기 후 1초가 지난 뒤에만 내보낸다 (If-Modified-Since 오판 방지)
+    stamps = [stamp[0] for stamp in (db_stamp, wal_stamp) if stamp]
+    last_modified = None
+    if stamps and time.time_ns() - max(stamps) >= 1_000_000_000:
+        last_modified = datetime.fromtimestamp(max(stamps) // 1_000_000_000, tz=timezone.utc)
+    return DbETag(f'"{digest}"', last_modified)
+
+
+class FileETag:
+    """파일의 inode·크기·mtime 으로 만든 강한 ETag (바뀌지 않는 파일용)"""
+
+    __slots__ = ("value", "last_modified")
+
+    def __init__(self, stat_result):
+        self.value = f'"{stat_result.st_ino:x}-{stat_result.st_size:x}-{stat_result.st_mtime_ns:x}"'
+        self.last_modified = datetime.fromtimestamp(int(stat_result.st_mtime), tz=timezone.utc)
+
+    def headers(self) -> dict:
+        return {
+            "ETag": self.value,
+            "Last-Modified": format_datetime(self.last_modified, usegmt=True),
+            "Cache-Control": IMMUTABLE_CACHE_CONTROL,
+        }
+
+
+class ContentETag:
+    """내용 해시로 만든 강한 ETag (id 로 조회하며 바뀌지 않는 게시글 요약용)"""
+
+    __slots__ = ("value", "last_modified")
+
+    def __init__(self, content: str):
+        digest = hashlib.sha1((content or "").encode("utf-8")).hexdigest()
+        self.value = f'"{digest}"'
+        self.last_modified = None
+
+    def headers(self) -> dict:
+        return {"ETag": self.value, "Cache-Control": IMMUTABLE_CACHE_CONTROL}
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """If-None-Match 비교 (목록, '*', W/ 접두어 허용)"""
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+def not_modified(request: Request, etag) -> Response | None:
+    """
+    클라이언트 캐시가 유효하면 304 응답, 아니면 None
+
+    If-None-Match 가 있으면 그것만 보고, 없을 때만 If-Modified-Since 를 본다.
+    """
+    if etag is None:
+        return None
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        fresh = _etag_matches(if_none_match, etag.value)
+    else:
+        fresh = False
+        if_modified_since = request.headers.get("if-modified-since")
+        if if_modified_since and etag.last_modified is not None:
+            try:
+                fresh = etag.last_modified <= parsedate_to_datetime(if_modified_since)
+            except (TypeError, ValueError):
+                fresh = False
+
+    if not fresh:
+        return None
+    return Response(status_code=304, headers=etag.headers())
+
+
+def etag_json(content, etag) -> JSONResponse:
+    """ETag / Last-Modified 헤더를 붙인 JSON 응답 (etag 가 None 이면 헤더 없음)"""
+    headers = etag.headers() if etag is not None else None
+    return JSONResponse(content=content, headers=headers)
@@ -27,6 +27,13 @@ class Config:
         if not os.path.exists(self.UI_LOG_DIR):
             os.makedirs(self.UI_LOG_DIR, exist_ok=True)
 
+        # 로그 큐 (writer 스레드 하나가 파일에 씀): 최대 대기 레코드 수, 가득 찼을 때 정책
+        self.LOG_QUEUE_SIZE = int(os.getenv("LOG_QUEUE_SIZE", "10000"))
+        self.LOG_QUEUE_POLICY = os.getenv("LOG_QUEUE_POLICY", "drop")  # drop | block
+        self.LOG_QUEUE_BLOCK_TIMEOUT = float(os.getenv("LOG_QUEUE_BLOCK_TIMEOUT", "1"))
+        # 쿼리별 SQL 로그는 초당 이 건수까지만 남김 (0 이면 남기지 않음)
+        self.SQL_LOG_PER_SECOND = float(os.getenv("SQL_LOG_PER_SECOND", "2"))
+
         # CRAWLER 설정
         # LAW_CRAWLER_DIR 환경 변수에서 기본 경로 읽기
         crawler_base_dir = os.getenv("CRAWLER_BASE_DIR")
@@ -47,5 +54,79 @@ class Config:
         self.ATTACHS_DIR = os.path.join(self.CRAWLER_DATA_DIR, "Attaches")
         self.YAML_PATH = os.path.join(self.CRAWLER_EXE_DIR, "LAW_SITE_DESC.yaml")
 
+        # 서버 워커(프로세스) 수: --workers 또는 gunicorn -w 와 같은 값
+        self.WORKERS = max(1, int(os.getenv("WORKERS", "1")))
+
+        # DB 커넥션 풀 설정
+        # DB_POOL_SIZE 를 주지 않으면 전체 커넥션 수(DB_POOL_TOTAL)를 워커 수로 나눔
+        self.DB_POOL_TOTAL = int(os.getenv("DB_POOL_TOTAL", "8"))
+        self.DB_POOL_SIZE = int(
+            os.getenv("DB_POOL_SIZE", str(max(2, self.DB_POOL_TOTAL // self.WORKERS)))
+        )
+        self.DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "5"))
+        self.DB_MMAP_SIZE = int(os.getenv("DB_MMAP_SIZE", str(256 * 1024 * 1024)))
+        self.DB_CACHE_SIZE = int(os.getenv("DB_CACHE_SIZE", str(-64 * 1024)))
+
+        # 전문 검색(FTS) 색인 동기화 주기(초)
+        self.FTS_SYNC_INTERVAL = float(os.getenv("FTS_SYNC_INTERVAL", "60"))
+
+        # 대시보드 일자별 집계(daily_counts) 동기화 주기(초)
+        self.DAILY_ROLLUP_SYNC_INTERVAL = float(
+            os.getenv("DAILY_ROLLUP_SYNC_INTERVAL", "60")
+        )
+
+        # summary 파생 컬럼(summary_derived) 동기화 주기(초)와 HTML 파싱 프로세스 수
+        # (DERIVE_WORKERS=0 이면 프로세스 풀 없이 동기화 스레드에서 파싱)
+        self.DERIVE_SYNC_INTERVAL = float(os.getenv("DERIVE_SYNC_INTERVAL", "60"))
+        self.DERIVE_WORKERS = int(
+            os.getenv("DERIVE_WORKERS", str(max(1, (os.cpu_count() or 2) // 2)))
+        )
+
+        # 조회 결과 캐시 (DB 변경 시 무효화, TTL·최대 항목 수 제한)
+        self.RESULT_CACHE_TTL = float(os.getenv("RESULT_CACHE_TTL", "300"))
+        self.RESULT_CACHE_MAXSIZE = int(os.getenv("RESULT_CACHE_MAXSIZE", "256"))
+        self.RESULT_CACHE_CHECK_INTERVAL = float(
+            os.getenv("RESULT_CACHE_CHECK_INTERVAL", "1")
+        )
+        # 워커 간 공유 결과 캐시 (UI 쪽 SQLite 파일, 기본: 워커가 2개 이상일 때 사용)
+        self.SHARED_CACHE_ENABLED = os.getenv(
+            "SHARED_CACHE_ENABLED", "1" if self.WORKERS > 1 else "0"
+        ) not in ("", "0", "false", "False")
+        self.SHARED_CACHE_PATH = os.getenv(
+            "SHARED_CACHE_PATH", os.path.join(self.UI_BASE_DIR, "data", "result_cache.db")
+        )
+        self.SHARED_CACHE_MAXSIZE = int(os.getenv("SHARED_CACHE_MAXSIZE", "1024"))
+
+        # 워커 간 잠금 파일 디렉터리와 백그라운드 쓰기 작업(leader) 인계 확인 주기(초)
+        self.LOCK_DIR = os.getenv("LOCK_DIR", os.path.join(self.UI_BASE_DIR, "data", "locks"))
+        self.LEADER_RETRY_INTERVAL = float(os.getenv("LEADER_RETRY_INTERVAL", "30"))
+
+        # 블로킹 I/O 전용 스레드 풀 크기 (DB 는 커넥션 풀 크기를 넘지 않게)
+        self.DB_EXECUTOR_WORKERS = int(
+            os.getenv("DB_EXECUTOR_WORKERS", str(self.DB_POOL_SIZE))
+        )
+        self.FILE_EXECUTOR_WORKERS = int(os.getenv("FILE_EXECUTOR_WORKERS", "4"))
+
+        # 이벤트 루프 지연 측정 주기(초)와 경고 기준(ms)
+        self.LOOP_LAG_INTERVAL = float(os.getenv("LOOP_LAG_INTERVAL", "0.5"))
+        self.LOOP_LAG_WARN_MS = float(os.getenv("LOOP_LAG_WARN_MS", "200"))
+
+        # 느린 쿼리 기록: 기준 시간(ms, 0 이면 끔), 보관 건수
+        self.SLOW_QUERY_MS = float(os.getenv("SLOW_QUERY_MS", "200"))
+        self.SLOW_QUERY_LOG_SIZE = int(os.getenv("SLOW_QUERY_LOG_SIZE", "200"))
+
+        # 로그 뷰어 한 화면(페이지) 줄 수
+        self.LOG_PAGE_LINES = int(os.getenv("LOG_PAGE_LINES", "500"))
+
+        # 로그 실시간 추적(SSE): 새 줄을 모아 보내는 주기(초), 유휴 시 keep-alive 주기(초)
+        self.LOG_STREAM_INTERVAL = float(os.getenv("LOG_STREAM_INTERVAL", "0.5"))
+        self.LOG_STREAM_HEARTBEAT = float(os.getenv("LOG_STREAM_HEARTBEAT", "15"))
+
+        # 크롤러 로그 색인 DB (UI 쪽 파일) 와 증분 색인 주기(초)
+        self.LOG_INDEX_DB_PATH = os.getenv(
+            "LOG_INDEX_DB_PATH", os.path.join(self.UI_BASE_DIR, "data", "crawler_log_index.db")
+        )
+        self.LOG_INDEX_SYNC_INTERVAL = float(os.getenv("LOG_INDEX_SYNC_INTERVAL", "30"))
+
 
 config = Config()
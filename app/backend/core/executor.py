@@ -0,0 +1,86 @@
+"""
+블로킹 I/O 전용 스레드 풀
+
+라우터는 async def 로 선언되어 있으므로 sqlite3 조회나 파일 읽기를 그대로
+호출하면 그동안 이벤트 루프 전체가 멈춘다. DB 작업과 파일 작업을 각각
+크기가 제한된 스레드 풀에서 실행해, 느린 로그 읽기나 검색 하나가 다른
+요청을 막지 않도록 한다.
+
+- db: 커넥션 풀 크기(DB_EXECUTOR_WORKERS)만큼만 동시에 실행
+- file: 로그/첨부파일 등 파일 시스템 작업 (FILE_EXECUTOR_WORKERS)
+"""
+
+import asyncio
+import contextvars
+import functools
+from concurrent.futures import ThreadPoolExecutor
+
+from app.backend.core.config import config
+from app.backend.core.logger import get_logger
+from app.backend.core.metrics import timed
+
+logger = get_logger(__name__)
+
+_executors = {}
+
+
+def get_executor(kind: str) -> ThreadPoolExecutor:
+    """kind("db" | "file") 용 스레드 풀 반환 (없으면 생성)"""
+    executor = _executors.get(kind)
+    if executor is None:
+        if kind == "db":
+            workers = config.DB_EXECUTOR_WORKERS
+        elif kind == "file":
+            workers = config.FILE_EXECUTOR_WORKERS
+        else:
+            raise ValueError(f"알 수 없는 executor 종류: {kind}")
+        executor = ThreadPoolExecutor(
+            max_workers=max(workers, 1), thread_name_prefix=f"{kind}-io"
+        )
+        _executors[kind] = executor
+        logger.info(f"🧵 {kind} executor 생성 (workers={workers})")
+    return executor
+
+
+async def _run_in(kind: str, func, *args, **kwargs):
+    loop = asyncio.get_running_loop()
+    # 요청 단위 contextvar(로그 상관관계 ID 등)를 작업 스레드에서도 유지
+    ctx = contextvars.copy_context()
+    call = functools.partial(ctx.run, _timed_call, kind, func, *args, **kwargs)
+    return await loop.run_in_executor(get_executor(kind), call)
+
+
+def _timed_call(kind: str, func, *args, **kwargs):
+    """작업 스레드에서 func 실행 시간을 (pool, task) 별로 기록"""
+    task = getattr(func, "__name__", type(func).__name__)
+    with timed("executor_task_duration_seconds", "스레드 풀 작업 실행 시간(초)", pool=kind, task=task):
+        return func(*args, **kwargs)
+
+
+async def run_db(func, *args, **kwargs):
+    """DB 조회 함수를 db 스레드 풀에서 실행하고 결과를 기다림"""
+    return await _run_in("db", func, *args, **kwargs)
+
+
+async def run_file(func, *args, **kwargs):
+    """파일 I/O 함수를 file 스레드 풀에서 실행하고 결과를 기다림"""
+    return await _run_in("file", func, *args, **kwargs)
+
+
+def executor_stats() -> dict:
+    """스레드 풀별 작업자 수와 대기 중인 작업 수"""
+    return {
+        kind: {
+            "max_workers": executor._max_workers,
+            "threads": len(executor._threads),
+            "queued": executor._work_queue.qsize(),
+        }
+        for kind, executor in _executors.items()
+    }
+
+
+def shutdown_executors(wait: bool = False):
+    """모든 스레드 풀 종료 (shutdown 이벤트에서 호출)"""
+    for executor in _executors.values():
+        executor.shutdown(wait=wait, cancel_futures=True)
+    _executors.clear()
@@ -1,29 +1,205 @@
+"""
+로깅 설정 (QueueHandler → 단일 writer 스레드)
+
+요청을 처리하는 스레드는 로그 레코드를 메모리 큐에 넣기만 하고, 파일
+쓰기(ConcurrentRotatingFileHandler 의 프로세스 간 파일 잠금 포함)는
+QueueListener 스레드 하나가 맡는다.
+
+- 큐는 LOG_QUEUE_SIZE 로 제한한다. 가득 차면 LOG_QUEUE_POLICY 에 따라
+  "drop" 은 INFO 이하 레코드를 버리고(유실 건수 집계), "block" 은
+  LOG_QUEUE_BLOCK_TIMEOUT 초까지 기다린다. WARNING 이상은 항상 기다린다.
+- stop_logging() 으로 writer 스레드를 멈춘 뒤에는 큐 대신 호출 스레드에서
+  바로 파일에 쓴다 (아무도 비우지 않는 큐에서 기다리지 않도록).
+  start_logging() 이 writer 스레드를 다시 띄운다.
+- 요청마다 correlation id(request_id)를 contextvar 로 두고 모든 레코드에
+  붙인다. 블로킹 I/O 스레드 풀(run_db/run_file)은 contextvars 를 복사하므로
+  스레드에서 남긴 로그도 같은 id 를 가진다.
+- 쿼리마다 남기던 SQL 로그는 sql_log_sampled() 로 초당 SQL_LOG_PER_SECOND
+  건까지만 남긴다.
+"""
+
+import atexit
+import contextvars
 import logging
+import queue
+import threading
+import time
+from logging.handlers import QueueHandler, QueueListener
+
 from concurrent_log_handler import ConcurrentRotatingFileHandler
 
+LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - [%(request_id)s] %(message)s"
+
+# 현재 요청의 correlation id (요청 밖에서는 "-")
+request_id_var = contextvars.ContextVar("request_id", default="-")
+
+
+class RequestIdFilter(logging.Filter):
+    """레코드에 현재 컨텍스트의 request_id 를 붙인다 (큐에 넣기 전, 호출 스레드에서)"""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if not hasattr(record, "request_id"):
+            record.request_id = request_id_var.get()
+        return True
+
+
+class BoundedQueueHandler(QueueHandler):
+    """
+    크기 제한 큐에 넣는 QueueHandler
+
+    Args:
+        log_queue: maxsize 가 있는 queue.Queue
+        policy: "drop" (INFO 이하 즉시 버림) 또는 "block" (block_timeout 까지 대기)
+        block_timeout: 기다리는 최대 시간(초). 넘으면 버린다
+    """
+
+    def __init__(self, log_queue: queue.Queue, policy: str = "drop", block_timeout: float = 1.0):
+        super().__init__(log_queue)
+        self.policy = policy
+        self.block_timeout = block_timeout
+        self.dropped = 0
+        self._dropped_lock = threading.Lock()
+        self.direct_handlers = None
+
+    def write_through(self, handlers):
+        """handlers 가 있으면 큐를 거치지 않고 바로 씀 (None 이면 다시 큐로)"""
+        self.direct_handlers = handlers
+
+    def enqueue(self, record: logging.LogRecord):
+        direct_handlers = self.direct_handlers
+        if direct_handlers is not None:
+            for handler in direct_handlers:
+                if record.levelno >= handler.level:
+                    handler.handle(record)
+            return
+        try:
+            if self.policy == "block" or record.levelno >= logging.WARNING:
+                self.queue.put(record, timeout=self.block_timeout)
+            else:
+                self.queue.put_nowait(record)
+        except queue.Full:
+            with self._dropped_lock:
+                self.dropped += 1
+
+
+class SqlLogSampler:
+    """초당 최대 per_second 건만 통과시키는 SQL 로그 샘플러 (스레드 안전)"""
+
+    def __init__(self, per_second: float):
+        self.per_second = per_second
+        self._lock = threading.Lock()
+        self._window_start = 0.0
+        self._count = 0
+        self.suppressed = 0
+
+    def sample(self) -> bool:
+        if self.per_second <= 0:
+            return False
+        now = time.monotonic()
+        with self._lock:
+            if now - self._window_start >= 1.0:
+                self._window_start = now
+                self._count = 0
+            if self._count < self.per_second:
+                self._count += 1
+                return True
+            self.suppressed += 1
+            return False
+
+
+_lock = threading.Lock()
+_queue_handler = None
+_listener = None
+_sql_sampler = None
+_handlers = ()
+
+
+def _build_pipeline():
+    """공용 큐 핸들러와 writer 스레드(QueueListener) 생성 (최초 1회)"""
+    global _queue_handler, _listener, _sql_sampler, _handlers
+    from app.backend.core.config import config
+
+    formatter = logging.Formatter(LOG_FORMAT)
+    # 매일 자정에 로그 파일을 회전, 최대 7개의 파일 보관
+    # 파일의 최대 크기는 예시로 5MB로 설정하였습니다. 필요에 따라 조절하십시오.
+    file_handler = ConcurrentRotatingFileHandler(
+        config.UI_LOG_FILE, "a", 5 * 1024 * 1024, 7, encoding="utf-8"
+    )
+    file_handler.setFormatter(formatter)
+    handlers = [file_handler]
+
+    if config.PROFILE_NAME == "local":
+        # 콘솔에도 로그 메시지 출력
+        console_handler = logging.StreamHandler()
+        console_handler.setFormatter(formatter)
+        handlers.append(console_handler)
+
+    log_queue = queue.Queue(maxsize=config.LOG_QUEUE_SIZE)
+    _queue_handler = BoundedQueueHandler(
+        log_queue, config.LOG_QUEUE_POLICY, config.LOG_QUEUE_BLOCK_TIMEOUT
+    )
+    _queue_handler.addFilter(RequestIdFilter())
+    _handlers = tuple(handlers)
+    _listener = QueueListener(log_queue, *_handlers, respect_handler_level=True)
+    _listener.start()
+    _sql_sampler = SqlLogSampler(config.SQL_LOG_PER_SECOND)
+    atexit.register(stop_logging)
+
 
 def get_logger(name):
     from app.backend.core.config import config
 
     logger = logging.getLogger(name)
     logger.setLevel(config.UI_LOG_LEVEL)
-    LOG_FILE = config.UI_LOG_FILE
     if not logger.handlers:
-        # 매일 자정에 로그 파일을 회전, 최대 7개의 파일 보관
-        # 파일의 최대 크기는 예시로 5MB로 설정하였습니다. 필요에 따라 조절하십시오.
-        file_handler = ConcurrentRotatingFileHandler(
-            LOG_FILE, "a", 5 * 1024 * 1024, 7, encoding="utf-8"
-        )
-        formatter = logging.Formatter(
-            "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-        )
-        file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
-
-        if config.PROFILE_NAME == "local":
-            # 콘솔에도 로그 메시지 출력
-            console_handler = logging.StreamHandler()
-            console_handler.setFormatter(formatter)
-            logger.addHandler(console_handler)
+        with _lock:
+            if _queue_handler is None:
+                _build_pipeline()
+        logger.addHandler(_queue_handler)
 
     return logger
+
+
+def start_logging():
+    """stop_logging 으로 멈춘 writer 스레드를 다시 시작 (실행 중이면 아무 것도 안 함)"""
+    global _listener
+    with _lock:
+        if _queue_handler is None or _listener is not None:
+            return
+        _listener = QueueListener(_queue_handler.queue, *_handlers, respect_handler_level=True)
+        _listener.start()
+        _queue_handler.write_through(None)
+
+
+def stop_logging():
+    """
+    큐에 남은 레코드를 모두 쓰고 writer 스레드 종료
+
+    이후 레코드는 start_logging 전까지 호출 스레드에서 바로 쓴다.
+    """
+    global _listener
+    with _lock:
+        listener, _listener = _listener, None
+        if listener is None:
+            return
+        listener.stop()
+        _queue_handler.write_through(_handlers)
+
+
+def sql_log_sampled() -> bool:
+    """이번 쿼리의 SQL 을 INFO 로 남길지 여부 (초당 SQL_LOG_PER_SECOND 건까지)"""
+    return _sql_sampler is not None and _sql_sampler.sample()
+
+
+def logging_stats() -> dict:
+    """로그 큐 상태 (진단용)"""
+    if _queue_handler is None:
+        return {}
+    return {
+        "queued": _queue_handler.queue.qsize(),
+        "maxsize": _queue_handler.queue.maxsize,
+        "policy": _queue_handler.policy,
+        "dropped": _queue_handler.dropped,
+        "sql_suppressed": _sql_sampler.suppressed if _sql_sampler else 0,
+        "writer_running": _listener is not None,
+    }
@@ -0,0 +1,73 @@
+"""
+이벤트 루프 지연(lag) 측정
+
+interval 초마다 sleep 한 뒤 실제로 깨어난 시각이 예정보다 얼마나 늦었는지
+기록한다. 루프에서 블로킹 호출이 실행되면 그 시간만큼 지연이 커지므로,
+무거운 검색 중에도 값이 작게 유지되는지로 루프가 막히지 않음을 확인할 수 있다.
+"""
+
+import asyncio
+
+from app.backend.core.config import config
+from app.backend.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class LoopLagMonitor:
+    """이벤트 루프 지연 측정기 (단위: ms)"""
+
+    def __init__(self, interval: float = 0.5, warn_ms: float = 200.0):
+        self.interval = interval
+        self.warn_ms = warn_ms
+        self.reset()
+
+    def reset(self):
+        """측정값 초기화"""
+        self.samples = 0
+        self.last_ms = 0.0
+        self.max_ms = 0.0
+        self.total_ms = 0.0
+        self.over_warn = 0
+
+    def record(self, lag_ms: float):
+        """지연 측정값 하나를 반영"""
+        lag_ms = max(lag_ms, 0.0)
+        self.samples += 1
+        self.last_ms = lag_ms
+        self.total_ms += lag_ms
+        self.max_ms = max(self.max_ms, lag_ms)
+        if lag_ms >= self.warn_ms:
+            self.over_warn += 1
+            logger.warning(f"⚠️ 이벤트 루프 지연: {lag_ms:.1f}ms")
+
+    def stats(self) -> dict:
+        """측정 통계"""
+        return {
+            "interval_ms": round(self.interval * 1000, 1),
+            "samples": self.samples,
+            "last_ms": round(self.last_ms, 2),
+            "avg_ms": round(self.total_ms / self.samples, 2) if self.samples else 0.0,
+            "max_ms": round(self.max_ms, 2),
+            "warn_ms": self.warn_ms,
+            "over_warn": self.over_warn,
+        }
+
+    async def run(self):
+        """interval 마다 지연을 측정하는 백그라운드 루프"""
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            self.record((loop.time() - expected) * 1000)
+
+
+_monitor = None
+
+
+def get_loop_monitor() -> LoopLagMonitor:
+    """전역 지연 측정기 반환 (설정값으로 최초 1회 생성)"""
+    global _monitor
+    if _monitor is None:
+        _monitor = LoopLagMonitor(config.LOOP_LAG_INTERVAL, config.LOOP_LAG_WARN_MS)
+    return _monitor
@@ -0,0 +1,243 @@
+"""
+요청·쿼리 소요 시간 계측 (Prometheus 텍스트 형식)
+
+외부 수집기 없이 프로세스 안에서 히스토그램을 누적하고, /metrics 가
+Prometheus exposition 텍스트로 내보낸다. 로컬에서 curl 로 보거나
+Prometheus 가 직접 scrape 할 수 있다.
+
+- law_ui_http_request_duration_seconds{method, route, status}: TimingMiddleware
+- law_ui_db_query_duration_seconds{query} / law_ui_db_query_rows_total{query}:
+  db_util 의 timed_query 데코레이터
+- law_ui_template_render_duration_seconds{template}: render_template
+- law_ui_executor_task_duration_seconds{pool, task}: run_db / run_file 작업
+
+라벨 값은 라우트 경로 템플릿·쿼리 이름처럼 개수가 정해진 값만 쓴다
+(요청 경로 원문이나 SQL 을 라벨로 쓰지 않는다).
+"""
+
+import bisect
+import functools
+import threading
+import time
+from contextlib import contextmanager
+
+# 초 단위 히스토그램 버킷 (5ms ~ 10s)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+METRIC_PREFIX = "law_ui_"
+
+
+class Histogram:
+    """누적 버킷 히스토그램 (라벨 조합 하나)"""
+
+    __slots__ = ("buckets", "counts", "count", "sum")
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float):
+        index = bisect.bisect_left(self.buckets, value)
+        if index < len(self.counts):
+            self.counts[index] += 1
+        self.count += 1
+        self.sum += value
+
+    def cumulative(self):
+        """(le, 누적 건수) 목록 (+Inf 포함)"""
+        total = 0
+        result = []
+        for bound, count in zip(self.buckets, self.counts):
+            total += count
+            result.append((bound, total))
+        result.append((float("inf"), self.count))
+        return result
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: dict) -> str:
+    if not labels:
+        return ""
+    body = ",".join(f'{key}="{_escape(value)}"' for key, value in labels.items())
+    return "{" + body + "}"
+
+
+def _format_value(value) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return repr(value) if isinstance(value, float) else str(value)
+
+
+class MetricsRegistry:
+    """
+    히스토그램·카운터 저장소 (스레드 안전)
+
+    이름별로 {라벨 튜플: Histogram | 값} 을 보관한다.
+    """
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self._lock = threading.Lock()
+        self._histograms = {}
+        self._counters = {}
+        self._help = {}
+
+    def observe(self, name: str, value: float, help_text: str = "", **labels):
+        """히스토그램 name 에 값 하나 기록"""
+        key = tuple(labels.items())
+        with self._lock:
+            series = self._histograms.setdefault(name, {})
+            histogram = series.get(key)
+            if histogram is None:
+                histogram = series[key] = Histogram(self.buckets)
+            histogram.observe(value)
+            if help_text:
+                self._help.setdefault(name, help_text)
+
+    def inc(self, name: str, amount: float = 1, help_text: str = "", **labels):
+        """카운터 name 증가"""
+        key = tuple(labels.items())
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            series[key] = series.get(key, 0) + amount
+            if help_text:
+                self._help.setdefault(name, help_text)
+
+    def reset(self):
+        """모든 측정값 초기화"""
+        with self._lock:
+            self._histograms.clear()
+            self._counters.clear()
+
+    def snapshot(self) -> dict:
+        """
+        요약 (진단 API 용)
+
+        Returns:
+            {히스토그램 이름: [{"labels", "count", "sum", "avg"}, ...], 카운터 이름: [{"labels", "value"}, ...]}
+        """
+        with self._lock:
+            result = {}
+            for name, series in self._histograms.items():
+                result[name] = [
+                    {
+                        "labels": dict(key),
+                        "count": histogram.count,
+                        "sum": round(histogram.sum, 6),
+                        "avg": round(histogram.sum / histogram.count, 6) if histogram.count else 0.0,
+                    }
+                    for key, histogram in series.items()
+                ]
+            for name, series in self._counters.items():
+                result[name] = [{"labels": dict(key), "value": value} for key, value in series.items()]
+            return result
+
+    def render(self, gauges: dict = None, counters: dict = None) -> str:
+        """
+        Prometheus exposition 텍스트
+
+        Args:
+            gauges: {이름: (도움말, 값 또는 [(라벨 dict, 값), ...])} — 조회 시점 값
+            counters: gauges 와 같은 형식, 다른 곳에서 누적한 값 (적중 수 등)
+        """
+        lines = []
+        with self._lock:
+            for name, series in sorted(self._histograms.items()):
+                full = METRIC_PREFIX + name
+                lines.append(f"# HELP {full} {self._help.get(name, name)}")
+                lines.append(f"# TYPE {full} histogram")
+                for key, histogram in series.items():
+                    labels = dict(key)
+                    for bound, count in histogram.cumulative():
+                        bucket_labels = _format_labels({**labels, "le": _format_value(float(bound))})
+                        lines.append(f"{full}_bucket{bucket_labels} {count}")
+                    lines.append(f"{full}_sum{_format_labels(labels)} {_format_value(histogram.sum)}")
+                    lines.append(f"{full}_count{_format_labels(labels)} {histogram.count}")
+            for name, series in sorted(self._counters.items()):
+                full = METRIC_PREFIX + name
+                lines.append(f"# HELP {full} {self._help.get(name, name)}")
+                lines.append(f"# TYPE {full} counter")
+                for key, value in series.items():
+                    lines.append(f"{full}{_format_labels(dict(key))} {_format_value(value)}")
+
+        for kind, values in (("gauge", gauges), ("counter", counters)):
+            for name, (help_text, value) in sorted((values or {}).items()):
+                full = METRIC_PREFIX + name
+                lines.append(f"# HELP {full} {help_text}")
+                lines.append(f"# TYPE {full} {kind}")
+                samples = value if isinstance(value, list) else [({}, value)]
+                for labels, sample in samples:
+                    lines.append(f"{full}{_format_labels(labels)} {_format_value(sample)}")
+        return "\n".join(lines) + "\n"
+
+
+_registry = MetricsRegistry()
+
+
+def get_metrics() -> MetricsRegistry:
+    """전역 측정값 저장소 반환"""
+    return _registry
+
+
+def observe_request(method: str, route: str, status: int, seconds: float):
+    """HTTP 요청 하나의 소요 시간 기록"""
+    _registry.observe(
+        "http_request_duration_seconds", seconds,
+        "HTTP 요청 처리 시간(초)", method=method, route=route, status=str(status),
+    )
+
+
+def _row_count(result) -> int:
+    """
+    쿼리 함수 반환값의 행 수
+
+    목록은 길이, 페이지 dict 는 rows 길이, None(조회 결과 없음)은 0,
+    그 외(한 행 dict·집계 튜플·값)는 1
+    """
+    if isinstance(result, list):
+        return len(result)
+    if result is None:
+        return 0
+    if isinstance(result, dict) and isinstance(result.get("rows"), list):
+        return len(result["rows"])
+    return 1
+
+
+def observe_query(name: str, seconds: float, rows: int = None):
+    """이름 붙은 DB 조회 하나의 소요 시간과 행 수 기록"""
+    _registry.observe("db_query_duration_seconds", seconds, "DB 조회 시간(초)", query=name)
+    if rows is not None:
+        _registry.inc("db_query_rows_total", rows, "DB 조회 반환 행 수", query=name)
+
+
+def timed_query(name: str):
+    """DB 조회 함수의 소요 시간·반환 행 수를 query=name 으로 기록하는 데코레이터"""
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            started = time.perf_counter()
+            result = func(*args, **kwargs)
+            observe_query(name, time.perf_counter() - started, _row_count(result))
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+@contextmanager
+def timed(metric: str, help_text: str = "", **labels):
+    """with 블록의 소요 시간을 히스토그램 metric 에 기록 (예외가 나도 기록)"""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        _registry.observe(metric, time.perf_counter() - started, help_text, **labels)
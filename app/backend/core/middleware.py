@@ -0,0 +1,92 @@
+"""
+ASGI 미들웨어
+"""
+
+import re
+import time
+import uuid
+
+from app.backend.core.logger import request_id_var
+from app.backend.core.metrics import observe_request
+
+REQUEST_ID_HEADER = b"x-request-id"
+# 클라이언트가 보낸 id 는 로그 줄을 깨뜨리지 않는 형식만 받는다
+_VALID_REQUEST_ID = re.compile(r"^[0-9A-Za-z._-]{1,64}$")
+
+
+class RequestIdMiddleware:
+    """
+    요청마다 correlation id 를 정해 request_id_var 에 두고 X-Request-ID 응답 헤더로 돌려준다
+
+    요청에 X-Request-ID 가 있으면 그대로 쓰고, 없으면 새로 만든다.
+    스트리밍 응답(SSE 등)에도 동작하도록 순수 ASGI 미들웨어로 구현한다.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = None
+        for name, value in scope.get("headers", []):
+            if name == REQUEST_ID_HEADER:
+                candidate = value.decode("latin-1")
+                if _VALID_REQUEST_ID.match(candidate):
+                    request_id = candidate
+                break
+        if request_id is None:
+            request_id = uuid.uuid4().hex[:12]
+
+        async def send_with_request_id(message):
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", []))
+                headers.append((REQUEST_ID_HEADER, request_id.encode("latin-1")))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        token = request_id_var.set(request_id)
+        try:
+            await self.app(scope, receive, send_with_request_id)
+        finally:
+            request_id_var.reset(token)
+
+
+class TimingMiddleware:
+    """
+    요청 처리 시간을 (method, route, status) 별 히스토그램으로 기록
+
+    route 는 매칭된 라우트의 경로 템플릿(예: /api/v1/logs/crawler/file/{filename})
+    이라 라벨 개수가 늘어나지 않는다. 매칭되지 않은 요청은 "unmatched".
+    스트리밍 응답은 본문을 모두 보낼 때까지의 시간이다.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+        started = time.perf_counter()
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            route = scope.get("route")
+            observe_request(
+                scope["method"],
+                getattr(route, "path", None) or "unmatched",
+                status,
+                time.perf_counter() - started,
+            )
@@ -0,0 +1,112 @@
+"""
+프로세스 간 파일 잠금
+
+uvicorn --workers / gunicorn 으로 워커 여러 개를 띄우면 startup 이 워커마다
+동시에 실행된다. DB 에 쓰는 초기화(yaml_info 동기화, 인덱스 생성)는
+잠금을 잡은 워커가 하나씩 차례로 실행하고, FTS 색인·일자별 집계·로그 색인
+같은 백그라운드 쓰기 작업은 잠금을 잡은 워커(leader) 하나만 실행한다.
+
+잠금 파일은 LOCK_DIR 아래에 만든다. OS 파일 잠금(POSIX fcntl.flock,
+Windows msvcrt.locking)이므로 프로세스가 죽으면 자동으로 풀린다.
+"""
+
+import os
+import threading
+import time
+
+from app.backend.core.config import config
+
+if os.name == "nt":
+    import msvcrt
+
+    def _try_lock(handle) -> bool:
+        handle.seek(0)
+        try:
+            msvcrt.locking(handle.fileno(), msvcrt.LK_NBLCK, 1)
+            return True
+        except OSError:
+            return False
+
+    def _unlock(handle):
+        handle.seek(0)
+        msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+
+else:
+    import fcntl
+
+    def _try_lock(handle) -> bool:
+        try:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            return True
+        except OSError:
+            return False
+
+    def _unlock(handle):
+        fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+
+
+class ProcessLock:
+    """
+    이름 붙은 프로세스 간 배타 잠금
+
+    Args:
+        name: 잠금 이름 (LOCK_DIR/<name>.lock)
+        lock_dir: 잠금 파일 디렉터리 (기본: config.LOCK_DIR)
+    """
+
+    def __init__(self, name: str, lock_dir: str = None):
+        lock_dir = lock_dir or config.LOCK_DIR
+        os.makedirs(lock_dir, exist_ok=True)
+        self.name = name
+        self.path = os.path.join(lock_dir, f"{name}.lock")
+        self._handle = None
+        self._lock = threading.Lock()
+
+    @property
+    def locked(self) -> bool:
+        """이 객체가 잠금을 잡고 있는지"""
+        return self._handle is not None
+
+    def acquire(self, timeout: float = None, poll_interval: float = 0.1) -> bool:
+        """
+        잠금 획득
+
+        Args:
+            timeout: 최대 대기 시간(초). None 이면 무한 대기, 0 이면 한 번만 시도
+            poll_interval: 재시도 간격(초)
+
+        Returns:
+            획득 여부
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._lock:
+            if self._handle is not None:
+                return True
+            handle = open(self.path, "a+b")
+            while not _try_lock(handle):
+                if deadline is not None and time.monotonic() >= deadline:
+                    handle.close()
+                    return False
+                time.sleep(poll_interval)
+            self._handle = handle
+            return True
+
+    def release(self):
+        """잠금 해제 (잡고 있지 않으면 무시)"""
+        with self._lock:
+            handle, self._handle = self._handle, None
+        if handle is None:
+            return
+        try:
+            _unlock(handle)
+        except OSError:
+            pass
+        finally:
+            handle.close()
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.release()
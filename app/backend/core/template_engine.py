@@ -15,6 +15,7 @@ import re
 from jinja2 import Environment, FileSystemLoader, select_autoescape
 from app.backend.core.logger import get_logger
 from app.backend.core.config import config
+from app.backend.core.metrics import timed
 
 logger = get_logger(__name__)
 
@@ -40,7 +41,9 @@ env.globals['version'] = config.VERSION
 
 def render_template(template_name, context={}):
     template = env.get_template(template_name)
-    return template.render(context)
+    # 존재하는 템플릿만 라벨로 기록 (없는 경로는 get_template 에서 예외)
+    with timed("template_render_duration_seconds", "템플릿 렌더링 시간(초)", template=template_name):
+        return template.render(context)
 
 
 def get_template_html(template_name):
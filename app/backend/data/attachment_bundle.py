@@ -0,0 +1,128 @@
+"""
+첨부파일 ZIP 묶음 스트리밍
+
+임시 파일이나 메모리에 ZIP 전체를 만들지 않고, 파일을 청크 단위로 읽어
+압축하면서 만들어진 바이트를 바로 내보낸다 (StreamingResponse 용 제너레이터).
+출력 스트림은 되감을 수 없으므로 zipfile 이 항목마다 크기·CRC 를 데이터
+디스크립터로 뒤에 붙인다. 메모리 사용량은 청크 크기 정도로 일정하다.
+
+pdf·hwp·zip·이미지처럼 이미 압축된 형식은 다시 압축해도 줄지 않으므로
+저장(ZIP_STORED)만 하고, 나머지는 deflate 로 압축한다.
+"""
+
+import io
+import os
+import time
+import zipfile
+
+from app.backend.data.attachment_file import resolve_attachment_path
+from app.backend.data.log_reader import CHUNK_SIZE
+
+# 이미 압축된 형식 (저장만 함)
+STORED_EXTENSIONS = frozenset({
+    ".pdf", ".hwp", ".hwpx", ".zip", ".7z", ".gz", ".rar", ".egg",
+    ".jpg", ".jpeg", ".png", ".gif", ".webp",
+    ".docx", ".xlsx", ".pptx", ".odt", ".ods", ".mp3", ".mp4",
+})
+
+# ZIP 날짜 필드로 표현할 수 있는 가장 이른 시각 (1980-01-01)
+ZIP_EPOCH = 315532800
+
+# 없는 파일 목록을 담아 묶음 끝에 넣는 항목 이름
+MISSING_LIST_NAME = "_missing_files.txt"
+
+
+class _ChunkSink(io.RawIOBase):
+    """zipfile 이 쓴 바이트를 모아 두었다가 drain() 으로 꺼내는 출력 스트림 (되감기 불가)"""
+
+    def __init__(self):
+        super().__init__()
+        self._chunks = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def compress_type_for(filename: str) -> int:
+    """확장자로 ZIP 압축 방식 선택"""
+    if os.path.splitext(filename)[1].lower() in STORED_EXTENSIONS:
+        return zipfile.ZIP_STORED
+    return zipfile.ZIP_DEFLATED
+
+
+def bundle_entries(rows: list) -> list:
+    """
+    첨부파일 행 → (ZIP 안 경로, 실제 경로) 목록
+
+    ZIP 안 경로는 save_folder/save_file_name 이다. 같은 파일은 한 번만 넣고,
+    ATTACHS_DIR 밖을 가리키는 행은 실제 경로를 None 으로 둔다 (없는 파일로 기록).
+    """
+    entries = []
+    seen = set()
+    for row in rows:
+        save_folder = (row["save_folder"] or "").strip("/\\")
+        filename = row["save_file_name"]
+        arcname = f"{save_folder}/{filename}" if save_folder else filename
+        if arcname in seen:
+            continue
+        seen.add(arcname)
+        entries.append((arcname, resolve_attachment_path(save_folder, filename)))
+    return entries
+
+
+def iter_zip_stream(entries: list, chunk_size: int = CHUNK_SIZE):
+    """
+    (ZIP 안 경로, 실제 경로) 목록을 ZIP 으로 묶어 바이트 청크로 내보내는 제너레이터
+
+    읽을 수 없는 파일은 건너뛰고 MISSING_LIST_NAME 에 이름을 남긴다.
+    """
+    sink = _ChunkSink()
+    missing = []
+    with zipfile.ZipFile(sink, "w", allowZip64=True) as archive:
+        for arcname, path in entries:
+            try:
+                if path is None:
+                    raise FileNotFoundError(arcname)
+                src = open(path, "rb")
+            except OSError:
+                missing.append(arcname)
+                continue
+            with src:
+                st = os.fstat(src.fileno())
+                info = zipfile.ZipInfo(arcname, date_time=_zip_date_time(st.st_mtime))
+                info.compress_type = compress_type_for(arcname)
+                info.file_size = st.st_size
+                with archive.open(info, "w") as dest:
+                    while True:
+                        chunk = src.read(chunk_size)
+                        if not chunk:
+                            break
+                        dest.write(chunk)
+                        data = sink.drain()
+                        if data:
+                            yield data
+            data = sink.drain()
+            if data:
+                yield data
+
+        if missing:
+            archive.writestr(MISSING_LIST_NAME, "\n".join(missing) + "\n")
+
+    # 중앙 디렉터리
+    data = sink.drain()
+    if data:
+        yield data
+
+
+def _zip_date_time(mtime: float) -> tuple:
+    """ZIP 날짜 필드 범위(1980~2107)로 제한한 수정 시각"""
+    return time.localtime(max(mtime, ZIP_EPOCH))[:6]
@@ -0,0 +1,84 @@
+"""
+첨부파일 경로 확인과 MIME 판별
+
+크롤러가 저장한 파일은 확장자가 없거나(.do, .jsp 등 다운로드 URL 그대로)
+mimetypes 가 모르는 확장자(.hwp)인 경우가 많다. 확장자로 알 수 없으면
+파일 앞부분(magic bytes)을 보고 판별해서 PDF·이미지는 브라우저에서 바로
+열리게 한다.
+"""
+
+import mimetypes
+import os
+import stat
+from pathlib import Path
+
+from app.backend.core.config import config
+
+OCTET_STREAM = "application/octet-stream"
+
+# mimetypes 에 없는 국내 문서 형식
+EXTRA_TYPES = {
+    ".hwp": "application/x-hwp",
+    ".hwpx": "application/hwp+zip",
+}
+
+# (파일 앞부분, MIME) - 확장자로 알 수 없을 때만 사용
+MAGIC_TYPES = (
+    (b"%PDF-", "application/pdf"),
+    (b"\x89PNG\r\n\x1a\n", "image/png"),
+    (b"\xff\xd8\xff", "image/jpeg"),
+    (b"GIF87a", "image/gif"),
+    (b"GIF89a", "image/gif"),
+    (b"PK\x03\x04", "application/zip"),
+    # OLE 복합 문서 (hwp, doc, xls 등)
+    (b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1", "application/x-ole-storage"),
+)
+SNIFF_BYTES = 16
+
+# 다운로드 대신 브라우저에서 바로 여는 형식
+INLINE_TYPES = ("application/pdf", "image/png", "image/jpeg", "image/gif")
+
+
+def resolve_attachment_path(save_folder: str, filename: str) -> Path | None:
+    """
+    ATTACHS_DIR/{save_folder}/{filename} 경로 (ATTACHS_DIR 밖을 가리키면 None)
+    """
+    attach_base = Path(config.ATTACHS_DIR).resolve()
+    file_path = (attach_base / save_folder / filename).resolve()
+    if file_path != attach_base and attach_base not in file_path.parents:
+        return None
+    return file_path
+
+
+def sniff_media_type(path, filename: str) -> str:
+    """확장자 → MIME, 모르면 파일 앞부분으로 판별 (그래도 모르면 octet-stream)"""
+    ext = os.path.splitext(filename)[1].lower()
+    media_type = EXTRA_TYPES.get(ext) or mimetypes.guess_type(filename)[0]
+    if media_type and media_type != OCTET_STREAM:
+        return media_type
+
+    with open(path, "rb") as f:
+        head = f.read(SNIFF_BYTES)
+    for magic, sniffed in MAGIC_TYPES:
+        if head.startswith(magic):
+            return sniffed
+    return OCTET_STREAM
+
+
+def inspect_attachment(path) -> tuple | None:
+    """
+    (os.stat 결과, MIME) 반환. 일반 파일이 아니면 None
+
+    블로킹 I/O 이므로 run_file 로 호출한다.
+    """
+    try:
+        stat_result = os.stat(path)
+    except OSError:
+        return None
+    if not stat.S_ISREG(stat_result.st_mode):
+        return None
+    return stat_result, sniff_media_type(path, os.path.basename(path))
+
+
+def is_inline_type(media_type: str) -> bool:
+    return media_type in INLINE_TYPES
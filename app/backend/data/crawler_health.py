@@ -0,0 +1,156 @@
+"""
+크롤러 헬스 체크 (증분 로그 스캔)
+
+헤더의 크롤러 상태 표시는 모든 페이지에서 호출되므로, 매번 로그 디렉터리를
+glob·stat·정렬하고 최신 로그를 통째로 읽으면 안 된다.
+
+- 최신 로그 파일은 디렉터리 목록 캐시에서 찾는다. 디렉터리 mtime 이
+  바뀔 때(파일 추가·삭제·이름 변경)만 목록을 다시 만든다.
+- 파일별로 (마지막 스캔 오프셋, 오류 줄 수, 마지막 시각) 을 기억하고
+  이후에 추가된 바이트만 스캔한다. 파일이 바뀌거나(inode) 작아지면 처음부터.
+- 마지막 시각은 파일 끝에서 역방향으로 읽어 처음 나오는 타임스탬프.
+"""
+
+import os
+import re
+import threading
+from pathlib import Path
+
+from app.backend.core.logger import get_logger
+from app.backend.data.log_reader import CHUNK_SIZE, read_lines_before
+
+logger = get_logger(__name__)
+
+LOG_PATTERN = "law_crawler_*.log"
+ERROR_MARKERS = (b"ERROR", b"Exception")
+# 로그 형식 예: 2025-01-30 10:30:45,123 - INFO - message
+TIMESTAMP_RE = re.compile(r"(\d{4}-\d{2}-\d{2}\s\d{2}:\d{2}:\d{2})")
+
+
+class LogDirectoryCache:
+    """디렉터리 mtime 이 바뀔 때만 다시 만드는 최신 로그 파일 캐시"""
+
+    def __init__(self, pattern: str = LOG_PATTERN):
+        self.pattern = pattern
+        self._key = None
+        self._latest = None
+        self.refreshes = 0
+
+    def latest(self, log_dir: str):
+        """가장 최근에 수정된 로그 파일 경로 (없으면 None)"""
+        st = os.stat(log_dir)
+        key = (log_dir, st.st_mtime_ns)
+        if key != self._key:
+            files = []
+            for path in Path(log_dir).glob(self.pattern):
+                try:
+                    files.append((path.stat().st_mtime, str(path)))
+                except OSError:
+                    continue
+            self._latest = max(files)[1] if files else None
+            self._key = key
+            self.refreshes += 1
+        return self._latest
+
+
+class _FileScanState:
+    __slots__ = ("file_id", "offset", "error_count", "last_timestamp")
+
+    def __init__(self, file_id):
+        self.file_id = file_id
+        self.offset = 0
+        self.error_count = 0
+        self.last_timestamp = None
+
+
+class CrawlerHealthChecker:
+    """최신 크롤러 로그를 증분 스캔해 헬스 상태를 판단 (스레드 안전)"""
+
+    def __init__(self, chunk_size: int = CHUNK_SIZE):
+        self.chunk_size = chunk_size
+        self.directory = LogDirectoryCache()
+        self._states = {}
+        self._lock = threading.Lock()
+
+    def _scan_errors(self, path: str, state: _FileScanState, size: int):
+        """state.offset 이후 완성된 줄에서 오류 줄 수 누적"""
+        with open(path, "rb") as f:
+            f.seek(state.offset)
+            pending = b""
+            position = state.offset
+            while position < size:
+                chunk = f.read(min(self.chunk_size, size - position))
+                if not chunk:
+                    break
+                position += len(chunk)
+                complete, sep, pending = (pending + chunk).rpartition(b"\n")
+                if not sep:
+                    continue
+                for line in complete.split(b"\n"):
+                    if any(marker in line for marker in ERROR_MARKERS):
+                        state.error_count += 1
+                state.offset = position - len(pending)
+
+    def _find_last_timestamp(self, path: str, state: _FileScanState, end: int, scanned_from: int):
+        """파일 끝에서 역방향으로 마지막 타임스탬프 찾기 (이미 본 구간 이전은 재사용)"""
+        before = end
+        while before > scanned_from:
+            page = read_lines_before(path, before, 64, self.chunk_size)
+            for line in reversed(page["lines"]):
+                match = TIMESTAMP_RE.match(line)
+                if match:
+                    state.last_timestamp = match.group(1)
+                    return
+            if page["start"] >= before:
+                break
+            before = page["start"]
+
+    def check(self, log_dir: str) -> dict:
+        """
+        헬스 상태
+
+        Returns:
+            {"healthy": "ok" | "check", "last_crawling_time", "error_detected", "error_count"}
+            또는 {"healthy": "check", "last_crawling_time": None, "error_message"}
+        """
+        latest = self.directory.latest(log_dir)
+        if latest is None:
+            return {
+                "healthy": "check",
+                "last_crawling_time": None,
+                "error_message": "로그 파일을 찾을 수 없습니다."
+            }
+
+        with self._lock:
+            st = os.stat(latest)
+            file_id = (st.st_dev, st.st_ino)
+            state = self._states.get(latest)
+            if state is None or state.file_id != file_id or st.st_size < state.offset:
+                logger.debug(f"크롤러 로그 스캔 시작: {latest}")
+                state = _FileScanState(file_id)
+                # 최신 파일 하나만 추적
+                self._states = {latest: state}
+
+            scanned_from = state.offset
+            if st.st_size > scanned_from:
+                self._scan_errors(latest, state, st.st_size)
+                self._find_last_timestamp(latest, state, st.st_size, scanned_from)
+
+            has_error = state.error_count > 0
+            return {
+                "healthy": "check" if has_error else "ok",
+                "last_crawling_time": state.last_timestamp,
+                "error_detected": has_error,
+                "error_count": state.error_count,
+            }
+
+
+_checker = None
+
+
+def get_crawler_health_checker() -> CrawlerHealthChecker:
+    """전역 크롤러 헬스 체커 반환"""
+    global _checker
+    if _checker is None:
+        _checker = CrawlerHealthChecker()
+    return _checker
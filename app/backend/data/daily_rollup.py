@@ -0,0 +1,244 @@
+"""
+일자별 수집 건수 집계 테이블(daily_counts) 관리
+
+대시보드 메트릭(오늘/3일/7일/전체 수집 건수, 최근 오류 건수)은 매번
+law_summary / law_summary_attach 를 기간별로 다시 세면 요청마다 여러 번의
+스캔이 필요하다. 일자·사이트·페이지별 건수를 daily_counts 에 미리 집계해
+두고, 모든 기간을 이 테이블 하나에 대한 집계 쿼리로 구한다.
+
+크롤러는 행을 추가만 하므로 FTS 색인과 같은 방식으로 id 기준 증분
+동기화한다(ui_meta 에 마지막으로 반영한 id 를 저장). 아직 반영되지 않은
+최신 행은 조회 시 id 범위(PK)로만 읽어 보완한다. 동기화 위치와 집계를
+한 읽기 트랜잭션에서 읽으므로(db_pool.read_transaction) 동기화 중에도 결과는
+정확하다.
+"""
+
+import asyncio
+import sqlite3
+
+from app.backend.core.logger import get_logger
+from app.backend.data.meta_table import (
+    ensure_meta_table,
+    get_meta_value,
+    set_meta_value,
+)
+
+logger = get_logger(__name__)
+
+DAILY_TABLE = "daily_counts"
+SUMMARY_SYNC_KEY = "daily_summary_last_id"
+ATTACH_SYNC_KEY = "daily_attach_last_id"
+
+
+def ensure_daily_table(conn: sqlite3.Connection):
+    """daily_counts 테이블 생성 (쓰기 커넥션 필요)"""
+    conn.execute(f"""
+        CREATE TABLE IF NOT EXISTS {DAILY_TABLE} (
+            day TEXT NOT NULL,
+            site_name TEXT NOT NULL,
+            page_id TEXT NOT NULL,
+            summary_count INTEGER NOT NULL DEFAULT 0,
+            attach_count INTEGER NOT NULL DEFAULT 0,
+            log_count INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (day, site_name, page_id)
+        ) WITHOUT ROWID
+    """)
+
+
+def _next_batch_end(conn, table: str, last_id: int, batch_size: int):
+    """last_id 이후 batch_size 개 행의 마지막 id (없으면 None)"""
+    return conn.execute(
+        f"SELECT MAX(id) FROM (SELECT id FROM {table} WHERE id > ? ORDER BY id LIMIT ?)",
+        (last_id, batch_size),
+    ).fetchone()[0]
+
+
+def _sync_summary(conn, batch_size: int) -> int:
+    last_id = int(get_meta_value(conn, SUMMARY_SYNC_KEY, 0))
+    total = 0
+    while True:
+        end_id = _next_batch_end(conn, "law_summary", last_id, batch_size)
+        if end_id is None:
+            break
+        cursor = conn.execute(
+            f"""
+            INSERT INTO {DAILY_TABLE} (day, site_name, page_id, summary_count, log_count)
+            SELECT
+                COALESCE(DATE(upd_time), ''),
+                site_name,
+                page_id,
+                COUNT(*),
+                SUM(CASE WHEN category = 'LOG' THEN 1 ELSE 0 END)
+            FROM law_summary
+            WHERE id > ? AND id <= ?
+            GROUP BY 1, 2, 3
+            ON CONFLICT (day, site_name, page_id) DO UPDATE SET
+                summary_count = summary_count + excluded.summary_count,
+                log_count = log_count + excluded.log_count
+            """,
+            (last_id, end_id),
+        )
+        total += cursor.rowcount
+        last_id = end_id
+        set_meta_value(conn, SUMMARY_SYNC_KEY, last_id)
+        conn.commit()
+    return total
+
+
+def _sync_attach(conn, batch_size: int) -> int:
+    last_id = int(get_meta_value(conn, ATTACH_SYNC_KEY, 0))
+    total = 0
+    while True:
+        end_id = _next_batch_end(conn, "law_summary_attach", last_id, batch_size)
+        if end_id is None:
+            break
+        # 첨부파일의 사이트·페이지는 부모 게시글 기준 (부모가 없으면 '')
+        cursor = conn.execute(
+            f"""
+            INSERT INTO {DAILY_TABLE} (day, site_name, page_id, attach_count)
+            SELECT
+                COALESCE(DATE(b.upd_time), ''),
+                COALESCE(a.site_name, ''),
+                COALESCE(a.page_id, ''),
+                COUNT(*)
+            FROM law_summary_attach b
+            LEFT JOIN law_summary a ON a.id = b.parent_id
+            WHERE b.id > ? AND b.id <= ?
+            GROUP BY 1, 2, 3
+            ON CONFLICT (day, site_name, page_id) DO UPDATE SET
+                attach_count = attach_count + excluded.attach_count
+            """,
+            (last_id, end_id),
+        )
+        total += cursor.rowcount
+        last_id = end_id
+        set_meta_value(conn, ATTACH_SYNC_KEY, last_id)
+        conn.commit()
+    return total
+
+
+def sync_daily_counts(db_path: str, batch_size: int = 50000) -> int:
+    """
+    law_summary / law_summary_attach 에 새로 추가된 행을 daily_counts 에 반영
+
+    Args:
+        db_path: 데이터베이스 파일 경로
+        batch_size: 한 트랜잭션에서 집계할 원본 행 수
+
+    Returns:
+        갱신된 daily_counts 행 수
+    """
+    conn = sqlite3.connect(db_path, timeout=30)
+    try:
+        ensure_daily_table(conn)
+        ensure_meta_table(conn)
+        conn.commit()
+
+        total = _sync_summary(conn, batch_size) + _sync_attach(conn, batch_size)
+        if total:
+            logger.info(f"✅ 일자별 집계 동기화: {total}행 갱신")
+        return total
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+
+
+def rebuild_daily_counts(db_path: str) -> int:
+    """daily_counts 를 비우고 처음부터 다시 집계"""
+    conn = sqlite3.connect(db_path, timeout=30)
+    try:
+        ensure_daily_table(conn)
+        ensure_meta_table(conn)
+        conn.commit()
+        # 테이블은 두고 행 삭제와 동기화 위치 초기화를 한 트랜잭션으로
+        # (DROP 은 바로 커밋되어 조회 쪽이 테이블 없는 순간을 보게 된다)
+        conn.execute("BEGIN IMMEDIATE")
+        conn.execute(f"DELETE FROM {DAILY_TABLE}")
+        set_meta_value(conn, SUMMARY_SYNC_KEY, 0)
+        set_meta_value(conn, ATTACH_SYNC_KEY, 0)
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+    return sync_daily_counts(db_path)
+
+
+def daily_synced_ids(conn: sqlite3.Connection):
+    """
+    daily_counts 에 반영된 마지막 (law_summary.id, law_summary_attach.id)
+
+    아직 한 번도 동기화되지 않았으면 None
+    """
+    summary_id = get_meta_value(conn, SUMMARY_SYNC_KEY)
+    attach_id = get_meta_value(conn, ATTACH_SYNC_KEY)
+    if summary_id is None or attach_id is None:
+        return None
+    return int(summary_id), int(attach_id)
+
+
+def build_window_counts_query(windows: dict, synced_ids=None):
+    """
+    기간별 게시글/첨부파일 수와 최근 수집일의 오류 건수를 한 번에 구하는 쿼리
+
+    Args:
+        windows: {이름: (start, end)} — day >= start AND day < end 반열린 구간
+        synced_ids: daily_synced_ids() 결과. None 이면 원본 테이블만 집계
+
+    Returns:
+        (sql, params) — 컬럼은 {이름}_summary, {이름}_attach ..., error_count
+    """
+    if synced_ids is None:
+        rollup = ""
+        summary_last_id, attach_last_id = 0, 0
+    else:
+        rollup = f"""
+            SELECT day, summary_count, attach_count, log_count FROM {DAILY_TABLE}
+            UNION ALL"""
+        summary_last_id, attach_last_id = synced_ids
+
+    columns = []
+    params = []
+    for name, (start, end) in windows.items():
+        columns.append(
+            f"COALESCE(SUM(CASE WHEN day >= ? AND day < ? THEN summary_count END), 0) AS {name}_summary"
+        )
+        columns.append(
+            f"COALESCE(SUM(CASE WHEN day >= ? AND day < ? THEN attach_count END), 0) AS {name}_attach"
+        )
+        params += [start, end, start, end]
+
+    # 최근 수집일(= MAX(upd_time) 의 날짜)의 LOG 건수
+    columns.append("""COALESCE(SUM(CASE WHEN day = (
+                SELECT MAX(day) FROM counts WHERE summary_count > 0
+            ) THEN log_count END), 0) AS error_count""")
+
+    select_list = ",\n            ".join(columns)
+    sql = f"""
+        WITH counts AS ({rollup}
+            SELECT COALESCE(DATE(upd_time), '') AS day, 1 AS summary_count,
+                   0 AS attach_count,
+                   CASE WHEN category = 'LOG' THEN 1 ELSE 0 END AS log_count
+            FROM law_summary WHERE id > ?
+            UNION ALL
+            SELECT COALESCE(DATE(upd_time), ''), 0, 1, 0
+            FROM law_summary_attach WHERE id > ?
+        )
+        SELECT
+            {select_list}
+        FROM counts
+    """
+    return sql, (summary_last_id, attach_last_id, *params)
+
+
+async def run_daily_sync_loop(db_path: str, interval: float):
+    """interval 초마다 sync_daily_counts 를 스레드에서 실행하는 백그라운드 루프"""
+    while True:
+        try:
+            await asyncio.to_thread(sync_daily_counts, db_path)
+        except Exception as e:
+            logger.error(f"❌ 일자별 집계 동기화 실패: {e}")
+        await asyncio.sleep(interval)
@@ -0,0 +1,251 @@
+"""
+SQLite 읽기 전용 커넥션 풀
+
+law_summary.db 는 크롤러가 쓰고 UI 는 읽기만 한다.
+요청마다 connect/close 를 반복하지 않도록 mode=ro URI 로 연 커넥션을
+스레드 간에 재사용하고, 커넥션마다 PRAGMA(mmap_size, cache_size,
+temp_store, query_only)를 한 번만 적용한다.
+"""
+
+import os
+import queue
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+from app.backend.core.logger import get_logger
+from app.backend.core.config import config
+
+logger = get_logger(__name__)
+
+
+class PoolTimeoutError(RuntimeError):
+    """풀에서 정해진 시간 안에 커넥션을 얻지 못한 경우"""
+
+    pass
+
+
+class SQLiteConnectionPool:
+    """
+    스레드 안전한 SQLite 읽기 전용 커넥션 풀
+
+    Args:
+        db_path: 데이터베이스 파일 경로
+        max_size: 동시에 열 수 있는 최대 커넥션 수
+        timeout: 커넥션 대기 최대 시간(초)
+        mmap_size: PRAGMA mmap_size (bytes)
+        cache_size: PRAGMA cache_size (음수면 KiB 단위)
+        health_check_interval: 이 시간(초) 이상 쉬었던 커넥션은 꺼낼 때 점검
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        max_size: int = 8,
+        timeout: float = 5.0,
+        mmap_size: int = 256 * 1024 * 1024,
+        cache_size: int = -64 * 1024,
+        health_check_interval: float = 30.0,
+    ):
+        self.db_path = db_path
+        self.max_size = max(1, max_size)
+        self.timeout = timeout
+        self.mmap_size = mmap_size
+        self.cache_size = cache_size
+        self.health_check_interval = health_check_interval
+
+        self._idle = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(self.max_size)
+        self._lock = threading.Lock()
+        self._all = set()
+        self._last_used = {}
+        self._closed = False
+        self._created_count = 0
+
+    def _uri(self) -> str:
+        """읽기 전용 URI (file:///...?mode=ro)"""
+        return Path(os.path.abspath(self.db_path)).as_uri() + "?mode=ro"
+
+    def _create_connection(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self._uri(), uri=True, check_same_thread=False)
+        conn.execute(f"PRAGMA mmap_size = {int(self.mmap_size)}")
+        conn.execute(f"PRAGMA cache_size = {int(self.cache_size)}")
+        conn.execute("PRAGMA temp_store = MEMORY")
+        conn.execute("PRAGMA query_only = ON")
+        with self._lock:
+            self._all.add(conn)
+            self._created_count += 1
+        logger.debug(f"새 DB 커넥션 생성 (총 {len(self._all)}개)")
+        return conn
+
+    def _discard(self, conn: sqlite3.Connection):
+        with self._lock:
+            self._all.discard(conn)
+            self._last_used.pop(id(conn), None)
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+    @staticmethod
+    def is_healthy(conn: sqlite3.Connection) -> bool:
+        """커넥션이 쿼리를 수행할 수 있는지 확인"""
+        try:
+            conn.execute("SELECT 1").fetchone()
+            return True
+        except Exception:
+            return False
+
+    def acquire(self) -> sqlite3.Connection:
+        """풀에서 커넥션을 하나 꺼낸다 (없으면 새로 생성)"""
+        if self._closed:
+            raise RuntimeError("커넥션 풀이 이미 종료되었습니다.")
+        if not self._slots.acquire(timeout=self.timeout):
+            raise PoolTimeoutError(
+                f"DB 커넥션 대기 시간 초과 ({self.timeout}s, max_size={self.max_size})"
+            )
+        try:
+            while True:
+                try:
+                    conn = self._idle.get_nowait()
+                except queue.Empty:
+                    return self._create_connection()
+
+                idle_for = time.monotonic() - self._last_used.get(id(conn), 0)
+                if idle_for < self.health_check_interval or self.is_healthy(conn):
+                    return conn
+                logger.warning("⚠️ 비정상 DB 커넥션 폐기 후 재생성")
+                self._discard(conn)
+        except Exception:
+            self._slots.release()
+            raise
+
+    def release(self, conn: sqlite3.Connection, broken: bool = False):
+        """사용이 끝난 커넥션을 풀에 반납한다"""
+        try:
+            if broken or self._closed:
+                self._discard(conn)
+                return
+            if conn.in_transaction:
+                conn.rollback()
+            self._last_used[id(conn)] = time.monotonic()
+            self._idle.put(conn)
+        finally:
+            self._slots.release()
+
+    @contextmanager
+    def connection(self):
+        """with 문으로 커넥션을 빌려 쓰고 자동 반납"""
+        conn = self.acquire()
+        broken = False
+        try:
+            yield conn
+        except sqlite3.DatabaseError:
+            broken = not self.is_healthy(conn)
+            raise
+        finally:
+            self.release(conn, broken=broken)
+
+    def health_check(self) -> bool:
+        """풀에서 커넥션을 하나 빌려 SELECT 1 을 수행"""
+        try:
+            with self.connection() as conn:
+                return self.is_healthy(conn)
+        except Exception as e:
+            logger.error(f"❌ DB 풀 헬스 체크 실패: {e}")
+            return False
+
+    def stats(self) -> dict:
+        """풀 사용 현황"""
+        with self._lock:
+            total = len(self._all)
+        idle = self._idle.qsize()
+        return {
+            "max_size": self.max_size,
+            "open": total,
+            "idle": idle,
+            "in_use": total - idle,
+            "created": self._created_count,
+        }
+
+    def close_all(self):
+        """모든 커넥션을 닫는다 (shutdown 시 호출)"""
+        self._closed = True
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._discard(conn)
+        with self._lock:
+            remaining = list(self._all)
+        for conn in remaining:
+            self._discard(conn)
+        logger.info("DB 커넥션 풀 종료")
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_pool() -> SQLiteConnectionPool:
+    """프로세스 전역 커넥션 풀 반환 (최초 호출 시 생성)"""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = SQLiteConnectionPool(
+                    config.DB_PATH,
+                    max_size=config.DB_POOL_SIZE,
+                    timeout=config.DB_POOL_TIMEOUT,
+                    mmap_size=config.DB_MMAP_SIZE,
+                    cache_size=config.DB_CACHE_SIZE,
+                )
+                logger.info(
+                    f"DB 커넥션 풀 생성: {config.DB_PATH} (max_size={config.DB_POOL_SIZE})"
+                )
+    return _pool
+
+
+@contextmanager
+def get_connection():
+    """
+    전역 풀에서 읽기 전용 커넥션을 빌려준다
+
+    사용 예:
+        with get_connection() as conn:
+            conn.execute("SELECT COUNT(*) FROM law_summary").fetchone()
+    """
+    with get_pool().connection() as conn:
+        yield conn
+
+
+@contextmanager
+def read_transaction(conn: sqlite3.Connection):
+    """
+    with 블록의 SELECT 들을 한 읽기 트랜잭션(같은 스냅샷)에서 실행
+
+    동기화 위치(ui_meta)와 집계·색인 테이블을 따로 읽으면 그 사이에 커밋된
+    동기화 배치가 양쪽에서 한 번씩 세어진다.
+
+    사용 예:
+        with get_connection() as conn, read_transaction(conn):
+            last_id = fts_last_synced_id(conn)
+            conn.execute(..., (last_id,))
+    """
+    conn.execute("BEGIN")
+    try:
+        yield conn
+    finally:
+        conn.rollback()
+
+
+def close_pool():
+    """전역 커넥션 풀 종료"""
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.close_all()
+            _pool = None
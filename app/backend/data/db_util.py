@@ -3,122 +3,280 @@ Database access utilities for FastAPI backend
 """
 
 import os
+import json
+import base64
 import sqlite3
-import yaml
-import pandas as pd
-from sqlite3 import connect
-from app.backend.core.logger import get_logger
+from datetime import date, datetime, timedelta
+from app.backend.core.logger import get_logger, sql_log_sampled
 from app.backend.core.config import config
+from app.backend.core.metrics import timed_query
+from app.backend.data.db_pool import get_connection, read_transaction
+from app.backend.data.slow_query_log import profiled_fetchall, profiled_fetch_dicts
+from app.backend.data.daily_rollup import (
+    daily_synced_ids,
+    build_window_counts_query,
+)
+from app.backend.data.summary_derived import DERIVED_TABLE, derived_synced_id
+from app.backend.data.text_util import html_excerpt, sanitize_html
+from app.backend.data.yaml_sync import ensure_yaml_table, sync_yaml_info
+from app.backend.data.fts_index import (
+    can_use_fts,
+    fts_last_synced_id,
+    build_fts_hits_query,
+    build_fts_snippet_query,
+)
 
 logger = get_logger(__name__)
 
 
+# 날짜 범위 조건은 upd_time 컬럼을 함수로 감싸지 않고 반열린 구간
+# (upd_time >= 시작일 AND upd_time < 종료일+1) 으로 비교해야 인덱스를 탄다.
+SUMMARY_ATTACH_COUNT_SQL = """
+    SELECT
+        (SELECT COUNT(*) FROM law_summary
+          WHERE upd_time >= ? AND upd_time < ?) AS summary_count,
+        (SELECT COUNT(*) FROM law_summary_attach
+          WHERE upd_time >= ? AND upd_time < ?) AS attach_count
+"""
+
+ERROR_COUNT_SQL = """
+    SELECT COUNT(*)
+    FROM law_summary
+    WHERE category = 'LOG'
+    AND upd_time >= (SELECT DATE(MAX(upd_time)) FROM law_summary)
+    AND upd_time < (SELECT DATE(MAX(upd_time), '+1 day') FROM law_summary)
+"""
+
+# 발췌문을 만들 때 읽는 summary 앞부분 길이 (전체 HTML 을 읽지 않도록)
+EXCERPT_SOURCE_CHARS = 2000
+EXCERPT_SOURCE = f"SUBSTR(a.summary, 1, {EXCERPT_SOURCE_CHARS})"
+
+# 발췌문 컬럼. summary_derived 가 있으면 미리 만든 발췌문을 쓰고, 아직 반영되지
+# 않은 최신 행만 "excerpt_source"(summary 앞부분)를 읽어 _apply_excerpts 가 변환한다.
+RAW_EXCERPT_COLUMNS = f'''NULL as "excerpt",
+        {EXCERPT_SOURCE} as "excerpt_source"'''
+DERIVED_EXCERPT_COLUMNS = f'''d.excerpt as "excerpt",
+        CASE WHEN d.id IS NULL THEN {EXCERPT_SOURCE} END as "excerpt_source"'''
+
+# 파생 컬럼 (alias d, 미반영 행은 NULL)
+DERIVED_JOIN = f"""
+    LEFT JOIN
+        {DERIVED_TABLE} d
+    ON
+        d.id = a.id
+"""
+
+# 목록/검색 행의 컬럼 별칭은 API 응답 필드명과 같다.
+# (site_name/page_id 는 사이트·페이지 명칭, 실제 코드는 site_code/page_code)
+# summary HTML 은 목록에 싣지 않고 /api/v1/items/{id} 로 따로 조회한다.
+# {excerpt_columns} 는 summary_row_columns 가 채운다.
+SUMMARY_ROW_COLUMNS = """
+        a.id as "id",
+        b.h_name as "site_name",
+        b.desc as "page_id",
+        a.title as "title",
+        a.register_date as "registration_date",
+        a.upd_time as "collection_date",
+        b.url as "site_url",
+        b.detail_url as "detail_url",
+        a.org_url as "org_url",
+        {excerpt_columns},
+        CAST(a.real_seq AS TEXT) as "real_seq",
+        a.site_name as "site_code",
+        a.page_id as "page_code",
+        COALESCE(c.attach_count, 0) as "attach_count"
+"""
+
+# 행별 첨부파일 수 (alias c). {parent_ids} 는 대상 게시글 id 를 돌려주는 SQL 이며
+# 대상 게시글의 첨부파일만 parent_id 인덱스로 읽어 한 번에 묶는다 (행별 조회 없음).
+ATTACH_COUNT_JOIN = """
+    LEFT JOIN (
+        SELECT parent_id, COUNT(*) AS attach_count
+        FROM law_summary_attach
+        WHERE parent_id IN ({parent_ids})
+        GROUP BY parent_id
+    ) c
+    ON
+        c.parent_id = a.id
+"""
+
+# 파라미터: (시작, 종료) 를 첨부파일 수 집계와 목록 조건에 두 번
+# {columns}, {derived_join} 은 build_summary_list_sql 이 채운다.
+SUMMARY_LIST_SQL = f"""
+    SELECT{{columns}}
+    FROM
+        law_summary a
+    INNER JOIN
+        yaml_info b
+    ON
+        a.site_name = b.site_name AND a.page_id = b.page_id
+    {ATTACH_COUNT_JOIN.format(
+        parent_ids="SELECT id FROM law_summary WHERE upd_time >= ? AND upd_time < ?"
+    )}{{derived_join}}
+    WHERE
+        a.upd_time >= ? AND a.upd_time < ?
+    ORDER BY
+        a.site_name, a.register_date DESC
+"""
+
+# 게시글 하나의 summary (목록에서 펼칠 때 조회). 정제된 HTML 이 아직 없으면 원문
+SUMMARY_ITEM_SQL = """
+    SELECT a.id AS id, NULL AS safe_html, a.summary AS summary
+    FROM law_summary a
+    WHERE a.id = ?
+"""
+DERIVED_ITEM_SQL = f"""
+    SELECT a.id AS id, d.safe_html AS safe_html, a.summary AS summary
+    FROM law_summary a{DERIVED_JOIN}
+    WHERE a.id = ?
+"""
+
+
+def summary_row_columns(derived: bool) -> str:
+    """목록/검색 행 컬럼 (derived: summary_derived 를 조인하는지)"""
+    return SUMMARY_ROW_COLUMNS.format(
+        excerpt_columns=DERIVED_EXCERPT_COLUMNS if derived else RAW_EXCERPT_COLUMNS
+    )
+
+
+def build_summary_list_sql(derived: bool) -> str:
+    """기간별 목록 쿼리 (derived: summary_derived 의 발췌문 사용)"""
+    return SUMMARY_LIST_SQL.format(
+        columns=summary_row_columns(derived),
+        derived_join=DERIVED_JOIN if derived else "",
+    )
+
+
+ATTACH_LIST_SQL = """
+    SELECT id, parent_id, save_folder, save_file_name
+    FROM law_summary_attach
+    WHERE parent_id = (
+        SELECT id FROM law_summary
+        WHERE site_name = ? AND page_id = ? AND real_seq = ?
+    )
+"""
+
+
+# 여러 게시글 (site_name, page_id, real_seq) 의 첨부파일을 한 번에 조회
+# {values} 는 "(?, ?, ?)" 를 키 수만큼 쉼표로 이은 것
+ATTACH_BATCH_SQL = """
+    SELECT
+        a.site_name AS site_name,
+        a.page_id AS page_id,
+        CAST(a.real_seq AS TEXT) AS real_seq,
+        b.id AS id,
+        b.parent_id AS parent_id,
+        b.save_folder AS save_folder,
+        b.save_file_name AS save_file_name
+    FROM law_summary a
+    INNER JOIN law_summary_attach b
+        ON b.parent_id = a.id
+    WHERE (a.site_name, a.page_id, a.real_seq) IN (VALUES {values})
+"""
+# 한 쿼리에 넣는 최대 키 수 (SQLite 변수 개수 제한 999 이내)
+ATTACH_BATCH_CHUNK = 300
+
+# ZIP 묶음 다운로드 대상 첨부파일 (조건은 bundle_attach_rows 에서 붙임)
+BUNDLE_ATTACH_SQL = """
+    SELECT
+        a.site_name AS site_name,
+        a.page_id AS page_id,
+        CAST(a.real_seq AS TEXT) AS real_seq,
+        b.save_folder AS save_folder,
+        b.save_file_name AS save_file_name
+    FROM law_summary a
+    INNER JOIN law_summary_attach b ON b.parent_id = a.id
+"""
+
+
+def date_range_bounds(from_date, to_date=None):
+    """
+    날짜 범위를 upd_time 비교용 반열린 구간 [start, end) 으로 변환
+
+    Args:
+        from_date: 시작 날짜 (YYYY-MM-DD)
+        to_date: 종료 날짜 (YYYY-MM-DD). None이면 from_date와 동일
+
+    Returns:
+        tuple: ("YYYY-MM-DD", 종료일 다음날 "YYYY-MM-DD")
+    """
+    if to_date is None:
+        to_date = from_date
+    if isinstance(to_date, (date, datetime)):
+        to_date = to_date.strftime("%Y-%m-%d")
+    if isinstance(from_date, (date, datetime)):
+        from_date = from_date.strftime("%Y-%m-%d")
+    end = datetime.strptime(to_date[:10], "%Y-%m-%d") + timedelta(days=1)
+    return from_date[:10], end.strftime("%Y-%m-%d")
+
+
 def get_summary_db_file():
     """Summary DB 파일 경로 반환"""
     logger.debug(f"DB_PATH: {config.DB_PATH}")
     return config.DB_PATH
 
 
-def create_and_fill_yaml_table(db_path: str, yaml_path: str):
+def create_and_fill_yaml_table(db_path: str, yaml_path: str) -> bool:
     """
     yaml_info 테이블 생성 및 YAML 데이터 로드
 
+    YAML 파일 해시가 지난 동기화 때와 같으면 아무것도 쓰지 않고, 다르면
+    바뀐 페이지만 반영한다 (yaml_sync.sync_yaml_info).
+
     Args:
         db_path (str): 데이터베이스 파일 경로
         yaml_path (str): YAML 파일 경로
 
+    Returns:
+        bool: yaml_info 행을 바꿨으면 True
+
     Raises:
         Exception: 테이블 생성 또는 데이터 로드 중 오류 발생 시
     """
     try:
-        conn = sqlite3.connect(db_path)
-        cursor = conn.cursor()
-
-        # 테이블 생성
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS yaml_info (
-                site_name TEXT NOT NULL,
-                page_id TEXT NOT NULL,
-                h_name TEXT,
-                desc TEXT,
-                url TEXT,
-                detail_url TEXT,
-                PRIMARY KEY (site_name, page_id)
-            );
-        """)
-        conn.commit()
-        logger.info("yaml_info 테이블 생성 완료")
-
-        # YAML 파일 읽기 및 데이터 삽입
         if not os.path.exists(yaml_path):
             logger.warning(f"YAML 파일을 찾을 수 없습니다: {yaml_path}")
-            conn.close()
-            return
-
-        with open(yaml_path, 'r', encoding='utf-8') as f:
-            data = yaml.safe_load(f)
-
-        # 기존 데이터 삭제
-        cursor.execute("DELETE FROM yaml_info")
-
-        # YAML 데이터 파싱 및 삽입
-        site_count = 0
-        page_count = 0
-
-        for site_name, site_info in data.items():
-            h_name = site_info.get('h_name', '')
-            base_url = site_info.get('url', '')
-            site_count += 1
-
-            # pages 배열 처리
-            pages = site_info.get('pages', [])
-            for page in pages:
-                cursor.execute("""
-                    INSERT INTO yaml_info
-                    (site_name, page_id, h_name, desc, url, detail_url)
-                    VALUES (?, ?, ?, ?, ?, ?)
-                """, (
-                    site_name,
-                    page.get('id', ''),
-                    h_name,
-                    page.get('desc', ''),
-                    base_url,
-                    page.get('detail_url', '')
-                ))
-                page_count += 1
-
-        conn.commit()
-        logger.info(f"YAML 데이터 로드 완료: 사이트 {site_count}개, 페이지 {page_count}개")
-        conn.close()
+            conn = sqlite3.connect(db_path, timeout=30)
+            try:
+                ensure_yaml_table(conn)
+                conn.commit()
+            finally:
+                conn.close()
+            return False
+
+        result = sync_yaml_info(db_path, yaml_path)
+        return bool(result["upserted"] or result["deleted"])
 
     except Exception as e:
         logger.error(f"yaml_info 테이블 처리 중 오류: {e}")
-        if 'conn' in locals():
-            conn.close()
         raise
 
 
-def get_data_frame_summary(sql: str, params: tuple = ()) -> pd.DataFrame:
-    """쿼리를 실행하고 Pandas DataFrame으로 반환"""
-    summary_path = get_summary_db_file()
-    conn = connect(summary_path)
+def query_rows(sql: str, params: tuple = (), name: str = "query_rows") -> list:
+    """
+    쿼리를 실행하고 [{컬럼 별칭: 값}, ...] 으로 반환
 
+    name 은 느린 쿼리 기록에 남는 쿼리 이름이다.
+    """
     try:
-        # SQL 쿼리 로깅
-        logger.info(f"📊 SQL 실행: {sql}")
-        if params:
-            logger.info(f"📌 파라미터: {params}")
-
-        df = pd.read_sql_query(sql, conn, params=params)
-        logger.info(f"✅ SQL 결과: {len(df)} rows 반환")
-        return df
+        # SQL 쿼리 로깅 (초당 SQL_LOG_PER_SECOND 건까지만)
+        sampled = sql_log_sampled()
+        if sampled:
+            logger.info(f"📊 SQL 실행: {sql}")
+            if params:
+                logger.info(f"📌 파라미터: {params}")
+
+        with get_connection() as conn:
+            rows = profiled_fetch_dicts(conn, name, sql, params)
+        if sampled:
+            logger.info(f"✅ SQL 결과: {len(rows)} rows 반환")
+        return rows
     except Exception as e:
         logger.error(f"❌ DB 조회 오류: {e}")
         raise RuntimeError(f"DB 조회 오류: {e}")
-    finally:
-        conn.close()
 
 
+@timed_query("total_site_attach_counts")
 def total_site_attach_counts(from_date, to_date=None):
     """
     특정 날짜 범위의 전체 사이트와 페이지 수를 반환합니다.
@@ -127,62 +285,76 @@ def total_site_attach_counts(from_date, to_date=None):
         from_date: 시작 날짜 (YYYY-MM-DD)
         to_date: 종료 날짜 (YYYY-MM-DD). None이면 from_date와 동일 (특정 날짜만 조회)
     """
-    summary_path = get_summary_db_file()
-    conn = connect(summary_path)
-    cursor = conn.cursor()
-
-    if to_date is None:
-        # 특정 날짜만 조회 (오늘)
-        sql = """
-            SELECT
-                (SELECT COUNT(*) FROM law_summary WHERE DATE(upd_time) = ?) AS summary_count,
-                (SELECT COUNT(*) FROM law_summary_attach WHERE DATE(upd_time) = ?) AS attach_count
-        """
-        params = (from_date, from_date)
-    else:
-        # 날짜 범위 조회 (3일, 7일)
-        sql = """
-            SELECT
-                (SELECT COUNT(*) FROM law_summary WHERE DATE(upd_time) BETWEEN ? AND ?) AS summary_count,
-                (SELECT COUNT(*) FROM law_summary_attach WHERE DATE(upd_time) BETWEEN ? AND ?) AS attach_count
-        """
-        params = (from_date, to_date, from_date, to_date)
-
-    logger.info(f"📊 SQL 실행 (total_site_attach_counts): {sql.strip()}")
-    logger.info(f"📌 파라미터: from_date={from_date}, to_date={to_date}")
-
-    cursor.execute(sql, params)
-
-    summary_count, attach_count = cursor.fetchone()
-    logger.info(f"✅ SQL 결과: summary_count={summary_count}, attach_count={attach_count}")
-    conn.close()
+    start, end = date_range_bounds(from_date, to_date)
+    sql = SUMMARY_ATTACH_COUNT_SQL
+    params = (start, end, start, end)
+
+    sampled = sql_log_sampled()
+    if sampled:
+        logger.info(f"📊 SQL 실행 (total_site_attach_counts): {sql.strip()}")
+        logger.info(f"📌 파라미터: from_date={from_date}, to_date={to_date}")
+
+    with get_connection() as conn:
+        summary_count, attach_count = profiled_fetchall(
+            conn, "total_site_attach_counts", sql, params
+        )[0]
+    if sampled:
+        logger.info(f"✅ SQL 결과: summary_count={summary_count}, attach_count={attach_count}")
     return summary_count, attach_count
 
 
+@timed_query("error_count_of_last_24h")
 def error_count_of_last_24h():
     """
     최근 24시간 이내의 에러 로그 수를 반환합니다.
     """
-    summary_path = get_summary_db_file()
-    conn = connect(summary_path)
-    cursor = conn.cursor()
+    sql = ERROR_COUNT_SQL
+
+    sampled = sql_log_sampled()
+    if sampled:
+        logger.info(f"📊 SQL 실행 (error_count_of_last_24h): {sql.strip()}")
+    with get_connection() as conn:
+        error_count = profiled_fetchall(conn, "error_count_of_last_24h", sql)[0][0]
+    if sampled:
+        logger.info(f"✅ SQL 결과: error_count={error_count}")
+    return error_count
 
-    sql = """
-        SELECT COUNT(*)
-        FROM law_summary
-        WHERE category = 'LOG'
-        AND DATE(upd_time) = (SELECT DATE(MAX(upd_time)) FROM law_summary)
+
+@timed_query("window_counts")
+def window_counts(windows: dict) -> dict:
     """
+    여러 기간의 게시글/첨부파일 수와 최근 수집일 오류 건수를 한 번의 쿼리로 반환
 
-    logger.info(f"📊 SQL 실행 (error_count_of_last_24h): {sql.strip()}")
-    cursor.execute(sql)
-
-    error_count = cursor.fetchone()[0]
-    logger.info(f"✅ SQL 결과: error_count={error_count}")
-    conn.close()
-    return error_count
+    daily_counts 집계 테이블과 아직 집계되지 않은 최신 행(id 범위)만 읽는다.
 
+    Args:
+        windows: {이름: (from_date, to_date)} — to_date 가 None 이면 from_date 하루
 
+    Returns:
+        {이름: (summary_count, attach_count), ..., "error_count": 오류 건수}
+    """
+    bounds = {
+        name: date_range_bounds(from_date, to_date)
+        for name, (from_date, to_date) in windows.items()
+    }
+    sampled = sql_log_sampled()
+    # 동기화 위치와 집계 테이블을 같은 스냅샷에서 읽어야 결과가 정확하다
+    with get_connection() as conn, read_transaction(conn):
+        sql, params = build_window_counts_query(bounds, daily_synced_ids(conn))
+        if sampled:
+            logger.info(f"📊 SQL 실행 (window_counts): {bounds}")
+        row = profiled_fetchall(conn, "window_counts", sql, params)[0]
+
+    result = {
+        name: (row[i * 2], row[i * 2 + 1]) for i, name in enumerate(bounds)
+    }
+    result["error_count"] = row[-1]
+    if sampled:
+        logger.info(f"✅ SQL 결과: {result}")
+    return result
+
+
+@timed_query("get_collection_period")
 def get_collection_period():
     """
     데이터 수집 기간 조회 (첫날 ~ 최근날)
@@ -190,10 +362,6 @@ def get_collection_period():
     Returns:
         tuple: (first_date, last_date) 또는 (None, None)
     """
-    summary_path = get_summary_db_file()
-    conn = connect(summary_path)
-    cursor = conn.cursor()
-
     sql = """
         SELECT
             DATE(MIN(upd_time)) as first_date,
@@ -201,21 +369,23 @@ def get_collection_period():
         FROM law_summary
     """
 
-    logger.info(f"📊 SQL 실행 (get_collection_period): {sql.strip()}")
-    cursor.execute(sql)
+    sampled = sql_log_sampled()
+    if sampled:
+        logger.info(f"📊 SQL 실행 (get_collection_period): {sql.strip()}")
+    with get_connection() as conn:
+        result = profiled_fetchall(conn, "get_collection_period", sql)
+    first_date, last_date = result[0] if result else (None, None)
 
-    result = cursor.fetchone()
-    first_date, last_date = result if result else (None, None)
-
-    logger.info(f"✅ SQL 결과: first_date={first_date}, last_date={last_date}")
-    conn.close()
+    if sampled:
+        logger.info(f"✅ SQL 결과: first_date={first_date}, last_date={last_date}")
 
     return first_date, last_date
 
 
-def get_summary_list(from_date: str, to_date: str = None) -> pd.DataFrame:
+@timed_query("get_summary_list")
+def get_summary_list(from_date: str, to_date: str = None) -> list:
     """
-    특정 날짜 범위의 요약 목록 반환
+    특정 날짜 범위의 요약 목록 반환 (SUMMARY_ROW_COLUMNS 별칭의 dict 리스트)
 
     Args:
         from_date: 시작 날짜 (YYYY-MM-DD)
@@ -224,69 +394,140 @@ def get_summary_list(from_date: str, to_date: str = None) -> pd.DataFrame:
     if to_date is None:
         to_date = from_date
 
-    sql = """
-        SELECT
-            b.h_name as "사이트",
-            b.desc as "페이지",
-            a.title "제목",
-            a.register_date as "등록일",
-            a.upd_time as "수집일시",
-            a.site_name,
-            a.page_id,
-            a.real_seq ,
-            b.url as "site_url",
-            b.detail_url as "detail_url",
-            a.org_url as "org_url",
-            a.summary
-
-        FROM
-            law_summary a
-        INNER JOIN
-            yaml_info b
-        ON
-            a.site_name = b.site_name AND a.page_id = b.page_id
-        WHERE
-            DATE(a.upd_time) BETWEEN ? AND ?
-        ORDER BY
-            a.site_name, a.register_date DESC
-    """
-    summary_path = get_summary_db_file()
-    conn = connect(summary_path)
-
     try:
-        params = (from_date, to_date)
-        logger.info(f"📊 get_summary_list 실행: from_date={from_date}, to_date={to_date}")
-        df = pd.read_sql_query(sql, conn, params=params)
-        logger.info(f"✅ 조회 결과: {len(df)}건")
-        return df
+        params = date_range_bounds(from_date, to_date) * 2
+        sampled = sql_log_sampled()
+        if sampled:
+            logger.info(f"📊 get_summary_list 실행: from_date={from_date}, to_date={to_date}")
+        with get_connection() as conn:
+            sql = build_summary_list_sql(derived_synced_id(conn) is not None)
+            rows = _apply_excerpts(profiled_fetch_dicts(conn, "get_summary_list", sql, params))
+        if sampled:
+            logger.info(f"✅ 조회 결과: {len(rows)}건")
+        return rows
     except Exception as e:
         raise RuntimeError(f"DB 조회 오류: {e}")
-    finally:
-        conn.close()
 
 
+def _apply_excerpts(rows: list) -> list:
+    """미리 만든 발췌문이 없는 행은 "excerpt_source"(summary 앞부분)로 발췌문을 만듦"""
+    for row in rows:
+        source = row.pop("excerpt_source", None)
+        if row.get("excerpt") is None:
+            row["excerpt"] = html_excerpt(source)
+    return rows
+
+
+@timed_query("get_summary_item")
+def get_summary_item(item_id: int):
+    """
+    게시글 하나의 정제된 summary HTML
+
+    summary_derived 에 아직 반영되지 않은 행은 원문을 바로 정제한다.
+
+    Returns:
+        {"id", "summary"} 또는 None (없는 id)
+    """
+    with get_connection() as conn:
+        sql = DERIVED_ITEM_SQL if derived_synced_id(conn) is not None else SUMMARY_ITEM_SQL
+        rows = profiled_fetch_dicts(conn, "get_summary_item", sql, (item_id,))
+    if not rows:
+        return None
+    row = rows[0]
+    safe_html = row["safe_html"]
+    if safe_html is None:
+        safe_html = sanitize_html(row["summary"])
+    return {"id": row["id"], "summary": safe_html}
+
+
+@timed_query("attach_list")
 def attach_list(site_name: str, page_id: str, real_seq: str):
     """
     특정 사이트와 페이지의 첨부파일 목록을 반환합니다.
     """
-    query = """
-    SELECT id, parent_id, save_folder, save_file_name
-    FROM law_summary_attach
-    WHERE parent_id = (
-        SELECT id FROM law_summary
-        WHERE site_name = ? AND page_id = ? AND real_seq = ?
-    )
+    return query_rows(ATTACH_LIST_SQL, (site_name, page_id, real_seq), "attach_list")
+
+
+@timed_query("attach_list_batch")
+def attach_list_batch(keys: list) -> list:
     """
-    return get_data_frame_summary(query, (site_name, page_id, real_seq))
+    여러 게시글의 첨부파일 목록 (게시글마다 attach_list 를 부르지 않도록)
 
+    Args:
+        keys: [(site_name, page_id, real_seq), ...]
 
+    Returns:
+        [{"site_name", "page_id", "real_seq", "id", "parent_id", "save_folder", "save_file_name"}, ...]
+        site_name/page_id/real_seq 는 요청한 키 값 그대로
+    """
+    rows = []
+    keys = list(dict.fromkeys(tuple(str(value) for value in key) for key in keys))
+    for start in range(0, len(keys), ATTACH_BATCH_CHUNK):
+        chunk = keys[start:start + ATTACH_BATCH_CHUNK]
+        sql = ATTACH_BATCH_SQL.format(values=", ".join(["(?, ?, ?)"] * len(chunk)))
+        params = tuple(value for key in chunk for value in key)
+        rows.extend(query_rows(sql, params, "attach_list_batch"))
+    # ORDER BY 를 SQL 에 넣으면 통계가 없을 때 parent_id 인덱스 대신 자동 인덱스를 만든다
+    rows.sort(key=lambda row: row["id"])
+    return rows
+
+
+@timed_query("bundle_attach_rows")
+def bundle_attach_rows(
+    site_name: str = None,
+    page_id: str = None,
+    real_seq: str = None,
+    date_from: str = None,
+    date_to: str = None,
+    site_names: list = None,
+) -> list:
+    """
+    ZIP 묶음 다운로드 대상 첨부파일 목록
+
+    게시글 하나(site_name, page_id, real_seq), 페이지 하나(site_name, page_id),
+    수집일(upd_time) 범위 중 주어진 조건을 모두 만족하는 첨부파일을
+    사이트·페이지·게시글 순으로 반환한다.
+
+    Returns:
+        [{"site_name", "page_id", "real_seq", "save_folder", "save_file_name"}, ...]
+    """
+    conditions = []
+    params = []
+    if site_name is not None:
+        conditions.append("a.site_name = ?")
+        params.append(site_name)
+    if page_id is not None:
+        conditions.append("a.page_id = ?")
+        params.append(page_id)
+    if real_seq is not None:
+        conditions.append("a.real_seq = ?")
+        params.append(real_seq)
+    if site_names:
+        conditions.append(f"a.site_name IN ({', '.join('?' * len(site_names))})")
+        params.extend(site_names)
+    if date_from is not None:
+        start, end = date_range_bounds(date_from, date_to or date_from)
+        conditions.append("a.upd_time >= ? AND a.upd_time < ?")
+        params.extend([start, end])
+
+    sql = BUNDLE_ATTACH_SQL
+    if conditions:
+        sql += " WHERE " + " AND ".join(conditions)
+    sql += " ORDER BY a.site_name, a.page_id, a.id, b.id"
+    return query_rows(sql, tuple(params), "bundle_attach_rows")
+
+
+@timed_query("site_static")
 def site_static():
     """
     전체 사이트의 통계 정보를 반환합니다.
+
+    Returns:
+        [{"site": 사이트명, "count": 게시글수}, ...]
     """
     query = """
         SELECT
-            b.h_name as "사이트", count(*) as "게시글수"
+            b.h_name as "site", count(*) as "count"
         FROM
             law_summary a
         INNER JOIN
@@ -295,16 +536,20 @@ def site_static():
             a.site_name = b.site_name AND a.page_id = b.page_id
 		GROUP BY b.h_name
     """
-    return get_data_frame_summary(query)
+    return query_rows(query, name="site_static")
 
 
+@timed_query("site_static_filecount")
 def site_static_filecount():
     """
     전체 사이트의 첨부파일 통계 정보를 반환합니다.
+
+    Returns:
+        [{"site": 사이트명, "file_count": 첨부파일수}, ...]
     """
     query = """
         select
-            c.h_name as "사이트",count(*) as "첨부파일수"
+            c.h_name as "site",count(*) as "file_count"
         from law_summary a
             inner join law_summary_attach b
             on a.id = b.parent_id
@@ -312,57 +557,58 @@ def site_static_filecount():
             on a.site_name = c.site_name and a.page_id = c.page_id
         group by c.h_name
     """
-    return get_data_frame_summary(query)
+    return query_rows(query, name="site_static_filecount")
 
 
+@timed_query("detail_static")
 def detail_static():
-    """사이트별 상세 통계 정보 반환"""
-    sql1 = """
-        SELECT
-            b.h_name as "사이트",
-            b.desc as "페이지",
-            count(*) as '게시글수'
-        FROM
-            law_summary a
-        INNER JOIN
-            yaml_info b
-        ON
-            a.site_name = b.site_name AND a.page_id = b.page_id
-        GROUP BY b.h_name, b.desc
-        ORDER BY b.h_name, b.desc
     """
-    sql2 = """
-        SELECT
-            c.h_name as '사이트',
-            c.desc as '페이지',
-            count(*) as '첨부파일수'
-        FROM law_summary a
-            INNER JOIN law_summary_attach b
-            ON a.id = b.parent_id
-            INNER JOIN yaml_info c
-            ON a.site_name = c.site_name AND a.page_id = c.page_id
-        GROUP BY c.h_name, c.desc
-        ORDER BY c.h_name, c.desc
-    """
-    df1 = get_data_frame_summary(sql1)
-    df2 = get_data_frame_summary(sql2)
-
-    # 두 DataFrame을 합치기
-    df = pd.merge(
-        df1,
-        df2,
-        on=["사이트", "페이지"],
-        how="outer"
-    )
-
-    # NaN 값을 0으로 대체
-    df.fillna(0, inplace=True)
+    사이트별 상세 통계 정보 반환
 
-    # 정수형으로 변환
-    df["게시글수"] = df["게시글수"].astype(int)
-    df["첨부파일수"] = df["첨부파일수"].astype(int)
+    페이지별 게시글 수에 첨부파일 수를 LEFT JOIN 으로 붙인다. 첨부파일은
+    항상 게시글에 딸려 있으므로 첨부파일 집계의 (사이트, 페이지)는
+    게시글 집계에 모두 포함된다.
 
-    return df
+    Returns:
+        [{"site": 사이트, "page": 페이지, "posts": 게시글수, "files": 첨부파일수}, ...]
+    """
+    sql = """
+        WITH posts AS (
+            SELECT
+                b.h_name as site,
+                b.desc as page,
+                count(*) as posts
+            FROM
+                law_summary a
+            INNER JOIN
+                yaml_info b
+            ON
+                a.site_name = b.site_name AND a.page_id = b.page_id
+            GROUP BY b.h_name, b.desc
+        ),
+        files AS (
+            SELECT
+                c.h_name as site,
+                c.desc as page,
+                count(*) as files
+            FROM law_summary a
+                INNER JOIN law_summary_attach b
+                ON a.id = b.parent_id
+                INNER JOIN yaml_info c
+                ON a.site_name = c.site_name AND a.page_id = c.page_id
+            GROUP BY c.h_name, c.desc
+        )
+        SELECT
+            p.site as "site",
+            p.page as "page",
+            p.posts as "posts",
+            COALESCE(f.files, 0) as "files"
+        FROM posts p
+        LEFT JOIN files f
+        ON f.site IS p.site AND f.page IS p.page
+        ORDER BY p.site, p.page
+    """
+    return query_rows(sql, name="detail_static")
 
 
 def yaml_info_to_html():
@@ -378,9 +624,10 @@ def yaml_info_to_html():
         ORDER BY
             site_name, page_id
     """
-    df = get_data_frame_summary(query)
+    with get_connection() as conn:
+        rows = profiled_fetchall(conn, "yaml_info_to_html", query)
 
-    if df.empty:
+    if not rows:
         return "<p>데이터가 없습니다.</p>"
 
     html = """
@@ -430,102 +677,241 @@ def yaml_info_to_html():
     prev_site_name = None
     site_color_index = 0
 
-    for _, row in df.iterrows():
+    parts = [html]
+    for site_name, _page_id, h_name, desc, _url, detail_url in rows:
         # 사이트가 바뀌면 색상 인덱스 토글
-        if prev_site_name is not None and prev_site_name != row['site_name']:
+        if prev_site_name is not None and prev_site_name != site_name:
             site_color_index = 1 - site_color_index  # 0 <-> 1 토글
-        prev_site_name = row['site_name']
+        prev_site_name = site_name
 
-        detail_url = row["detail_url"] if row["detail_url"] else "#"
-        html += f"<tr class='site-color-{site_color_index}'>"
-        html += f"<td>{row['h_name']}</td>"
-        html += f"<td>{row['desc']}</td>"
-        html += f'<td><a href="{detail_url}" target="_blank">{detail_url}</a></td>'
-        html += "</tr>"
+        detail_url = detail_url if detail_url else "#"
+        parts.append(
+            f"<tr class='site-color-{site_color_index}'>"
+            f"<td>{h_name}</td>"
+            f"<td>{desc}</td>"
+            f'<td><a href="{detail_url}" target="_blank">{detail_url}</a></td>'
+            "</tr>"
+        )
 
-    html += "</tbody></table>"
-    return html
+    parts.append("</tbody></table>")
+    return "".join(parts)
 
 
+@timed_query("get_site_and_code_dict")
 def get_site_and_code_dict():
     """사이트 코드와 이름 매핑 딕셔너리 반환"""
     sql = """
         select DISTINCT SITE_NAME, H_NAME from yaml_info ORDER BY H_NAME
     """
-    df = get_data_frame_summary(sql)
+    with get_connection() as conn:
+        rows = profiled_fetchall(conn, "get_site_and_code_dict", sql)
     site_dict = {}
-    for _, row in df.iterrows():
-        site_name = row["site_name"]
-        h_name = row["h_name"]
+    for site_name, h_name in rows:
         if site_name not in site_dict:
             site_dict[site_name] = h_name
     return site_dict
 
 
-def search_law_summary(site_names=None, keyword=None):
-    """법령 요약 검색 함수"""
-    try:
-        # 검색 조건 로깅
-        logger.info(f"🔍 검색 시작 - 사이트: {site_names}, 키워드: '{keyword}'")
+# 사이트/키워드 목록 정렬 순서 (keyset 커서도 같은 키를 사용).
+# idx_law_summary_site_page_reg(+ rowid) 를 역순으로 읽는 순서와 같아 정렬 단계(TEMP B-TREE)가 없다
+SEARCH_ORDER_BY = "a.site_name DESC, a.page_id DESC, a.register_date DESC, a.id DESC"
 
-        base_query = """
-        SELECT
-            b.h_name as "사이트",
-            b.desc as "페이지",
-            a.title as "제목",
-            a.register_date as "등록일",
-            a.upd_time as "수집일시",
-            a.site_name,
-            a.page_id,
-            a.real_seq,
-            b.url as "site_url",
-            b.detail_url as "detail_url",
-            a.org_url as "org_url",
-            a.summary
+# 커서 다음 행: 정렬 키 row value 비교 (인덱스 구간 탐색).
+# 등록일 NULL 행은 같은 사이트·페이지의 맨 뒤지만 row value 비교로는 걸러지므로 따로 포함
+SEARCH_KEYSET_PREDICATE = """
+    AND (a.site_name, a.page_id) <= (?, ?)
+    AND ((a.site_name, a.page_id, a.register_date, a.id) < (?, ?, ?, ?)
+        OR (a.site_name = ? AND a.page_id = ? AND a.register_date IS NULL))
+"""
+
+
+def build_search_keys_sql(site_names, keyword, derived: bool = False, keyset: bool = False):
+    """
+    사이트/키워드 목록의 건수·페이지 키 조회 SQL
+
+    Args:
+        derived: 키워드를 summary_derived 의 평문에서 찾을지
+        keyset: 커서 조건(SEARCH_KEYSET_PREDICATE) 포함 여부
+
+    Returns:
+        (건수 SQL, 키 SQL, WHERE 파라미터 리스트). 키 SQL 파라미터는 WHERE 파라미터 뒤에
+        keyset 이면 search_keyset_params(...) 와 LIMIT, 아니면 LIMIT, OFFSET
+    """
+    where, params = _like_search_where(site_names, keyword, derived)
+    from_clause = f"""
         FROM
             law_summary a
         INNER JOIN
             yaml_info b
         ON
-            a.site_name = b.site_name AND a.page_id = b.page_id
-        WHERE 1=1
-        """
+            a.site_name = b.site_name AND a.page_id = b.page_id{DERIVED_JOIN if derived else ""}
+        WHERE {where}
+    """
+    count_sql = f"SELECT COUNT(*) {from_clause}"
+    key_sql = f"""
+        SELECT a.id, a.site_name, a.page_id, a.register_date
+        {from_clause}{SEARCH_KEYSET_PREDICATE if keyset else ""}
+        ORDER BY {SEARCH_ORDER_BY}
+        LIMIT ?{"" if keyset else " OFFSET ?"}
+    """
+    return count_sql, key_sql, params
 
-        conditions = []
-        params = []
 
-        # 사이트명 조건 추가
-        if site_names and len(site_names) > 0:
-            placeholders = ",".join(["?" for _ in site_names])
-            conditions.append(f"a.site_name in ({placeholders})")
-            params.extend(site_names)
-            logger.debug(f"📌 사이트 조건 추가: {site_names}")
+def search_keyset_params(site_name, page_id, register_date, id_) -> list:
+    """SEARCH_KEYSET_PREDICATE 자리표시자 순서의 파라미터"""
+    return [site_name, page_id, site_name, page_id, register_date, id_, site_name, page_id]
 
-        # 키워드 조건 추가
-        if keyword and keyword.strip():
-            conditions.append("(a.title like ? or a.summary like ?)")
-            keyword_param = f"%{keyword.strip()}%"
-            params.extend([keyword_param, keyword_param])
-            logger.debug(f"📌 키워드 조건 추가: '{keyword}'")
 
-        # 조건 추가
-        if conditions:
-            base_query += " AND " + " AND ".join(conditions)
+def encode_search_cursor(site_name, page_id, register_date, id_) -> str:
+    """keyset 페이지 커서 토큰 생성 (URL-safe base64 JSON, 등록일은 NULL 이 아닌 값)"""
+    raw = json.dumps([site_name, page_id, register_date, id_], ensure_ascii=False)
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
 
-        # 정렬 추가
-        base_query += " ORDER BY a.site_name, a.page_id, a.register_date DESC"
 
-        logger.debug(f"🔗 최종 쿼리: {base_query}")
-        logger.debug(f"🔗 파라미터: {params}")
+def decode_search_cursor(token: str):
+    """커서 토큰 해석. 형식이 잘못되면 None"""
+    try:
+        raw = base64.urlsafe_b64decode(token.encode("ascii"))
+        site_name, page_id, register_date, id_ = json.loads(raw.decode("utf-8"))
+        return str(site_name), str(page_id), str(register_date), int(id_)
+    except Exception:
+        logger.warning(f"⚠️ 잘못된 검색 커서 무시: {token}")
+        return None
 
-        df = get_data_frame_summary(base_query, tuple(params))
-        if df.empty:
-            logger.info("❌ 검색 결과가 없습니다.")
-            return pd.DataFrame()
 
-        logger.info(f"✅ 검색 완료: {len(df)}개 항목 반환")
-        return df
+def _like_search_where(site_names, keyword: str, derived: bool = False):
+    """
+    LIKE 검색용 WHERE 절과 파라미터
 
-    except Exception as e:
-        logger.error(f"❌ 법령 요약 검색 쿼리 생성 오류: {e}")
-        return pd.DataFrame()
+    derived 이면 마크업 대신 summary_derived 의 평문에서 찾는다
+    (FROM 절에 DERIVED_JOIN 필요, 미반영 행은 원문).
+    """
+    conditions = []
+    params = []
+
+    # 사이트명 조건 추가
+    if site_names:
+        placeholders = ",".join(["?" for _ in site_names])
+        conditions.append(f"a.site_name in ({placeholders})")
+        params.extend(site_names)
+
+    # 키워드 조건 추가
+    if keyword:
+        body = "COALESCE(d.plain_text, a.summary)" if derived else "a.summary"
+        conditions.append(f"(a.title like ? or {body} like ?)")
+        keyword_param = f"%{keyword}%"
+        params.extend([keyword_param, keyword_param])
+
+    where = " AND ".join(conditions) if conditions else "1=1"
+    return where, params
+
+
+def _fetch_search_rows(ids: list, derived: bool = False) -> list:
+    """페이지에 해당하는 id 들의 목록 행을 ids 순서대로 조회"""
+    if not ids:
+        return []
+    placeholders = ",".join(["?" for _ in ids])
+    sql = f"""
+        SELECT{summary_row_columns(derived)}
+        FROM
+            law_summary a
+        INNER JOIN
+            yaml_info b
+        ON
+            a.site_name = b.site_name AND a.page_id = b.page_id
+        {ATTACH_COUNT_JOIN.format(parent_ids=placeholders)}{DERIVED_JOIN if derived else ""}
+        WHERE a.id IN ({placeholders})
+    """
+    order = {id_: i for i, id_ in enumerate(ids)}
+    rows = _apply_excerpts(query_rows(sql, tuple(ids) * 2, "search.rows"))
+    rows.sort(key=lambda row: order[row["id"]])
+    return rows
+
+
+@timed_query("search_law_summary_page")
+def search_law_summary_page(
+    site_names=None, keyword=None, page: int = 1, pagesize: int = 30, cursor: str = None
+) -> dict:
+    """
+    법령 요약 검색 (SQL 에서 페이징)
+
+    전체 건수는 COUNT(*) 로 따로 구하고, 정렬·LIMIT 은 id 만으로 수행한 뒤
+    해당 페이지 행에 대해서만 summary 앞부분(발췌문)을 읽는다.
+
+    - 3글자 이상 키워드: FTS 색인, bm25 관련도 순, LIMIT/OFFSET
+    - 그 외(사이트만/짧은 키워드): 사이트·페이지·등록일 역순(인덱스 순서). cursor 가 있으면
+      keyset(site_name, page_id, register_date, id) 으로 바로 다음 페이지를 찾는다.
+
+    Args:
+        site_names: 사이트 코드 목록 (비어 있으면 전체)
+        keyword: 검색 키워드
+        page: 페이지 번호 (1부터)
+        pagesize: 페이지당 항목 수
+        cursor: 직전 페이지 응답의 next_cursor (선택)
+
+    Returns:
+        {"rows": SUMMARY_ROW_COLUMNS 별칭의 dict 리스트 (FTS 결과는 "snippet" 포함),
+         "total": 전체 건수, "next_cursor": 다음 페이지 커서 또는 None}
+    """
+    keyword = (keyword or "").strip()
+    site_names = site_names or []
+    offset = max(page - 1, 0) * pagesize
+    snippets = {}
+    next_cursor = None
+
+    logger.info(
+        f"🔍 검색 시작 - 사이트: {site_names}, 키워드: '{keyword}', page={page}, pagesize={pagesize}"
+    )
+    # 색인 위치와 색인·원본 조회를 같은 스냅샷에서 (사이에 커밋된 배치가 중복되지 않도록)
+    with get_connection() as conn, read_transaction(conn):
+        last_id = fts_last_synced_id(conn) if keyword and can_use_fts(keyword) else None
+        derived = derived_synced_id(conn) is not None
+
+        if last_id is not None:
+            # FTS 색인 검색 (관련도 순)
+            hits_sql, hits_params = build_fts_hits_query(site_names, keyword, last_id)
+            total = profiled_fetchall(
+                conn, "search.fts_count", f"SELECT COUNT(*) FROM ({hits_sql})", hits_params
+            )[0][0]
+            ids = [
+                row[0]
+                for row in profiled_fetchall(
+                    conn,
+                    "search.fts_hits",
+                    f"SELECT id FROM ({hits_sql}) ORDER BY score, id DESC LIMIT ? OFFSET ?",
+                    hits_params + (pagesize, offset),
+                )
+            ]
+            if ids:
+                snippet_sql, snippet_params = build_fts_snippet_query(keyword, ids)
+                snippets = dict(
+                    profiled_fetchall(conn, "search.fts_snippet", snippet_sql, snippet_params)
+                )
+        else:
+            # 키워드는 마크업이 아닌 평문(summary_derived)에서 찾음
+            plain_body = derived and bool(keyword)
+            after = decode_search_cursor(cursor) if cursor else None
+            count_sql, key_sql, params = build_search_keys_sql(
+                site_names, keyword, plain_body, keyset=after is not None
+            )
+            total = profiled_fetchall(conn, "search.count", count_sql, tuple(params))[0][0]
+
+            if after:
+                params += search_keyset_params(*after) + [pagesize]
+            else:
+                params += [pagesize, offset]
+
+            keys = profiled_fetchall(conn, "search.keys", key_sql, tuple(params))
+            ids = [row[0] for row in keys]
+            # 등록일이 NULL 인 행 뒤로는 row value 비교를 할 수 없어 커서 없이 OFFSET 으로 넘긴다
+            if keys and offset + len(keys) < total and keys[-1][3] is not None:
+                last = keys[-1]
+                next_cursor = encode_search_cursor(last[1], last[2], last[3], last[0])
+
+    rows = _fetch_search_rows(ids, derived)
+    if snippets:
+        for row in rows:
+            row["snippet"] = snippets.get(row["id"])
+
+    logger.info(f"✅ 검색 완료: 전체 {total}건 중 {len(rows)}건 반환")
+    return {"rows": rows, "total": total, "next_cursor": next_cursor}
@@ -0,0 +1,221 @@
+"""
+law_summary 전문 검색(FTS5) 색인 관리
+
+title 과 태그를 제거한 summary 를 trigram 토크나이저로 색인한다.
+summary_derived 에 평문이 이미 있으면 그것을 쓰고, 없을 때만 태그를 제거한다.
+trigram 은 형태소 분석 없이 3글자 단위로 쪼개므로 한국어 부분 문자열
+검색(LIKE '%키워드%' 와 같은 의미)을 인덱스로 처리할 수 있다.
+
+크롤러는 별도 프로세스에서 law_summary 에 행을 추가하므로 트리거 대신
+id 기준 증분 동기화(sync_fts_index)를 주기적으로 실행한다. 트리거에서
+태그 제거용 파이썬 함수를 호출하면 그 함수를 모르는 크롤러의 INSERT 가
+실패하기 때문이다. 아직 색인되지 않은 최신 행은 검색 시 LIKE 로 보완한다.
+"""
+
+import asyncio
+import sqlite3
+
+from app.backend.core.logger import get_logger
+from app.backend.data.meta_table import (
+    ensure_meta_table,
+    get_meta_value,
+    set_meta_value,
+)
+from app.backend.data.summary_derived import DERIVED_TABLE, ensure_derived_table
+from app.backend.data.text_util import html_to_text, MARK_OPEN, MARK_CLOSE
+
+logger = get_logger(__name__)
+
+FTS_TABLE = "law_summary_fts"
+FTS_SYNC_KEY = "fts_last_id"
+
+# trigram 토크나이저는 3글자 미만 검색어를 색인으로 찾을 수 없다
+FTS_MIN_KEYWORD_LENGTH = 3
+
+
+def ensure_fts_table(conn: sqlite3.Connection) -> bool:
+    """FTS5 가상 테이블 생성. trigram 을 지원하지 않는 SQLite면 False"""
+    try:
+        conn.execute(f"""
+            CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE}
+            USING fts5(title, body, tokenize = 'trigram')
+        """)
+        return True
+    except sqlite3.OperationalError as e:
+        logger.error(f"❌ FTS5(trigram) 테이블 생성 실패: {e}")
+        return False
+
+
+def sync_fts_index(db_path: str, batch_size: int = 500) -> int:
+    """
+    law_summary 에 새로 추가된 행을 FTS 색인에 반영
+
+    Args:
+        db_path: 데이터베이스 파일 경로
+        batch_size: 한 트랜잭션에서 처리할 행 수
+
+    Returns:
+        새로 색인한 행 수
+    """
+    conn = sqlite3.connect(db_path, timeout=30)
+    try:
+        if not ensure_fts_table(conn):
+            return 0
+        ensure_derived_table(conn)
+        ensure_meta_table(conn)
+        conn.commit()
+
+        last_id = int(get_meta_value(conn, FTS_SYNC_KEY, 0))
+        total = 0
+        while True:
+            rows = conn.execute(
+                f"""
+                SELECT a.id, a.title, a.summary, d.plain_text
+                FROM law_summary a
+                LEFT JOIN {DERIVED_TABLE} d ON d.id = a.id
+                WHERE a.id > ? ORDER BY a.id LIMIT ?
+                """,
+                (last_id, batch_size),
+            ).fetchall()
+            if not rows:
+                break
+            conn.executemany(
+                f"INSERT INTO {FTS_TABLE} (rowid, title, body) VALUES (?, ?, ?)",
+                [
+                    (id_, title or "", plain_text if plain_text is not None else html_to_text(summary))
+                    for id_, title, summary, plain_text in rows
+                ],
+            )
+            last_id = rows[-1][0]
+            set_meta_value(conn, FTS_SYNC_KEY, last_id)
+            conn.commit()
+            total += len(rows)
+
+        if total:
+            logger.info(f"✅ FTS 색인 동기화: {total}건 추가 (last_id={last_id})")
+        return total
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+
+
+def rebuild_fts_index(db_path: str) -> int:
+    """FTS 색인을 비우고 처음부터 다시 생성"""
+    conn = sqlite3.connect(db_path, timeout=30)
+    try:
+        if not ensure_fts_table(conn):
+            return 0
+        ensure_meta_table(conn)
+        conn.commit()
+        # 테이블은 두고 행 삭제와 동기화 위치 초기화를 한 트랜잭션으로
+        # (DROP 은 바로 커밋되어 검색 쪽이 색인 없는 순간을 보게 된다)
+        conn.execute("BEGIN IMMEDIATE")
+        conn.execute(f"DELETE FROM {FTS_TABLE}")
+        set_meta_value(conn, FTS_SYNC_KEY, 0)
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+    return sync_fts_index(db_path)
+
+
+def fts_last_synced_id(conn: sqlite3.Connection):
+    """색인에 반영된 마지막 law_summary.id (색인이 없으면 None)"""
+    value = get_meta_value(conn, FTS_SYNC_KEY)
+    return int(value) if value is not None else None
+
+
+def can_use_fts(keyword: str) -> bool:
+    """검색어가 trigram 색인으로 처리 가능한 길이인지"""
+    return len(keyword.strip()) >= FTS_MIN_KEYWORD_LENGTH
+
+
+def fts_match_expression(keyword: str) -> str:
+    """검색어 전체를 하나의 구(phrase)로 묶은 MATCH 식 (LIKE '%kw%' 와 같은 의미)"""
+    return '"' + keyword.strip().replace('"', '""') + '"'
+
+
+def build_fts_hits_query(site_names, keyword: str, last_id: int):
+    """
+    FTS 색인 + 미색인 최신 행(LIKE) 을 합친 검색 결과 (id, score) 쿼리
+
+    Args:
+        site_names: 사이트 코드 목록 (비어 있으면 전체)
+        keyword: 검색어 (3글자 이상)
+        last_id: 색인에 반영된 마지막 law_summary.id
+
+    Returns:
+        (sql, params) — score 는 bm25 값(작을수록 관련도 높음), 미색인 행은 0
+    """
+    site_filter = ""
+    site_params = []
+    if site_names:
+        placeholders = ",".join(["?" for _ in site_names])
+        site_filter = f" AND a.site_name in ({placeholders})"
+        site_params = list(site_names)
+
+    like = f"%{keyword.strip()}%"
+    sql = f"""
+        SELECT
+            {FTS_TABLE}.rowid AS id,
+            bm25({FTS_TABLE}, 5.0, 1.0) AS score
+        FROM
+            {FTS_TABLE}
+        INNER JOIN
+            law_summary a ON a.id = {FTS_TABLE}.rowid
+        INNER JOIN
+            yaml_info b
+        ON
+            a.site_name = b.site_name AND a.page_id = b.page_id
+        WHERE {FTS_TABLE} MATCH ?{site_filter}
+        UNION ALL
+        SELECT
+            a.id AS id,
+            0 AS score
+        FROM
+            law_summary a
+        INNER JOIN
+            yaml_info b
+        ON
+            a.site_name = b.site_name AND a.page_id = b.page_id
+        WHERE a.id > ? AND (a.title like ? or a.summary like ?){site_filter}
+    """
+    params = (
+        [fts_match_expression(keyword)]
+        + site_params
+        + [last_id, like, like]
+        + site_params
+    )
+    return sql, tuple(params)
+
+
+def build_fts_snippet_query(keyword: str, ids: list):
+    """
+    지정한 id 들에 대해서만 하이라이트 발췌문(snippet)을 구하는 쿼리
+
+    Returns:
+        (sql, params) — 결과는 (id, snippet)
+    """
+    placeholders = ",".join(["?" for _ in ids])
+    sql = f"""
+        SELECT
+            rowid,
+            snippet({FTS_TABLE}, 1, '{MARK_OPEN}', '{MARK_CLOSE}', '…', 24)
+        FROM {FTS_TABLE}
+        WHERE {FTS_TABLE} MATCH ? AND rowid IN ({placeholders})
+    """
+    return sql, (fts_match_expression(keyword), *ids)
+
+
+async def run_fts_sync_loop(db_path: str, interval: float):
+    """interval 초마다 sync_fts_index 를 스레드에서 실행하는 백그라운드 루프"""
+    while True:
+        try:
+            await asyncio.to_thread(sync_fts_index, db_path)
+        except Exception as e:
+            logger.error(f"❌ FTS 색인 동기화 실패: {e}")
+        await asyncio.sleep(interval)
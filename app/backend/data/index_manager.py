@@ -0,0 +1,126 @@
+"""
+law_summary / law_summary_attach 인덱스 관리
+
+startup 시 대시보드·검색 쿼리가 사용하는 인덱스를 생성(없을 때만)하고
+실제로 존재하는지 확인한다. 또한 주요 쿼리의 EXPLAIN QUERY PLAN 을
+로그에 남겨, 인덱스를 타지 못하고 테이블 전체를 읽는(SCAN) 회귀가
+생기면 바로 드러나도록 한다.
+"""
+
+import sqlite3
+
+from app.backend.core.logger import get_logger
+from app.backend.data.db_pool import get_connection
+from app.backend.data.db_util import (
+    SUMMARY_ATTACH_COUNT_SQL,
+    ERROR_COUNT_SQL,
+    build_summary_list_sql,
+    ATTACH_LIST_SQL,
+    ATTACH_BATCH_SQL,
+    build_search_keys_sql,
+    search_keyset_params,
+)
+from app.backend.data.slow_query_log import explain_query, find_full_scans
+
+logger = get_logger(__name__)
+
+# (인덱스명, 테이블, 컬럼)
+MANAGED_INDEXES = [
+    ("idx_law_summary_upd_time", "law_summary", "upd_time"),
+    (
+        "idx_law_summary_site_page_reg",
+        "law_summary",
+        "site_name, page_id, register_date",
+    ),
+    ("idx_law_summary_category_upd_time", "law_summary", "category, upd_time"),
+    # 게시글 키로 첨부파일 찾기 (attach_list, attach_list_batch)
+    ("idx_law_summary_site_page_seq", "law_summary", "site_name, page_id, real_seq"),
+    ("idx_law_summary_attach_parent_id", "law_summary_attach", "parent_id"),
+    ("idx_law_summary_attach_upd_time", "law_summary_attach", "upd_time"),
+]
+
+# 쿼리명 -> (SQL, 대표 파라미터)
+HOT_QUERIES = {
+    "total_site_attach_counts": (
+        SUMMARY_ATTACH_COUNT_SQL,
+        ("2025-01-01", "2025-01-08", "2025-01-01", "2025-01-08"),
+    ),
+    "error_count_of_last_24h": (ERROR_COUNT_SQL, ()),
+    "get_summary_list": (
+        build_summary_list_sql(derived=True),
+        ("2025-01-01", "2025-01-08", "2025-01-01", "2025-01-08"),
+    ),
+    "attach_list": (ATTACH_LIST_SQL, ("site", "page", "1")),
+    "attach_list_batch": (ATTACH_BATCH_SQL.format(values="(?, ?, ?)"), ("site", "page", "1")),
+    # 사이트별 검색 목록 (첫 페이지 / keyset 커서 다음 페이지)
+    "search_keys": (build_search_keys_sql(["site"], "")[1], ("site", 30, 0)),
+    "search_keys_after": (
+        build_search_keys_sql(["site"], "", keyset=True)[1],
+        ("site", *search_keyset_params("site", "page", "2025-01-01", 1), 30),
+    ),
+}
+
+
+def ensure_indexes(db_path: str) -> dict:
+    """
+    관리 대상 인덱스를 생성하고 존재 여부를 확인
+
+    Args:
+        db_path: 데이터베이스 파일 경로
+
+    Returns:
+        {인덱스명: True/False} 생성·확인 결과
+    """
+    result = {}
+    conn = sqlite3.connect(db_path, timeout=30)
+    try:
+        for index_name, table, columns in MANAGED_INDEXES:
+            try:
+                conn.execute(
+                    f"CREATE INDEX IF NOT EXISTS {index_name} ON {table} ({columns})"
+                )
+                conn.commit()
+            except sqlite3.Error as e:
+                logger.error(f"❌ 인덱스 생성 실패 ({index_name}): {e}")
+
+        existing = {
+            row[0]
+            for row in conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'index'"
+            )
+        }
+        for index_name, table, columns in MANAGED_INDEXES:
+            ok = index_name in existing
+            result[index_name] = ok
+            if ok:
+                logger.info(f"✅ 인덱스 확인: {index_name} ON {table}({columns})")
+            else:
+                logger.warning(f"⚠️ 인덱스 없음: {index_name} ON {table}({columns})")
+
+        # 쿼리 플래너 통계 갱신 (필요한 경우에만 ANALYZE 수행)
+        conn.execute("PRAGMA optimize")
+    finally:
+        conn.close()
+    return result
+
+
+def explain_hot_queries() -> dict:
+    """
+    주요 쿼리의 실행 계획을 로그로 출력
+
+    Returns:
+        {쿼리명: [계획 detail, ...]}
+    """
+    plans = {}
+    with get_connection() as conn:
+        for name, (sql, params) in HOT_QUERIES.items():
+            try:
+                plan = explain_query(conn, sql, params)
+            except sqlite3.Error as e:
+                logger.error(f"❌ 실행 계획 조회 실패 ({name}): {e}")
+                continue
+            plans[name] = plan
+            logger.info(f"🔎 쿼리 계획 ({name}): {' | '.join(plan)}")
+            for detail in find_full_scans(plan):
+                logger.warning(f"⚠️ 전체 테이블 스캔 감지 ({name}): {detail}")
+    return plans
@@ -0,0 +1,106 @@
+"""
+로그 파일 추적 (tail -f)
+
+LogFollower 는 마지막으로 읽은 바이트 위치를 기억하고, poll() 할 때마다
+그 뒤에 추가된 바이트만 읽어 완성된 줄로 돌려준다.
+
+- 파일 핸들을 열어 둔 채로 기다리지 않는다. Windows 에서 열린 파일은
+  ConcurrentRotatingFileHandler 가 이름을 바꿀 수 없기 때문에 poll 마다
+  열고 닫는다.
+- 파일 식별자(st_dev, st_ino)가 바뀌었거나 크기가 읽은 위치보다 작아지면
+  회전(또는 truncate)된 것으로 보고 새 파일의 처음부터 읽는다. 회전된
+  파일(path.1)이 이전 파일이면 못 읽은 나머지를 먼저 읽는다.
+- 줄바꿈으로 끝나지 않은 마지막 조각은 다음 poll 까지 내보내지 않는다.
+"""
+
+import os
+
+from app.backend.data.log_reader import CHUNK_SIZE
+
+
+def _file_id(st: os.stat_result):
+    return st.st_dev, st.st_ino
+
+
+class LogFollower:
+    """
+    로그 파일에 새로 추가된 줄 읽기
+
+    Args:
+        path: 로그 파일 경로
+        offset: 시작 바이트 오프셋 (None 이면 현재 파일 끝부터)
+        max_bytes: poll 한 번에 읽을 최대 바이트 수 (나머지는 다음 poll 에)
+    """
+
+    def __init__(self, path: str, offset: int = None, max_bytes: int = 4 * CHUNK_SIZE):
+        self.path = path
+        self.max_bytes = max_bytes
+        self._file_id = None
+        self._pending = b""
+        try:
+            st = os.stat(path)
+            self._file_id = _file_id(st)
+            size = st.st_size
+        except OSError:
+            size = 0
+        self.offset = size if offset is None else max(0, min(offset, size))
+
+    def _read(self, path: str, offset: int, limit: int) -> bytes:
+        with open(path, "rb") as f:
+            f.seek(offset)
+            return f.read(limit)
+
+    def _drain_rotated(self) -> bytes:
+        """회전되어 path.1 로 옮겨진 이전 파일에서 아직 못 읽은 부분"""
+        rotated = self.path + ".1"
+        try:
+            if _file_id(os.stat(rotated)) != self._file_id:
+                return b""
+            return self._read(rotated, self.offset, self.max_bytes)
+        except OSError:
+            return b""
+
+    def poll(self) -> dict:
+        """
+        새로 추가된 줄 읽기
+
+        Returns:
+            {"lines": [...], "offset": 다음 읽을 위치, "rotated": 회전 감지 여부}
+        """
+        rotated = False
+        data = b""
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            # 회전 도중 잠시 파일이 없을 수 있음
+            return {"lines": [], "offset": self.offset, "rotated": False}
+
+        if self._file_id is not None and (
+            _file_id(st) != self._file_id or st.st_size < self.offset
+        ):
+            rotated = True
+            if _file_id(st) != self._file_id:
+                data = self._drain_rotated()
+            else:
+                # truncate: 이어 붙일 이전 줄 조각이 없어짐
+                self._pending = b""
+            self.offset = 0
+        self._file_id = _file_id(st)
+
+        if st.st_size > self.offset:
+            chunk = self._read(self.path, self.offset, self.max_bytes)
+            self.offset += len(chunk)
+            data += chunk
+
+        data = self._pending + data
+        complete, sep, self._pending = data.rpartition(b"\n")
+        lines = [
+            line.rstrip(b"\r").decode("utf-8", errors="replace")
+            for line in complete.split(b"\n")
+        ] if sep else []
+        # 아직 줄이 끝나지 않은 조각은 읽은 위치에서 제외
+        return {
+            "lines": lines,
+            "offset": max(0, self.offset - len(self._pending)),
+            "rotated": rotated,
+        }
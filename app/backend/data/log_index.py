@@ -0,0 +1,424 @@
+"""
+크롤러 로그 색인 (별도 SQLite DB)
+
+CRAWLER_LOG_DIR 의 law_crawler_*.log 각 로그 항목을
+(ts, level, site, page, 파일, 바이트 오프셋, 길이) 행으로 색인한다.
+본문은 색인에 복사하지 않고 조회 시 오프셋으로 원본 파일에서 읽는다.
+
+- 파일별로 마지막으로 색인한 오프셋을 기억하고 그 뒤만 읽는다
+  (fts_index / daily_rollup 의 id 증분 동기화와 같은 방식).
+- 타임스탬프로 시작하지 않는 줄(traceback 등)은 직전 항목의 연속으로 보고
+  그 항목의 길이를 늘린다.
+- 파일 식별자(st_dev, st_ino)가 바뀌었거나 작아졌으면 그 파일을 다시 색인하고,
+  사라진 파일의 행은 지운다.
+- site / page 는 yaml_info 의 코드(또는 한글명)가 로그 줄에 나오면 채운다.
+
+law_summary.db 는 크롤러가 쓰는 DB 라서 색인은 UI 쪽 파일(LOG_INDEX_DB_PATH)에 둔다.
+"""
+
+import asyncio
+import base64
+import json
+import os
+import re
+import sqlite3
+from pathlib import Path
+
+from app.backend.core.logger import get_logger
+from app.backend.data.crawler_health import LOG_PATTERN, TIMESTAMP_RE
+
+logger = get_logger(__name__)
+
+LEVEL_RE = re.compile(r"\b(DEBUG|INFO|WARNING|WARN|ERROR|CRITICAL|FATAL)\b")
+LEVEL_ALIASES = {"WARN": "WARNING", "FATAL": "CRITICAL"}
+
+# 조회 결과의 본문 최대 바이트 (traceback 이 매우 긴 경우)
+MAX_MESSAGE_BYTES = 8 * 1024
+# 부분 문자열 검색 시 한 요청에서 확인할 최대 후보 행 수
+MAX_SCAN_ROWS = 20000
+
+
+def ensure_index_tables(conn: sqlite3.Connection):
+    """색인 테이블 생성"""
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.executescript("""
+        CREATE TABLE IF NOT EXISTS log_files (
+            file_id INTEGER PRIMARY KEY,
+            filename TEXT NOT NULL UNIQUE,
+            identity TEXT,
+            indexed_offset INTEGER NOT NULL DEFAULT 0,
+            last_entry_offset INTEGER
+        );
+        CREATE TABLE IF NOT EXISTS log_entries (
+            file_id INTEGER NOT NULL,
+            offset INTEGER NOT NULL,
+            length INTEGER NOT NULL,
+            ts TEXT NOT NULL,
+            level TEXT,
+            site TEXT,
+            page TEXT,
+            PRIMARY KEY (file_id, offset)
+        ) WITHOUT ROWID;
+        CREATE INDEX IF NOT EXISTS idx_log_entries_ts ON log_entries (ts, file_id, offset);
+        CREATE INDEX IF NOT EXISTS idx_log_entries_level_ts ON log_entries (level, ts);
+        CREATE INDEX IF NOT EXISTS idx_log_entries_site_ts ON log_entries (site, ts);
+    """)
+
+
+class LogLineParser:
+    """
+    로그 줄에서 시각·레벨·사이트·페이지 추출
+
+    Args:
+        site_pages: [(site_code, page_code, site_name, page_name), ...] (yaml_info)
+    """
+
+    def __init__(self, site_pages=()):
+        self._sites = {}
+        self._pages = {}
+        for site, page, site_name, page_name in site_pages:
+            for token in (site, site_name):
+                if token:
+                    self._sites[token] = site
+            for token in (page, page_name):
+                if token:
+                    self._pages.setdefault(site, {})[token] = page
+        self._site_re = self._token_re(self._sites)
+        self._page_res = {site: self._token_re(pages) for site, pages in self._pages.items()}
+
+    @staticmethod
+    def _token_re(tokens):
+        if not tokens:
+            return None
+        # 긴 토큰 우선, 영숫자 경계에서만 일치 (site1 이 site10 에 걸리지 않도록)
+        alternation = "|".join(re.escape(t) for t in sorted(tokens, key=len, reverse=True))
+        return re.compile(rf"(?<![0-9A-Za-z_])({alternation})(?![0-9A-Za-z_])")
+
+    def parse(self, line: str):
+        """
+        로그 항목의 첫 줄이면 (ts, level, site, page), 연속 줄이면 None
+        """
+        match = TIMESTAMP_RE.match(line)
+        if not match:
+            return None
+        ts = match.group(1)
+        rest = line[match.end():]
+
+        level_match = LEVEL_RE.search(rest)
+        level = None
+        if level_match:
+            level = LEVEL_ALIASES.get(level_match.group(1), level_match.group(1))
+
+        site = page = None
+        if self._site_re is not None:
+            site_match = self._site_re.search(rest)
+            if site_match:
+                site = self._sites[site_match.group(1)]
+                page_re = self._page_res.get(site)
+                page_match = page_re.search(rest) if page_re is not None else None
+                if page_match:
+                    page = self._pages[site][page_match.group(1)]
+        return ts, level, site, page
+
+
+def load_site_pages(db_path: str):
+    """yaml_info 의 (사이트 코드, 페이지 코드, 사이트명, 페이지명) 목록 (없으면 빈 목록)"""
+    if not os.path.exists(db_path):
+        return []
+    uri = Path(os.path.abspath(db_path)).as_uri() + "?mode=ro"
+    try:
+        conn = sqlite3.connect(uri, uri=True)
+        try:
+            return conn.execute(
+                'SELECT site_name, page_id, h_name, "desc" FROM yaml_info'
+            ).fetchall()
+        finally:
+            conn.close()
+    except sqlite3.Error as e:
+        logger.warning(f"⚠️ 로그 색인용 사이트 목록 조회 실패: {e}")
+        return []
+
+
+def _index_file(conn, parser: LogLineParser, path: str, file_row, batch_size: int) -> int:
+    """파일 하나의 새로 추가된 완성 줄을 색인. 추가된 항목 수 반환"""
+    st = os.stat(path)
+    identity = f"{st.st_dev}:{st.st_ino}"
+    filename = os.path.basename(path)
+
+    if file_row is None:
+        cursor = conn.execute(
+            "INSERT INTO log_files (filename, identity) VALUES (?, ?)", (filename, identity)
+        )
+        file_id, offset, last_entry = cursor.lastrowid, 0, None
+    else:
+        file_id, stored_identity, offset, last_entry = file_row
+        if stored_identity != identity or st.st_size < offset:
+            logger.info(f"🔁 로그 파일 변경 감지, 다시 색인: {filename}")
+            conn.execute("DELETE FROM log_entries WHERE file_id = ?", (file_id,))
+            offset, last_entry = 0, None
+
+    if st.st_size <= offset:
+        return 0
+
+    added = 0
+    rows = []
+    with open(path, "rb") as f:
+        f.seek(offset)
+        position = offset
+        while position < st.st_size:
+            line = f.readline()
+            if not line or not line.endswith(b"\n"):
+                # 아직 쓰는 중인 마지막 줄은 다음 동기화에서
+                break
+            line_end = position + len(line)
+            parsed = parser.parse(line.decode("utf-8", errors="replace").rstrip("\r\n"))
+            if parsed is None:
+                if last_entry is not None:
+                    # 직전 항목의 연속 줄 (이번 배치에 있으면 배치 안에서 늘린다)
+                    if rows and rows[-1][1] == last_entry:
+                        rows[-1][2] = line_end - last_entry
+                    else:
+                        conn.execute(
+                            "UPDATE log_entries SET length = ? WHERE file_id = ? AND offset = ?",
+                            (line_end - last_entry, file_id, last_entry),
+                        )
+            else:
+                ts, level, site, page = parsed
+                rows.append([file_id, position, len(line), ts, level, site, page])
+                last_entry = position
+                added += 1
+            position = line_end
+
+            if len(rows) >= batch_size:
+                conn.executemany("INSERT OR REPLACE INTO log_entries VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+                rows = []
+
+    if rows:
+        conn.executemany("INSERT OR REPLACE INTO log_entries VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+    conn.execute(
+        "UPDATE log_files SET identity = ?, indexed_offset = ?, last_entry_offset = ? WHERE file_id = ?",
+        (identity, position, last_entry, file_id),
+    )
+    return added
+
+
+def sync_log_index(index_path: str, log_dir: str, site_pages=(), batch_size: int = 5000) -> int:
+    """
+    크롤러 로그 디렉터리의 새 로그 줄을 색인에 반영
+
+    Args:
+        index_path: 색인 DB 파일 경로
+        log_dir: 크롤러 로그 디렉터리
+        site_pages: LogLineParser 에 넘길 yaml_info 목록
+        batch_size: 한 번에 INSERT 할 항목 수
+
+    Returns:
+        새로 색인한 항목 수
+    """
+    if not log_dir or not os.path.isdir(log_dir):
+        return 0
+
+    os.makedirs(os.path.dirname(os.path.abspath(index_path)), exist_ok=True)
+    parser = LogLineParser(site_pages)
+    conn = sqlite3.connect(index_path, timeout=30)
+    try:
+        ensure_index_tables(conn)
+        known = {
+            row[0]: row[1:]
+            for row in conn.execute(
+                "SELECT filename, file_id, identity, indexed_offset, last_entry_offset FROM log_files"
+            )
+        }
+        paths = {os.path.basename(p): p for p in map(str, Path(log_dir).glob(LOG_PATTERN))}
+
+        total = 0
+        for filename in sorted(paths):
+            try:
+                total += _index_file(conn, parser, paths[filename], known.get(filename), batch_size)
+                conn.commit()
+            except OSError as e:
+                conn.rollback()
+                logger.warning(f"⚠️ 로그 파일 색인 건너뜀 ({filename}): {e}")
+
+        # 삭제된 파일의 항목 정리
+        for filename in set(known) - set(paths):
+            file_id = known[filename][0]
+            conn.execute("DELETE FROM log_entries WHERE file_id = ?", (file_id,))
+            conn.execute("DELETE FROM log_files WHERE file_id = ?", (file_id,))
+        conn.commit()
+
+        if total:
+            logger.info(f"✅ 크롤러 로그 색인: {total}건 추가")
+        return total
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+
+
+def encode_log_cursor(ts: str, file_id: int, offset: int) -> str:
+    """로그 조회 keyset 커서 토큰 (URL-safe base64 JSON)"""
+    raw = json.dumps([ts, file_id, offset], ensure_ascii=False)
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+
+def decode_log_cursor(token: str):
+    """커서 토큰 해석. 형식이 잘못되면 None"""
+    try:
+        raw = base64.urlsafe_b64decode(token.encode("ascii"))
+        ts, file_id, offset = json.loads(raw.decode("utf-8"))
+        return str(ts), int(file_id), int(offset)
+    except Exception:
+        logger.warning(f"⚠️ 잘못된 로그 조회 커서 무시: {token}")
+        return None
+
+
+def _read_messages(log_dir: str, rows) -> dict:
+    """{(file_id, offset): 본문} — 파일별로 한 번만 열어 오프셋으로 읽는다"""
+    messages = {}
+    by_file = {}
+    for row in rows:
+        by_file.setdefault(row["filename"], []).append(row)
+    for filename, file_rows in by_file.items():
+        try:
+            with open(os.path.join(log_dir, filename), "rb") as f:
+                for row in sorted(file_rows, key=lambda r: r["offset"]):
+                    f.seek(row["offset"])
+                    data = f.read(min(row["length"], MAX_MESSAGE_BYTES))
+                    messages[(row["file_id"], row["offset"])] = (
+                        data.decode("utf-8", errors="replace").rstrip("\r\n")
+                    )
+        except OSError:
+            continue
+    return messages
+
+
+def _fetch_entries(conn, log_dir: str, where: str, params: list, after, limit: int) -> list:
+    """조건에 맞는 항목을 최신순으로 after 다음부터 limit 개 (본문 포함)"""
+    cursor_sql = ""
+    cursor_params = []
+    if after is not None:
+        cursor_sql = "AND (e.ts, e.file_id, e.offset) < (?, ?, ?)"
+        cursor_params = list(after)
+    rows = [
+        dict(row)
+        for row in conn.execute(
+            f"""
+            SELECT e.ts, e.level, e.site, e.page, f.filename, e.file_id, e.offset, e.length
+            FROM log_entries e JOIN log_files f ON f.file_id = e.file_id
+            WHERE {where} {cursor_sql}
+            ORDER BY e.ts DESC, e.file_id DESC, e.offset DESC
+            LIMIT ?
+            """,
+            (*params, *cursor_params, limit),
+        )
+    ]
+    messages = _read_messages(log_dir, rows) if rows else {}
+    for row in rows:
+        row["message"] = messages.get((row["file_id"], row["offset"]), "")
+    return rows
+
+
+def query_log_index(
+    index_path: str,
+    log_dir: str,
+    levels=None,
+    site: str = None,
+    date_from: str = None,
+    date_to: str = None,
+    keyword: str = None,
+    limit: int = 100,
+    cursor: str = None,
+) -> dict:
+    """
+    색인된 크롤러 로그 조회 (최신순)
+
+    Args:
+        index_path: 색인 DB 경로
+        log_dir: 크롤러 로그 디렉터리 (본문 읽기용)
+        levels: 레벨 목록 (예: ["ERROR", "CRITICAL"])
+        site: 사이트 코드
+        date_from / date_to: YYYY-MM-DD (둘 다 포함)
+        keyword: 본문 부분 문자열
+        limit: 최대 행 수
+        cursor: 이전 응답의 next_cursor
+
+    Returns:
+        {"rows": [{"ts", "level", "site", "page", "filename", "offset", "message"}, ...],
+         "next_cursor": str | None}
+    """
+    if not os.path.exists(index_path):
+        return {"rows": [], "next_cursor": None}
+
+    conditions = []
+    params = []
+    if levels:
+        conditions.append(f"e.level IN ({','.join('?' for _ in levels)})")
+        params.extend(levels)
+    if site:
+        conditions.append("e.site = ?")
+        params.append(site)
+    if date_from:
+        conditions.append("e.ts >= ?")
+        params.append(date_from)
+    if date_to:
+        # 날짜만 주면 그날 끝까지 포함
+        conditions.append("e.ts < ?")
+        params.append(date_to + " 99")
+    where = " AND ".join(conditions) if conditions else "1=1"
+    last = decode_log_cursor(cursor) if cursor else None
+
+    uri = Path(os.path.abspath(index_path)).as_uri() + "?mode=ro"
+    conn = sqlite3.connect(uri, uri=True)
+    conn.row_factory = sqlite3.Row
+    try:
+        # 부분 문자열 조건은 본문을 읽어야 알 수 있으므로 후보를 나눠 확인
+        batch = limit if not keyword else max(limit * 4, 200)
+        results = []
+        scanned = 0
+        has_more = False
+        while True:
+            rows = _fetch_entries(conn, log_dir, where, params, last, batch)
+            for row in rows:
+                scanned += 1
+                last = (row["ts"], row["file_id"], row["offset"])
+                message = row["message"]
+                if keyword and keyword not in message:
+                    continue
+                results.append({
+                    "ts": row["ts"],
+                    "level": row["level"],
+                    "site": row["site"],
+                    "page": row["page"],
+                    "filename": row["filename"],
+                    "offset": row["offset"],
+                    "message": message,
+                })
+                if len(results) >= limit:
+                    break
+            if len(rows) < batch:
+                # 마지막 후보까지 봤으면 더 없음
+                has_more = bool(rows) and last != (
+                    rows[-1]["ts"], rows[-1]["file_id"], rows[-1]["offset"]
+                )
+                break
+            if len(results) >= limit or scanned >= MAX_SCAN_ROWS:
+                has_more = True
+                break
+    finally:
+        conn.close()
+
+    next_cursor = encode_log_cursor(*last) if has_more and last is not None else None
+    return {"rows": results, "next_cursor": next_cursor}
+
+
+async def run_log_index_loop(index_path: str, log_dir: str, db_path: str, interval: float):
+    """interval 초마다 sync_log_index 를 스레드에서 실행하는 백그라운드 루프"""
+    while True:
+        try:
+            site_pages = await asyncio.to_thread(load_site_pages, db_path)
+            await asyncio.to_thread(sync_log_index, index_path, log_dir, site_pages)
+        except Exception as e:
+            logger.error(f"❌ 크롤러 로그 색인 실패: {e}")
+        await asyncio.sleep(interval)
@@ -0,0 +1,94 @@
+"""
+로그 파일 부분 읽기 유틸리티
+
+로그 파일은 수 MB 까지 커지므로 화면에는 필요한 줄만 읽어서 보낸다.
+
+- read_lines_after: 바이트 오프셋부터 앞으로 limit 줄 (다음 페이지)
+- read_lines_before: 바이트 오프셋(기본: 파일 끝) 직전 limit 줄 (tail / 이전 페이지)
+- iter_file_chunks: 다운로드용 고정 크기 청크 스트림
+
+오프셋은 항상 바이트 단위이고, 반환값의 start/end 는 줄 경계이므로 다음
+요청의 offset / before 로 그대로 넘기면 된다. 디코딩할 수 없는 바이트는
+대체 문자로 바꾼다.
+"""
+
+import os
+
+CHUNK_SIZE = 64 * 1024
+
+
+def _decode(line: bytes) -> str:
+    return line.rstrip(b"\r\n").decode("utf-8", errors="replace")
+
+
+def _page(lines: list, start: int, end: int, size: int) -> dict:
+    return {"lines": lines, "start": start, "end": end, "size": size}
+
+
+def read_lines_after(path: str, offset: int = 0, limit: int = 500) -> dict:
+    """
+    offset 바이트부터 최대 limit 줄 읽기
+
+    Args:
+        path: 로그 파일 경로
+        offset: 시작 바이트 오프셋 (줄 시작이어야 함)
+        limit: 최대 줄 수
+
+    Returns:
+        {"lines": [...], "start": 시작 오프셋, "end": 마지막 줄 다음 오프셋, "size": 파일 크기}
+    """
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        start = max(0, min(offset, size))
+        f.seek(start)
+        lines = []
+        while len(lines) < limit:
+            line = f.readline()
+            if not line:
+                break
+            lines.append(_decode(line))
+        return _page(lines, start, f.tell(), size)
+
+
+def read_lines_before(path: str, before: int = None, limit: int = 500, chunk_size: int = CHUNK_SIZE) -> dict:
+    """
+    before 바이트 직전의 최대 limit 줄 읽기 (파일 끝에서부터 역방향 탐색)
+
+    Args:
+        path: 로그 파일 경로
+        before: 끝 바이트 오프셋 (None 이면 파일 끝 → tail -n limit)
+        limit: 최대 줄 수
+        chunk_size: 역방향으로 한 번에 읽을 바이트 수
+
+    Returns:
+        read_lines_after 와 같은 형식
+    """
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        end = size if before is None else max(0, min(before, size))
+        pos = end
+        data = b""
+        # 마지막 바이트의 줄바꿈을 빼고 limit 개의 줄바꿈이 보이면 limit 줄이 온전히 확보됨
+        while pos > 0 and data.count(b"\n", 0, max(len(data) - 1, 0)) < limit:
+            read_size = min(chunk_size, pos)
+            pos -= read_size
+            f.seek(pos)
+            data = f.read(read_size) + data
+
+    if not data or limit <= 0:
+        return _page([], end, end, size)
+
+    body = data[:-1] if data.endswith(b"\n") else data
+    parts = body.split(b"\n")[-limit:]
+    kept = sum(len(part) + 1 for part in parts) - 1 + (1 if data.endswith(b"\n") else 0)
+    return _page([_decode(part) for part in parts], end - kept, end, size)
+
+
+def iter_file_chunks(path: str, chunk_size: int = CHUNK_SIZE):
+    """파일을 chunk_size 바이트씩 읽어 내보내는 제너레이터 (StreamingResponse 용)"""
+    with open(path, "rb") as f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+            yield chunk
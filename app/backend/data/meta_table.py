@@ -0,0 +1,43 @@
+"""
+ui_meta 테이블 접근 유틸리티
+
+UI가 law_summary.db 안에 만드는 파생 데이터(FTS 색인 등)의
+동기화 위치 같은 작은 상태값을 key/value 로 저장한다.
+"""
+
+import sqlite3
+
+META_TABLE = "ui_meta"
+
+
+def ensure_meta_table(conn: sqlite3.Connection):
+    """ui_meta 테이블 생성 (쓰기 커넥션 필요)"""
+    conn.execute(f"""
+        CREATE TABLE IF NOT EXISTS {META_TABLE} (
+            key TEXT PRIMARY KEY,
+            value TEXT
+        )
+    """)
+
+
+def get_meta_value(conn: sqlite3.Connection, key: str, default=None):
+    """
+    ui_meta 값 조회
+
+    테이블이 아직 없으면(읽기 전용 커넥션 등) default 를 반환한다.
+    """
+    try:
+        row = conn.execute(
+            f"SELECT value FROM {META_TABLE} WHERE key = ?", (key,)
+        ).fetchone()
+    except sqlite3.OperationalError:
+        return default
+    return row[0] if row else default
+
+
+def set_meta_value(conn: sqlite3.Connection, key: str, value):
+    """ui_meta 값 저장 (commit 은 호출자가 수행)"""
+    conn.execute(
+        f"INSERT OR REPLACE INTO {META_TABLE} (key, value) VALUES (?, ?)",
+        (key, str(value)),
+    )
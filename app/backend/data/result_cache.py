@@ -0,0 +1,257 @@
+"""
+DB 조회 결과 캐시 (TTL + 쓰기 감지 무효화 + LRU)
+
+크롤러는 하루 몇 번 배치로만 law_summary.db 에 쓰는데, 대시보드·통계
+화면은 새로고침마다 같은 집계를 다시 계산한다. 함수 이름과 인자를 키로
+결과를 메모리에 보관하고, DB 가 바뀌었으면 버린다.
+
+DB 변경 여부는 다음 값을 묶은 버전 토큰으로 판단한다.
+
+- 전용 커넥션의 PRAGMA data_version (다른 커넥션이 커밋하면 증가)
+- DB 파일 / -wal 파일의 mtime·크기
+- law_summary / law_summary_attach 의 MAX(id)
+
+버전 토큰은 check_interval 초에 한 번만 다시 구하고, 변경이 감지되지
+않더라도 ttl 초가 지나면 다시 계산한다. 캐시된 객체는 호출자 간에
+공유되므로 반환값을 수정하면 안 된다.
+
+워커가 여러 개면(WORKERS > 1 또는 SHARED_CACHE_ENABLED) 메모리(L1)에 없는
+항목을 워커 간 공유 저장소(L2, shared_cache.SharedResultStore)에서 찾는다.
+"""
+
+import functools
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+
+from app.backend.core.config import config
+from app.backend.core.logger import get_logger
+from app.backend.data.shared_cache import MISS, SharedResultStore, shared_key, shared_version
+
+logger = get_logger(__name__)
+
+
+class DbVersionProbe:
+    """law_summary.db 의 변경 여부를 나타내는 버전 토큰 계산기"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._conn = None
+        self._path = None
+
+    def _connection(self, db_path: str) -> sqlite3.Connection:
+        if self._conn is None or self._path != db_path:
+            self.close()
+            uri = Path(os.path.abspath(db_path)).as_uri() + "?mode=ro"
+            self._conn = sqlite3.connect(uri, uri=True, check_same_thread=False)
+            self._path = db_path
+        return self._conn
+
+    @staticmethod
+    def _file_stamp(path: str):
+        try:
+            st = os.stat(path)
+            return st.st_mtime_ns, st.st_size
+        except OSError:
+            return None
+
+    def token(self, db_path: str):
+        """현재 버전 토큰. DB 를 읽을 수 없으면 None"""
+        if not os.path.exists(db_path):
+            return None
+        with self._lock:
+            try:
+                conn = self._connection(db_path)
+                data_version = conn.execute("PRAGMA data_version").fetchone()[0]
+                max_ids = conn.execute(
+                    "SELECT (SELECT MAX(id) FROM law_summary),"
+                    " (SELECT MAX(id) FROM law_summary_attach)"
+                ).fetchone()
+            except sqlite3.Error as e:
+                logger.warning(f"⚠️ DB 버전 확인 실패: {e}")
+                self.close()
+                return None
+        return (
+            data_version,
+            self._file_stamp(db_path),
+            self._file_stamp(db_path + "-wal"),
+            tuple(max_ids),
+        )
+
+    def close(self):
+        if self._conn is not None:
+            try:
+                self._conn.close()
+            except sqlite3.Error:
+                pass
+        self._conn = None
+        self._path = None
+
+
+class ResultCache:
+    """
+    스레드 안전한 LRU 결과 캐시
+
+    Args:
+        maxsize: 최대 보관 항목 수 (넘으면 가장 오래 안 쓴 항목 제거)
+        ttl: 항목 유효 시간(초)
+        check_interval: DB 버전 토큰 재확인 주기(초)
+        db_path_getter: DB 경로를 돌려주는 함수 (기본: config.DB_PATH)
+        shared: 워커 간 공유 저장소 (None 이면 메모리 캐시만 사용)
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 256,
+        ttl: float = 300.0,
+        check_interval: float = 1.0,
+        db_path_getter=None,
+        shared: SharedResultStore = None,
+    ):
+        self.maxsize = max(1, maxsize)
+        self.ttl = ttl
+        self.check_interval = check_interval
+        self._db_path_getter = db_path_getter or (lambda: config.DB_PATH)
+        self._probe = DbVersionProbe()
+        self.shared = shared
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._version = None
+        self._version_checked_at = 0.0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def current_version(self):
+        """버전 토큰 (check_interval 동안은 직전 값 재사용)"""
+        now = time.monotonic()
+        with self._lock:
+            if now - self._version_checked_at < self.check_interval:
+                return self._version
+        version = self._probe.token(self._db_path_getter())
+        with self._lock:
+            if version != self._version:
+                if self._entries:
+                    self.invalidations += 1
+                    logger.info(f"🧹 DB 변경 감지 → 결과 캐시 {len(self._entries)}건 무효화")
+                self._entries.clear()
+                self._version = version
+            self._version_checked_at = now
+        return version
+
+    def get_or_compute(self, key, compute):
+        """key 에 해당하는 결과를 반환. 없거나 만료되었으면 compute() 결과를 저장"""
+        version = self.current_version()
+        if version is None:
+            # DB 상태를 알 수 없으면 캐시하지 않음
+            with self._lock:
+                self.misses += 1
+            return compute()
+
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry_version, expires_at, value = entry
+                if entry_version == version and expires_at > now:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._entries[key]
+            self.misses += 1
+
+        if self.shared is not None:
+            l2_key, l2_version = shared_key(key), shared_version(version)
+            value = self.shared.get(l2_key, l2_version)
+            if value is MISS:
+                value = compute()
+                self.shared.put(l2_key, l2_version, value, self.ttl)
+        else:
+            value = compute()
+
+        self._store(key, version, value)
+        return value
+
+    def _store(self, key, version, value):
+        with self._lock:
+            self._entries[key] = (version, time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        """모든 항목 제거 및 카운터 초기화 (공유 저장소 포함)"""
+        with self._lock:
+            self._entries.clear()
+            self._version = None
+            self._version_checked_at = 0.0
+            self.hits = self.misses = self.evictions = self.invalidations = 0
+        if self.shared is not None:
+            self.shared.clear()
+
+    def close(self):
+        """버전 확인용 커넥션과 공유 저장소 커넥션 종료"""
+        self._probe.close()
+        if self.shared is not None:
+            self.shared.close()
+
+    def stats(self) -> dict:
+        """캐시 상태 및 적중률"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 3) if lookups else 0.0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "shared": self.shared.stats() if self.shared is not None else None,
+            }
+
+
+_cache = None
+
+
+def get_result_cache() -> ResultCache:
+    """전역 결과 캐시 반환 (설정값으로 최초 1회 생성)"""
+    global _cache
+    if _cache is None:
+        shared = None
+        if config.SHARED_CACHE_ENABLED:
+            shared = SharedResultStore(config.SHARED_CACHE_PATH, config.SHARED_CACHE_MAXSIZE)
+        _cache = ResultCache(
+            maxsize=config.RESULT_CACHE_MAXSIZE,
+            ttl=config.RESULT_CACHE_TTL,
+            check_interval=config.RESULT_CACHE_CHECK_INTERVAL,
+            shared=shared,
+        )
+    return _cache
+
+
+def cached_result(name: str):
+    """
+    함수 결과를 전역 결과 캐시에 보관하는 데코레이터
+
+    키는 (name, 위치 인자, 키워드 인자) 이며 인자는 해시 가능해야 한다.
+    예외가 발생한 호출은 캐시하지 않는다.
+    """
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = (name, args, tuple(sorted(kwargs.items())))
+            return get_result_cache().get_or_compute(
+                key, lambda: func(*args, **kwargs)
+            )
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,24 @@
+"""
+SQLite 조회 결과를 dict 행으로 변환하는 경량 매핑 계층
+
+API 응답 필드명은 SQL 의 컬럼 별칭(AS)으로 지정하고, 커서에서 읽은 튜플을
+바로 dict 로 만든다. DataFrame 을 거치지 않으므로 pandas 임포트와
+셀 단위 박싱 비용이 없다.
+"""
+
+import sqlite3
+
+
+def fetch_dicts(conn: sqlite3.Connection, sql: str, params: tuple = ()) -> list:
+    """
+    쿼리 결과 전체를 [{컬럼 별칭: 값}, ...] 으로 반환
+
+    컬럼명 목록은 커서당 한 번만 구한다. 풀에서 빌린 커넥션의
+    row_factory 는 다른 호출자와 공유되므로 건드리지 않는다.
+    """
+    cursor = conn.execute(sql, params)
+    try:
+        names = [col[0] for col in cursor.description or ()]
+        return [dict(zip(names, row)) for row in cursor.fetchall()]
+    finally:
+        cursor.close()
@@ -0,0 +1,178 @@
+"""
+워커 간 공유 결과 캐시 (SQLite 파일)
+
+워커를 여러 개 띄우면 프로세스마다 ResultCache(L1, 메모리)를 따로 가지므로
+같은 집계를 워커 수만큼 다시 계산한다. ResultCache 는 L1 에 없는 항목을
+이 저장소(L2)에서 찾고, 새로 계산한 결과를 여기에 넣어 다른 워커가 쓰게 한다.
+
+- 저장 위치는 UI 쪽 파일(SHARED_CACHE_PATH)이며 크롤러 DB 에는 쓰지 않는다.
+- 키는 캐시 키 repr 의 sha1, 값은 pickle 이다.
+- 버전은 프로세스마다 다른 PRAGMA data_version 을 뺀 DB 버전 토큰
+  (파일 mtime·크기, MAX(id))이라 모든 워커가 같은 값을 얻는다.
+- 만료는 벽시계(time.time) 기준이다.
+
+캐시는 최선 노력(best effort)이다. 파일이 잠겨 있거나 손상되어 오류가 나면
+경고만 남기고 캐시 없이 계산한다.
+"""
+
+import hashlib
+import os
+import pickle
+import sqlite3
+import threading
+import time
+
+from app.backend.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+# L2 에 값이 없을 때 get() 이 돌려주는 표식 (None 도 캐시할 수 있도록)
+MISS = object()
+
+
+def shared_key(key) -> str:
+    """캐시 키 -> 프로세스 간 같은 문자열 키"""
+    return hashlib.sha1(repr(key).encode("utf-8")).hexdigest()
+
+
+def shared_version(version) -> str:
+    """ResultCache 버전 토큰 -> 프로세스 간 같은 버전 문자열 (data_version 제외)"""
+    return repr(tuple(version[1:]))
+
+
+class SharedResultStore:
+    """
+    SQLite 기반 공유 결과 저장소 (스레드 안전, 여러 프로세스 동시 사용 가능)
+
+    Args:
+        path: 캐시 DB 파일 경로
+        maxsize: 최대 보관 항목 수 (넘으면 만료가 가까운 항목부터 제거)
+        busy_timeout_ms: 다른 워커가 쓰는 중일 때 기다릴 최대 시간(ms)
+    """
+
+    def __init__(self, path: str, maxsize: int = 1024, busy_timeout_ms: int = 200):
+        self.path = path
+        self.maxsize = max(1, maxsize)
+        self.busy_timeout_ms = busy_timeout_ms
+        self._lock = threading.Lock()
+        self._conn = None
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            conn = sqlite3.connect(
+                self.path,
+                timeout=self.busy_timeout_ms / 1000,
+                check_same_thread=False,
+                isolation_level=None,
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS result_cache (
+                    key TEXT PRIMARY KEY,
+                    version TEXT NOT NULL,
+                    expires_at REAL NOT NULL,
+                    value BLOB NOT NULL
+                )
+            """)
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_result_cache_expires ON result_cache (expires_at)"
+            )
+            self._conn = conn
+        return self._conn
+
+    def _failed(self, action: str, e: Exception):
+        self.errors += 1
+        logger.warning(f"⚠️ 공유 캐시 {action} 실패: {e}")
+        if isinstance(e, sqlite3.DatabaseError) and not isinstance(e, sqlite3.OperationalError):
+            # 손상 등 복구할 수 없는 오류면 다음 호출에서 다시 연결
+            self._close()
+
+    def get(self, key: str, version: str):
+        """version 이 같고 만료되지 않은 값. 없으면 MISS"""
+        with self._lock:
+            try:
+                row = self._connection().execute(
+                    "SELECT value FROM result_cache WHERE key = ? AND version = ? AND expires_at > ?",
+                    (key, version, time.time()),
+                ).fetchone()
+                value = pickle.loads(row[0]) if row else MISS
+            except (sqlite3.Error, pickle.UnpicklingError, EOFError) as e:
+                self._failed("조회", e)
+                return MISS
+            if value is MISS:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return value
+
+    def put(self, key: str, version: str, value, ttl: float):
+        """값 저장 (pickle 할 수 없는 값은 저장하지 않음)"""
+        try:
+            blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            return
+        with self._lock:
+            try:
+                conn = self._connection()
+                conn.execute(
+                    "INSERT OR REPLACE INTO result_cache (key, version, expires_at, value)"
+                    " VALUES (?, ?, ?, ?)",
+                    (key, version, time.time() + ttl, blob),
+                )
+                self._prune(conn)
+            except sqlite3.Error as e:
+                self._failed("저장", e)
+
+    def _prune(self, conn: sqlite3.Connection):
+        """만료 항목과 maxsize 초과분 제거"""
+        conn.execute("DELETE FROM result_cache WHERE expires_at <= ?", (time.time(),))
+        size = conn.execute("SELECT COUNT(*) FROM result_cache").fetchone()[0]
+        if size > self.maxsize:
+            conn.execute(
+                "DELETE FROM result_cache WHERE key IN"
+                " (SELECT key FROM result_cache ORDER BY expires_at LIMIT ?)",
+                (size - self.maxsize,),
+            )
+
+    def clear(self):
+        """모든 항목 제거 (다른 워커의 항목 포함) 및 카운터 초기화"""
+        with self._lock:
+            try:
+                self._connection().execute("DELETE FROM result_cache")
+            except sqlite3.Error as e:
+                self._failed("비우기", e)
+            self.hits = self.misses = self.errors = 0
+
+    def _close(self):
+        if self._conn is not None:
+            try:
+                self._conn.close()
+            except sqlite3.Error:
+                pass
+        self._conn = None
+
+    def close(self):
+        with self._lock:
+            self._close()
+
+    def stats(self) -> dict:
+        with self._lock:
+            try:
+                size = self._connection().execute("SELECT COUNT(*) FROM result_cache").fetchone()[0]
+            except sqlite3.Error:
+                size = None
+            lookups = self.hits + self.misses
+            return {
+                "path": self.path,
+                "size": size,
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 3) if lookups else 0.0,
+                "errors": self.errors,
+            }
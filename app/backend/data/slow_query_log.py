@@ -0,0 +1,153 @@
+"""
+느린 쿼리 기록 (slow-query log)
+
+db_util 의 조회는 profiled_fetchall / profiled_fetch_dicts 를 거쳐 실행된다.
+실행 시간이 SLOW_QUERY_MS 이상이면 SQL, 파라미터, 소요 시간, 반환 행 수와
+같은 커넥션에서 구한 EXPLAIN QUERY PLAN 을 크기 제한 버퍼(최근
+SLOW_QUERY_LOG_SIZE 건, 오래된 것부터 밀려남)에 남기고 WARNING 로그를 쓴다.
+계획에 인덱스 없는 전체 테이블 스캔이 있으면 full_scans 로 표시한다.
+
+기록은 프로세스 단위이며 /api/v1/diagnostics/slow-queries 로 조회한다.
+"""
+
+import re
+import sqlite3
+import threading
+import time
+from collections import deque
+from datetime import datetime
+
+from app.backend.core.config import config
+from app.backend.core.logger import get_logger, request_id_var
+from app.backend.data.row_mapper import fetch_dicts
+
+logger = get_logger(__name__)
+
+# "SCAN law_summary" 처럼 USING 없이 테이블을 통째로 읽는 계획
+_FULL_SCAN_RE = re.compile(r"^SCAN (\w+)(?! USING)\s*$")
+# 기록하는 파라미터 값 하나의 최대 길이
+MAX_PARAM_LENGTH = 200
+
+
+def explain_query(conn, sql: str, params: tuple = ()) -> list:
+    """EXPLAIN QUERY PLAN 결과의 detail 컬럼 목록 반환"""
+    rows = conn.execute(f"EXPLAIN QUERY PLAN {sql}", params).fetchall()
+    return [row[3] for row in rows]
+
+
+def find_full_scans(plan: list) -> list:
+    """쿼리 계획 중 인덱스 없이 테이블 전체를 읽는 단계만 반환"""
+    return [detail for detail in plan if _FULL_SCAN_RE.match(detail.strip())]
+
+
+def _short_param(value):
+    if isinstance(value, str) and len(value) > MAX_PARAM_LENGTH:
+        return value[:MAX_PARAM_LENGTH] + "…"
+    return value
+
+
+class SlowQueryLog:
+    """
+    느린 쿼리 기록 버퍼 (스레드 안전)
+
+    Args:
+        threshold_ms: 이 시간(ms) 이상 걸린 쿼리만 기록 (0 이하면 기록하지 않음)
+        maxlen: 보관할 최대 건수
+    """
+
+    def __init__(self, threshold_ms: float, maxlen: int = 200):
+        self.threshold_ms = threshold_ms
+        self._entries = deque(maxlen=max(maxlen, 1))
+        self._lock = threading.Lock()
+        self.recorded = 0
+
+    def is_slow(self, duration_ms: float) -> bool:
+        return self.threshold_ms > 0 and duration_ms >= self.threshold_ms
+
+    def record(self, conn, name: str, sql: str, params, duration_ms: float, rows: int):
+        """
+        느린 쿼리 하나 기록 (실행 계획은 같은 커넥션에서 조회)
+
+        Returns:
+            기록한 항목 dict
+        """
+        try:
+            plan = explain_query(conn, sql, params)
+        except sqlite3.Error as e:
+            plan = [f"EXPLAIN 실패: {e}"]
+        full_scans = find_full_scans(plan)
+        entry = {
+            "time": datetime.now().isoformat(timespec="seconds"),
+            "query": name,
+            "sql": " ".join(sql.split()),
+            "params": [_short_param(value) for value in params],
+            "duration_ms": round(duration_ms, 2),
+            "rows": rows,
+            "plan": plan,
+            "full_scans": full_scans,
+            "request_id": request_id_var.get(),
+        }
+        with self._lock:
+            self._entries.append(entry)
+            self.recorded += 1
+
+        logger.warning(f"🐢 느린 쿼리 ({name}): {entry['duration_ms']}ms, {rows} rows")
+        for detail in full_scans:
+            logger.warning(f"⚠️ 전체 테이블 스캔 감지 ({name}): {detail}")
+        return entry
+
+    def entries(self, limit: int = None, query: str = None) -> list:
+        """최근 기록부터 반환 (query 를 주면 해당 쿼리 이름만)"""
+        with self._lock:
+            items = list(reversed(self._entries))
+        if query:
+            items = [item for item in items if item["query"] == query]
+        return items[:limit] if limit else items
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "threshold_ms": self.threshold_ms,
+                "maxlen": self._entries.maxlen,
+                "size": len(self._entries),
+                "recorded": self.recorded,
+            }
+
+
+_slow_log = None
+
+
+def get_slow_query_log() -> SlowQueryLog:
+    """전역 느린 쿼리 기록 반환 (설정값으로 최초 1회 생성)"""
+    global _slow_log
+    if _slow_log is None:
+        _slow_log = SlowQueryLog(config.SLOW_QUERY_MS, config.SLOW_QUERY_LOG_SIZE)
+    return _slow_log
+
+
+def _profiled(conn, name: str, sql: str, params: tuple, fetch):
+    started = time.perf_counter()
+    rows = fetch(conn, sql, params)
+    duration_ms = (time.perf_counter() - started) * 1000
+    slow_log = get_slow_query_log()
+    if slow_log.is_slow(duration_ms):
+        slow_log.record(conn, name, sql, tuple(params), duration_ms, len(rows))
+    return rows
+
+
+def _fetchall(conn, sql: str, params: tuple) -> list:
+    return conn.execute(sql, params).fetchall()
+
+
+def profiled_fetchall(conn, name: str, sql: str, params: tuple = ()) -> list:
+    """conn.execute(sql, params).fetchall() 을 실행하고 느리면 기록"""
+    return _profiled(conn, name, sql, params, _fetchall)
+
+
+def profiled_fetch_dicts(conn, name: str, sql: str, params: tuple = ()) -> list:
+    """fetch_dicts(conn, sql, params) 를 실행하고 느리면 기록"""
+    return _profiled(conn, name, sql, params, fetch_dicts)
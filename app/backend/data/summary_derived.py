@@ -0,0 +1,168 @@
+"""
+summary 파생 컬럼 테이블(summary_derived) 관리
+
+law_summary.summary 는 크롤링한 HTML 원문이라 화면에 그대로 넣기엔
+안전하지 않고, 키워드 검색·발췌문을 만들 때마다 마크업을 다시 훑어야 한다.
+게시글마다 정제된 HTML, 평문, 발췌문, 평문 길이를 summary_derived 에 미리
+만들어 두고 검색·목록·상세 조회는 이 컬럼을 읽는다.
+
+크롤러는 행을 추가만 하므로 FTS 색인·일자별 집계와 같은 방식으로 id 기준
+증분 동기화한다(ui_meta 에 마지막으로 반영한 id 를 저장). HTML 파싱은 CPU
+작업이라 웹 워커의 GIL 을 잡지 않도록 프로세스 풀에서 실행하고, DB 쓰기는
+파싱이 끝난 배치 단위로 짧게 한다. 아직 반영되지 않은 최신 행은 조회 시
+원문에서 바로 만든다.
+"""
+
+import asyncio
+import multiprocessing
+import sqlite3
+from concurrent.futures import ProcessPoolExecutor
+
+from app.backend.core.logger import get_logger
+from app.backend.data.meta_table import (
+    ensure_meta_table,
+    get_meta_value,
+    set_meta_value,
+)
+from app.backend.data.text_util import derive_summary
+
+logger = get_logger(__name__)
+
+DERIVED_TABLE = "summary_derived"
+DERIVED_SYNC_KEY = "derived_last_id"
+
+# 프로세스 풀 작업자에 한 번에 넘기는 행 수
+DERIVE_CHUNKSIZE = 16
+
+
+def ensure_derived_table(conn: sqlite3.Connection):
+    """summary_derived 테이블 생성 (쓰기 커넥션 필요)"""
+    conn.execute(f"""
+        CREATE TABLE IF NOT EXISTS {DERIVED_TABLE} (
+            id INTEGER PRIMARY KEY,
+            safe_html TEXT NOT NULL,
+            plain_text TEXT NOT NULL,
+            excerpt TEXT NOT NULL,
+            content_length INTEGER NOT NULL
+        )
+    """)
+
+
+def create_derived_table(db_path: str):
+    """summary_derived 테이블만 생성 (startup 에서 실행 계획 확인 전에 호출)"""
+    conn = sqlite3.connect(db_path, timeout=30)
+    try:
+        ensure_derived_table(conn)
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def sync_summary_derived(db_path: str, batch_size: int = 200, executor=None) -> int:
+    """
+    law_summary 에 새로 추가된 행의 파생 컬럼을 summary_derived 에 반영
+
+    Args:
+        db_path: 데이터베이스 파일 경로
+        batch_size: 한 트랜잭션에서 처리할 행 수
+        executor: HTML 파싱을 실행할 프로세스 풀 (None 이면 현재 스레드에서 파싱)
+
+    Returns:
+        새로 만든 행 수
+    """
+    conn = sqlite3.connect(db_path, timeout=30)
+    try:
+        ensure_derived_table(conn)
+        ensure_meta_table(conn)
+        conn.commit()
+
+        last_id = int(get_meta_value(conn, DERIVED_SYNC_KEY, 0))
+        total = 0
+        while True:
+            rows = conn.execute(
+                """
+                SELECT id, summary FROM law_summary
+                WHERE id > ? ORDER BY id LIMIT ?
+                """,
+                (last_id, batch_size),
+            ).fetchall()
+            if not rows:
+                break
+            # 파싱하는 동안에는 쓰기 트랜잭션을 열지 않음
+            summaries = [summary or "" for _, summary in rows]
+            if executor is not None:
+                derived = list(executor.map(derive_summary, summaries, chunksize=DERIVE_CHUNKSIZE))
+            else:
+                derived = [derive_summary(summary) for summary in summaries]
+            conn.executemany(
+                f"""
+                INSERT OR REPLACE INTO {DERIVED_TABLE}
+                    (id, safe_html, plain_text, excerpt, content_length)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                [(id_, *values) for (id_, _), values in zip(rows, derived)],
+            )
+            last_id = rows[-1][0]
+            set_meta_value(conn, DERIVED_SYNC_KEY, last_id)
+            conn.commit()
+            total += len(rows)
+
+        if total:
+            logger.info(f"✅ summary 파생 컬럼 동기화: {total}건 추가 (last_id={last_id})")
+        return total
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+
+
+def rebuild_summary_derived(db_path: str, executor=None) -> int:
+    """summary_derived 를 비우고 처음부터 다시 생성 (정제 규칙을 바꿨을 때)"""
+    conn = sqlite3.connect(db_path, timeout=30)
+    try:
+        ensure_derived_table(conn)
+        ensure_meta_table(conn)
+        conn.commit()
+        # 테이블은 두고 행 삭제와 동기화 위치 초기화를 한 트랜잭션으로
+        # (DROP 은 바로 커밋되어 조회 쪽이 테이블 없는 순간을 보게 된다)
+        conn.execute("BEGIN IMMEDIATE")
+        conn.execute(f"DELETE FROM {DERIVED_TABLE}")
+        set_meta_value(conn, DERIVED_SYNC_KEY, 0)
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+    return sync_summary_derived(db_path, executor=executor)
+
+
+def derived_synced_id(conn: sqlite3.Connection):
+    """summary_derived 에 반영된 마지막 law_summary.id (아직 없으면 None)"""
+    value = get_meta_value(conn, DERIVED_SYNC_KEY)
+    return int(value) if value is not None else None
+
+
+async def run_derive_sync_loop(db_path: str, interval: float, workers: int):
+    """
+    interval 초마다 sync_summary_derived 를 실행하는 백그라운드 루프
+
+    workers 개의 프로세스 풀을 루프 동안 유지한다 (0 이면 프로세스 풀 없이).
+    스레드가 여럿 도는 워커 프로세스를 fork 하면 교착될 수 있어 spawn 으로 시작한다.
+    """
+    executor = None
+    if workers > 0:
+        executor = ProcessPoolExecutor(
+            max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+        )
+    try:
+        while True:
+            try:
+                await asyncio.to_thread(sync_summary_derived, db_path, executor=executor)
+            except Exception as e:
+                logger.error(f"❌ summary 파생 컬럼 동기화 실패: {e}")
+            await asyncio.sleep(interval)
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,180 @@
+"""
+HTML/텍스트 변환 유틸리티
+
+외부 모듈(로거·설정)에 의존하지 않으므로 파생 컬럼 동기화의 프로세스
+풀 작업자에서도 가볍게 임포트된다.
+"""
+
+import re
+from html import escape, unescape
+from html.parser import HTMLParser
+
+_BLOCK_RE = re.compile(r"<(script|style)\b.*?</\1\s*>", re.IGNORECASE | re.DOTALL)
+_COMMENT_RE = re.compile(r"<!--.*?-->", re.DOTALL)
+_TAG_RE = re.compile(r"<[^>]+>")
+_SPACE_RE = re.compile(r"\s+")
+# 잘린 HTML 끝의 닫히지 않은 script/style 블록과 태그
+_OPEN_BLOCK_RE = re.compile(r"<(script|style)\b.*\Z", re.IGNORECASE | re.DOTALL)
+_PARTIAL_TAG_RE = re.compile(r"<[^>]*\Z")
+
+# 목록 행에 싣는 평문 발췌문 길이 (글자 수)
+EXCERPT_LENGTH = 160
+
+# 정제된 HTML 에 남기는 태그와 속성 (그 외 태그는 버리고 내용만 남김)
+SAFE_TAGS = frozenset({
+    "a", "b", "strong", "i", "em", "u", "s", "sub", "sup", "small", "mark", "span", "font",
+    "p", "br", "hr", "div", "blockquote", "pre", "code",
+    "h1", "h2", "h3", "h4", "h5", "h6",
+    "ul", "ol", "li", "dl", "dt", "dd",
+    "table", "caption", "colgroup", "col", "thead", "tbody", "tfoot", "tr", "th", "td",
+    "img",
+})
+SAFE_ATTRS = {
+    "a": frozenset({"href", "title"}),
+    "img": frozenset({"src", "alt", "title", "width", "height"}),
+    "td": frozenset({"colspan", "rowspan"}),
+    "th": frozenset({"colspan", "rowspan", "scope"}),
+    "col": frozenset({"span"}),
+    "colgroup": frozenset({"span"}),
+}
+# 내용까지 버리는 태그
+DROP_CONTENT_TAGS = frozenset({"script", "style", "iframe", "object", "embed", "noscript", "template", "title"})
+# 닫는 태그가 없는 태그
+VOID_TAGS = frozenset({"br", "hr", "img", "col"})
+_URL_ATTRS = frozenset({"href", "src"})
+_SAFE_URL_RE = re.compile(r"^(https?:|mailto:|[^:]*$)", re.IGNORECASE)
+
+# snippet() 결과에서 하이라이트 구간을 표시하는 제어 문자
+MARK_OPEN = "\x02"
+MARK_CLOSE = "\x03"
+
+
+def html_to_text(html: str) -> str:
+    """
+    HTML에서 태그를 제거한 평문 반환
+
+    script/style 블록과 주석은 내용까지 제거하고, 엔티티는 디코딩하며
+    연속 공백은 하나로 줄인다.
+    """
+    if not html:
+        return ""
+    text = _BLOCK_RE.sub(" ", html)
+    text = _COMMENT_RE.sub(" ", text)
+    text = _TAG_RE.sub(" ", text)
+    text = unescape(text)
+    return _SPACE_RE.sub(" ", text).strip()
+
+
+def html_excerpt(html: str, length: int = EXCERPT_LENGTH) -> str:
+    """
+    HTML(앞부분만 잘라 온 것이어도 됨)의 평문 발췌문
+
+    잘린 끝의 태그 조각은 버리고, length 를 넘으면 잘라서 "…" 를 붙인다.
+    """
+    if not html:
+        return ""
+    html = _BLOCK_RE.sub(" ", html)
+    html = _PARTIAL_TAG_RE.sub(" ", _OPEN_BLOCK_RE.sub(" ", html))
+    return truncate_text(html_to_text(html), length)
+
+
+def truncate_text(text: str, length: int = EXCERPT_LENGTH) -> str:
+    """length 글자를 넘으면 잘라서 "…" 를 붙임"""
+    if len(text) > length:
+        return text[:length].rstrip() + "…"
+    return text
+
+
+class _HtmlSanitizer(HTMLParser):
+    """SAFE_TAGS/SAFE_ATTRS 만 남기고 태그 짝을 맞춘 HTML 을 만드는 파서"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.parts = []
+        self.open_tags = []
+        self.drop_depth = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in DROP_CONTENT_TAGS:
+            self.drop_depth += 1
+            return
+        if self.drop_depth or tag not in SAFE_TAGS:
+            return
+        allowed = SAFE_ATTRS.get(tag, ())
+        kept = []
+        for name, value in attrs:
+            if name not in allowed or value is None:
+                continue
+            if name in _URL_ATTRS and not _SAFE_URL_RE.match(value.strip()):
+                continue
+            kept.append(f' {name}="{escape(value)}"')
+        if tag == "a":
+            kept.append(' target="_blank" rel="noopener noreferrer"')
+        self.parts.append(f"<{tag}{''.join(kept)}>")
+        if tag not in VOID_TAGS:
+            self.open_tags.append(tag)
+
+    def handle_startendtag(self, tag, attrs):
+        if tag not in DROP_CONTENT_TAGS:
+            self.handle_starttag(tag, attrs)
+
+    def handle_endtag(self, tag):
+        if tag in DROP_CONTENT_TAGS:
+            self.drop_depth = max(self.drop_depth - 1, 0)
+            return
+        if self.drop_depth or tag not in self.open_tags:
+            return
+        while self.open_tags:
+            open_tag = self.open_tags.pop()
+            self.parts.append(f"</{open_tag}>")
+            if open_tag == tag:
+                break
+
+    def handle_data(self, data):
+        if not self.drop_depth:
+            self.parts.append(escape(data, quote=False))
+
+    def result(self) -> str:
+        self.close()
+        closing = "".join(f"</{tag}>" for tag in reversed(self.open_tags))
+        return "".join(self.parts) + closing
+
+
+def sanitize_html(html: str) -> str:
+    """
+    크롤링한 HTML 을 화면에 그대로 넣어도 안전한 HTML 로 정제
+
+    스크립트·스타일·iframe 등은 내용까지 버리고, 허용하지 않는 태그는 내용만
+    남긴다. on* 이벤트·style 속성과 javascript: 같은 URL 은 제거하고, 닫히지
+    않은 태그는 끝에서 닫는다.
+    """
+    if not html:
+        return ""
+    sanitizer = _HtmlSanitizer()
+    sanitizer.feed(html)
+    return sanitizer.result()
+
+
+def derive_summary(html: str) -> tuple:
+    """
+    summary HTML → (정제된 HTML, 평문, 발췌문, 평문 길이)
+
+    summary_derived 동기화에서 프로세스 풀로 실행한다 (모듈 최상위 함수).
+    """
+    text = html_to_text(html)
+    return sanitize_html(html), text, truncate_text(text), len(text)
+
+
+def highlight_to_html(text: str, tag: str = "mark") -> str:
+    """
+    MARK_OPEN/MARK_CLOSE 로 표시된 평문을 안전한 HTML로 변환
+
+    평문은 escape 한 뒤 표시 구간만 <mark> 태그로 감싼다.
+    """
+    if not text:
+        return ""
+    return (
+        escape(text)
+        .replace(MARK_OPEN, f"<{tag}>")
+        .replace(MARK_CLOSE, f"</{tag}>")
+    )
@@ -0,0 +1,158 @@
+"""
+LAW_SITE_DESC.yaml → yaml_info 동기화
+
+startup 마다(워커가 여러 개면 워커마다) 호출되므로 평소에는 DB 에 쓰지 않는다.
+
+- YAML 파일 내용의 sha256 을 ui_meta(yaml_info_hash)에 저장하고,
+  같으면 YAML 을 파싱하지도 않고 바로 끝낸다.
+- 다르면 기존 행과 비교해 바뀐 페이지만 INSERT OR REPLACE, 없어진 페이지만
+  DELETE 한다 (executemany, 한 트랜잭션).
+
+Streamlit UI(ui/utils/db_manager.py)도 같은 ui_meta 키를 쓴다.
+"""
+
+import hashlib
+import sqlite3
+
+import yaml
+
+from app.backend.core.logger import get_logger
+from app.backend.data.meta_table import (
+    ensure_meta_table,
+    get_meta_value,
+    set_meta_value,
+)
+
+logger = get_logger(__name__)
+
+YAML_TABLE = "yaml_info"
+YAML_HASH_KEY = "yaml_info_hash"
+YAML_INFO_COLUMNS = ("site_name", "page_id", "h_name", "desc", "url", "detail_url")
+
+
+def yaml_file_hash(yaml_path: str) -> str:
+    """YAML 파일 내용의 sha256"""
+    digest = hashlib.sha256()
+    with open(yaml_path, "rb") as f:
+        for chunk in iter(lambda: f.read(65536), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def load_yaml_rows(yaml_path: str) -> tuple:
+    """
+    YAML 파일을 yaml_info 행 목록으로 변환
+
+    Returns:
+        (행 튜플 목록, 사이트 수)
+    """
+    with open(yaml_path, "r", encoding="utf-8") as f:
+        data = yaml.safe_load(f) or {}
+
+    rows = []
+    for site_name, site_info in data.items():
+        h_name = site_info.get("h_name", "")
+        base_url = site_info.get("url", "")
+        # pages 배열 처리
+        for page in site_info.get("pages", []):
+            rows.append((
+                site_name,
+                page.get("id", ""),
+                h_name,
+                page.get("desc", ""),
+                base_url,
+                page.get("detail_url", ""),
+            ))
+    return rows, len(data)
+
+
+def diff_yaml_rows(existing: list, rows: list) -> tuple:
+    """
+    기존 행과 새 행 비교 (키: site_name, page_id)
+
+    Returns:
+        (새로 쓰거나 바꿀 행 목록, 지울 (site_name, page_id) 목록)
+    """
+    current = {row[:2]: tuple(row) for row in existing}
+    wanted = {row[:2]: tuple(row) for row in rows}
+    upserts = [row for key, row in wanted.items() if current.get(key) != row]
+    deletes = [key for key in current if key not in wanted]
+    return upserts, deletes
+
+
+def ensure_yaml_table(conn: sqlite3.Connection):
+    """yaml_info 테이블 생성 (쓰기 커넥션 필요)"""
+    conn.execute(f"""
+        CREATE TABLE IF NOT EXISTS {YAML_TABLE} (
+            site_name TEXT NOT NULL,
+            page_id TEXT NOT NULL,
+            h_name TEXT,
+            desc TEXT,
+            url TEXT,
+            detail_url TEXT,
+            PRIMARY KEY (site_name, page_id)
+        )
+    """)
+
+
+def _table_exists(conn: sqlite3.Connection) -> bool:
+    return conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (YAML_TABLE,)
+    ).fetchone() is not None
+
+
+def sync_yaml_info(db_path: str, yaml_path: str) -> dict:
+    """
+    YAML 이 바뀌었을 때만 yaml_info 에 차이를 반영
+
+    Args:
+        db_path: 데이터베이스 파일 경로
+        yaml_path: YAML 파일 경로
+
+    Returns:
+        {"changed": 파일 해시가 달라 동기화했는지, "upserted": 쓴 행 수, "deleted": 지운 행 수}
+    """
+    file_hash = yaml_file_hash(yaml_path)
+    result = {"changed": False, "upserted": 0, "deleted": 0}
+
+    conn = sqlite3.connect(db_path, timeout=30, isolation_level=None)
+    try:
+        # 해시가 같으면 읽기만 하고 끝 (쓰기 잠금 없음)
+        if _table_exists(conn) and get_meta_value(conn, YAML_HASH_KEY) == file_hash:
+            logger.info("YAML 데이터 변경 없음 (해시 동일)")
+            return result
+
+        rows, site_count = load_yaml_rows(yaml_path)
+
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            ensure_yaml_table(conn)
+            ensure_meta_table(conn)
+            existing = conn.execute(
+                f"SELECT {', '.join(YAML_INFO_COLUMNS)} FROM {YAML_TABLE}"
+            ).fetchall()
+            upserts, deletes = diff_yaml_rows(existing, rows)
+            if deletes:
+                conn.executemany(
+                    f"DELETE FROM {YAML_TABLE} WHERE site_name = ? AND page_id = ?", deletes
+                )
+            if upserts:
+                conn.executemany(
+                    f"INSERT OR REPLACE INTO {YAML_TABLE}"
+                    f" ({', '.join(YAML_INFO_COLUMNS)}) VALUES (?, ?, ?, ?, ?, ?)",
+                    upserts,
+                )
+            set_meta_value(conn, YAML_HASH_KEY, file_hash)
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+    finally:
+        conn.close()
+
+    result.update(changed=True, upserted=len(upserts), deleted=len(deletes))
+    logger.info(
+        f"YAML 데이터 동기화 완료: 사이트 {site_count}개, 페이지 {len(rows)}개"
+        f" (변경 {len(upserts)}건, 삭제 {len(deletes)}건)"
+    )
+    return result
@@ -1,11 +1,13 @@
+import asyncio
 import os
 import sys
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 
-from app.backend.core.logger import get_logger
+from app.backend.core.logger import get_logger, start_logging, stop_logging
 from app.backend.core.config import config
 from app.backend.api.endpoints.home_routes import router as home_router
 from app.backend.api.v1.dashboard import router as dashboard_router
@@ -14,19 +16,40 @@ from app.backend.api.v1.statistics import router as statistics_router
 from app.backend.api.v1.logs import router as logs_router
 from app.backend.api.v1.settings import router as settings_router
 from app.backend.api.v1.attachments import router as attachments_router
+from app.backend.api.v1.items import router as items_router
+from app.backend.api.v1.diagnostics import router as diagnostics_router
+from app.backend.api.v1.diagnostics import metrics_router
+from app.backend.core.executor import get_executor, shutdown_executors
+from app.backend.core.middleware import RequestIdMiddleware, TimingMiddleware
+from app.backend.core.loop_monitor import get_loop_monitor
+from app.backend.core.process_lock import ProcessLock
 from app.backend.data.db_util import create_and_fill_yaml_table
+from app.backend.data.db_pool import get_pool, close_pool
+from app.backend.data.index_manager import ensure_indexes, explain_hot_queries
+from app.backend.data.fts_index import run_fts_sync_loop
+from app.backend.data.daily_rollup import run_daily_sync_loop
+from app.backend.data.summary_derived import create_derived_table, run_derive_sync_loop
+from app.backend.data.log_index import run_log_index_loop
+from app.backend.data.result_cache import get_result_cache
 
 from app.backend.core.exception_handler import add_exception_handlers
 
 
 logger = get_logger(__name__)
 
+# startup 에서 띄운 백그라운드 작업 (shutdown 시 취소)
+background_tasks = []
+
+# 다른 워커의 startup DB 초기화를 기다리는 최대 시간(초)
+STARTUP_LOCK_TIMEOUT = 120
+
 
 def create_app() -> FastAPI:
-    app = FastAPI(title="Law Crawler UI - 법규사이트 정보 모음", version="0.0.1")
+    app = FastAPI(
+        title="Law Crawler UI - 법규사이트 정보 모음", version="0.0.1", lifespan=lifespan
+    )
     add_middlewares(app)
     add_routes(app)
-    add_event_handlers(app)
     add_static_files(app)
     add_exception_handlers(app)
     return app
@@ -34,6 +57,12 @@ def create_app() -> FastAPI:
 
 def add_middlewares(app: FastAPI):
     """미들웨어 설정"""
+    # 라우트별 요청 처리 시간 (/metrics)
+    app.add_middleware(TimingMiddleware)
+
+    # 요청별 correlation id (로그의 [request_id])
+    app.add_middleware(RequestIdMiddleware)
+
     # CORS 설정
     app.add_middleware(
         CORSMiddleware,
@@ -55,12 +84,21 @@ def add_routes(app: FastAPI):
     app.include_router(logs_router, prefix="/api/v1")
     app.include_router(settings_router, prefix="/api/v1")
     app.include_router(attachments_router, prefix="/api/v1")
+    app.include_router(items_router, prefix="/api/v1")
+    app.include_router(diagnostics_router, prefix="/api/v1")
 
+    # Prometheus scrape 경로 (/metrics)
+    app.include_router(metrics_router)
 
-def add_event_handlers(app: FastAPI):
-    """이벤트 핸들러 설정"""
-    app.add_event_handler("startup", startup_event)
-    app.add_event_handler("shutdown", shutdown_event)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """application 시작/종료 이벤트 (startup_event → 요청 처리 → shutdown_event)"""
+    await startup_event()
+    try:
+        yield
+    finally:
+        await shutdown_event()
 
 
 def add_static_files(app: FastAPI):
@@ -81,6 +119,8 @@ def add_static_files(app: FastAPI):
 
 async def startup_event():
     """Law Crawler UI application  시작"""
+    # 같은 프로세스에서 다시 시작한 경우(테스트 등) 멈춘 writer 스레드를 다시 띄움
+    start_logging()
     logger.info("---------------------------------")
     logger.info("Startup 프로세스 시작")
     logger.info("---------------------------------")
@@ -120,12 +160,52 @@ async def startup_event():
 
     logger.info(f"DB 파일 경로: {db_path}")
 
-    # yaml_info 테이블 생성 및 YAML 데이터 로드
+    # DB 에 쓰는 초기화는 워커 하나씩 차례로 (여러 워커 동시 startup 경합 방지)
+    startup_lock = ProcessLock("startup")
+    if not startup_lock.acquire(timeout=STARTUP_LOCK_TIMEOUT):
+        logger.warning(f"⚠️ startup 잠금 대기 시간 초과({STARTUP_LOCK_TIMEOUT}초), 잠금 없이 진행")
+    try:
+        # yaml_info 테이블 생성 및 YAML 데이터 로드 (변경이 있을 때만 씀)
+        try:
+            create_and_fill_yaml_table(db_path, config.YAML_PATH)
+            logger.info("YAML 데이터 로드 완료")
+        except Exception as e:
+            logger.error(f"YAML 데이터 로드 중 오류: {e}")
+
+        # 조회용 인덱스 생성/확인
+        try:
+            ensure_indexes(db_path)
+        except Exception as e:
+            logger.error(f"인덱스 확인 중 오류: {e}")
+
+        # summary 파생 컬럼 테이블 (채우기는 leader 워커의 백그라운드 동기화)
+        try:
+            create_derived_table(db_path)
+        except Exception as e:
+            logger.error(f"summary 파생 컬럼 테이블 생성 중 오류: {e}")
+    finally:
+        startup_lock.release()
+
+    # 읽기 전용 DB 커넥션 풀 준비 및 점검
+    pool = get_pool()
+    if pool.health_check():
+        logger.info(f"✅ DB 커넥션 풀 정상: {pool.stats()}")
+    else:
+        logger.error("❌ DB 커넥션 풀 헬스 체크 실패")
+
+    # 주요 쿼리 실행 계획 출력 (전체 스캔 회귀 감지)
     try:
-        create_and_fill_yaml_table(db_path, config.YAML_PATH)
-        logger.info("YAML 데이터 로드 완료")
+        explain_hot_queries()
     except Exception as e:
-        logger.error(f"YAML 데이터 로드 중 오류: {e}")
+        logger.error(f"쿼리 실행 계획 확인 중 오류: {e}")
+
+    # 블로킹 I/O 스레드 풀 준비 및 이벤트 루프 지연 측정 시작
+    get_executor("db")
+    get_executor("file")
+    background_tasks.append(asyncio.create_task(get_loop_monitor().run()))
+
+    # DB·색인 파일에 쓰는 백그라운드 작업은 leader 워커 하나만 실행
+    background_tasks.append(asyncio.create_task(run_leader_tasks(db_path)))
 
     logger.info("scheduler 시작함...")
     logger.info("---------------------------------")
@@ -133,11 +213,60 @@ async def startup_event():
     logger.info("---------------------------------")
 
 
+def leader_jobs(db_path: str) -> list:
+    """leader 워커가 실행할 백그라운드 쓰기 작업 코루틴 목록"""
+    jobs = [
+        # 전문 검색 색인 증분 동기화 (첫 실행은 전체 색인이라 백그라운드로)
+        run_fts_sync_loop(db_path, config.FTS_SYNC_INTERVAL),
+        # 대시보드 일자별 집계 증분 동기화 (미반영 행은 조회 시 id 범위로 보완)
+        run_daily_sync_loop(db_path, config.DAILY_ROLLUP_SYNC_INTERVAL),
+        # summary 정제 HTML·평문·발췌문 증분 생성 (HTML 파싱은 프로세스 풀)
+        run_derive_sync_loop(db_path, config.DERIVE_SYNC_INTERVAL, config.DERIVE_WORKERS),
+    ]
+    # 크롤러 로그 증분 색인 (/api/v1/logs/query)
+    if config.CRAWLER_LOG_DIR:
+        jobs.append(
+            run_log_index_loop(
+                config.LOG_INDEX_DB_PATH,
+                config.CRAWLER_LOG_DIR,
+                db_path,
+                config.LOG_INDEX_SYNC_INTERVAL,
+            )
+        )
+    return jobs
+
+
+async def run_leader_tasks(db_path: str):
+    """
+    leader 잠금을 잡은 워커에서만 백그라운드 쓰기 작업 실행
+
+    잠금을 못 잡은 워커는 LEADER_RETRY_INTERVAL 초마다 다시 시도하므로
+    leader 워커가 죽거나 재시작되면 다른 워커가 이어받는다.
+    """
+    leader_lock = ProcessLock("leader")
+    while not leader_lock.acquire(timeout=0):
+        await asyncio.sleep(config.LEADER_RETRY_INTERVAL)
+
+    logger.info(f"👑 leader 워커 (pid={os.getpid()}): 색인·집계 동기화 시작")
+    try:
+        await asyncio.gather(*leader_jobs(db_path))
+    finally:
+        leader_lock.release()
+
+
 async def shutdown_event():
     """application 종료"""
+    for task in background_tasks:
+        task.cancel()
+    background_tasks.clear()
+    shutdown_executors()
+    get_result_cache().close()
+    close_pool()
     logger.info("---------------------------------")
     logger.info("Shutdown 프로세스 종료")
     logger.info("---------------------------------")
+    # 큐에 남은 로그를 모두 쓰고 writer 스레드 종료
+    stop_logging()
 
 
 app = create_app()
@@ -145,13 +274,26 @@ app = create_app()
 if __name__ == "__main__":
     import uvicorn
     import argparse
+    import multiprocessing
+
+    # PyInstaller 빌드에서 워커 프로세스(spawn) 시작 지원 (인자 파싱보다 먼저)
+    multiprocessing.freeze_support()
 
     # 커맨드라인 인자 파싱
     parser = argparse.ArgumentParser(description="Law Crawler UI")
     parser.add_argument("--host", type=str, default="0.0.0.0", help="Host address (default: 0.0.0.0)")
     parser.add_argument("--port", type=int, default=8000, help="Port number (default: 8000)")
+    parser.add_argument(
+        "--workers", type=int, default=config.WORKERS,
+        help="Worker process count (default: WORKERS env or 1)",
+    )
     args = parser.parse_args()
 
     logger.info("Law Crawler UI version: " + config.VERSION)
-    logger.info(f"Starting server on {args.host}:{args.port}")
-    uvicorn.run(app, host=args.host, port=args.port)
+    logger.info(f"Starting server on {args.host}:{args.port} (workers={args.workers})")
+    if args.workers > 1:
+        # 워커 프로세스는 앱을 새로 임포트하므로 워커 수(풀 크기·공유 캐시)를 환경 변수로 전달
+        os.environ["WORKERS"] = str(args.workers)
+        uvicorn.run("app.backend.main:app", host=args.host, port=args.port, workers=args.workers)
+    else:
+        uvicorn.run(app, host=args.host, port=args.port)
@@ -5,12 +5,11 @@
 from datetime import datetime, timedelta
 from app.backend.core.logger import get_logger
 from app.backend.data.db_util import (
-    total_site_attach_counts,
-    error_count_of_last_24h,
+    window_counts,
     get_summary_list,
-    get_summary_db_file,
 )
-import sqlite3
+from app.backend.data.db_pool import get_connection
+from app.backend.data.result_cache import cached_result
 
 logger = get_logger(__name__)
 
@@ -23,13 +22,10 @@ def _get_latest_data_date():
         str: 최신 날짜 (YYYY-MM-DD 형식), 데이터가 없으면 None
     """
     try:
-        db_path = get_summary_db_file()
-        conn = sqlite3.connect(db_path)
-        cursor = conn.cursor()
-
-        cursor.execute("SELECT DATE(MAX(upd_time)) FROM law_summary")
-        result = cursor.fetchone()
-        conn.close()
+        with get_connection() as conn:
+            result = conn.execute(
+                "SELECT DATE(MAX(upd_time)) FROM law_summary"
+            ).fetchone()
 
         if result and result[0]:
             return result[0]
@@ -56,24 +52,27 @@ def get_dashboard_metrics():
     )  # 오늘 포함 7일
     first_days_age = "1900-01-01"  # 초기 데이터 수집 시작일
 
-    # 각 기간별 수집 데이터
-    # 오늘: 특정 날짜만 (to_date=None)
-    today_site_count, today_attach_count = total_site_attach_counts(today, to_date=None)
-    # 3일: 3일 전 ~ 오늘
-    three_site_count, three_attach_count = total_site_attach_counts(
-        three_days_ago, today
-    )
-    # 7일: 7일 전 ~ 오늘
-    seven_site_count, seven_attach_count = total_site_attach_counts(
-        seven_days_ago, today
+    return _dashboard_metrics(today, three_days_ago, seven_days_ago, first_days_age)
+
+
+@cached_result("dashboard.metrics")
+def _dashboard_metrics(today, three_days_ago, seven_days_ago, first_days_age):
+    """기준 날짜별 메트릭 계산 (DB 가 바뀌기 전까지 결과 캐시)"""
+    # 각 기간별 수집 데이터와 오류 건수를 한 번의 집계 쿼리로 조회
+    # 오늘: 특정 날짜만 / 3일·7일: N일 전 ~ 오늘 / 전체: 처음 ~ 오늘
+    counts = window_counts(
+        {
+            "today": (today, None),
+            "three_days": (three_days_ago, today),
+            "seven_days": (seven_days_ago, today),
+            "total": (first_days_age, today),
+        }
     )
-    # 전체: 처음 ~ 오늘
-    first_site_count, first_attach_count = total_site_attach_counts(
-        first_days_age, today
-    )
-
-    # 오류 건수
-    error_count = error_count_of_last_24h()
+    today_site_count, today_attach_count = counts["today"]
+    three_site_count, three_attach_count = counts["three_days"]
+    seven_site_count, seven_attach_count = counts["seven_days"]
+    first_site_count, first_attach_count = counts["total"]
+    error_count = counts["error_count"]
 
     return {
         "site_count": f"{first_site_count} ({first_attach_count})",  # 수집 사이트(pages)로 표현
@@ -113,41 +112,18 @@ def get_dashboard_data(period: str = "today"):
 
     from_date, to_date = period_map.get(period, (today, None))
 
-    try:
-        logger.info(
-            f"대시보드 데이터 조회 시작: period={period}, from_date={from_date}, to_date={to_date}"
-        )
-        df = get_summary_list(from_date, to_date)
-        logger.info(f"DB 조회 결과: {len(df)} rows, columns={list(df.columns)}")
-
-        # DataFrame을 딕셔너리 리스트로 변환
-        rows = []
-        for _, row in df.iterrows():
-            site_code = row.get("site_name", "")
-            page_code = row.get("page_id", "")
-            real_seq = str(row.get("real_seq", ""))
-
-            rows.append(
-                {
-                    "site_name": row.get("사이트", ""),  # h_name (사이트 명칭)
-                    "page_id": row.get("페이지", ""),  # desc (페이지 명칭)
-                    "title": row.get("제목", ""),
-                    "registration_date": row.get("등록일", ""),
-                    "collection_date": row.get("수집일시", ""),
-                    "site_url": row.get("site_url", ""),
-                    "detail_url": row.get("detail_url", ""),
-                    "org_url": row.get("org_url", ""),
-                    "summary": row.get("summary", ""),
-                    "real_seq": real_seq,
-                    "site_code": site_code,  # 실제 코드 (첨부파일 조회용)
-                    "page_code": page_code,  # 실제 코드 (첨부파일 조회용)
-                }
-            )
-        logger.info(f"✅ 대시보드 데이터 로드 성공: {len(rows)} rows from {from_date}")
-        return rows
-    except Exception as e:
-        logger.error(f"❌ 대시보드 데이터 로드 실패: {e}")
-        import traceback
+    # 조회 실패는 예외로 라우터에 넘긴다 (빈 결과가 ETag 와 함께 캐시되지 않도록)
+    logger.info(
+        f"대시보드 데이터 조회 시작: period={period}, from_date={from_date}, to_date={to_date}"
+    )
+    # 응답 필드명은 SQL 별칭으로 지정됨 (site_name/page_id 는 명칭,
+    # site_code/page_code 는 첨부파일 조회용 실제 코드)
+    rows = _summary_rows(from_date, to_date)
+    logger.info(f"✅ 대시보드 데이터 로드 성공: {len(rows)} rows from {from_date}")
+    return rows
+
 
-        logger.error(f"❌ 스택 트레이스: {traceback.format_exc()}")
-        return []
+@cached_result("dashboard.data")
+def _summary_rows(from_date, to_date):
+    """기간별 요약 목록 (DB 가 바뀌기 전까지 결과 캐시)"""
+    return get_summary_list(from_date, to_date)
@@ -3,7 +3,8 @@
 """
 
 from datetime import datetime, timedelta
-from app.backend.data.log_util import get_log_data
+from app.backend.data.log_util import get_crawler_log_file_path
+from app.backend.data.log_reader import read_lines_after, read_lines_before
 from app.backend.core.logger import get_logger
 import os
 import glob
@@ -29,62 +30,95 @@ def get_available_dates(days_back=7):
     return dates
 
 
-def get_crawler_log(log_date: str):
+def _read_log_page(log_file: str, offset=None, limit=None, before=None) -> dict:
     """
-    크롤러 로그 내용 반환
+    로그 파일의 한 화면 분량 읽기
+
+    offset 이 있으면 그 위치부터 앞으로, 없으면 before(기본: 파일 끝) 직전
+    limit 줄을 읽는다.
+
+    Returns:
+        {"content", "start", "end", "size", "has_before", "has_after"}
+    """
+    from app.backend.core.config import config
+
+    limit = limit or config.LOG_PAGE_LINES
+    if offset is not None:
+        page = read_lines_after(log_file, offset, limit)
+    else:
+        page = read_lines_before(log_file, before, limit)
+
+    return {
+        "content": "\n".join(page["lines"]),
+        "start": page["start"],
+        "end": page["end"],
+        "size": page["size"],
+        "has_before": page["start"] > 0,
+        "has_after": page["end"] < page["size"],
+    }
+
+
+def get_crawler_log(log_date: str, offset=None, limit=None, before=None):
+    """
+    크롤러 로그 내용 반환 (기본: 마지막 LOG_PAGE_LINES 줄)
 
     Args:
         log_date: 로그 날짜 (YYYY-MM-DD)
+        offset: 이 바이트 오프셋부터 앞으로 읽기
+        limit: 최대 줄 수
+        before: 이 바이트 오프셋 직전까지 읽기 (offset 이 없을 때)
 
     Returns:
-        {"content": "로그 내용", "path": "파일경로", "filename": "파일명"}
+        {"content": "로그 내용", "path": "파일경로", "filename": "파일명", "start", "end", "size", ...}
     """
     try:
         # log_date 형식: YYYY-MM-DD
         date_obj = datetime.strptime(log_date, "%Y-%m-%d").date()
-        log_content, log_fullpath = get_log_data(date_obj)
+        log_fullpath = get_crawler_log_file_path(date_obj)
 
-        if log_content is None or len(log_content) == 0:
+        if not os.path.exists(log_fullpath) or os.path.getsize(log_fullpath) == 0:
             return {
                 "content": "해당 날짜의 로그가 없습니다.",
                 "path": "",
                 "filename": "",
             }
 
-        content_text = "\n".join(line.rstrip("\n") for line in log_content)
-        filename = log_fullpath.split("\\")[-1] if log_fullpath else "log.txt"
+        page = _read_log_page(log_fullpath, offset, limit, before)
+        filename = os.path.basename(log_fullpath)
 
-        return {"content": content_text, "path": log_fullpath, "filename": filename}
+        return {**page, "path": log_fullpath, "filename": filename}
     except Exception as e:
         logger.error(f"❌ 크롤러 로그 로드 실패: {e}")
         return {"content": f"로그 로드 중 오류 발생: {e}", "path": "", "filename": ""}
 
 
-def get_ui_log():
+def get_ui_log_path() -> str:
+    """FastAPI UI 로그 파일 경로"""
+    from app.backend.core.config import config
+
+    return os.path.join(config.UI_LOG_DIR, "law_crawler.log")
+
+
+def get_ui_log(offset=None, limit=None, before=None):
     """
-    FastAPI UI 로그 내용 반환
+    FastAPI UI 로그 내용 반환 (기본: 마지막 LOG_PAGE_LINES 줄)
+
+    Args:
+        offset / limit / before: get_crawler_log 와 같음
 
     Returns:
-        {"content": "로그 내용", "path": "파일경로", "filename": "파일명"}
+        {"content": "로그 내용", "path": "파일경로", "filename": "파일명", "start", "end", "size", ...}
     """
     try:
-        from app.backend.core.config import config
+        log_file = get_ui_log_path()
 
-        log_file = os.path.join(config.UI_LOG_DIR, "law_crawler.log")
-
-        if not os.path.exists(log_file):
-            return {"content": "UI 로그가 없습니다.", "path": "", "filename": ""}
-
-        with open(log_file, "r", encoding="utf-8") as f:
-            log_lines = f.readlines()
-
-        if not log_lines:
+        if not os.path.exists(log_file) or os.path.getsize(log_file) == 0:
             return {"content": "UI 로그가 없습니다.", "path": "", "filename": ""}
 
-        content_text = "\n".join(line.rstrip("\n") for line in log_lines)
-        filename = log_file.split("\\")[-1] if log_file else "ui.log"
+        page = _read_log_page(log_file, offset, limit, before)
+        filename = os.path.basename(log_file)
 
-        return {"content": content_text, "path": log_file, "filename": filename}
+        return {**page, "path": log_file, "filename": filename}
     except Exception as e:
         logger.error(f"❌ UI 로그 로드 실패: {e}")
         return {"content": f"로그 로드 중 오류 발생: {e}", "path": "", "filename": ""}
@@ -144,33 +178,44 @@ def get_crawler_log_files():
         return []
 
 
-def get_crawler_log_by_filename(filename: str):
+def resolve_crawler_log_file(filename: str):
+    """
+    크롤러 로그 디렉터리 안의 파일 경로 (경로 구분자가 들어간 이름은 거부)
+
+    Returns:
+        파일 경로, 없거나 허용되지 않는 이름이면 None
+    """
+    from app.backend.core.config import config
+
+    if not filename or os.path.basename(filename) != filename or filename in (".", ".."):
+        return None
+    log_file = os.path.join(config.CRAWLER_LOG_DIR, filename)
+    return log_file if os.path.isfile(log_file) else None
+
+
+def get_crawler_log_by_filename(filename: str, offset=None, limit=None, before=None):
     """
-    크롤러 로그 파일 내용 반환
+    크롤러 로그 파일 내용 반환 (기본: 마지막 LOG_PAGE_LINES 줄)
 
     Args:
         filename: 로그 파일명
+        offset / limit / before: get_crawler_log 와 같음
 
     Returns:
-        {"content": "로그 내용", "path": "파일경로", "filename": "파일명"}
+        {"content": "로그 내용", "path": "파일경로", "filename": "파일명", "start", "end", "size", ...}
     """
     try:
-        from app.backend.core.config import config
-
-        log_file = os.path.join(config.CRAWLER_LOG_DIR, filename)
+        log_file = resolve_crawler_log_file(filename)
 
-        if not os.path.exists(log_file):
+        if log_file is None:
             return {"content": "해당 로그 파일이 없습니다.", "path": "", "filename": ""}
 
-        with open(log_file, "r", encoding="utf-8") as f:
-            log_lines = f.readlines()
-
-        if not log_lines:
+        if os.path.getsize(log_file) == 0:
             return {"content": "로그 내용이 없습니다.", "path": log_file, "filename": filename}
 
-        content_text = "\n".join(line.rstrip("\n") for line in log_lines)
+        page = _read_log_page(log_file, offset, limit, before)
 
-        return {"content": content_text, "path": log_file, "filename": filename}
+        return {**page, "path": log_file, "filename": filename}
     except Exception as e:
         logger.error(f"❌ 크롤러 로그 파일 조회 실패: {e}")
         return {"content": f"로그 조회 중 오류 발생: {e}", "path": "", "filename": ""}
@@ -4,9 +4,11 @@
 
 from app.backend.core.logger import get_logger
 from app.backend.data.db_util import (
-    search_law_summary,
+    search_law_summary_page,
     get_site_and_code_dict,
 )
+from app.backend.data.result_cache import cached_result
+from app.backend.data.text_util import highlight_to_html
 
 logger = get_logger(__name__)
 
@@ -18,17 +20,18 @@ def get_sites_list():
     Returns:
         [{"code": "code1", "name": "사이트명1"}, ...]
     """
-    try:
-        site_dict = get_site_and_code_dict()
-        sites = [{"code": code, "name": name} for code, name in site_dict.items()]
-        return sorted(sites, key=lambda x: x["name"])
-    except Exception as e:
-        logger.error(f"❌ 사이트 목록 로드 실패: {e}")
-        return []
+    # 조회 실패는 예외로 라우터에 넘긴다 (빈 목록이 ETag 와 함께 캐시되지 않도록)
+    site_dict = _cached_site_dict()
+    sites = [{"code": code, "name": name} for code, name in site_dict.items()]
+    return sorted(sites, key=lambda x: x["name"])
 
 
 def search_data(
-    site_names: list = None, keyword: str = "", page: int = 1, pagesize: int = 30
+    site_names: list = None,
+    keyword: str = "",
+    page: int = 1,
+    pagesize: int = 30,
+    cursor: str = None,
 ):
     """
     키워드 기반 데이터 검색 (페이징 지원)
@@ -38,6 +41,7 @@ def search_data(
         keyword: 검색 키워드 (선택사항)
         page: 페이지 번호 (1부터 시작)
         pagesize: 페이지당 항목 수
+        cursor: 이전 응답의 next_cursor (다음 페이지를 keyset 으로 조회)
 
     Returns:
         {
@@ -45,7 +49,8 @@ def search_data(
             "total": 전체 항목 수,
             "page": 현재 페이지,
             "pagesize": 페이지당 항목 수,
-            "total_pages": 전체 페이지 수
+            "total_pages": 전체 페이지 수,
+            "next_cursor": 다음 페이지 커서 (없으면 None)
         }
     """
     try:
@@ -61,47 +66,31 @@ def search_data(
                 "page": page,
                 "pagesize": pagesize,
                 "total_pages": 0,
+                "next_cursor": None,
             }
 
-        df = search_law_summary(site_names=site_names, keyword=keyword)
+        result = search_law_summary_page(
+            site_names=site_names,
+            keyword=keyword,
+            page=page,
+            pagesize=pagesize,
+            cursor=cursor,
+        )
+        rows = result["rows"]
 
         # 전체 항목 수 계산
-        total_count = len(df)
+        total_count = result["total"]
         total_pages = (total_count + pagesize - 1) // pagesize
 
-        # 페이지별 데이터 슬라이싱
-        start_idx = (page - 1) * pagesize
-        end_idx = start_idx + pagesize
-        paginated_df = df.iloc[start_idx:end_idx]
-
         # 페이징 정보 로깅
         logger.info(
-            f"📄 페이징: {page}/{total_pages} (전체: {total_count}건, 페이지당: {pagesize}건, 현재페이지: {len(paginated_df)}건)"
+            f"📄 페이징: {page}/{total_pages} (전체: {total_count}건, 페이지당: {pagesize}건, 현재페이지: {len(rows)}건)"
         )
 
-        # DataFrame을 딕셔너리 리스트로 변환
-        rows = []
-        for _, row in paginated_df.iterrows():
-            site_code = row.get("site_name", "")
-            page_code = row.get("page_id", "")
-            real_seq = str(row.get("real_seq", ""))
-
-            rows.append(
-                {
-                    "site_name": row.get("사이트", ""),
-                    "page_id": row.get("페이지", ""),
-                    "title": row.get("제목", ""),
-                    "registration_date": row.get("등록일", ""),
-                    "collection_date": row.get("수집일시", ""),
-                    "site_url": row.get("site_url", ""),
-                    "detail_url": row.get("detail_url", ""),
-                    "org_url": row.get("org_url", ""),
-                    "summary": row.get("summary", ""),
-                    "real_seq": real_seq,
-                    "site_code": site_code,
-                    "page_code": page_code,
-                }
-            )
+        # 응답 필드명은 SQL 별칭으로 지정됨. FTS 결과에만 있는
+        # 하이라이트 발췌문은 escape 후 <mark> HTML 로 변환
+        for row in rows:
+            row["snippet"] = highlight_to_html(row.get("snippet"))
 
         return {
             "items": rows,
@@ -109,6 +98,7 @@ def search_data(
             "page": page,
             "pagesize": pagesize,
             "total_pages": total_pages,
+            "next_cursor": result["next_cursor"],
         }
     except Exception as e:
         logger.error(f"❌ 검색 실패: {e}")
@@ -118,4 +108,11 @@ def search_data(
             "page": page,
             "pagesize": pagesize,
             "total_pages": 0,
+            "next_cursor": None,
         }
+
+
+@cached_result("search.sites")
+def _cached_site_dict():
+    """사이트 코드/명칭 매핑 (DB 가 바뀌기 전까지 결과 캐시)"""
+    return get_site_and_code_dict()
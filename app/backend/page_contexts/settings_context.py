@@ -148,9 +148,6 @@ def get_site_list_html():
     대상 사이트 및 리스트를 HTML로 반환
 
     Returns:
-        HTML 문자열
+        HTML 문자열 (조회 실패는 예외로 라우터에 넘긴다)
     """
-    try:
-        return yaml_info_to_html()
-    except Exception as e:
-        return f"사이트 목록을 불러올 수 없습니다: {e}"
+    return yaml_info_to_html()
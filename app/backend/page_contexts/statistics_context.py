@@ -8,10 +8,13 @@ from app.backend.data.db_util import (
     detail_static,
     get_collection_period
 )
+from app.backend.data.db_pool import get_connection
+from app.backend.data.result_cache import cached_result
 
 logger = get_logger(__name__)
 
 
+@cached_result("statistics.metrics")
 def get_statistics_metrics():
     """
     통계 메트릭 데이터 반환
@@ -22,30 +25,24 @@ def get_statistics_metrics():
         - total_posts: 전체 게시물 개수 (law_summary 테이블의 레코드 개수)
         - total_attachments: 전체 첨부파일 개수 (law_summary_attach의 레코드 개수)
     """
-    from app.backend.data.db_util import get_summary_db_file
-    from sqlite3 import connect
+    with get_connection() as conn:
+        cursor = conn.cursor()
 
-    summary_path = get_summary_db_file()
-    conn = connect(summary_path)
-    cursor = conn.cursor()
+        # 전체 수집 사이트 수 (yaml_info의 고유 site_name 개수)
+        cursor.execute("SELECT COUNT(DISTINCT site_name) FROM yaml_info")
+        total_sites = cursor.fetchone()[0]
 
-    # 전체 수집 사이트 수 (yaml_info의 고유 site_name 개수)
-    cursor.execute("SELECT COUNT(DISTINCT site_name) FROM yaml_info")
-    total_sites = cursor.fetchone()[0]
+        # 전체 수집 페이지 수 (yaml_info 테이블의 레코드 개수)
+        cursor.execute("SELECT COUNT(*) FROM yaml_info")
+        total_pages = cursor.fetchone()[0]
 
-    # 전체 수집 페이지 수 (yaml_info 테이블의 레코드 개수)
-    cursor.execute("SELECT COUNT(*) FROM yaml_info")
-    total_pages = cursor.fetchone()[0]
+        # 전체 게시물 개수 (law_summary 테이블의 레코드 개수)
+        cursor.execute("SELECT COUNT(*) FROM law_summary")
+        total_posts = cursor.fetchone()[0]
 
-    # 전체 게시물 개수 (law_summary 테이블의 레코드 개수)
-    cursor.execute("SELECT COUNT(*) FROM law_summary")
-    total_posts = cursor.fetchone()[0]
-
-    # 전체 첨부파일 개수 (law_summary_attach 테이블의 레코드 개수)
-    cursor.execute("SELECT COUNT(*) FROM law_summary_attach")
-    total_attachments = cursor.fetchone()[0]
-
-    conn.close()
+        # 전체 첨부파일 개수 (law_summary_attach 테이블의 레코드 개수)
+        cursor.execute("SELECT COUNT(*) FROM law_summary_attach")
+        total_attachments = cursor.fetchone()[0]
 
     logger.info(f"📊 통계 메트릭: 사이트={total_sites}, 페이지={total_pages}, 게시물={total_posts}, 첨부파일={total_attachments}")
 
@@ -57,6 +54,8 @@ def get_statistics_metrics():
     }
 
 
+# 조회 실패는 예외로 라우터에 넘긴다 (빈 결과가 ETag 와 함께 캐시되지 않도록)
+@cached_result("statistics.sites")
 def get_site_statistics():
     """
     사이트별 수집 통계 반환 (차트용)
@@ -64,20 +63,10 @@ def get_site_statistics():
     Returns:
         [{"site": "사이트명", "count": 100}, ...]
     """
-    try:
-        df = site_static()
-        rows = []
-        for _, row in df.iterrows():
-            rows.append({
-                "site": row.get("사이트", ""),
-                "count": int(row.get("게시글수", 0))
-            })
-        return rows
-    except Exception as e:
-        logger.error(f"❌ 사이트별 통계 로드 실패: {e}")
-        return []
+    return site_static()
 
 
+@cached_result("statistics.files")
 def get_site_file_statistics():
     """
     사이트별 첨부파일 통계 반환
@@ -85,20 +74,10 @@ def get_site_file_statistics():
     Returns:
         [{"site": "사이트명", "file_count": 50}, ...]
     """
-    try:
-        df = site_static_filecount()
-        rows = []
-        for _, row in df.iterrows():
-            rows.append({
-                "site": row.get("사이트", ""),
-                "file_count": int(row.get("첨부파일수", 0))
-            })
-        return rows
-    except Exception as e:
-        logger.error(f"❌ 사이트별 첨부파일 통계 로드 실패: {e}")
-        return []
+    return site_static_filecount()
 
 
+@cached_result("statistics.detail")
 def get_detail_statistics():
     """
     사이트·페이지별 상세 통계 반환
@@ -106,22 +85,10 @@ def get_detail_statistics():
     Returns:
         [{"site": "사이트", "page": "페이지", "posts": 100, "files": 50}, ...]
     """
-    try:
-        df = detail_static()
-        rows = []
-        for _, row in df.iterrows():
-            rows.append({
-                "site": row.get("사이트", ""),
-                "page": row.get("페이지", ""),
-                "posts": int(row.get("게시글수", 0)),
-                "files": int(row.get("첨부파일수", 0))
-            })
-        return rows
-    except Exception as e:
-        logger.error(f"❌ 상세 통계 로드 실패: {e}")
-        return []
+    return detail_static()
 
 
+@cached_result("statistics.collection_period")
 def get_collection_period_info():
     """
     데이터 수집 기간 정보 반환
@@ -129,15 +96,8 @@ def get_collection_period_info():
     Returns:
         {"first_date": "2024-01-15", "last_date": "2025-01-23"}
     """
-    try:
-        first_date, last_date = get_collection_period()
-        return {
-            "first_date": first_date,
-            "last_date": last_date
-        }
-    except Exception as e:
-        logger.error(f"❌ 수집 기간 조회 실패: {e}")
-        return {
-            "first_date": None,
-            "last_date": None
-        }
+    first_date, last_date = get_collection_period()
+    return {
+        "first_date": first_date,
+        "last_date": last_date
+    }
@@ -0,0 +1,215 @@
+"""
+벤치마크 공용 fixtures
+
+RUN_BENCHMARKS=1 일 때만 실행된다 (평소 pytest 에서는 skip).
+
+환경 변수:
+    RUN_BENCHMARKS=1        벤치마크 실행
+    BENCH_ROWS=10k          생성할 law_summary 행 수 (10k / 100k / 1m)
+    BENCH_DATA_DIR          생성한 DB·로그를 보관할 디렉터리 (기본: 시스템 임시 디렉터리).
+                            같은 날 만든 같은 행 수의 DB 가 있으면 다시 만들지 않는다
+                            (게시글은 오늘까지 분포하므로 날짜가 바뀌면 다시 만든다)
+    BENCH_ROUNDS=10         측정 반복 횟수 (warm-up 1회 별도)
+    BENCH_BASELINE          기준값 파일 (기본: tests/benchmarks/baseline.json)
+    BENCH_SAVE_BASELINE=1   이번 측정값을 기준값 파일에 저장
+    BENCH_TOLERANCE=0.3     기준값 대비 허용 증가율 (넘으면 실패)
+    BENCH_MIN_DELTA_MS=2    허용 증가율을 넘어도 이 차이(ms) 미만이면 통과
+
+회귀 판정은 최솟값(min_ms)으로 한다. 다른 프로세스의 간섭은 시간을 늘리기만
+하므로 최솟값이 중앙값보다 덜 흔들린다.
+
+결과는 BENCH_DATA_DIR/bench_results_<rows>.json 에 남는다.
+"""
+
+import json
+import os
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+import pytest
+
+from tests.benchmarks.law_db_generator import (
+    generate_crawler_logs,
+    generate_law_db,
+    parse_row_count,
+)
+
+BENCH_DIR = Path(__file__).resolve().parent
+
+
+def benchmarks_enabled() -> bool:
+    return os.getenv("RUN_BENCHMARKS", "") not in ("", "0")
+
+
+def bench_rows() -> int:
+    return parse_row_count(os.getenv("BENCH_ROWS", "10k"))
+
+
+def _data_dir() -> Path:
+    base = os.getenv("BENCH_DATA_DIR") or os.path.join(tempfile.gettempdir(), "law_crawler_bench")
+    return Path(base)
+
+
+def _baseline_path() -> Path:
+    return Path(os.getenv("BENCH_BASELINE", str(BENCH_DIR / "baseline.json")))
+
+
+def _load_json(path: Path) -> dict:
+    if not path.exists():
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+class BenchmarkSession:
+    """측정값 수집, 기준값 비교, 결과 파일 저장"""
+
+    def __init__(self, rows: int):
+        self.rows = rows
+        self.rounds = int(os.getenv("BENCH_ROUNDS", "10"))
+        self.tolerance = float(os.getenv("BENCH_TOLERANCE", "0.3"))
+        self.min_delta_ms = float(os.getenv("BENCH_MIN_DELTA_MS", "2"))
+        self.baseline = _load_json(_baseline_path()).get(str(rows), {})
+        self.results = {}
+
+    def regression(self, name: str, stats: dict):
+        """기준값 대비 느려졌으면 메시지, 아니면 None"""
+        base = self.baseline.get(name)
+        if not base:
+            return None
+        limit = base["min_ms"] * (1 + self.tolerance)
+        if stats["min_ms"] > limit and stats["min_ms"] - base["min_ms"] >= self.min_delta_ms:
+            return (
+                f"{name}: 최솟값 {stats['min_ms']}ms > 기준 {base['min_ms']}ms"
+                f" (+{self.tolerance:.0%} 허용)"
+            )
+        return None
+
+    def save(self):
+        data_dir = _data_dir()
+        data_dir.mkdir(parents=True, exist_ok=True)
+        with open(data_dir / f"bench_results_{self.rows}.json", "w", encoding="utf-8") as f:
+            json.dump(self.results, f, ensure_ascii=False, indent=2, sort_keys=True)
+
+        if os.getenv("BENCH_SAVE_BASELINE", "") not in ("", "0"):
+            path = _baseline_path()
+            baseline = _load_json(path)
+            baseline[str(self.rows)] = {
+                name: {"min_ms": stats["min_ms"], "median_ms": stats["median_ms"]}
+                for name, stats in self.results.items()
+            }
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(baseline, f, ensure_ascii=False, indent=2, sort_keys=True)
+                f.write("\n")
+
+
+class Benchmark:
+    """
+    pytest-benchmark 와 비슷한 측정기
+
+    benchmark(func, *args, **kwargs) 는 warm-up 1회 후 rounds 회 실행한 시간의
+    min/median/mean/max 를 기록하고 func 의 결과를 돌려준다.
+    setup 을 주면 매 회 실행 전에 (측정 밖에서) 호출한다.
+    """
+
+    def __init__(self, session: BenchmarkSession, name: str):
+        self.session = session
+        self.name = name
+        self.stats = None
+
+    def __call__(self, func, *args, setup=None, **kwargs):
+        if setup:
+            setup()
+        result = func(*args, **kwargs)
+
+        timings = []
+        for _ in range(self.session.rounds):
+            if setup:
+                setup()
+            started = time.perf_counter()
+            result = func(*args, **kwargs)
+            timings.append((time.perf_counter() - started) * 1000)
+
+        self.stats = {
+            "rounds": len(timings),
+            "min_ms": round(min(timings), 3),
+            "median_ms": round(statistics.median(timings), 3),
+            "mean_ms": round(statistics.fmean(timings), 3),
+            "max_ms": round(max(timings), 3),
+        }
+        self.session.results[self.name] = self.stats
+        message = self.session.regression(self.name, self.stats)
+        if message:
+            pytest.fail(f"성능 회귀: {message}", pytrace=False)
+        return result
+
+
+@pytest.fixture(scope="session")
+def bench_session():
+    session = BenchmarkSession(bench_rows())
+    yield session
+    session.save()
+
+
+@pytest.fixture
+def benchmark(request, bench_session):
+    """측정기 (이름: 모듈명::테스트명)"""
+    name = f"{request.node.module.__name__.rsplit('.', 1)[-1]}::{request.node.name}"
+    return Benchmark(bench_session, name)
+
+
+@pytest.fixture(scope="session")
+def bench_data():
+    """
+    생성한 DB 와 로그 디렉터리 (같은 날·같은 행 수면 재사용)
+
+    startup 과 같이 인덱스·전문 검색 색인·일자별 집계·summary 파생 컬럼과
+    크롤러 로그 색인(bench_db 의 LOG_INDEX_DB_PATH)을 만들어 둔다.
+    """
+    from app.backend.data.daily_rollup import sync_daily_counts
+    from app.backend.data.fts_index import sync_fts_index
+    from app.backend.data.index_manager import ensure_indexes
+    from app.backend.data.log_index import load_site_pages, sync_log_index
+    from app.backend.data.summary_derived import create_derived_table, sync_summary_derived
+
+    rows = bench_rows()
+    data_dir = _data_dir()
+    db_path = data_dir / f"law_summary_{rows}.db"
+    log_dir = data_dir / "logs"
+    ready_marker = data_dir / f"law_summary_{rows}.ready"
+
+    today = time.strftime("%Y-%m-%d")
+    if not ready_marker.exists() or ready_marker.read_text(encoding="utf-8") != today:
+        generate_law_db(db_path, rows)
+        create_derived_table(str(db_path))
+        ensure_indexes(str(db_path))
+        sync_fts_index(str(db_path), batch_size=10_000)
+        sync_daily_counts(str(db_path))
+        sync_summary_derived(str(db_path), batch_size=10_000)
+        generate_crawler_logs(log_dir)
+        sync_log_index(str(log_dir / "log_index.db"), str(log_dir), load_site_pages(str(db_path)))
+        ready_marker.write_text(today, encoding="utf-8")
+
+    return {
+        "db_path": str(db_path),
+        "log_dir": str(log_dir),
+        "log_index_path": str(log_dir / "log_index.db"),
+        "rows": rows,
+    }
+
+
+@pytest.fixture
+def bench_db(bench_data, monkeypatch):
+    """config 를 생성한 DB·로그로 바꾸고 전역 커넥션 풀을 새로 만든다"""
+    from app.backend.core.config import config
+    from app.backend.data.db_pool import close_pool
+
+    close_pool()
+    monkeypatch.setattr(config, "DB_PATH", bench_data["db_path"])
+    monkeypatch.setattr(config, "UI_LOG_DIR", bench_data["log_dir"])
+    monkeypatch.setattr(config, "CRAWLER_LOG_DIR", bench_data["log_dir"])
+    monkeypatch.setattr(config, "LOG_INDEX_DB_PATH", bench_data["log_index_path"])
+    yield bench_data
+    close_pool()
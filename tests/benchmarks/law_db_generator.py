@@ -0,0 +1,343 @@
+"""
+벤치마크용 law_summary.db 생성기
+
+크롤러가 만드는 것과 같은 스키마로 law_summary / law_summary_attach /
+yaml_info 를 채운다. LAW_SITE_DESC.yaml 의 사이트·페이지에 게시글을 고르게
+나누고, 한글 제목과 HTML 요약, 첨부파일 행, 일부 LOG 행을 넣는다.
+id 는 upd_time 순서와 같게(크롤러가 시간 순으로 쌓는 것처럼) 만든다.
+같은 seed 면 같은 DB 가 만들어진다.
+
+크롤러 로그 파일(law_crawler_YYYY_MM_DD.log)과 UI 로그도 함께 만들 수 있다.
+
+사용 예:
+    python -m tests.benchmarks.law_db_generator --rows 100k --out /tmp/bench/law_summary.db
+    python -m tests.benchmarks.law_db_generator --rows 1m --out /tmp/bench/law_summary.db --logs /tmp/bench/logs
+"""
+
+import argparse
+import os
+import random
+import sqlite3
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import yaml
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+DEFAULT_YAML_PATH = PROJECT_ROOT / "LAW_SITE_DESC.yaml"
+
+# docs/table_ddl.md 의 크롤러 스키마
+LAW_DB_SCHEMA = """
+CREATE TABLE law_summary (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    category TEXT NOT NULL DEFAULT 'DATA',
+    site_name TEXT NOT NULL,
+    page_id TEXT NOT NULL,
+    real_seq TEXT,
+    title TEXT,
+    register_date TEXT,
+    org_url TEXT,
+    summary TEXT,
+    upd_time DATETIME DEFAULT CURRENT_TIMESTAMP
+);
+CREATE TABLE law_summary_attach (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    parent_id INTEGER NOT NULL,
+    save_folder TEXT,
+    save_file_name TEXT,
+    upd_time DATETIME DEFAULT CURRENT_TIMESTAMP
+);
+CREATE TABLE yaml_info (
+    site_name TEXT NOT NULL,
+    page_id TEXT NOT NULL,
+    h_name TEXT,
+    desc TEXT,
+    url TEXT,
+    detail_url TEXT,
+    PRIMARY KEY (site_name, page_id)
+);
+"""
+
+ROW_PRESETS = {"10k": 10_000, "100k": 100_000, "1m": 1_000_000}
+
+TITLE_SUBJECTS = [
+    "금융투자업규정", "자본시장과 금융투자업에 관한 법률 시행령", "증권의 발행 및 공시 등에 관한 규정",
+    "은행업감독규정", "보험업감독업무시행세칙", "여신전문금융업감독규정", "전자금융감독규정",
+    "신용정보업감독규정", "상호저축은행업감독규정", "금융소비자 보호에 관한 감독규정",
+    "외국환거래규정", "파생상품시장 업무규정", "유가증권시장 상장규정", "코스닥시장 공시규정",
+    "집합투자기구 평가 기준", "증권인수업무 등에 관한 규정", "금융회사 지배구조 감독규정",
+    "자금세탁방지 업무규정", "대출모집인 제도 모범규준", "가상자산 이용자 보호 감독규정",
+]
+TITLE_ACTIONS = [
+    "일부개정", "전부개정", "제정", "폐지", "개정예고", "규정변경예고", "시행세칙 개정",
+    "입법예고", "개정안 의견수렴", "시행 안내",
+]
+TITLE_SUFFIXES = ["", " 안내", " (안)", " 공고", " 결과", " 관련 질의응답"]
+
+SUMMARY_SENTENCES = [
+    "금융회사의 내부통제 기준을 강화하고 임원의 책임 범위를 명확히 규정함.",
+    "투자자 보호를 위하여 설명의무 이행 절차와 기록 보관 기간을 정비함.",
+    "전자금융거래의 안전성 확보를 위한 보안 점검 주기를 연 1회에서 반기 1회로 단축함.",
+    "공시 서식을 간소화하고 정정 공시 기한을 3영업일로 통일함.",
+    "시장 변동성 확대에 대응하여 신용공여 한도 산정 기준을 조정함.",
+    "소비자 민원 처리 결과를 분기별로 공개하도록 의무화함.",
+    "해외 금융회사와의 정보 교환 절차를 마련하고 개인정보 보호 조치를 보완함.",
+    "가상자산사업자의 이용자 자산 분리 보관 기준을 구체화함.",
+    "위반 시 과태료 부과 기준을 위반 횟수에 따라 세분화함.",
+    "부칙에서 시행일을 공포 후 3개월이 경과한 날로 정함.",
+    "업계 의견을 반영하여 경과조치 기간을 6개월 연장함.",
+    "보고 서식의 전산 제출을 원칙으로 하고 서면 제출은 예외로 허용함.",
+]
+ATTACH_EXTENSIONS = ["pdf", "hwp", "hwpx", "xlsx", "docx", "zip"]
+
+LOG_MESSAGES = [
+    "{h_name} {desc} 수집 시작",
+    "{h_name} {desc} 목록 {n}건 조회",
+    "{h_name} {desc} 게시글 저장 완료 (real_seq={seq})",
+    "{h_name} {desc} 첨부파일 다운로드 완료: {seq}.pdf",
+]
+LOG_ERRORS = [
+    "{h_name} {desc} 페이지 요청 실패: ReadTimeout",
+    "{h_name} {desc} 첨부파일 다운로드 실패: HTTP 404",
+    "{h_name} {desc} 파싱 오류: 목록 테이블을 찾을 수 없음",
+]
+
+
+def parse_row_count(value) -> int:
+    """'10k' / '100k' / '1m' 또는 정수 문자열을 행 수로 변환"""
+    text = str(value).strip().lower()
+    if text in ROW_PRESETS:
+        return ROW_PRESETS[text]
+    if text.endswith("k"):
+        return int(float(text[:-1]) * 1_000)
+    if text.endswith("m"):
+        return int(float(text[:-1]) * 1_000_000)
+    return int(text)
+
+
+def load_site_pages(yaml_path=DEFAULT_YAML_PATH) -> list:
+    """LAW_SITE_DESC.yaml 의 (site_name, page_id, h_name, desc, url, detail_url) 목록"""
+    with open(yaml_path, "r", encoding="utf-8") as f:
+        data = yaml.safe_load(f)
+    pages = []
+    for site_name, site_info in data.items():
+        for page in site_info.get("pages", []):
+            pages.append((
+                site_name,
+                page.get("id", ""),
+                site_info.get("h_name", ""),
+                page.get("desc", ""),
+                site_info.get("url", ""),
+                page.get("detail_url", ""),
+            ))
+    return pages
+
+
+def _title(rng: random.Random, number: int) -> str:
+    return (
+        f"{rng.choice(TITLE_SUBJECTS)} {rng.choice(TITLE_ACTIONS)}"
+        f"{rng.choice(TITLE_SUFFIXES)} (제{number}호)"
+    )
+
+
+def _summary(rng: random.Random, title: str) -> str:
+    sentences = rng.sample(SUMMARY_SENTENCES, rng.randint(2, 6))
+    items = "".join(f"<li>{sentence}</li>" for sentence in sentences)
+    return (
+        f"<h3>{title}</h3>"
+        f"<p><b>주요 내용</b></p><ul>{items}</ul>"
+        f"<p>문의: 담당 부서 ({rng.randint(2, 9)}{rng.randint(100, 999)}-{rng.randint(1000, 9999)})</p>"
+    )
+
+
+def generate_law_db(
+    path,
+    rows: int,
+    yaml_path=DEFAULT_YAML_PATH,
+    days: int = 365,
+    seed: int = 42,
+    attach_ratio: float = 0.4,
+    log_ratio: float = 0.01,
+    end: datetime = None,
+    batch_size: int = 10_000,
+) -> dict:
+    """
+    벤치마크용 law_summary.db 생성 (기존 파일은 덮어씀)
+
+    Args:
+        path: 만들 DB 파일 경로
+        rows: law_summary 행 수
+        yaml_path: 사이트·페이지 정의 (LAW_SITE_DESC.yaml)
+        days: 게시글을 흩뿌릴 기간(일). 마지막 날이 end
+        seed: 난수 seed
+        attach_ratio: 첨부파일(1~3개)이 있는 게시글 비율
+        log_ratio: category='LOG' 행 비율
+        end: 마지막 수집 시각 (기본: 지금)
+
+    Returns:
+        {"path", "rows", "attachments", "log_rows", "sites", "pages", "seconds"}
+    """
+    started = time.perf_counter()
+    rng = random.Random(seed)
+    pages = load_site_pages(yaml_path)
+    end = end or datetime.now().replace(microsecond=0)
+    begin = end - timedelta(days=days)
+    step = (end - begin).total_seconds() / max(rows, 1)
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    for suffix in ("", "-wal", "-shm"):
+        Path(f"{path}{suffix}").unlink(missing_ok=True)
+
+    conn = sqlite3.connect(path)
+    # 생성 중에는 저널·fsync 없이 일괄 삽입
+    conn.execute("PRAGMA journal_mode = OFF")
+    conn.execute("PRAGMA synchronous = OFF")
+    conn.executescript(LAW_DB_SCHEMA)
+    conn.executemany("INSERT INTO yaml_info VALUES (?, ?, ?, ?, ?, ?)", pages)
+
+    seqs = {(page[0], page[1]): 0 for page in pages}
+    attachments = 0
+    log_rows = 0
+    summary_batch = []
+    attach_batch = []
+    for row_id in range(1, rows + 1):
+        upd_time = begin + timedelta(seconds=step * row_id)
+        upd_text = upd_time.strftime("%Y-%m-%d %H:%M:%S")
+        site_name, page_id, h_name, desc, url, detail_url = rng.choice(pages)
+        seqs[(site_name, page_id)] += 1
+        real_seq = str(seqs[(site_name, page_id)])
+
+        if rng.random() < log_ratio:
+            log_rows += 1
+            summary_batch.append((
+                row_id, "LOG", site_name, page_id, real_seq,
+                rng.choice(LOG_ERRORS).format(h_name=h_name, desc=desc),
+                upd_time.strftime("%Y-%m-%d"), "", "", upd_text,
+            ))
+        else:
+            title = _title(rng, rng.randint(1, 300))
+            register_date = (upd_time - timedelta(days=rng.randint(0, 3))).strftime("%Y-%m-%d")
+            summary_batch.append((
+                row_id, "DATA", site_name, page_id, real_seq, title, register_date,
+                f"{detail_url}?seq={real_seq}", _summary(rng, title), upd_text,
+            ))
+            if rng.random() < attach_ratio:
+                folder = f"{site_name}/{page_id}/{upd_time:%Y%m}"
+                for n in range(rng.randint(1, 3)):
+                    attachments += 1
+                    attach_batch.append((
+                        attachments, row_id, folder,
+                        f"{real_seq}_{n + 1}.{rng.choice(ATTACH_EXTENSIONS)}", upd_text,
+                    ))
+
+        if len(summary_batch) >= batch_size:
+            _flush(conn, summary_batch, attach_batch)
+
+    _flush(conn, summary_batch, attach_batch)
+    conn.commit()
+    # 크롤러 DB 와 같이 WAL 로 두고 플래너 통계를 만든다
+    conn.execute("PRAGMA journal_mode = WAL")
+    conn.execute("ANALYZE")
+    conn.close()
+
+    return {
+        "path": str(path),
+        "rows": rows,
+        "attachments": attachments,
+        "log_rows": log_rows,
+        "sites": len({page[0] for page in pages}),
+        "pages": len(pages),
+        "seconds": round(time.perf_counter() - started, 2),
+    }
+
+
+def _flush(conn, summary_batch: list, attach_batch: list):
+    conn.executemany(
+        """INSERT INTO law_summary
+           (id, category, site_name, page_id, real_seq, title, register_date, org_url, summary, upd_time)
+           VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+        summary_batch,
+    )
+    conn.executemany(
+        """INSERT INTO law_summary_attach (id, parent_id, save_folder, save_file_name, upd_time)
+           VALUES (?, ?, ?, ?, ?)""",
+        attach_batch,
+    )
+    summary_batch.clear()
+    attach_batch.clear()
+
+
+def generate_crawler_logs(
+    log_dir,
+    days: int = 7,
+    lines_per_day: int = 5_000,
+    yaml_path=DEFAULT_YAML_PATH,
+    seed: int = 42,
+    end: datetime = None,
+) -> list:
+    """
+    크롤러 로그(law_crawler_YYYY_MM_DD.log)와 UI 로그(law_crawler.log) 생성
+
+    Returns:
+        만든 파일 경로 목록
+    """
+    rng = random.Random(seed)
+    pages = load_site_pages(yaml_path)
+    end = end or datetime.now().replace(microsecond=0)
+    log_dir = Path(log_dir)
+    log_dir.mkdir(parents=True, exist_ok=True)
+
+    created = []
+    for day in range(days):
+        day_start = (end - timedelta(days=day)).replace(hour=0, minute=0, second=0)
+        path = log_dir / f"law_crawler_{day_start:%Y_%m_%d}.log"
+        step = 86_400 / lines_per_day
+        with open(path, "w", encoding="utf-8") as f:
+            for n in range(lines_per_day):
+                stamp = day_start + timedelta(seconds=step * n)
+                site_name, page_id, h_name, desc, _, _ = rng.choice(pages)
+                if rng.random() < 0.02:
+                    level, template = "ERROR", rng.choice(LOG_ERRORS)
+                else:
+                    level, template = "INFO", rng.choice(LOG_MESSAGES)
+                message = template.format(
+                    h_name=h_name, desc=desc, n=rng.randint(1, 30), seq=rng.randint(1, 99_999)
+                )
+                f.write(f"{stamp:%Y-%m-%d %H:%M:%S},{n % 1000:03d} - {level} - {message}\n")
+        created.append(str(path))
+
+    ui_log = log_dir / "law_crawler.log"
+    with open(ui_log, "w", encoding="utf-8") as f:
+        for n in range(lines_per_day):
+            stamp = end - timedelta(seconds=lines_per_day - n)
+            f.write(
+                f"{stamp:%Y-%m-%d %H:%M:%S},000 - app.backend.api.v1.dashboard - INFO - "
+                f"[-] 📊 SQL 실행 (window_counts): {n}\n"
+            )
+    created.append(str(ui_log))
+    return created
+
+
+def main():
+    parser = argparse.ArgumentParser(description="벤치마크용 law_summary.db 생성")
+    parser.add_argument("--rows", default="10k", help="행 수 (10k, 100k, 1m 또는 정수)")
+    parser.add_argument("--out", required=True, help="만들 DB 파일 경로")
+    parser.add_argument("--yaml", default=str(DEFAULT_YAML_PATH), help="LAW_SITE_DESC.yaml 경로")
+    parser.add_argument("--days", type=int, default=365, help="게시글 기간(일)")
+    parser.add_argument("--seed", type=int, default=42, help="난수 seed")
+    parser.add_argument("--logs", default=None, help="크롤러/UI 로그도 만들 디렉터리")
+    args = parser.parse_args()
+
+    result = generate_law_db(
+        args.out, parse_row_count(args.rows), yaml_path=args.yaml, days=args.days, seed=args.seed
+    )
+    print(f"✅ DB 생성 완료: {result}")
+    if args.logs:
+        files = generate_crawler_logs(args.logs, yaml_path=args.yaml, seed=args.seed)
+        print(f"✅ 로그 {len(files)}개 생성: {os.path.abspath(args.logs)}")
+
+
+if __name__ == "__main__":
+    main()
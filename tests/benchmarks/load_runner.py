@@ -0,0 +1,278 @@
+"""
+부하 시나리오 실행기 (프로세스 내부, 네트워크 없음)
+
+app.backend.main.app 을 httpx.ASGITransport 로 직접 호출한다. 가상 사용자
+N 명이 각자 (대시보드 화면, 메트릭 폴링, 검색, 첨부파일 목록, 로그 보기)
+를 가중치에 따라 골라 요청하고, 요청 사이에는 생각 시간(think time)만큼 쉰다.
+앱과 가상 사용자가 같은 이벤트 루프를 쓰므로 uvicorn 워커 하나가 받는
+부하와 같다 (DB·파일 작업은 앱의 스레드 풀에서 실행).
+
+시나리오별 처리량(req/s), p50/p95/p99 지연(ms), 오류율을 출력한다.
+--users 10,25,50 처럼 여러 단계를 주면 단계마다 따로 측정한다.
+
+사용 예:
+    python -m tests.benchmarks.law_db_generator --rows 1m --out /tmp/bench/law_summary.db --logs /tmp/bench/logs
+    python -m tests.benchmarks.load_runner --db /tmp/bench/law_summary.db --logs /tmp/bench/logs \\
+        --users 10,25,50,100 --duration 60 --json /tmp/bench/load_1m.json
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import random
+import sqlite3
+import time
+from datetime import date
+
+import httpx
+
+from tests.benchmarks.law_db_generator import DEFAULT_YAML_PATH, TITLE_ACTIONS, TITLE_SUBJECTS
+
+# 시나리오 이름 -> 가중치 (사무실 사용자의 화면 사용 비율)
+DEFAULT_MIX = {
+    "dashboard_page": 5,
+    "dashboard_metrics": 30,
+    "dashboard_data": 15,
+    "search": 25,
+    "search_page2": 5,
+    "attachments": 10,
+    "crawler_log": 5,
+    "ui_log": 3,
+    "statistics": 2,
+}
+
+SEARCH_KEYWORDS = TITLE_SUBJECTS + TITLE_ACTIONS + ["공시", "규정", "감독", "시행령 개정"]
+
+
+def percentile(sorted_values: list, pct: float) -> float:
+    """정렬된 값 목록의 pct 백분위 (nearest-rank)"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+class ScenarioData:
+    """시나리오 요청에 쓸 사이트·게시글 샘플 (DB 에서 한 번 읽음)"""
+
+    def __init__(self, sites: list, posts: list, log_date: str):
+        self.sites = sites
+        self.posts = posts
+        self.log_date = log_date
+
+    @classmethod
+    def from_db(cls, db_path: str, sample_size: int = 2000):
+        conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+        try:
+            sites = [row[0] for row in conn.execute("SELECT DISTINCT site_name FROM yaml_info")]
+            posts = conn.execute(
+                """
+                SELECT a.site_name, a.page_id, a.real_seq
+                FROM law_summary a
+                WHERE a.id IN (SELECT parent_id FROM law_summary_attach ORDER BY random() LIMIT ?)
+                """,
+                (sample_size,),
+            ).fetchall() or conn.execute(
+                "SELECT site_name, page_id, real_seq FROM law_summary LIMIT ?", (sample_size,)
+            ).fetchall()
+        finally:
+            conn.close()
+        return cls(sites, posts, date.today().isoformat())
+
+
+class VirtualUser:
+    """가중치에 따라 시나리오를 골라 요청하는 가상 사용자"""
+
+    def __init__(self, client: httpx.AsyncClient, data: ScenarioData, mix: dict,
+                 think_time: tuple, rng: random.Random):
+        self.client = client
+        self.data = data
+        self.names = list(mix)
+        self.weights = list(mix.values())
+        self.think_time = think_time
+        self.rng = rng
+        self.last_cursor = None
+        self.last_search = None
+
+    def _search_params(self) -> dict:
+        rng = self.rng
+        params = {"page": 1, "pagesize": 10}
+        if rng.random() < 0.7:
+            params["keyword"] = rng.choice(SEARCH_KEYWORDS)
+        if rng.random() < 0.5 or "keyword" not in params:
+            params["sites"] = ",".join(rng.sample(self.data.sites, rng.randint(1, 3)))
+        return params
+
+    def request_for(self, name: str):
+        """시나리오 이름 -> (url, params)"""
+        rng = self.rng
+        if name == "dashboard_page":
+            return "/dashboard", None
+        if name == "dashboard_metrics":
+            return "/api/v1/dashboard/metrics", None
+        if name == "dashboard_data":
+            return "/api/v1/dashboard/data", {"period": rng.choice(["today", "3days", "7days"])}
+        if name == "search" or (name == "search_page2" and self.last_search is None):
+            self.last_search = self._search_params()
+            return "/api/v1/search/results", self.last_search
+        if name == "search_page2":
+            params = {**self.last_search, "page": 2}
+            if self.last_cursor:
+                params["cursor"] = self.last_cursor
+            return "/api/v1/search/results", params
+        if name == "attachments":
+            site, page, seq = rng.choice(self.data.posts)
+            return f"/api/v1/search/attachments/{site}/{page}/{seq}", None
+        if name == "crawler_log":
+            return "/api/v1/logs/crawler", {"date": self.data.log_date}
+        if name == "ui_log":
+            return "/api/v1/logs/ui", None
+        if name == "statistics":
+            return rng.choice([
+                "/api/v1/statistics/metrics",
+                "/api/v1/statistics/sites",
+                "/api/v1/statistics/detail",
+            ]), None
+        raise ValueError(f"알 수 없는 시나리오: {name}")
+
+    async def run(self, deadline: float, results: dict):
+        while time.perf_counter() < deadline:
+            name = self.rng.choices(self.names, self.weights)[0]
+            url, params = self.request_for(name)
+            started = time.perf_counter()
+            ok = False
+            try:
+                response = await self.client.get(url, params=params)
+                ok = response.status_code < 400
+                if ok and url == "/api/v1/search/results":
+                    self.last_cursor = response.json().get("next_cursor")
+            except Exception:
+                ok = False
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            record = results.setdefault(name, {"latencies": [], "errors": 0})
+            record["latencies"].append(elapsed_ms)
+            if not ok:
+                record["errors"] += 1
+            low, high = self.think_time
+            if high > 0:
+                await asyncio.sleep(self.rng.uniform(low, high))
+
+
+def summarize(results: dict, seconds: float) -> dict:
+    """시나리오별 처리량·지연 백분위·오류율"""
+    summary = {}
+    all_latencies = []
+    all_errors = 0
+    for name, record in sorted(results.items()):
+        latencies = sorted(record["latencies"])
+        all_latencies.extend(latencies)
+        all_errors += record["errors"]
+        summary[name] = _stats(latencies, record["errors"], seconds)
+    summary["TOTAL"] = _stats(sorted(all_latencies), all_errors, seconds)
+    return summary
+
+
+def _stats(latencies: list, errors: int, seconds: float) -> dict:
+    count = len(latencies)
+    return {
+        "requests": count,
+        "rps": round(count / seconds, 2) if seconds else 0.0,
+        "p50_ms": round(percentile(latencies, 50), 1),
+        "p95_ms": round(percentile(latencies, 95), 1),
+        "p99_ms": round(percentile(latencies, 99), 1),
+        "max_ms": round(latencies[-1], 1) if latencies else 0.0,
+        "error_rate": round(errors / count, 4) if count else 0.0,
+    }
+
+
+def format_report(users: int, summary: dict) -> str:
+    lines = [
+        f"\n👥 동시 사용자 {users}명",
+        f"{'scenario':<20}{'req':>8}{'req/s':>9}{'p50':>9}{'p95':>9}{'p99':>9}{'max':>9}{'err%':>7}",
+    ]
+    for name, stats in summary.items():
+        lines.append(
+            f"{name:<20}{stats['requests']:>8}{stats['rps']:>9}{stats['p50_ms']:>9}"
+            f"{stats['p95_ms']:>9}{stats['p99_ms']:>9}{stats['max_ms']:>9}"
+            f"{stats['error_rate'] * 100:>7.2f}"
+        )
+    return "\n".join(lines)
+
+
+async def run_stage(app, data: ScenarioData, users: int, duration: float,
+                    mix: dict = None, think_time: tuple = (0.5, 2.0), seed: int = 42) -> dict:
+    """
+    가상 사용자 users 명으로 duration 초 동안 부하를 주고 요약 반환
+
+    사용자 시작 시각은 생각 시간 범위 안에서 흩어 놓는다 (동시 첫 요청 방지).
+    """
+    transport = httpx.ASGITransport(app=app)
+    results = {}
+    async with httpx.AsyncClient(transport=transport, base_url="http://loadtest") as client:
+        rng = random.Random(seed)
+        started = time.perf_counter()
+        deadline = started + duration
+
+        async def start_user(index: int):
+            await asyncio.sleep(rng.uniform(0, think_time[1]))
+            user = VirtualUser(client, data, mix or DEFAULT_MIX, think_time, random.Random(seed + index))
+            await user.run(deadline, results)
+
+        await asyncio.gather(*(start_user(i) for i in range(users)))
+        elapsed = time.perf_counter() - started
+    return summarize(results, elapsed)
+
+
+async def run_load(app, data: ScenarioData, user_stages: list, duration: float,
+                   mix: dict = None, think_time: tuple = (0.5, 2.0), seed: int = 42) -> dict:
+    """앱 lifespan(startup/shutdown) 안에서 단계별 부하 실행"""
+    report = {}
+    async with app.router.lifespan_context(app):
+        for users in user_stages:
+            summary = await run_stage(app, data, users, duration, mix, think_time, seed)
+            report[str(users)] = summary
+            print(format_report(users, summary), flush=True)
+    return report
+
+
+def _configure(db_path: str, log_dir: str = None):
+    """앱 임포트 전에 대상 DB·로그 경로 설정"""
+    from app.backend.core.config import config
+
+    config.DB_PATH = db_path
+    config.YAML_PATH = str(DEFAULT_YAML_PATH)
+    if log_dir:
+        config.UI_LOG_DIR = log_dir
+        config.CRAWLER_LOG_DIR = log_dir
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Law Crawler UI 부하 시나리오 실행기")
+    parser.add_argument("--db", required=True, help="대상 law_summary.db (law_db_generator 로 생성)")
+    parser.add_argument("--logs", default=None, help="크롤러/UI 로그 디렉터리")
+    parser.add_argument("--users", default="10,25,50", help="동시 사용자 수 단계 (쉼표 구분)")
+    parser.add_argument("--duration", type=float, default=30, help="단계별 측정 시간(초)")
+    parser.add_argument("--think-min", type=float, default=0.5, help="요청 사이 최소 대기(초)")
+    parser.add_argument("--think-max", type=float, default=2.0, help="요청 사이 최대 대기(초), 0 이면 대기 없음")
+    parser.add_argument("--seed", type=int, default=42, help="난수 seed")
+    parser.add_argument("--json", default=None, help="결과를 저장할 JSON 파일")
+    args = parser.parse_args()
+
+    _configure(args.db, args.logs)
+    from app.backend.main import app
+
+    data = ScenarioData.from_db(args.db)
+    stages = [int(value) for value in args.users.split(",") if value.strip()]
+    report = asyncio.run(
+        run_load(app, data, stages, args.duration,
+                 think_time=(args.think_min, args.think_max), seed=args.seed)
+    )
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"\n✅ 결과 저장: {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+API 라우트 벤치마크 (RUN_BENCHMARKS=1 일 때만 실행)
+
+main.add_routes 로 모든 라우터를 붙인 앱에 TestClient 로 요청한다.
+조회 결과 캐시를 매 회 비우므로 라우터·직렬화·SQL 비용이 모두 포함된다.
+"""
+
+import sqlite3
+from datetime import date
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.backend.data.result_cache import get_result_cache
+from tests.benchmarks.conftest import benchmarks_enabled
+
+pytestmark = [
+    pytest.mark.benchmark,
+    pytest.mark.skipif(not benchmarks_enabled(), reason="RUN_BENCHMARKS=1 일 때만 실행"),
+]
+
+TODAY_LOG = f"law_crawler_{date.today():%Y_%m_%d}.log"
+
+ROUTES = [
+    "/dashboard",
+    "/search",
+    "/statistics",
+    "/logs",
+    "/settings",
+    "/api/v1/dashboard/metrics",
+    "/api/v1/dashboard/data?period=today",
+    "/api/v1/dashboard/data?period=7days",
+    "/api/v1/dashboard/crawler-health",
+    "/api/v1/dashboard/attachments/fss/menu_200488/1",
+    "/api/v1/search/sites",
+    "/api/v1/search/results?sites=fss,fsc&page=1&pagesize=30",
+    "/api/v1/search/results?keyword=금융투자업규정&page=1&pagesize=30",
+    "/api/v1/search/results?keyword=공시&page=1&pagesize=30",
+    "/api/v1/search/attachments/fss/menu_200488/1",
+    "/api/v1/items/1",
+    "/api/v1/statistics/metrics",
+    "/api/v1/statistics/sites",
+    "/api/v1/statistics/files",
+    "/api/v1/statistics/detail",
+    "/api/v1/statistics/collection-period",
+    "/api/v1/logs/dates",
+    f"/api/v1/logs/crawler?date={date.today().isoformat()}",
+    "/api/v1/logs/ui",
+    "/api/v1/logs/ui/download",
+    "/api/v1/logs/query",
+    "/api/v1/logs/query?level=ERROR&site=fss",
+    "/api/v1/logs/query?q=ReadTimeout",
+    "/api/v1/logs/crawler/files",
+    f"/api/v1/logs/crawler/file?filename={TODAY_LOG}",
+    f"/api/v1/logs/crawler/file/download?filename={TODAY_LOG}",
+    "/api/v1/settings/system-info",
+    "/api/v1/settings/info",
+    "/api/v1/settings/history",
+    "/api/v1/settings/sites",
+]
+
+
+@pytest.fixture(scope="module")
+def client():
+    from app.backend.core.exception_handler import add_exception_handlers
+    from app.backend.main import add_routes
+
+    app = FastAPI()
+    add_routes(app)
+    add_exception_handlers(app)
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.mark.parametrize("url", ROUTES)
+def test_route(bench_db, benchmark, client, url):
+    def setup():
+        get_result_cache().clear()
+
+    response = benchmark(client.get, url, setup=setup)
+    assert response.status_code == 200, response.text[:200]
+
+
+@pytest.fixture(scope="module")
+def batch_body(bench_data):
+    """목록 한 페이지(최신 30건)의 게시글 키"""
+    conn = sqlite3.connect(bench_data["db_path"])
+    rows = conn.execute(
+        "SELECT site_name, page_id, real_seq FROM law_summary ORDER BY id DESC LIMIT 30"
+    ).fetchall()
+    conn.close()
+    return {"items": [{"site_code": s, "page_code": p, "real_seq": r} for s, p, r in rows]}
+
+
+def test_attachments_batch(bench_db, benchmark, client, batch_body):
+    response = benchmark(client.post, "/api/v1/attachments/batch", json=batch_body)
+    assert response.status_code == 200, response.text[:200]
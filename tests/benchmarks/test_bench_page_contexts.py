@@ -0,0 +1,134 @@
+"""
+page_contexts 함수 벤치마크 (RUN_BENCHMARKS=1 일 때만 실행)
+
+조회 결과 캐시를 매 회 비우고 측정한다 (캐시 미스 경로 = SQL·파일 I/O 비용).
+"""
+
+from datetime import date
+
+import pytest
+
+from app.backend.data.result_cache import get_result_cache
+from app.backend.page_contexts import (
+    dashboard_context,
+    logs_context,
+    search_context,
+    settings_context,
+    statistics_context,
+)
+from tests.benchmarks.conftest import benchmarks_enabled
+
+pytestmark = [
+    pytest.mark.benchmark,
+    pytest.mark.skipif(not benchmarks_enabled(), reason="RUN_BENCHMARKS=1 일 때만 실행"),
+]
+
+
+def _cold():
+    get_result_cache().clear()
+
+
+class TestDashboardContextBench:
+    """dashboard_context 벤치마크"""
+
+    def test_get_dashboard_metrics(self, bench_db, benchmark):
+        result = benchmark(dashboard_context.get_dashboard_metrics, setup=_cold)
+        assert result["site_count"] != "-"
+
+    @pytest.mark.parametrize("period", ["today", "3days", "7days"])
+    def test_get_dashboard_data(self, bench_db, benchmark, period):
+        result = benchmark(dashboard_context.get_dashboard_data, period, setup=_cold)
+        assert isinstance(result, list)
+
+    def test_get_dashboard_data_warm(self, bench_db, benchmark):
+        """캐시 적중 경로"""
+        result = benchmark(dashboard_context.get_dashboard_data, "7days")
+        assert isinstance(result, list)
+
+
+class TestSearchContextBench:
+    """search_context 벤치마크"""
+
+    def test_get_sites_list(self, bench_db, benchmark):
+        assert benchmark(search_context.get_sites_list, setup=_cold)
+
+    def test_search_sites(self, bench_db, benchmark):
+        result = benchmark(search_context.search_data, ["fss", "fsc"], "", 1, 30)
+        assert result["items"]
+
+    def test_search_deep_page(self, bench_db, benchmark):
+        """OFFSET 이 큰 페이지 (cursor 없이)"""
+        result = benchmark(search_context.search_data, ["fss", "fsc"], "", 20, 30)
+        assert "items" in result
+
+    def test_search_cursor_page(self, bench_db, benchmark):
+        """keyset 커서로 다음 페이지"""
+        first = search_context.search_data(["fss", "fsc"], "", 1, 30)
+        result = benchmark(search_context.search_data, ["fss", "fsc"], "", 2, 30, first["next_cursor"])
+        assert result["items"]
+
+    def test_search_fts_keyword(self, bench_db, benchmark):
+        """3글자 이상 키워드 (FTS)"""
+        result = benchmark(search_context.search_data, [], "금융투자업규정", 1, 30)
+        assert result["total"] > 0
+
+    def test_search_short_keyword(self, bench_db, benchmark):
+        """2글자 키워드 (LIKE)"""
+        result = benchmark(search_context.search_data, [], "공시", 1, 30)
+        assert "items" in result
+
+
+class TestStatisticsContextBench:
+    """statistics_context 벤치마크"""
+
+    @pytest.mark.parametrize("func", [
+        "get_statistics_metrics",
+        "get_site_statistics",
+        "get_site_file_statistics",
+        "get_detail_statistics",
+        "get_collection_period_info",
+    ])
+    def test_statistics(self, bench_db, benchmark, func):
+        result = benchmark(getattr(statistics_context, func), setup=_cold)
+        assert result
+
+
+class TestSettingsContextBench:
+    """settings_context 벤치마크"""
+
+    @pytest.mark.parametrize("func", [
+        "get_system_info",
+        "get_info_content",
+        "get_history_content",
+        "get_site_list_html",
+    ])
+    def test_settings(self, bench_db, benchmark, func):
+        result = benchmark(getattr(settings_context, func), setup=_cold)
+        assert result is not None
+
+
+class TestLogsContextBench:
+    """logs_context 벤치마크"""
+
+    def test_get_available_dates(self, bench_db, benchmark):
+        assert benchmark(logs_context.get_available_dates)
+
+    def test_get_crawler_log_tail(self, bench_db, benchmark):
+        result = benchmark(logs_context.get_crawler_log, date.today().isoformat())
+        assert result["filename"]
+
+    def test_get_crawler_log_first_page(self, bench_db, benchmark):
+        result = benchmark(logs_context.get_crawler_log, date.today().isoformat(), 0)
+        assert result["has_after"]
+
+    def test_get_ui_log(self, bench_db, benchmark):
+        result = benchmark(logs_context.get_ui_log)
+        assert result["filename"]
+
+    def test_get_crawler_log_files(self, bench_db, benchmark):
+        assert benchmark(logs_context.get_crawler_log_files)
+
+    def test_get_crawler_log_by_filename(self, bench_db, benchmark):
+        filename = f"law_crawler_{date.today():%Y_%m_%d}.log"
+        result = benchmark(logs_context.get_crawler_log_by_filename, filename)
+        assert result["filename"] == filename
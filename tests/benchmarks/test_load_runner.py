@@ -0,0 +1,76 @@
+"""
+load_runner.py 모듈에 대한 테스트 (작은 앱으로 짧게 실행)
+"""
+
+import asyncio
+
+from fastapi import FastAPI
+
+from tests.benchmarks.load_runner import ScenarioData, percentile, run_stage, summarize
+
+
+class TestPercentile:
+    """percentile 함수 테스트"""
+
+    def test_nearest_rank(self):
+        """nearest-rank 백분위"""
+        values = list(range(1, 101))
+        assert percentile(values, 50) == 50
+        assert percentile(values, 95) == 95
+        assert percentile(values, 99) == 99
+        assert percentile([7], 99) == 7
+        assert percentile([], 50) == 0.0
+
+
+class TestSummarize:
+    """summarize 함수 테스트"""
+
+    def test_per_scenario_and_total(self):
+        """시나리오별·전체 처리량과 오류율"""
+        # Arrange
+        results = {
+            "search": {"latencies": [10.0, 30.0, 20.0, 40.0], "errors": 1},
+            "ui_log": {"latencies": [5.0], "errors": 0},
+        }
+
+        # Act
+        summary = summarize(results, 2.0)
+
+        # Assert
+        assert summary["search"]["requests"] == 4
+        assert summary["search"]["rps"] == 2.0
+        assert summary["search"]["p50_ms"] == 20.0
+        assert summary["search"]["error_rate"] == 0.25
+        assert summary["TOTAL"]["requests"] == 5
+        assert summary["TOTAL"]["error_rate"] == 0.2
+
+
+class TestRunStage:
+    """run_stage 함수 테스트"""
+
+    def test_drives_app_in_process(self):
+        """ASGI 앱을 네트워크 없이 호출하고 오류(5xx)를 집계"""
+        # Arrange
+        app = FastAPI()
+
+        @app.get("/api/v1/dashboard/metrics")
+        async def metrics():
+            return {"ok": True}
+
+        @app.get("/api/v1/logs/ui")
+        async def ui_log():
+            raise RuntimeError("boom")
+
+        data = ScenarioData(["fss"], [("fss", "menu_1", "1")], "2025-01-01")
+        mix = {"dashboard_metrics": 1, "ui_log": 1}
+
+        # Act
+        summary = asyncio.run(run_stage(app, data, users=3, duration=0.3, mix=mix, think_time=(0, 0.01)))
+
+        # Assert
+        assert summary["dashboard_metrics"]["requests"] > 0
+        assert summary["dashboard_metrics"]["error_rate"] == 0.0
+        assert summary["ui_log"]["error_rate"] == 1.0
+        assert summary["TOTAL"]["requests"] == (
+            summary["dashboard_metrics"]["requests"] + summary["ui_log"]["requests"]
+        )
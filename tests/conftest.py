@@ -3,13 +3,25 @@
 """
 
 import pytest
-import pandas as pd
 import sqlite3
 import os
 from datetime import datetime, date
 from unittest.mock import Mock, MagicMock, patch
 
 
+@pytest.fixture(autouse=True)
+def clear_result_cache(monkeypatch):
+    """테스트 간 조회 결과 캐시가 공유되지 않도록 비우고, DB 변경을 즉시 감지"""
+    from app.backend.data.result_cache import get_result_cache
+
+    cache = get_result_cache()
+    cache.clear()
+    monkeypatch.setattr(cache, "check_interval", 0)
+    yield
+    cache.clear()
+    cache.close()
+
+
 @pytest.fixture
 def mock_config():
     """Mock config 객체"""
@@ -40,22 +52,27 @@ def mock_logger():
 
 
 @pytest.fixture
-def sample_dataframe():
-    """샘플 DataFrame 생성"""
-    return pd.DataFrame({
-        "site_name": ["site1", "site2", "site3"],
-        "page_id": ["page1", "page2", "page3"],
-        "사이트": ["사이트1", "사이트2", "사이트3"],
-        "페이지": ["페이지1", "페이지2", "페이지3"],
-        "제목": ["제목1", "제목2", "제목3"],
-        "등록일": ["2025-01-01", "2025-01-02", "2025-01-03"],
-        "수집일시": ["2025-01-01 10:00:00", "2025-01-02 11:00:00", "2025-01-03 12:00:00"],
-        "site_url": ["http://site1.com", "http://site2.com", "http://site3.com"],
-        "detail_url": ["http://site1.com/detail1", "http://site2.com/detail2", "http://site3.com/detail3"],
-        "org_url": ["http://site1.com/org1", "http://site2.com/org2", "http://site3.com/org3"],
-        "summary": ["요약1", "요약2", "요약3"],
-        "real_seq": [1, 2, 3],
-    })
+def sample_rows():
+    """샘플 목록 행 (SUMMARY_ROW_COLUMNS 별칭의 dict 리스트)"""
+    return [
+        {
+            "id": i,
+            "site_name": f"사이트{i}",
+            "page_id": f"페이지{i}",
+            "title": f"제목{i}",
+            "registration_date": f"2025-01-0{i}",
+            "collection_date": f"2025-01-0{i} 1{i - 1}:00:00",
+            "site_url": f"http://site{i}.com",
+            "detail_url": f"http://site{i}.com/detail{i}",
+            "org_url": f"http://site{i}.com/org{i}",
+            "excerpt": f"요약{i}",
+            "real_seq": str(i),
+            "attach_count": 0,
+            "site_code": f"site{i}",
+            "page_code": f"page{i}",
+        }
+        for i in range(1, 4)
+    ]
 
 
 @pytest.fixture
@@ -129,3 +146,100 @@ def mock_site_dict():
         "site2": "사이트2",
         "site3": "사이트3",
     }
+
+
+LAW_DB_SCHEMA = """
+CREATE TABLE law_summary (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    category TEXT NOT NULL DEFAULT 'DATA',
+    site_name TEXT NOT NULL,
+    page_id TEXT NOT NULL,
+    real_seq TEXT,
+    title TEXT,
+    register_date TEXT,
+    org_url TEXT,
+    summary TEXT,
+    upd_time DATETIME DEFAULT CURRENT_TIMESTAMP
+);
+CREATE TABLE law_summary_attach (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    parent_id INTEGER NOT NULL,
+    save_folder TEXT,
+    save_file_name TEXT,
+    upd_time DATETIME DEFAULT CURRENT_TIMESTAMP
+);
+CREATE TABLE yaml_info (
+    site_name TEXT NOT NULL,
+    page_id TEXT NOT NULL,
+    h_name TEXT,
+    desc TEXT,
+    url TEXT,
+    detail_url TEXT,
+    PRIMARY KEY (site_name, page_id)
+);
+"""
+
+
+@pytest.fixture
+def law_db(tmp_path, monkeypatch):
+    """
+    실제 SQLite 파일로 만든 law_summary.db
+
+    config.DB_PATH 를 임시 파일로 바꾸고 전역 커넥션 풀을 새로 만든다.
+    """
+    from app.backend.core.config import config
+    from app.backend.data.db_pool import close_pool
+
+    db_path = tmp_path / "law_summary.db"
+    conn = sqlite3.connect(db_path)
+    conn.executescript(LAW_DB_SCHEMA)
+    conn.executemany(
+        "INSERT INTO yaml_info VALUES (?, ?, ?, ?, ?, ?)",
+        [
+            ("site1", "page1", "사이트1", "페이지1", "http://site1.com", "http://site1.com/d1"),
+            ("site2", "page2", "사이트2", "페이지2", "http://site2.com", "http://site2.com/d2"),
+        ],
+    )
+    conn.executemany(
+        """INSERT INTO law_summary
+           (category, site_name, page_id, real_seq, title, register_date, org_url, summary, upd_time)
+           VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+        [
+            ("DATA", "site1", "page1", "1", "금융 규정 개정", "2025-01-20", "http://o/1", "<p>규정 요약</p>", "2025-01-20 09:00:00"),
+            ("DATA", "site1", "page1", "2", "공시 안내", "2025-01-22", "http://o/2", "<p>공시 요약</p>", "2025-01-22 10:00:00"),
+            ("DATA", "site2", "page2", "3", "감독 규정", "2025-01-23", "http://o/3", "<p>감독 요약</p>", "2025-01-23 23:59:59"),
+            ("LOG", "site2", "page2", "4", "오류 로그", "2025-01-23", "", "", "2025-01-23 11:00:00"),
+        ],
+    )
+    conn.executemany(
+        "INSERT INTO law_summary_attach (parent_id, save_folder, save_file_name, upd_time) VALUES (?, ?, ?, ?)",
+        [
+            (1, "site1/page1", "a.pdf", "2025-01-20 09:00:01"),
+            (1, "site1/page1", "b.hwp", "2025-01-20 09:00:02"),
+            (3, "site2/page2", "c.pdf", "2025-01-23 23:59:59"),
+        ],
+    )
+    conn.commit()
+    conn.close()
+
+    close_pool()
+    monkeypatch.setattr(config, "DB_PATH", str(db_path))
+    yield str(db_path)
+    close_pool()
+
+
+def insert_summary(db_path):
+    """law_db 에 게시글 한 건 추가 (DB 변경 감지 테스트용)"""
+    conn = sqlite3.connect(db_path)
+    conn.execute(
+        "INSERT INTO law_summary (site_name, page_id, real_seq, title) "
+        "VALUES ('site1', 'page1', '9', '신규')"
+    )
+    conn.commit()
+    conn.close()
+
+
+def append_text(path, text):
+    """파일 끝에 UTF-8 텍스트 추가 (로그 파일이 자라는 상황 재현)"""
+    with open(path, "ab") as f:
+        f.write(text.encode("utf-8"))
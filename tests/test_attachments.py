@@ -0,0 +1,298 @@
+"""
+첨부파일 다운로드 API (ETag / Range / MIME / ZIP 묶음) 테스트
+"""
+
+import io
+import threading
+import zipfile
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.backend.api.v1 import attachments
+from app.backend.data.attachment_bundle import MISSING_LIST_NAME, iter_zip_stream
+from app.backend.data.attachment_file import sniff_media_type
+
+PDF_BYTES = b"%PDF-1.4\n" + bytes(range(256)) * 8
+
+
+@pytest.fixture
+def attach_dir(tmp_path, monkeypatch):
+    """ATTACHS_DIR 를 임시 디렉터리로 바꾸고 샘플 파일 생성"""
+    from app.backend.core.config import config
+
+    base = tmp_path / "Attaches"
+    folder = base / "site1" / "page1"
+    folder.mkdir(parents=True)
+    (folder / "notice.pdf").write_bytes(PDF_BYTES)
+    # 확장자 없이 저장된 PDF (다운로드 URL 그대로)
+    (folder / "download.do").write_bytes(PDF_BYTES)
+    (folder / "form.hwp").write_bytes(b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1" + b"\0" * 64)
+    (tmp_path / "secret.txt").write_text("secret", encoding="utf-8")
+    monkeypatch.setattr(config, "ATTACHS_DIR", str(base))
+    return folder
+
+
+@pytest.fixture
+def client(attach_dir):
+    app = FastAPI()
+    app.include_router(attachments.router, prefix="/api/v1")
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+URL = "/api/v1/attachments/site1/page1/notice.pdf"
+
+
+class TestDownloadAttachment:
+    """download_attachment 테스트"""
+
+    def test_pdf_inline_with_immutable_cache(self, client):
+        """PDF 는 inline, 강한 ETag 와 immutable Cache-Control"""
+        # Act
+        response = client.get(URL)
+
+        # Assert
+        assert response.status_code == 200
+        assert response.content == PDF_BYTES
+        assert response.headers["content-type"] == "application/pdf"
+        assert response.headers["content-disposition"].startswith("inline")
+        assert response.headers["etag"].startswith('"') and "W/" not in response.headers["etag"]
+        assert "immutable" in response.headers["cache-control"]
+        assert response.headers["accept-ranges"] == "bytes"
+
+    def test_matching_etag_returns_304(self, client):
+        """If-None-Match 가 같으면 본문 없이 304"""
+        # Arrange
+        etag = client.get(URL).headers["etag"]
+
+        # Act
+        response = client.get(URL, headers={"If-None-Match": etag})
+
+        # Assert
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+
+    def test_single_range(self, client):
+        """Range 한 구간은 206 과 해당 바이트"""
+        # Act
+        response = client.get(URL, headers={"Range": "bytes=10-19"})
+
+        # Assert
+        assert response.status_code == 206
+        assert response.content == PDF_BYTES[10:20]
+        assert response.headers["content-range"] == f"bytes 10-19/{len(PDF_BYTES)}"
+
+    def test_multiple_ranges(self, client):
+        """여러 구간은 multipart/byteranges"""
+        # Act
+        response = client.get(URL, headers={"Range": "bytes=0-4,100-109"})
+
+        # Assert
+        assert response.status_code == 206
+        assert response.headers["content-type"].startswith("multipart/byteranges")
+        assert PDF_BYTES[0:5] in response.content
+        assert PDF_BYTES[100:110] in response.content
+
+    def test_stale_if_range_sends_full_file(self, client):
+        """If-Range 가 현재 ETag 와 다르면 전체 파일"""
+        # Act
+        response = client.get(URL, headers={"Range": "bytes=0-9", "If-Range": '"old"'})
+
+        # Assert
+        assert response.status_code == 200
+        assert response.content == PDF_BYTES
+
+    def test_sniffs_type_without_extension(self, client):
+        """확장자로 알 수 없으면 파일 앞부분으로 판별"""
+        # Act
+        response = client.get("/api/v1/attachments/site1/page1/download.do")
+
+        # Assert
+        assert response.headers["content-type"] == "application/pdf"
+
+    def test_hwp_is_downloaded(self, client):
+        """hwp 는 전용 MIME 으로 attachment"""
+        # Act
+        response = client.get("/api/v1/attachments/site1/page1/form.hwp")
+
+        # Assert
+        assert response.headers["content-type"] == "application/x-hwp"
+        assert response.headers["content-disposition"].startswith("attachment")
+
+    def test_path_outside_attach_dir_is_404(self, client):
+        """ATTACHS_DIR 밖을 가리키는 경로는 404"""
+        # Act
+        response = client.get("/api/v1/attachments/site1/%2E%2E/%2E%2E/%2E%2E/secret.txt")
+
+        # Assert
+        assert response.status_code == 404
+
+    def test_missing_file_is_404(self, client):
+        # Act
+        response = client.get("/api/v1/attachments/site1/page1/none.pdf")
+
+        # Assert
+        assert response.status_code == 404
+
+
+class TestSniffMediaType:
+    """sniff_media_type 테스트"""
+
+    def test_unknown_content_is_octet_stream(self, tmp_path):
+        # Arrange
+        path = tmp_path / "blob"
+        path.write_bytes(b"\x00\x01\x02")
+
+        # Act / Assert
+        assert sniff_media_type(path, "blob") == "application/octet-stream"
+
+
+@pytest.fixture
+def bundle_client(law_db, attach_dir):
+    """law_db 의 첨부파일 행(a.pdf, b.hwp / c.pdf)에 맞춘 파일과 테스트 앱"""
+    (attach_dir / "a.pdf").write_bytes(PDF_BYTES)
+    (attach_dir / "b.hwp").write_bytes(b"hwp" * 1000)
+    # site2/page2/c.pdf 는 만들지 않음 (없는 파일)
+    app = FastAPI()
+    app.include_router(attachments.router, prefix="/api/v1")
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+def _zip_names(response) -> dict:
+    archive = zipfile.ZipFile(io.BytesIO(response.content))
+    assert archive.testzip() is None
+    return {info.filename: info for info in archive.infolist()}
+
+
+class TestAttachmentBundle:
+    """/attachments/bundle 테스트"""
+
+    def test_post_bundle(self, bundle_client):
+        """게시글 하나의 첨부파일을 ZIP 으로, pdf·hwp 는 저장만"""
+        # Act
+        response = bundle_client.get("/api/v1/attachments/bundle/site1/page1/1")
+
+        # Assert
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/zip"
+        assert "attachments_site1_page1_1.zip" in response.headers["content-disposition"]
+        infos = _zip_names(response)
+        assert set(infos) == {"site1/page1/a.pdf", "site1/page1/b.hwp"}
+        assert all(info.compress_type == zipfile.ZIP_STORED for info in infos.values())
+
+    def test_date_range_bundle_lists_missing_files(self, bundle_client):
+        """수집일 범위 묶음, 없는 파일은 목록 파일로 남김"""
+        # Act
+        response = bundle_client.get(
+            "/api/v1/attachments/bundle", params={"date_from": "2025-01-20", "date_to": "2025-01-23"}
+        )
+
+        # Assert
+        infos = _zip_names(response)
+        assert set(infos) == {"site1/page1/a.pdf", "site1/page1/b.hwp", MISSING_LIST_NAME}
+        archive = zipfile.ZipFile(io.BytesIO(response.content))
+        assert archive.read(MISSING_LIST_NAME).decode() == "site2/page2/c.pdf\n"
+        assert archive.read("site1/page1/a.pdf") == PDF_BYTES
+
+    def test_site_filter_and_empty_result(self, bundle_client):
+        """사이트 필터로 대상이 없으면 404"""
+        # Act
+        response = bundle_client.get(
+            "/api/v1/attachments/bundle", params={"date_from": "2025-01-20", "sites": "site9"}
+        )
+
+        # Assert
+        assert response.status_code == 404
+
+    def test_page_bundle(self, bundle_client):
+        # Act
+        response = bundle_client.get("/api/v1/attachments/bundle/site1/page1")
+
+        # Assert
+        assert set(_zip_names(response)) == {"site1/page1/a.pdf", "site1/page1/b.hwp"}
+
+    def test_chunks_are_read_in_file_pool(self, bundle_client, monkeypatch):
+        """ZIP 청크는 file 스레드 풀에서 만들고 끝나면 제너레이터를 닫음"""
+        # Arrange
+        threads = []
+        closed = []
+
+        def fake_zip_stream(entries):
+            try:
+                for _ in range(3):
+                    threads.append(threading.current_thread().name)
+                    yield b"chunk"
+            finally:
+                closed.append(True)
+
+        monkeypatch.setattr(attachments, "iter_zip_stream", fake_zip_stream)
+
+        # Act
+        response = bundle_client.get("/api/v1/attachments/bundle/site1/page1/1")
+
+        # Assert
+        assert response.content == b"chunk" * 3
+        assert threads and all(name.startswith("file-io") for name in threads)
+        assert closed == [True]
+
+
+class TestIterZipStream:
+    """iter_zip_stream 테스트"""
+
+    def test_streams_in_chunks_and_deflates_text(self, tmp_path):
+        """청크 단위로 내보내고, 텍스트는 deflate 로 압축"""
+        # Arrange
+        path = tmp_path / "big.txt"
+        path.write_bytes(b"law crawler " * 50_000)
+
+        # Act
+        chunks = list(iter_zip_stream([("big.txt", path)], chunk_size=4096))
+
+        # Assert
+        assert len(chunks) > 2
+        archive = zipfile.ZipFile(io.BytesIO(b"".join(chunks)))
+        info = archive.getinfo("big.txt")
+        assert info.compress_type == zipfile.ZIP_DEFLATED
+        assert info.compress_size < info.file_size
+        assert archive.read("big.txt") == path.read_bytes()
+
+
+class TestAttachmentBatch:
+    """/attachments/batch 테스트"""
+
+    def test_groups_by_post_and_keeps_empty_posts(self, bundle_client):
+        """게시글별로 묶고, 첨부파일 없는 게시글은 count 0"""
+        # Arrange
+        body = {"items": [
+            {"site_code": "site1", "page_code": "page1", "real_seq": "1"},
+            {"site_code": "site1", "page_code": "page1", "real_seq": "2"},
+            {"site_code": "site2", "page_code": "page2", "real_seq": "3"},
+        ]}
+
+        # Act
+        response = bundle_client.post("/api/v1/attachments/batch", json=body)
+
+        # Assert
+        assert response.status_code == 200
+        result = response.json()
+        assert result["count"] == 3
+        assert [item["name"] for item in result["items"]["site1/page1/1"]["items"]] == ["a.pdf", "b.hwp"]
+        assert result["items"]["site1/page1/2"] == {"count": 0, "items": []}
+        assert result["items"]["site2/page2/3"]["items"] == [
+            {"name": "c.pdf", "url": "/api/v1/attachments/site2/page2/c.pdf"}
+        ]
+
+    def test_too_many_items_is_422(self, bundle_client):
+        # Arrange
+        item = {"site_code": "site1", "page_code": "page1", "real_seq": "1"}
+        body = {"items": [item] * (attachments.MAX_BATCH_ITEMS + 1)}
+
+        # Act
+        response = bundle_client.post("/api/v1/attachments/batch", json=body)
+
+        # Assert
+        assert response.status_code == 422
@@ -0,0 +1,117 @@
+"""
+conditional.py (ETag / 304 조건부 응답) 에 대한 테스트
+"""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.backend.api.v1 import dashboard, search, settings, statistics
+from tests.conftest import insert_summary
+
+
+@pytest.fixture
+def client(law_db):
+    """조건부 응답을 쓰는 라우터만 올린 테스트 앱"""
+    app = FastAPI()
+    for module in (statistics, search, settings, dashboard):
+        app.include_router(module.router, prefix="/api/v1")
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+class TestConditionalResponses:
+    """ETag / If-None-Match 처리 테스트"""
+
+    def test_etag_and_no_cache_headers(self, client):
+        """응답에 강한 ETag 와 no-cache 헤더"""
+        # Act
+        response = client.get("/api/v1/statistics/sites")
+
+        # Assert
+        assert response.status_code == 200
+        assert response.headers["etag"].startswith('"')
+        assert response.headers["cache-control"] == "no-cache"
+        assert {"site": "사이트1", "count": 2} in response.json()
+
+    def test_matching_etag_returns_304(self, client):
+        """If-None-Match 가 같으면 본문 없이 304"""
+        # Arrange
+        etag = client.get("/api/v1/search/sites").headers["etag"]
+
+        # Act
+        response = client.get("/api/v1/search/sites", headers={"If-None-Match": etag})
+
+        # Assert
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+
+    def test_etag_differs_per_endpoint(self, client):
+        """경로가 다르면 ETag 도 다르다"""
+        # Act
+        sites = client.get("/api/v1/statistics/sites").headers["etag"]
+        files = client.get("/api/v1/statistics/files").headers["etag"]
+        settings_sites = client.get("/api/v1/settings/sites").headers["etag"]
+
+        # Assert
+        assert len({sites, files, settings_sites}) == 3
+
+    def test_db_write_changes_etag(self, client, law_db):
+        """DB 에 행이 추가되면 이전 ETag 로는 304 가 아니다"""
+        # Arrange
+        etag = client.get("/api/v1/statistics/sites").headers["etag"]
+
+        # Act
+        insert_summary(law_db)
+        response = client.get("/api/v1/statistics/sites", headers={"If-None-Match": etag})
+
+        # Assert
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+        assert {"site": "사이트1", "count": 3} in response.json()
+
+    def test_error_fallback_has_no_etag(self, client, monkeypatch):
+        """조회 실패 시 기본값 응답에는 ETag 를 붙이지 않는다"""
+        # Arrange
+        def boom():
+            raise RuntimeError("boom")
+
+        monkeypatch.setattr(statistics, "get_site_statistics", boom)
+
+        # Act
+        response = client.get("/api/v1/statistics/sites")
+
+        # Assert
+        assert response.status_code == 200
+        assert response.json() == []
+        assert "etag" not in response.headers
+
+    @pytest.mark.parametrize(
+        ("target", "url"),
+        [
+            ("app.backend.page_contexts.statistics_context.site_static", "/api/v1/statistics/sites"),
+            ("app.backend.page_contexts.statistics_context.detail_static", "/api/v1/statistics/detail"),
+            ("app.backend.page_contexts.dashboard_context.get_summary_list", "/api/v1/dashboard/data"),
+            ("app.backend.page_contexts.search_context.get_site_and_code_dict", "/api/v1/search/sites"),
+            ("app.backend.page_contexts.settings_context.yaml_info_to_html", "/api/v1/settings/sites"),
+        ],
+    )
+    def test_data_error_is_not_validated(self, client, monkeypatch, target, url):
+        """DB 조회가 실패하면 ETag 없는 기본값 (복구 후 응답부터 ETag)"""
+        # Arrange
+        def boom(*args, **kwargs):
+            raise RuntimeError("database is locked")
+
+        with monkeypatch.context() as patched:
+            patched.setattr(target, boom)
+
+            # Act
+            failed = client.get(url)
+
+        recovered = client.get(url)
+
+        # Assert
+        assert failed.status_code == 200
+        assert "etag" not in failed.headers
+        assert "etag" in recovered.headers
@@ -0,0 +1,110 @@
+"""
+crawler_health.py 모듈에 대한 테스트
+"""
+
+import os
+from unittest.mock import patch
+
+from app.backend.data.crawler_health import CrawlerHealthChecker
+from tests.conftest import append_text
+
+
+class TestCrawlerHealthChecker:
+    """CrawlerHealthChecker 클래스 테스트"""
+
+    def test_ok_with_last_timestamp(self, tmp_path):
+        """오류가 없으면 ok, 마지막 타임스탬프 반환"""
+        # Arrange
+        log = tmp_path / "law_crawler_2025-01-30.log"
+        append_text(log, "2025-01-30 10:00:00,001 - INFO - start\n2025-01-30 10:30:45,123 - INFO - done\n  trailing\n")
+        checker = CrawlerHealthChecker()
+
+        # Act
+        result = checker.check(str(tmp_path))
+
+        # Assert
+        assert result["healthy"] == "ok"
+        assert result["last_crawling_time"] == "2025-01-30 10:30:45"
+        assert result["error_detected"] is False
+
+    def test_scans_only_appended_bytes(self, tmp_path):
+        """두 번째 호출은 추가된 부분만 읽어 오류 수를 누적"""
+        # Arrange
+        log = tmp_path / "law_crawler_2025-01-30.log"
+        append_text(log, "2025-01-30 10:00:00 - ERROR - boom\n")
+        checker = CrawlerHealthChecker()
+        checker.check(str(tmp_path))
+        append_text(log, "2025-01-30 11:00:00 - INFO - Exception handled\n")
+
+        # Act
+        with patch.object(checker, "_scan_errors", wraps=checker._scan_errors) as scan:
+            result = checker.check(str(tmp_path))
+            state = checker._states[str(log)]
+            checker.check(str(tmp_path))
+
+        # Assert
+        assert result["error_count"] == 2
+        assert result["last_crawling_time"] == "2025-01-30 11:00:00"
+        assert state.offset == os.path.getsize(log)
+        # 변경이 없으면 스캔하지 않음
+        scan.assert_called_once()
+
+    def test_partial_line_waits_for_newline(self, tmp_path):
+        """줄이 끝나지 않은 조각은 다음 호출에서 한 줄로 스캔"""
+        # Arrange
+        log = tmp_path / "law_crawler_2025-01-30.log"
+        append_text(log, "2025-01-30 10:00:00 - ER")
+        checker = CrawlerHealthChecker(chunk_size=4)
+
+        # Act
+        first = checker.check(str(tmp_path))
+        append_text(log, "ROR - boom\n")
+        second = checker.check(str(tmp_path))
+
+        # Assert
+        assert first["error_count"] == 0
+        assert second["error_count"] == 1
+
+    def test_truncated_file_is_rescanned(self, tmp_path):
+        """파일이 작아지면 처음부터 다시 스캔"""
+        # Arrange
+        log = tmp_path / "law_crawler_2025-01-30.log"
+        append_text(log, "2025-01-30 10:00:00 - ERROR - a long line that will be truncated\n")
+        checker = CrawlerHealthChecker()
+        checker.check(str(tmp_path))
+
+        # Act
+        log.write_text("2025-01-30 12:00:00 - INFO - ok\n", encoding="utf-8")
+        result = checker.check(str(tmp_path))
+
+        # Assert
+        assert result["healthy"] == "ok"
+        assert result["last_crawling_time"] == "2025-01-30 12:00:00"
+
+    def test_directory_listing_is_cached(self, tmp_path):
+        """디렉터리 mtime 이 같으면 목록을 다시 만들지 않고, 새 파일이 생기면 갱신"""
+        # Arrange
+        old = tmp_path / "law_crawler_2025-01-29.log"
+        append_text(old, "2025-01-29 10:00:00 - INFO - old\n")
+        os.utime(old, (1_000_000, 1_000_000))
+        checker = CrawlerHealthChecker()
+        checker.check(str(tmp_path))
+        checker.check(str(tmp_path))
+
+        # Act
+        append_text(tmp_path / "law_crawler_2025-01-30.log", "2025-01-30 09:00:00 - INFO - new\n")
+        os.utime(tmp_path, ns=(os.stat(tmp_path).st_atime_ns, os.stat(tmp_path).st_mtime_ns + 1_000_000_000))
+        result = checker.check(str(tmp_path))
+
+        # Assert
+        assert checker.directory.refreshes == 2
+        assert result["last_crawling_time"] == "2025-01-30 09:00:00"
+
+    def test_no_log_files(self, tmp_path):
+        """로그 파일이 없으면 check"""
+        # Act
+        result = CrawlerHealthChecker().check(str(tmp_path))
+
+        # Assert
+        assert result["healthy"] == "check"
+        assert result["error_message"] == "로그 파일을 찾을 수 없습니다."
@@ -0,0 +1,156 @@
+"""
+daily_rollup.py 모듈 및 window_counts 에 대한 테스트
+"""
+
+import sqlite3
+
+from app.backend.data.daily_rollup import (
+    DAILY_TABLE,
+    sync_daily_counts,
+    rebuild_daily_counts,
+)
+from app.backend.data import db_util
+from app.backend.data.db_util import (
+    window_counts,
+    total_site_attach_counts,
+    error_count_of_last_24h,
+)
+
+WINDOWS = {
+    "day": ("2025-01-23", None),
+    "range": ("2025-01-21", "2025-01-22"),
+    "total": ("1900-01-01", "2025-01-23"),
+}
+
+
+def _insert_rows(db_path):
+    """2025-01-24 에 게시글 2건(LOG 1건) + 첨부파일 1건 추가"""
+    conn = sqlite3.connect(db_path)
+    conn.executemany(
+        "INSERT INTO law_summary (category, site_name, page_id, real_seq, title, upd_time) "
+        "VALUES (?, ?, ?, ?, ?, ?)",
+        [
+            ("DATA", "site1", "page1", "5", "신규", "2025-01-24 08:00:00"),
+            ("LOG", "site1", "page1", "6", "오류", "2025-01-24 09:00:00"),
+        ],
+    )
+    conn.execute(
+        "INSERT INTO law_summary_attach (parent_id, save_folder, save_file_name, upd_time) "
+        "VALUES (5, 'site1/page1', 'd.pdf', '2025-01-24 08:00:01')"
+    )
+    conn.commit()
+    conn.close()
+
+
+def _rollup_rows(db_path):
+    conn = sqlite3.connect(db_path)
+    rows = conn.execute(
+        f"SELECT day, site_name, page_id, summary_count, attach_count, log_count "
+        f"FROM {DAILY_TABLE} ORDER BY day, site_name, page_id"
+    ).fetchall()
+    conn.close()
+    return rows
+
+
+class TestSyncDailyCounts:
+    """sync_daily_counts 함수 테스트"""
+
+    def test_initial_sync(self, law_db):
+        """일자·사이트·페이지별 게시글/첨부/LOG 건수"""
+        # Act
+        sync_daily_counts(law_db)
+
+        # Assert
+        assert _rollup_rows(law_db) == [
+            ("2025-01-20", "site1", "page1", 1, 2, 0),
+            ("2025-01-22", "site1", "page1", 1, 0, 0),
+            ("2025-01-23", "site2", "page2", 2, 1, 1),
+        ]
+
+    def test_incremental_sync(self, law_db):
+        """이미 반영한 행은 다시 세지 않는다"""
+        # Arrange
+        sync_daily_counts(law_db)
+        assert sync_daily_counts(law_db) == 0
+        _insert_rows(law_db)
+
+        # Act
+        sync_daily_counts(law_db, batch_size=1)
+
+        # Assert
+        assert _rollup_rows(law_db)[-1] == ("2025-01-24", "site1", "page1", 2, 1, 1)
+
+    def test_rebuild(self, law_db):
+        """재생성 결과는 증분 동기화 결과와 같다"""
+        # Arrange
+        sync_daily_counts(law_db)
+        expected = _rollup_rows(law_db)
+
+        # Act
+        rebuild_daily_counts(law_db)
+
+        # Assert
+        assert _rollup_rows(law_db) == expected
+
+
+class TestWindowCounts:
+    """window_counts 함수 테스트"""
+
+    def _legacy(self):
+        result = {
+            name: total_site_attach_counts(from_date, to_date)
+            for name, (from_date, to_date) in WINDOWS.items()
+        }
+        result["error_count"] = error_count_of_last_24h()
+        return result
+
+    def test_without_rollup_matches_base_tables(self, law_db):
+        """집계 전에는 원본 테이블로 계산"""
+        assert window_counts(WINDOWS) == self._legacy()
+
+    def test_with_rollup_matches_base_tables(self, law_db):
+        """집계 후 결과도 원본 기준과 같다"""
+        # Arrange
+        sync_daily_counts(law_db)
+
+        # Act / Assert
+        assert window_counts(WINDOWS) == self._legacy()
+
+    def test_unsynced_rows_are_included(self, law_db):
+        """집계 이후 추가된 행도 id 범위로 보완"""
+        # Arrange
+        sync_daily_counts(law_db)
+        _insert_rows(law_db)
+        windows = dict(WINDOWS, total=("1900-01-01", "2025-01-24"))
+
+        # Act
+        result = window_counts(windows)
+
+        # Assert
+        assert result["total"] == (6, 4)
+        # 최근 수집일이 2025-01-24 로 바뀌어 그날의 LOG 1건
+        assert result["error_count"] == 1
+
+    def test_sync_between_marker_and_aggregate(self, law_db, monkeypatch):
+        """동기화 위치를 읽은 직후 커밋된 배치도 두 번 세지 않는다"""
+        # Arrange
+        conn = sqlite3.connect(law_db)
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.close()
+        sync_daily_counts(law_db)
+        _insert_rows(law_db)
+        windows = dict(WINDOWS, total=("1900-01-01", "2025-01-24"))
+        read_synced_ids = db_util.daily_synced_ids
+
+        def synced_ids_then_sync(conn):
+            synced = read_synced_ids(conn)
+            sync_daily_counts(law_db)
+            return synced
+
+        monkeypatch.setattr(db_util, "daily_synced_ids", synced_ids_then_sync)
+
+        # Act
+        result = window_counts(windows)
+
+        # Assert
+        assert result["total"] == (6, 4)
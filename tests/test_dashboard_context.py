@@ -4,7 +4,6 @@ dashboard_context.py 모듈에 대한 단위 테스트
 
 import pytest
 import sqlite3
-import pandas as pd
 from datetime import datetime, timedelta
 from unittest.mock import Mock, patch, MagicMock
 
@@ -18,54 +17,45 @@ from app.backend.page_contexts.dashboard_context import (
 class TestGetLatestDataDate:
     """_get_latest_data_date 함수 테스트"""
 
-    @patch("app.backend.page_contexts.dashboard_context.get_summary_db_file")
-    @patch("app.backend.page_contexts.dashboard_context.sqlite3.connect")
-    def test_get_latest_data_date_success(self, mock_connect, mock_get_db):
+    @patch("app.backend.page_contexts.dashboard_context.get_connection")
+    def test_get_latest_data_date_success(self, mock_get_connection):
         """정상적으로 최신 날짜를 반환하는 경우"""
         # Arrange
-        mock_get_db.return_value = "test.db"
         mock_conn = MagicMock()
-        mock_cursor = MagicMock()
-        mock_connect.return_value = mock_conn
-        mock_conn.cursor.return_value = mock_cursor
-        mock_cursor.fetchone.return_value = ("2025-01-23",)
+        mock_get_connection.return_value.__enter__.return_value = mock_conn
+        mock_conn.execute.return_value.fetchone.return_value = ("2025-01-23",)
 
         # Act
         result = _get_latest_data_date()
 
         # Assert
         assert result == "2025-01-23"
-        mock_cursor.execute.assert_called_once_with(
+        mock_conn.execute.assert_called_once_with(
             "SELECT DATE(MAX(upd_time)) FROM law_summary"
         )
-        mock_conn.close.assert_called_once()
+        # 풀에 반납 (with 블록 종료)
+        mock_get_connection.return_value.__exit__.assert_called_once()
 
-    @patch("app.backend.page_contexts.dashboard_context.get_summary_db_file")
-    @patch("app.backend.page_contexts.dashboard_context.sqlite3.connect")
-    def test_get_latest_data_date_no_data(self, mock_connect, mock_get_db):
+    @patch("app.backend.page_contexts.dashboard_context.get_connection")
+    def test_get_latest_data_date_no_data(self, mock_get_connection):
         """데이터가 없는 경우 None 반환"""
         # Arrange
-        mock_get_db.return_value = "test.db"
         mock_conn = MagicMock()
-        mock_cursor = MagicMock()
-        mock_connect.return_value = mock_conn
-        mock_conn.cursor.return_value = mock_cursor
-        mock_cursor.fetchone.return_value = (None,)
+        mock_get_connection.return_value.__enter__.return_value = mock_conn
+        mock_conn.execute.return_value.fetchone.return_value = (None,)
 
         # Act
         result = _get_latest_data_date()
 
         # Assert
         assert result is None
-        mock_conn.close.assert_called_once()
+        mock_get_connection.return_value.__exit__.assert_called_once()
 
-    @patch("app.backend.page_contexts.dashboard_context.get_summary_db_file")
-    @patch("app.backend.page_contexts.dashboard_context.sqlite3.connect")
-    def test_get_latest_data_date_exception(self, mock_connect, mock_get_db):
+    @patch("app.backend.page_contexts.dashboard_context.get_connection")
+    def test_get_latest_data_date_exception(self, mock_get_connection):
         """예외 발생 시 None 반환"""
         # Arrange
-        mock_get_db.return_value = "test.db"
-        mock_connect.side_effect = sqlite3.OperationalError("Database error")
+        mock_get_connection.side_effect = sqlite3.OperationalError("Database error")
 
         # Act
         result = _get_latest_data_date()
@@ -77,26 +67,22 @@ class TestGetLatestDataDate:
 class TestGetDashboardMetrics:
     """get_dashboard_metrics 함수 테스트"""
 
-    @patch("app.backend.page_contexts.dashboard_context.error_count_of_last_24h")
-    @patch("app.backend.page_contexts.dashboard_context.total_site_attach_counts")
+    @patch("app.backend.page_contexts.dashboard_context.window_counts")
     @patch("app.backend.page_contexts.dashboard_context.datetime")
-    def test_get_dashboard_metrics_success(
-        self, mock_datetime, mock_total_counts, mock_error_count
-    ):
+    def test_get_dashboard_metrics_success(self, mock_datetime, mock_window_counts):
         """정상적으로 메트릭 데이터를 반환하는 경우"""
         # Arrange
         fixed_now = datetime(2025, 1, 23, 12, 0, 0)
         mock_datetime.now.return_value = fixed_now
         mock_datetime.strftime = datetime.strftime
 
-        # total_site_attach_counts의 반환값 설정 (순서대로: today, 3days, 7days, first)
-        mock_total_counts.side_effect = [
-            (10, 20),  # today
-            (30, 50),  # 3days
-            (70, 100),  # 7days
-            (150, 300),  # first (전체)
-        ]
-        mock_error_count.return_value = 5
+        mock_window_counts.return_value = {
+            "today": (10, 20),
+            "three_days": (30, 50),
+            "seven_days": (70, 100),
+            "total": (150, 300),
+            "error_count": 5,
+        }
 
         # Act
         result = get_dashboard_metrics()
@@ -109,23 +95,31 @@ class TestGetDashboardMetrics:
         assert result["total_collect"] == "150 (300)"
         assert result["error_count"] == 5
 
-        # total_site_attach_counts 호출 검증
-        assert mock_total_counts.call_count == 4
-        mock_error_count.assert_called_once()
+        # 모든 기간을 한 번의 호출로 조회
+        mock_window_counts.assert_called_once_with(
+            {
+                "today": ("2025-01-23", None),
+                "three_days": ("2025-01-21", "2025-01-23"),
+                "seven_days": ("2025-01-17", "2025-01-23"),
+                "total": ("1900-01-01", "2025-01-23"),
+            }
+        )
 
-    @patch("app.backend.page_contexts.dashboard_context.error_count_of_last_24h")
-    @patch("app.backend.page_contexts.dashboard_context.total_site_attach_counts")
+    @patch("app.backend.page_contexts.dashboard_context.window_counts")
     @patch("app.backend.page_contexts.dashboard_context.datetime")
-    def test_get_dashboard_metrics_zero_values(
-        self, mock_datetime, mock_total_counts, mock_error_count
-    ):
+    def test_get_dashboard_metrics_zero_values(self, mock_datetime, mock_window_counts):
         """모든 카운트가 0인 경우"""
         # Arrange
         fixed_now = datetime(2025, 1, 23, 12, 0, 0)
         mock_datetime.now.return_value = fixed_now
         mock_datetime.strftime = datetime.strftime
-        mock_total_counts.return_value = (0, 0)
-        mock_error_count.return_value = 0
+        mock_window_counts.return_value = {
+            "today": (0, 0),
+            "three_days": (0, 0),
+            "seven_days": (0, 0),
+            "total": (0, 0),
+            "error_count": 0,
+        }
 
         # Act
         result = get_dashboard_metrics()
@@ -138,19 +132,42 @@ class TestGetDashboardMetrics:
         assert result["total_collect"] == "0 (0)"
         assert result["error_count"] == 0
 
+    @patch("app.backend.page_contexts.dashboard_context.datetime")
+    def test_get_dashboard_metrics_real_db(self, mock_datetime, law_db):
+        """실제 DB: 집계 전/후 결과가 같다"""
+        # Arrange
+        from app.backend.data.daily_rollup import sync_daily_counts
+
+        mock_datetime.now.return_value = datetime(2025, 1, 23, 12, 0, 0)
+
+        # Act
+        before = get_dashboard_metrics()
+        sync_daily_counts(law_db)
+        after = get_dashboard_metrics()
+
+        # Assert
+        assert before == after == {
+            "site_count": "4 (3)",
+            "today_collect": "2 (1)",
+            "three_days_collect": "3 (1)",
+            "seven_days_collect": "4 (3)",
+            "total_collect": "4 (3)",
+            "error_count": 1,
+        }
+
 
 class TestGetDashboardData:
     """get_dashboard_data 함수 테스트"""
 
     @patch("app.backend.page_contexts.dashboard_context.get_summary_list")
     @patch("app.backend.page_contexts.dashboard_context.datetime")
-    def test_get_dashboard_data_today(self, mock_datetime, mock_get_summary, sample_dataframe):
+    def test_get_dashboard_data_today(self, mock_datetime, mock_get_summary, sample_rows):
         """오늘 데이터 조회"""
         # Arrange
         fixed_now = datetime(2025, 1, 23, 12, 0, 0)
         mock_datetime.now.return_value = fixed_now
         mock_datetime.strftime = datetime.strftime
-        mock_get_summary.return_value = sample_dataframe
+        mock_get_summary.return_value = sample_rows
 
         # Act
         result = get_dashboard_data(period="today")
@@ -168,13 +185,13 @@ class TestGetDashboardData:
 
     @patch("app.backend.page_contexts.dashboard_context.get_summary_list")
     @patch("app.backend.page_contexts.dashboard_context.datetime")
-    def test_get_dashboard_data_3days(self, mock_datetime, mock_get_summary, sample_dataframe):
+    def test_get_dashboard_data_3days(self, mock_datetime, mock_get_summary, sample_rows):
         """3일 데이터 조회"""
         # Arrange
         fixed_now = datetime(2025, 1, 23, 12, 0, 0)
         mock_datetime.now.return_value = fixed_now
         mock_datetime.strftime = datetime.strftime
-        mock_get_summary.return_value = sample_dataframe
+        mock_get_summary.return_value = sample_rows
 
         # Act
         result = get_dashboard_data(period="3days")
@@ -186,13 +203,13 @@ class TestGetDashboardData:
 
     @patch("app.backend.page_contexts.dashboard_context.get_summary_list")
     @patch("app.backend.page_contexts.dashboard_context.datetime")
-    def test_get_dashboard_data_7days(self, mock_datetime, mock_get_summary, sample_dataframe):
+    def test_get_dashboard_data_7days(self, mock_datetime, mock_get_summary, sample_rows):
         """7일 데이터 조회"""
         # Arrange
         fixed_now = datetime(2025, 1, 23, 12, 0, 0)
         mock_datetime.now.return_value = fixed_now
         mock_datetime.strftime = datetime.strftime
-        mock_get_summary.return_value = sample_dataframe
+        mock_get_summary.return_value = sample_rows
 
         # Act
         result = get_dashboard_data(period="7days")
@@ -204,13 +221,13 @@ class TestGetDashboardData:
 
     @patch("app.backend.page_contexts.dashboard_context.get_summary_list")
     @patch("app.backend.page_contexts.dashboard_context.datetime")
-    def test_get_dashboard_data_empty_dataframe(self, mock_datetime, mock_get_summary):
-        """빈 DataFrame 반환 시"""
+    def test_get_dashboard_data_empty(self, mock_datetime, mock_get_summary):
+        """조회 결과가 없을 때"""
         # Arrange
         fixed_now = datetime(2025, 1, 23, 12, 0, 0)
         mock_datetime.now.return_value = fixed_now
         mock_datetime.strftime = datetime.strftime
-        mock_get_summary.return_value = pd.DataFrame()
+        mock_get_summary.return_value = []
 
         # Act
         result = get_dashboard_data(period="today")
@@ -220,13 +237,13 @@ class TestGetDashboardData:
 
     @patch("app.backend.page_contexts.dashboard_context.get_summary_list")
     @patch("app.backend.page_contexts.dashboard_context.datetime")
-    def test_get_dashboard_data_invalid_period(self, mock_datetime, mock_get_summary, sample_dataframe):
+    def test_get_dashboard_data_invalid_period(self, mock_datetime, mock_get_summary, sample_rows):
         """잘못된 period 값 - 기본값(today) 사용"""
         # Arrange
         fixed_now = datetime(2025, 1, 23, 12, 0, 0)
         mock_datetime.now.return_value = fixed_now
         mock_datetime.strftime = datetime.strftime
-        mock_get_summary.return_value = sample_dataframe
+        mock_get_summary.return_value = sample_rows
 
         # Act
         result = get_dashboard_data(period="invalid")
@@ -239,43 +256,41 @@ class TestGetDashboardData:
     @patch("app.backend.page_contexts.dashboard_context.get_summary_list")
     @patch("app.backend.page_contexts.dashboard_context.datetime")
     def test_get_dashboard_data_exception(self, mock_datetime, mock_get_summary):
-        """예외 발생 시 빈 리스트 반환"""
+        """예외는 라우터로 전달"""
         # Arrange
         fixed_now = datetime(2025, 1, 23, 12, 0, 0)
         mock_datetime.now.return_value = fixed_now
         mock_datetime.strftime = datetime.strftime
         mock_get_summary.side_effect = Exception("Database error")
 
-        # Act
-        result = get_dashboard_data(period="today")
-
-        # Assert
-        assert result == []
+        # Act / Assert
+        with pytest.raises(Exception, match="Database error"):
+            get_dashboard_data(period="today")
 
-    @patch("app.backend.page_contexts.dashboard_context.get_summary_list")
     @patch("app.backend.page_contexts.dashboard_context.datetime")
-    def test_get_dashboard_data_missing_columns(self, mock_datetime, mock_get_summary):
-        """일부 컬럼이 없는 DataFrame"""
+    def test_get_dashboard_data_real_db(self, mock_datetime, law_db):
+        """실제 DB: 응답 필드명이 SQL 별칭 그대로"""
         # Arrange
-        fixed_now = datetime(2025, 1, 23, 12, 0, 0)
-        mock_datetime.now.return_value = fixed_now
-        mock_datetime.strftime = datetime.strftime
-
-        # 일부 컬럼만 있는 DataFrame
-        partial_df = pd.DataFrame({
-            "site_name": ["site1"],
-            "사이트": ["사이트1"],
-            "제목": ["제목1"],
-        })
-        mock_get_summary.return_value = partial_df
+        mock_datetime.now.return_value = datetime(2025, 1, 23, 12, 0, 0)
 
         # Act
-        result = get_dashboard_data(period="today")
+        result = get_dashboard_data(period="3days")
 
         # Assert
-        assert len(result) == 1
-        assert result[0]["site_name"] == "사이트1"
-        assert result[0]["title"] == "제목1"
-        # 없는 컬럼은 빈 문자열로 처리
-        assert result[0]["page_id"] == ""
-        assert result[0]["site_code"] == "site1"
+        assert [row["title"] for row in result] == ["공시 안내", "감독 규정", "오류 로그"]
+        assert result[0] == {
+            "id": 2,
+            "site_name": "사이트1",
+            "page_id": "페이지1",
+            "title": "공시 안내",
+            "registration_date": "2025-01-22",
+            "collection_date": "2025-01-22 10:00:00",
+            "site_url": "http://site1.com",
+            "detail_url": "http://site1.com/d1",
+            "org_url": "http://o/2",
+            "excerpt": "공시 요약",
+            "real_seq": "2",
+            "site_code": "site1",
+            "page_code": "page1",
+            "attach_count": 0,
+        }
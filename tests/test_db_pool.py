@@ -0,0 +1,120 @@
+"""
+db_pool.py 모듈에 대한 단위 테스트
+"""
+
+import sqlite3
+import threading
+
+import pytest
+
+from app.backend.data.db_pool import SQLiteConnectionPool, PoolTimeoutError
+
+
+@pytest.fixture
+def sample_db(tmp_path):
+    """law_summary 테이블이 있는 임시 DB 파일"""
+    db_path = tmp_path / "law_summary.db"
+    conn = sqlite3.connect(db_path)
+    conn.execute("CREATE TABLE law_summary (id INTEGER PRIMARY KEY, title TEXT)")
+    conn.executemany(
+        "INSERT INTO law_summary (title) VALUES (?)", [("제목1",), ("제목2",)]
+    )
+    conn.commit()
+    conn.close()
+    return str(db_path)
+
+
+class TestSQLiteConnectionPool:
+    """SQLiteConnectionPool 클래스 테스트"""
+
+    def test_connection_reused(self, sample_db):
+        """반납된 커넥션은 다음 요청에서 재사용"""
+        # Arrange
+        pool = SQLiteConnectionPool(sample_db, max_size=2)
+
+        # Act
+        with pool.connection() as conn1:
+            count = conn1.execute("SELECT COUNT(*) FROM law_summary").fetchone()[0]
+        with pool.connection() as conn2:
+            pass
+
+        # Assert
+        assert count == 2
+        assert conn1 is conn2
+        assert pool.stats()["created"] == 1
+        pool.close_all()
+
+    def test_connection_is_read_only(self, sample_db):
+        """mode=ro / query_only 로 열려 쓰기가 거부됨"""
+        # Arrange
+        pool = SQLiteConnectionPool(sample_db)
+
+        # Act & Assert
+        with pool.connection() as conn:
+            with pytest.raises(sqlite3.OperationalError):
+                conn.execute("INSERT INTO law_summary (title) VALUES ('x')")
+            assert conn.execute("PRAGMA query_only").fetchone()[0] == 1
+            assert conn.execute("PRAGMA temp_store").fetchone()[0] == 2
+        pool.close_all()
+
+    def test_pool_timeout(self, sample_db):
+        """max_size 를 넘으면 timeout 후 PoolTimeoutError"""
+        # Arrange
+        pool = SQLiteConnectionPool(sample_db, max_size=1, timeout=0.05)
+
+        # Act & Assert
+        with pool.connection():
+            with pytest.raises(PoolTimeoutError):
+                pool.acquire()
+        pool.close_all()
+
+    def test_shared_across_threads(self, sample_db):
+        """여러 스레드가 동시에 사용해도 max_size 이하로 유지"""
+        # Arrange
+        pool = SQLiteConnectionPool(sample_db, max_size=3)
+        errors = []
+
+        def worker():
+            try:
+                for _ in range(20):
+                    with pool.connection() as conn:
+                        conn.execute("SELECT COUNT(*) FROM law_summary").fetchone()
+            except Exception as e:  # pragma: no cover
+                errors.append(e)
+
+        # Act
+        threads = [threading.Thread(target=worker) for _ in range(6)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        # Assert
+        assert errors == []
+        assert pool.stats()["created"] <= 3
+        assert pool.stats()["in_use"] == 0
+        pool.close_all()
+
+    def test_health_check_and_close(self, sample_db):
+        """헬스 체크 후 close_all 이면 더 이상 사용 불가"""
+        # Arrange
+        pool = SQLiteConnectionPool(sample_db)
+
+        # Act
+        healthy = pool.health_check()
+        pool.close_all()
+
+        # Assert
+        assert healthy is True
+        assert pool.stats()["open"] == 0
+        with pytest.raises(RuntimeError):
+            pool.acquire()
+
+    def test_missing_db_file(self, tmp_path):
+        """DB 파일이 없으면 읽기 전용 연결 실패"""
+        # Arrange
+        pool = SQLiteConnectionPool(str(tmp_path / "none.db"))
+
+        # Act & Assert
+        assert pool.health_check() is False
+        assert pool.stats()["in_use"] == 0
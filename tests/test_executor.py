@@ -0,0 +1,119 @@
+"""
+executor.py / loop_monitor.py 모듈에 대한 테스트
+"""
+
+import asyncio
+import contextvars
+import threading
+import time
+
+import pytest
+
+from app.backend.core.executor import (
+    get_executor,
+    run_db,
+    run_file,
+    executor_stats,
+    shutdown_executors,
+)
+from app.backend.core.loop_monitor import LoopLagMonitor
+
+request_id = contextvars.ContextVar("request_id", default=None)
+
+
+@pytest.fixture(autouse=True)
+def fresh_executors():
+    shutdown_executors(wait=True)
+    yield
+    shutdown_executors(wait=True)
+
+
+class TestExecutor:
+    """run_db / run_file 테스트"""
+
+    def test_runs_in_worker_thread(self):
+        """작업은 이벤트 루프가 아닌 전용 스레드에서 실행"""
+        # Act
+        async def main():
+            return await run_db(lambda: threading.current_thread().name)
+
+        name = asyncio.run(main())
+
+        # Assert
+        assert name.startswith("db-io")
+
+    def test_args_and_contextvars_propagate(self):
+        """인자와 contextvar 가 작업 스레드로 전달"""
+        # Arrange
+        def work(a, b=0):
+            return a + b, request_id.get()
+
+        async def main():
+            request_id.set("req-1")
+            return await run_file(work, 1, b=2)
+
+        # Act / Assert
+        assert asyncio.run(main()) == (3, "req-1")
+
+    def test_exception_propagates(self):
+        """작업 예외는 호출자에게 그대로 전달"""
+        def fail():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError):
+            asyncio.run(run_db(fail))
+
+    def test_unknown_kind(self):
+        """알 수 없는 풀 종류"""
+        with pytest.raises(ValueError):
+            get_executor("gpu")
+
+    def test_stats(self):
+        """생성된 풀만 통계에 포함"""
+        asyncio.run(run_file(lambda: None))
+
+        stats = executor_stats()
+
+        assert list(stats) == ["file"]
+        assert stats["file"]["queued"] == 0
+
+
+class TestLoopLagMonitor:
+    """LoopLagMonitor 테스트"""
+
+    def test_record_and_stats(self):
+        """측정값 통계"""
+        monitor = LoopLagMonitor(interval=0.5, warn_ms=100)
+
+        monitor.record(10)
+        monitor.record(250)
+        monitor.record(-1)  # 시계 오차로 음수가 나와도 0으로
+
+        stats = monitor.stats()
+        assert stats["samples"] == 3
+        assert stats["max_ms"] == 250
+        assert stats["last_ms"] == 0
+        assert stats["over_warn"] == 1
+        assert stats["avg_ms"] == pytest.approx(86.67, abs=0.01)
+
+    def test_blocking_work_off_loop_keeps_lag_low(self):
+        """블로킹 작업을 run_db 로 넘기면 루프 지연이 작게 유지"""
+        monitor = LoopLagMonitor(interval=0.01, warn_ms=1000)
+
+        async def main(offload: bool):
+            monitor.reset()
+            task = asyncio.create_task(monitor.run())
+            await asyncio.sleep(0.03)
+            if offload:
+                await run_db(time.sleep, 0.3)
+            else:
+                time.sleep(0.3)
+                await asyncio.sleep(0.03)
+            task.cancel()
+            return monitor.stats()["max_ms"]
+
+        blocked = asyncio.run(main(offload=False))
+        offloaded = asyncio.run(main(offload=True))
+
+        assert blocked >= 250
+        assert offloaded < 150
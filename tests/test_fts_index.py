@@ -0,0 +1,172 @@
+"""
+fts_index.py 모듈 및 FTS 검색 경로에 대한 테스트
+"""
+
+import sqlite3
+
+from app.backend.data import db_util
+from app.backend.data.db_util import search_law_summary_page
+from app.backend.data.fts_index import (
+    FTS_TABLE,
+    rebuild_fts_index,
+    sync_fts_index,
+    fts_match_expression,
+    can_use_fts,
+)
+from app.backend.data.text_util import html_excerpt, html_to_text, highlight_to_html
+
+
+class TestTextUtil:
+    """text_util 함수 테스트"""
+
+    def test_html_to_text(self):
+        """태그·스크립트 제거 및 엔티티 디코딩"""
+        html = "<div><script>var x=1;</script><p>금융&nbsp;규정</p><br/>개정 &amp; 안내</div>"
+        assert html_to_text(html) == "금융 규정 개정 & 안내"
+
+    def test_html_to_text_empty(self):
+        """None/빈 문자열"""
+        assert html_to_text(None) == ""
+        assert html_to_text("") == ""
+
+    def test_highlight_to_html_escapes(self):
+        """본문은 escape 하고 하이라이트만 mark 태그로"""
+        assert highlight_to_html("<b>\x02규정\x03</b>") == "&lt;b&gt;<mark>규정</mark>&lt;/b&gt;"
+
+    def test_html_excerpt_of_truncated_html(self):
+        """잘린 태그·script 조각은 버리고 길이를 넘으면 말줄임"""
+        assert html_excerpt("<p>금융 규정</p><a href=\"http://x") == "금융 규정"
+        assert html_excerpt("<p>안내</p><script>var x") == "안내"
+        assert html_excerpt("<p>가나다라마바</p>", length=3) == "가나다…"
+
+
+class TestSyncFtsIndex:
+    """sync_fts_index 함수 테스트"""
+
+    def test_incremental_sync(self, law_db):
+        """처음엔 전체, 이후엔 새 행만 색인"""
+        # Act
+        first = sync_fts_index(law_db)
+        second = sync_fts_index(law_db)
+
+        conn = sqlite3.connect(law_db)
+        conn.execute(
+            "INSERT INTO law_summary (site_name, page_id, real_seq, title, summary) "
+            "VALUES ('site1', 'page1', '9', '신규 규정', '<p>추가</p>')"
+        )
+        conn.commit()
+        conn.close()
+        third = sync_fts_index(law_db)
+
+        # Assert
+        assert (first, second, third) == (4, 0, 1)
+        conn = sqlite3.connect(law_db)
+        body = conn.execute(f"SELECT body FROM {FTS_TABLE} WHERE rowid = 1").fetchone()[0]
+        conn.close()
+        assert body == "규정 요약"
+
+
+    def test_rebuild_keeps_table_and_reindexes(self, law_db):
+        """재생성은 테이블을 지우지 않고 비운 뒤 전체 재색인"""
+        # Arrange
+        sync_fts_index(law_db)
+
+        # Act
+        count = rebuild_fts_index(law_db)
+
+        # Assert
+        assert count == 4
+        conn = sqlite3.connect(law_db)
+        assert conn.execute(f"SELECT COUNT(*) FROM {FTS_TABLE}").fetchone()[0] == 4
+        conn.close()
+
+
+class TestFtsSearch:
+    """search_law_summary_page 의 FTS 경로 테스트"""
+
+    def test_match_expression_quotes(self):
+        """따옴표는 이스케이프하여 하나의 구로"""
+        assert fts_match_expression(' 금융 "규정" ') == '"금융 ""규정"""'
+
+    def test_can_use_fts_length(self):
+        """3글자 미만은 LIKE 로 처리"""
+        assert can_use_fts("규정") is False
+        assert can_use_fts("감독 규") is True
+
+    def test_search_uses_index_with_snippet(self, law_db):
+        """색인된 행은 snippet 과 함께 반환"""
+        # Arrange
+        sync_fts_index(law_db)
+
+        # Act
+        rows = search_law_summary_page(site_names=[], keyword="감독 요약")["rows"]
+
+        # Assert
+        assert [row["real_seq"] for row in rows] == ["3"]
+        assert "\x02감독 요약\x03" in rows[0]["snippet"]
+
+    def test_search_includes_unsynced_rows(self, law_db):
+        """아직 색인되지 않은 최신 행도 LIKE 로 검색"""
+        # Arrange
+        sync_fts_index(law_db)
+        conn = sqlite3.connect(law_db)
+        conn.execute(
+            "INSERT INTO law_summary (site_name, page_id, real_seq, title, summary) "
+            "VALUES ('site1', 'page1', '9', '공시 규정 신설', '')"
+        )
+        conn.commit()
+        conn.close()
+
+        # Act
+        rows = search_law_summary_page(site_names=["site1"], keyword="규정 신설")["rows"]
+
+        # Assert
+        assert [row["real_seq"] for row in rows] == ["9"]
+
+    def test_sync_between_marker_and_search(self, law_db, monkeypatch):
+        """색인 위치를 읽은 직후 커밋된 배치의 행도 한 번만 나온다"""
+        # Arrange
+        sync_fts_index(law_db)
+        conn = sqlite3.connect(law_db)
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute(
+            "INSERT INTO law_summary (site_name, page_id, real_seq, title, summary) "
+            "VALUES ('site1', 'page1', '9', '공시 규정 신설', '')"
+        )
+        conn.commit()
+        conn.close()
+        read_last_id = db_util.fts_last_synced_id
+
+        def last_id_then_sync(conn):
+            last_id = read_last_id(conn)
+            sync_fts_index(law_db)
+            return last_id
+
+        monkeypatch.setattr(db_util, "fts_last_synced_id", last_id_then_sync)
+
+        # Act
+        result = search_law_summary_page(site_names=["site1"], keyword="규정 신설")
+
+        # Assert
+        assert result["total"] == 1
+        assert [row["real_seq"] for row in result["rows"]] == ["9"]
+
+    def test_search_without_index_falls_back(self, law_db):
+        """색인이 없으면 기존 LIKE 검색"""
+        # Act
+        rows = search_law_summary_page(site_names=["site1"], keyword="공시 안내")["rows"]
+
+        # Assert
+        assert [row["real_seq"] for row in rows] == ["2"]
+        assert "snippet" not in rows[0]
+
+    def test_search_respects_site_filter(self, law_db):
+        """사이트 조건은 FTS 경로에도 적용"""
+        # Arrange
+        sync_fts_index(law_db)
+
+        # Act
+        rows = search_law_summary_page(site_names=["site2"], keyword="규정 요약")["rows"]
+
+        # Assert
+        assert rows == []
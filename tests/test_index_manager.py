@@ -0,0 +1,104 @@
+"""
+index_manager.py 및 db_util 날짜 범위 조건에 대한 테스트
+"""
+
+import sqlite3
+
+from app.backend.data.db_util import (
+    date_range_bounds,
+    total_site_attach_counts,
+    error_count_of_last_24h,
+)
+from app.backend.data.index_manager import (
+    MANAGED_INDEXES,
+    ensure_indexes,
+    explain_hot_queries,
+    find_full_scans,
+)
+from app.backend.data.summary_derived import create_derived_table
+
+
+class TestDateRangeBounds:
+    """date_range_bounds 함수 테스트"""
+
+    def test_single_day(self):
+        """종료일이 없으면 하루 구간"""
+        assert date_range_bounds("2025-01-23") == ("2025-01-23", "2025-01-24")
+
+    def test_range_month_boundary(self):
+        """월 경계를 넘는 종료일"""
+        assert date_range_bounds("2025-01-25", "2025-01-31") == ("2025-01-25", "2025-02-01")
+
+
+class TestSargableCounts:
+    """반열린 구간으로 바뀐 카운트 쿼리 결과 확인"""
+
+    def test_total_site_attach_counts_includes_end_of_day(self, law_db):
+        """종료일 23:59:59 데이터까지 포함"""
+        assert total_site_attach_counts("2025-01-23") == (2, 1)
+        assert total_site_attach_counts("2025-01-20", "2025-01-23") == (4, 3)
+        assert total_site_attach_counts("2025-01-21", "2025-01-22") == (1, 0)
+
+    def test_error_count_of_last_24h(self, law_db):
+        """가장 최근 날짜의 LOG 카테고리 건수"""
+        assert error_count_of_last_24h() == 1
+
+
+class TestEnsureIndexes:
+    """ensure_indexes 함수 테스트"""
+
+    def test_creates_all_indexes(self, law_db):
+        """모든 관리 인덱스가 생성되고 재실행해도 안전"""
+        # Act
+        first = ensure_indexes(law_db)
+        second = ensure_indexes(law_db)
+
+        # Assert
+        assert all(first.values())
+        assert first == second
+        conn = sqlite3.connect(law_db)
+        names = {r[0] for r in conn.execute("SELECT name FROM sqlite_master WHERE type='index'")}
+        conn.close()
+        assert {name for name, _, _ in MANAGED_INDEXES} <= names
+
+    def test_hot_queries_use_indexes(self, law_db):
+        """인덱스 생성 후 주요 쿼리에 전체 테이블 스캔이 없음"""
+        # Arrange
+        ensure_indexes(law_db)
+        create_derived_table(law_db)
+
+        # Act
+        plans = explain_hot_queries()
+
+        # Assert
+        assert set(plans) >= {"total_site_attach_counts", "get_summary_list"}
+        for name, plan in plans.items():
+            assert find_full_scans(plan) == [], name
+
+
+    def test_search_keys_follow_index_order(self, law_db):
+        """검색 목록 키 조회는 인덱스 순서대로 읽어 정렬 단계(TEMP B-TREE)가 없음"""
+        # Arrange
+        ensure_indexes(law_db)
+
+        # Act
+        plans = explain_hot_queries()
+
+        # Assert
+        for name in ("search_keys", "search_keys_after"):
+            assert any("idx_law_summary_site_page_reg" in detail for detail in plans[name]), name
+            assert not any("TEMP B-TREE" in detail for detail in plans[name]), name
+
+
+class TestFindFullScans:
+    """find_full_scans 함수 테스트"""
+
+    def test_detects_scan_without_index(self):
+        """USING 이 없는 SCAN 만 감지"""
+        plan = [
+            "SCAN law_summary",
+            "SCAN a USING COVERING INDEX idx_law_summary_upd_time",
+            "SEARCH b USING INDEX sqlite_autoindex_yaml_info_1 (site_name=? AND page_id=?)",
+            "SCAN CONSTANT ROW",
+        ]
+        assert find_full_scans(plan) == ["SCAN law_summary"]
@@ -0,0 +1,50 @@
+"""
+게시글 상세 API (/items/{id}) 테스트
+"""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.backend.api.v1 import items
+
+
+@pytest.fixture
+def client(law_db):
+    app = FastAPI()
+    app.include_router(items.router, prefix="/api/v1")
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+class TestGetItem:
+    """get_item 테스트"""
+
+    def test_returns_summary_with_immutable_cache(self, client):
+        """summary HTML 과 강한 ETag, immutable Cache-Control"""
+        # Act
+        response = client.get("/api/v1/items/1")
+
+        # Assert
+        assert response.status_code == 200
+        assert response.json() == {"id": 1, "summary": "<p>규정 요약</p>"}
+        assert response.headers["etag"].startswith('"')
+        assert "immutable" in response.headers["cache-control"]
+
+    def test_matching_etag_returns_304(self, client):
+        # Arrange
+        etag = client.get("/api/v1/items/1").headers["etag"]
+
+        # Act
+        response = client.get("/api/v1/items/1", headers={"If-None-Match": etag})
+
+        # Assert
+        assert response.status_code == 304
+        assert response.content == b""
+
+    def test_unknown_id_is_404(self, client):
+        # Act
+        response = client.get("/api/v1/items/999")
+
+        # Assert
+        assert response.status_code == 404
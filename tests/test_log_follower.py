@@ -0,0 +1,122 @@
+"""
+log_follower.py 모듈에 대한 테스트
+"""
+
+import os
+
+from app.backend.data.log_follower import LogFollower
+from tests.conftest import append_text
+
+
+class TestLogFollower:
+    """LogFollower 클래스 테스트"""
+
+    def test_starts_at_end_by_default(self, tmp_path):
+        """offset 이 없으면 기존 내용은 건너뛰고 새 줄만"""
+        # Arrange
+        path = str(tmp_path / "a.log")
+        append_text(path, "old 1\nold 2\n")
+        follower = LogFollower(path)
+
+        # Act
+        append_text(path, "new 1\nnew 2\n")
+        batch = follower.poll()
+
+        # Assert
+        assert batch["lines"] == ["new 1", "new 2"]
+        assert batch["offset"] == os.path.getsize(path)
+        assert batch["rotated"] is False
+
+    def test_starts_at_offset(self, tmp_path):
+        """주어진 offset 부터 읽기"""
+        # Arrange
+        path = str(tmp_path / "a.log")
+        append_text(path, "line 1\nline 2\n")
+
+        # Act
+        batch = LogFollower(path, offset=7).poll()
+
+        # Assert
+        assert batch["lines"] == ["line 2"]
+
+    def test_partial_line_is_held(self, tmp_path):
+        """줄바꿈 전 조각은 줄이 끝날 때 한 번에"""
+        # Arrange
+        path = str(tmp_path / "a.log")
+        append_text(path, "")
+        follower = LogFollower(path)
+
+        # Act
+        append_text(path, "hel")
+        first = follower.poll()
+        append_text(path, "lo\nwor")
+        second = follower.poll()
+
+        # Assert
+        assert first["lines"] == []
+        assert first["offset"] == 0
+        assert second["lines"] == ["hello"]
+        assert second["offset"] == len("hello\n")
+
+    def test_max_bytes_per_poll(self, tmp_path):
+        """한 번에 max_bytes 까지만 읽고 나머지는 다음 poll 에"""
+        # Arrange
+        path = str(tmp_path / "a.log")
+        append_text(path, "")
+        follower = LogFollower(path, max_bytes=8)
+        append_text(path, "1234567\nabcdefg\n")
+
+        # Act
+        batches = [follower.poll()["lines"], follower.poll()["lines"]]
+
+        # Assert
+        assert batches == [["1234567"], ["abcdefg"]]
+
+    def test_truncate_restarts_from_beginning(self, tmp_path):
+        """파일이 잘리면 처음부터 다시 읽기"""
+        # Arrange
+        path = str(tmp_path / "a.log")
+        append_text(path, "a long first line\n")
+        follower = LogFollower(path)
+
+        # Act
+        with open(path, "wb") as f:
+            f.write(b"fresh\n")
+        batch = follower.poll()
+
+        # Assert
+        assert batch["rotated"] is True
+        assert batch["lines"] == ["fresh"]
+
+    def test_rotation_reads_rest_of_old_file(self, tmp_path):
+        """회전(이름 변경 후 새 파일)되면 이전 파일 나머지 + 새 파일"""
+        # Arrange
+        path = str(tmp_path / "a.log")
+        append_text(path, "before\n")
+        follower = LogFollower(path)
+        append_text(path, "unread\n")
+
+        # Act
+        os.rename(path, path + ".1")
+        append_text(path, "after\n")
+        batch = follower.poll()
+
+        # Assert
+        assert batch["rotated"] is True
+        assert batch["lines"] == ["unread", "after"]
+        assert batch["offset"] == len("after\n")
+
+    def test_missing_file(self, tmp_path):
+        """파일이 아직 없으면 빈 결과, 생기면 처음부터"""
+        # Arrange
+        path = str(tmp_path / "a.log")
+        follower = LogFollower(path)
+
+        # Act
+        empty = follower.poll()
+        append_text(path, "created\n")
+        batch = follower.poll()
+
+        # Assert
+        assert empty["lines"] == []
+        assert batch["lines"] == ["created"]
@@ -0,0 +1,187 @@
+"""
+log_index.py 모듈에 대한 테스트
+"""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.backend.api.v1 import logs
+from app.backend.data.log_index import (
+    LogLineParser,
+    query_log_index,
+    sync_log_index,
+)
+from tests.conftest import append_text
+
+SITE_PAGES = [
+    ("fss", "notice", "금융감독원", "공지사항"),
+    ("fsc", "press", "금융위원회", "보도자료"),
+]
+
+
+@pytest.fixture
+def log_env(tmp_path):
+    """로그 디렉터리와 색인 DB 경로"""
+    log_dir = tmp_path / "logs"
+    log_dir.mkdir()
+    return str(tmp_path / "index" / "log_index.db"), log_dir
+
+
+class TestLogLineParser:
+    """LogLineParser 클래스 테스트"""
+
+    def test_parse_fields(self):
+        """시각·레벨·사이트·페이지 추출"""
+        parser = LogLineParser(SITE_PAGES)
+        assert parser.parse("2025-01-30 10:30:45,123 - crawler - ERROR - fss/notice 요청 실패") == (
+            "2025-01-30 10:30:45", "ERROR", "fss", "notice"
+        )
+
+    def test_korean_name_and_alias(self):
+        """한글 사이트명도 코드로, WARN 은 WARNING 으로"""
+        parser = LogLineParser(SITE_PAGES)
+        assert parser.parse("2025-01-30 10:30:45 WARN 금융위원회 보도자료 지연") == (
+            "2025-01-30 10:30:45", "WARNING", "fsc", "press"
+        )
+
+    def test_continuation_line(self):
+        """타임스탬프가 없는 줄은 연속 줄"""
+        assert LogLineParser(SITE_PAGES).parse("Traceback (most recent call last):") is None
+
+    def test_code_boundary(self):
+        """다른 단어의 일부는 사이트로 보지 않음"""
+        parser = LogLineParser(SITE_PAGES)
+        assert parser.parse("2025-01-30 10:30:45 INFO fssx done")[2] is None
+
+
+class TestSyncLogIndex:
+    """sync_log_index / query_log_index 함수 테스트"""
+
+    def test_query_by_level_and_site(self, log_env):
+        """레벨·사이트 조건 조회, 최신순, 본문은 원본에서"""
+        # Arrange
+        index_path, log_dir = log_env
+        append_text(log_dir / "law_crawler_2025_01_29.log",
+                "2025-01-29 09:00:00 - ERROR - fss notice 실패 1\n"
+                "2025-01-29 10:00:00 - INFO - fss notice 완료\n")
+        append_text(log_dir / "law_crawler_2025_01_30.log",
+                "2025-01-30 09:00:00 - ERROR - fss notice 실패 2\n"
+                "Traceback (most recent call last):\n"
+                "  ValueError: boom\n"
+                "2025-01-30 09:05:00 - ERROR - fsc press 실패\n")
+
+        # Act
+        added = sync_log_index(index_path, str(log_dir), SITE_PAGES)
+        result = query_log_index(index_path, str(log_dir), levels=["ERROR"], site="fss")
+
+        # Assert
+        assert added == 4
+        assert [row["ts"] for row in result["rows"]] == ["2025-01-30 09:00:00", "2025-01-29 09:00:00"]
+        assert result["rows"][0]["message"].endswith("ValueError: boom")
+        assert result["rows"][0]["page"] == "notice"
+        assert result["next_cursor"] is None
+
+    def test_incremental_and_continuation(self, log_env):
+        """추가된 바이트만 색인하고, 나중에 온 연속 줄도 직전 항목에 붙인다"""
+        # Arrange
+        index_path, log_dir = log_env
+        log = log_dir / "law_crawler_2025_01_30.log"
+        append_text(log, "2025-01-30 09:00:00 - ERROR - fss 실패\n2025-01-30 09:01:00 - INFO - 쓰는 중")
+        assert sync_log_index(index_path, str(log_dir), SITE_PAGES) == 1
+
+        # Act
+        append_text(log, "\n  detail line\n")
+        added = sync_log_index(index_path, str(log_dir), SITE_PAGES)
+        rows = query_log_index(index_path, str(log_dir))["rows"]
+
+        # Assert
+        assert added == 1
+        assert rows[0]["message"] == "2025-01-30 09:01:00 - INFO - 쓰는 중\n  detail line"
+        assert sync_log_index(index_path, str(log_dir), SITE_PAGES) == 0
+
+    def test_rewritten_file_is_reindexed(self, log_env):
+        """파일이 작아지면 해당 파일을 다시 색인"""
+        # Arrange
+        index_path, log_dir = log_env
+        log = log_dir / "law_crawler_2025_01_30.log"
+        append_text(log, "2025-01-30 09:00:00 - ERROR - 아주 긴 이전 내용입니다\n" * 3)
+        sync_log_index(index_path, str(log_dir))
+
+        # Act
+        log.write_text("2025-01-30 12:00:00 - INFO - new\n", encoding="utf-8")
+        sync_log_index(index_path, str(log_dir))
+        rows = query_log_index(index_path, str(log_dir))["rows"]
+
+        # Assert
+        assert [row["message"] for row in rows] == ["2025-01-30 12:00:00 - INFO - new"]
+
+    def test_pagination_with_keyword(self, log_env):
+        """부분 문자열 조건과 커서로 다음 페이지"""
+        # Arrange
+        index_path, log_dir = log_env
+        append_text(log_dir / "law_crawler_2025_01_30.log", "".join(
+            f"2025-01-30 09:{i:02d}:00 - INFO - {'timeout' if i % 2 else 'ok'} {i}\n"
+            for i in range(10)
+        ))
+        sync_log_index(index_path, str(log_dir))
+
+        # Act
+        first = query_log_index(index_path, str(log_dir), keyword="timeout", limit=3)
+        second = query_log_index(index_path, str(log_dir), keyword="timeout", limit=3,
+                                 cursor=first["next_cursor"])
+
+        # Assert
+        assert [row["message"][-9:] for row in first["rows"]] == ["timeout 9", "timeout 7", "timeout 5"]
+        assert [row["message"][-9:] for row in second["rows"]] == ["timeout 3", "timeout 1"]
+        assert second["next_cursor"] is None
+
+    def test_date_range_and_deleted_file(self, log_env):
+        """기간 조건은 종료일 포함, 사라진 파일의 항목은 정리"""
+        # Arrange
+        index_path, log_dir = log_env
+        append_text(log_dir / "law_crawler_2025_01_29.log", "2025-01-29 23:59:59 - INFO - a\n")
+        append_text(log_dir / "law_crawler_2025_01_30.log", "2025-01-30 00:00:00 - INFO - b\n")
+        sync_log_index(index_path, str(log_dir))
+
+        # Act
+        ranged = query_log_index(index_path, str(log_dir), date_from="2025-01-29", date_to="2025-01-29")
+        (log_dir / "law_crawler_2025_01_29.log").unlink()
+        sync_log_index(index_path, str(log_dir))
+        remaining = query_log_index(index_path, str(log_dir))
+
+        # Assert
+        assert [row["ts"] for row in ranged["rows"]] == ["2025-01-29 23:59:59"]
+        assert [row["ts"] for row in remaining["rows"]] == ["2025-01-30 00:00:00"]
+
+    def test_missing_index(self, log_env):
+        """색인 DB 가 없으면 빈 결과"""
+        index_path, log_dir = log_env
+        assert query_log_index(index_path, str(log_dir)) == {"rows": [], "next_cursor": None}
+
+
+class TestQueryRoute:
+    """/logs/query 라우트 테스트"""
+
+    def test_level_alias(self, log_env, monkeypatch):
+        """요청 레벨도 색인과 같이 WARN → WARNING, FATAL → CRITICAL 로 조회"""
+        # Arrange
+        from app.backend.core.config import config
+
+        index_path, log_dir = log_env
+        append_text(log_dir / "law_crawler_2025_01_30.log",
+                "2025-01-30 09:00:00 WARN fss notice 지연\n"
+                "2025-01-30 09:01:00 FATAL fsc press 중단\n"
+                "2025-01-30 09:02:00 INFO fss notice 완료\n")
+        sync_log_index(index_path, str(log_dir), SITE_PAGES)
+        monkeypatch.setattr(config, "LOG_INDEX_DB_PATH", index_path)
+        monkeypatch.setattr(config, "CRAWLER_LOG_DIR", str(log_dir))
+        app = FastAPI()
+        app.include_router(logs.router, prefix="/api/v1")
+
+        # Act
+        with TestClient(app) as client:
+            response = client.get("/api/v1/logs/query", params={"level": "warn,fatal"})
+
+        # Assert
+        assert [row["level"] for row in response.json()["rows"]] == ["CRITICAL", "WARNING"]
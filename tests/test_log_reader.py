@@ -0,0 +1,120 @@
+"""
+log_reader.py 모듈에 대한 테스트
+"""
+
+from app.backend.data.log_reader import (
+    read_lines_after,
+    read_lines_before,
+    iter_file_chunks,
+)
+
+
+def _write_log(path, line_count, newline="\n"):
+    path.write_bytes("".join(f"줄 {i}{newline}" for i in range(1, line_count + 1)).encode("utf-8"))
+    return str(path)
+
+
+class TestReadLinesAfter:
+    """read_lines_after 함수 테스트"""
+
+    def test_pages_forward(self, tmp_path):
+        """end 를 다음 offset 으로 넘기면 이어서 읽는다"""
+        # Arrange
+        path = _write_log(tmp_path / "a.log", 5)
+
+        # Act
+        first = read_lines_after(path, 0, 2)
+        second = read_lines_after(path, first["end"], 2)
+        last = read_lines_after(path, second["end"], 2)
+
+        # Assert
+        assert first["lines"] == ["줄 1", "줄 2"]
+        assert second["lines"] == ["줄 3", "줄 4"]
+        assert last["lines"] == ["줄 5"]
+        assert last["end"] == last["size"]
+
+    def test_offset_past_eof(self, tmp_path):
+        """파일 크기를 넘는 offset 은 빈 페이지"""
+        # Arrange
+        path = _write_log(tmp_path / "a.log", 2)
+
+        # Act
+        page = read_lines_after(path, 10_000, 5)
+
+        # Assert
+        assert page["lines"] == []
+        assert page["start"] == page["end"] == page["size"]
+
+
+class TestReadLinesBefore:
+    """read_lines_before 함수 테스트"""
+
+    def test_tail(self, tmp_path):
+        """작은 청크로 역방향 탐색해도 마지막 N 줄이 온전하다"""
+        # Arrange
+        path = _write_log(tmp_path / "a.log", 100, newline="\r\n")
+
+        # Act
+        page = read_lines_before(path, limit=3, chunk_size=7)
+
+        # Assert
+        assert page["lines"] == ["줄 98", "줄 99", "줄 100"]
+        assert page["end"] == page["size"]
+        # start 부터 앞으로 읽으면 같은 줄
+        assert read_lines_after(path, page["start"], 3)["lines"] == page["lines"]
+
+    def test_pages_backward(self, tmp_path):
+        """start 를 다음 before 로 넘기면 이전 페이지"""
+        # Arrange
+        path = _write_log(tmp_path / "a.log", 5)
+        tail = read_lines_before(path, limit=2)
+
+        # Act
+        older = read_lines_before(path, tail["start"], 2)
+        oldest = read_lines_before(path, older["start"], 2)
+
+        # Assert
+        assert older["lines"] == ["줄 2", "줄 3"]
+        assert oldest["lines"] == ["줄 1"]
+        assert oldest["start"] == 0
+
+    def test_last_line_without_newline(self, tmp_path):
+        """줄바꿈 없이 끝나는 마지막 줄도 포함"""
+        # Arrange
+        path = tmp_path / "a.log"
+        path.write_bytes(b"a\nb\nc")
+
+        # Act
+        page = read_lines_before(str(path), limit=2)
+
+        # Assert
+        assert page["lines"] == ["b", "c"]
+        assert page["start"] == 2
+
+    def test_empty_file(self, tmp_path):
+        """빈 파일은 빈 페이지"""
+        # Arrange
+        path = tmp_path / "a.log"
+        path.write_bytes(b"")
+
+        # Act
+        page = read_lines_before(str(path), limit=5)
+
+        # Assert
+        assert page == {"lines": [], "start": 0, "end": 0, "size": 0}
+
+
+class TestIterFileChunks:
+    """iter_file_chunks 함수 테스트"""
+
+    def test_chunks_cover_file(self, tmp_path):
+        """청크를 이으면 원본 파일과 같다"""
+        # Arrange
+        path = _write_log(tmp_path / "a.log", 50)
+
+        # Act
+        chunks = list(iter_file_chunks(path, chunk_size=16))
+
+        # Assert
+        assert all(len(chunk) <= 16 for chunk in chunks)
+        assert b"".join(chunks) == (tmp_path / "a.log").read_bytes()
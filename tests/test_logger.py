@@ -0,0 +1,203 @@
+"""
+logger.py / middleware.py 모듈에 대한 테스트
+"""
+
+import logging
+import queue
+import time
+from logging.handlers import QueueListener
+from unittest.mock import patch
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.backend.core import logger as logger_module
+from app.backend.core.logger import (
+    BoundedQueueHandler,
+    RequestIdFilter,
+    SqlLogSampler,
+    logging_stats,
+    request_id_var,
+    start_logging,
+    stop_logging,
+)
+from app.backend.core.middleware import RequestIdMiddleware
+
+
+def _record(level=logging.INFO, msg="message"):
+    return logging.LogRecord("test", level, __file__, 1, msg, None, None)
+
+
+class TestBoundedQueueHandler:
+    """BoundedQueueHandler 클래스 테스트"""
+
+    def test_drop_policy_counts_dropped_info(self):
+        """drop 정책: 큐가 가득 차면 INFO 레코드는 버리고 건수 집계"""
+        # Arrange
+        handler = BoundedQueueHandler(queue.Queue(maxsize=2), "drop", 0.01)
+
+        # Act
+        for _ in range(5):
+            handler.emit(_record())
+
+        # Assert
+        assert handler.queue.qsize() == 2
+        assert handler.dropped == 3
+
+    def test_warning_waits_for_space(self):
+        """WARNING 이상은 drop 정책이어도 block_timeout 까지 기다린 뒤에만 버림"""
+        # Arrange
+        handler = BoundedQueueHandler(queue.Queue(maxsize=1), "drop", 0.5)
+        handler.emit(_record())
+
+        # Act
+        with patch.object(handler.queue, "put", wraps=handler.queue.put) as put:
+            handler.emit(_record(logging.WARNING))
+
+        # Assert
+        put.assert_called_once()
+        assert put.call_args.kwargs["timeout"] == 0.5
+        assert handler.dropped == 1
+
+    def test_block_policy_uses_timeout(self):
+        """block 정책: INFO 도 block_timeout 까지 기다림"""
+        # Arrange
+        handler = BoundedQueueHandler(queue.Queue(maxsize=10), "block", 2.0)
+
+        # Act
+        with patch.object(handler.queue, "put", wraps=handler.queue.put) as put:
+            handler.emit(_record())
+
+        # Assert
+        assert put.call_args.kwargs["timeout"] == 2.0
+        assert handler.queue.qsize() == 1
+        assert handler.dropped == 0
+
+
+class _ListHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+
+class TestLoggingPipeline:
+    """start_logging / stop_logging 테스트"""
+
+    def test_stopped_pipeline_writes_through(self, monkeypatch):
+        """writer 스레드가 멈춘 뒤에는 가득 찬 큐에서 기다리지 않고 바로 쓰고, 다시 시작하면 큐로"""
+        # Arrange
+        target = _ListHandler()
+        log_queue = queue.Queue(maxsize=2)
+        handler = BoundedQueueHandler(log_queue, "drop", 1.0)
+        listener = QueueListener(log_queue, target, respect_handler_level=True)
+        listener.start()
+        monkeypatch.setattr(logger_module, "_queue_handler", handler)
+        monkeypatch.setattr(logger_module, "_listener", listener)
+        monkeypatch.setattr(logger_module, "_handlers", (target,))
+
+        # Act
+        stop_logging()
+        started = time.monotonic()
+        for n in range(3):
+            handler.emit(_record(logging.WARNING, f"stopped {n}"))
+        elapsed = time.monotonic() - started
+        stopped_stats = logging_stats()
+        start_logging()
+        handler.emit(_record(logging.WARNING, "restarted"))
+        stop_logging()
+
+        # Assert
+        assert elapsed < 0.5
+        assert stopped_stats["writer_running"] is False
+        assert target.messages == ["stopped 0", "stopped 1", "stopped 2", "restarted"]
+        assert handler.dropped == 0
+
+
+class TestRequestIdFilter:
+    """RequestIdFilter 클래스 테스트"""
+
+    def test_uses_context_request_id(self):
+        """현재 컨텍스트의 request_id 를 레코드에 붙임"""
+        # Arrange
+        record = _record()
+        token = request_id_var.set("abc123")
+
+        # Act
+        try:
+            RequestIdFilter().filter(record)
+        finally:
+            request_id_var.reset(token)
+
+        # Assert
+        assert record.request_id == "abc123"
+
+    def test_default_outside_request(self):
+        """요청 밖에서는 '-'"""
+        # Arrange
+        record = _record()
+
+        # Act
+        RequestIdFilter().filter(record)
+
+        # Assert
+        assert record.request_id == "-"
+
+
+class TestSqlLogSampler:
+    """SqlLogSampler 클래스 테스트"""
+
+    def test_limits_per_second(self):
+        """1초 창 안에서는 per_second 건만 통과"""
+        # Arrange
+        sampler = SqlLogSampler(2)
+
+        # Act
+        with patch("app.backend.core.logger.time.monotonic", return_value=100.0):
+            first = [sampler.sample() for _ in range(5)]
+        with patch("app.backend.core.logger.time.monotonic", return_value=101.5):
+            after_window = sampler.sample()
+
+        # Assert
+        assert first == [True, True, False, False, False]
+        assert sampler.suppressed == 3
+        assert after_window is True
+
+    def test_zero_disables(self):
+        """per_second 가 0 이면 모두 생략"""
+        assert SqlLogSampler(0).sample() is False
+
+
+class TestRequestIdMiddleware:
+    """RequestIdMiddleware 테스트"""
+
+    def _client(self):
+        app = FastAPI()
+        app.add_middleware(RequestIdMiddleware)
+
+        @app.get("/ping")
+        async def ping():
+            return {"request_id": request_id_var.get()}
+
+        return TestClient(app)
+
+    def test_echoes_client_request_id(self):
+        """요청의 X-Request-ID 를 그대로 사용"""
+        # Act
+        response = self._client().get("/ping", headers={"X-Request-ID": "req-42"})
+
+        # Assert
+        assert response.headers["x-request-id"] == "req-42"
+        assert response.json() == {"request_id": "req-42"}
+
+    def test_generates_request_id(self):
+        """헤더가 없거나 형식이 잘못되면 새로 생성"""
+        # Act
+        response = self._client().get("/ping", headers={"X-Request-ID": "bad id\n"})
+
+        # Assert
+        generated = response.headers["x-request-id"]
+        assert generated != "bad id\n"
+        assert response.json() == {"request_id": generated}
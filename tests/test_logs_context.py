@@ -64,39 +64,55 @@ class TestGetAvailableDates:
         assert result[0] == {"date": "2025-01-23", "label": "2025-01-23"}
 
 
+def _write_log(path, line_count):
+    """'Line 1' ~ 'Line N' 을 담은 로그 파일 생성"""
+    path.write_text("".join(f"Line {i}\n" for i in range(1, line_count + 1)), encoding="utf-8")
+    return path
+
+
 class TestGetCrawlerLog:
     """get_crawler_log 함수 테스트"""
 
-    @patch("app.backend.page_contexts.logs_context.get_log_data")
-    def test_get_crawler_log_success(self, mock_get_log_data):
+    @patch("app.backend.core.config.config")
+    @patch("app.backend.data.log_util.config")
+    def test_get_crawler_log_success(self, mock_util_config, mock_config, tmp_path):
         """정상적으로 로그 내용 반환"""
         # Arrange
-        log_lines = [
-            "2025-01-23 10:00:00 INFO Line 1\n",
-            "2025-01-23 10:01:00 WARNING Line 2\n",
-            "2025-01-23 10:02:00 ERROR Line 3\n",
-        ]
-        log_path = "c:/logs/law_crawler_2025-01-23.log"
-        mock_get_log_data.return_value = (log_lines, log_path)
+        mock_util_config.UI_LOG_DIR = str(tmp_path)
+        mock_config.LOG_PAGE_LINES = 500
+        log_path = _write_log(tmp_path / "law_crawler_2025_01_23.log", 3)
 
         # Act
         result = get_crawler_log("2025-01-23")
 
         # Assert
-        assert result["content"] == "2025-01-23 10:00:00 INFO Line 1\n2025-01-23 10:01:00 WARNING Line 2\n2025-01-23 10:02:00 ERROR Line 3"
-        assert result["path"] == log_path
-        # Windows 경로 구분자를 처리
-        assert result["filename"] in ["law_crawler_2025-01-23.log", "c:/logs/law_crawler_2025-01-23.log"]
+        assert result["content"] == "Line 1\nLine 2\nLine 3"
+        assert result["path"] == str(log_path)
+        assert result["filename"] == "law_crawler_2025_01_23.log"
+        assert result["has_before"] is False
+        assert result["has_after"] is False
+
+    @patch("app.backend.core.config.config")
+    @patch("app.backend.data.log_util.config")
+    def test_get_crawler_log_tail_by_default(self, mock_util_config, mock_config, tmp_path):
+        """기본은 마지막 LOG_PAGE_LINES 줄만"""
+        # Arrange
+        mock_util_config.UI_LOG_DIR = str(tmp_path)
+        mock_config.LOG_PAGE_LINES = 2
+        _write_log(tmp_path / "law_crawler_2025_01_23.log", 5)
+
+        # Act
+        result = get_crawler_log("2025-01-23")
 
-        # get_log_data가 date 객체로 호출되었는지 확인
-        called_date = mock_get_log_data.call_args[0][0]
-        assert called_date == date(2025, 1, 23)
+        # Assert
+        assert result["content"] == "Line 4\nLine 5"
+        assert result["has_before"] is True
 
-    @patch("app.backend.page_contexts.logs_context.get_log_data")
-    def test_get_crawler_log_no_content(self, mock_get_log_data):
+    @patch("app.backend.data.log_util.config")
+    def test_get_crawler_log_no_file(self, mock_util_config, tmp_path):
         """로그가 없는 경우"""
         # Arrange
-        mock_get_log_data.return_value = (None, "")
+        mock_util_config.UI_LOG_DIR = str(tmp_path)
 
         # Act
         result = get_crawler_log("2025-01-23")
@@ -106,11 +122,12 @@ class TestGetCrawlerLog:
         assert result["path"] == ""
         assert result["filename"] == ""
 
-    @patch("app.backend.page_contexts.logs_context.get_log_data")
-    def test_get_crawler_log_empty_list(self, mock_get_log_data):
-        """빈 로그 리스트"""
+    @patch("app.backend.data.log_util.config")
+    def test_get_crawler_log_empty_file(self, mock_util_config, tmp_path):
+        """빈 로그 파일"""
         # Arrange
-        mock_get_log_data.return_value = ([], "c:/logs/test.log")
+        mock_util_config.UI_LOG_DIR = str(tmp_path)
+        (tmp_path / "law_crawler_2025_01_23.log").write_text("")
 
         # Act
         result = get_crawler_log("2025-01-23")
@@ -118,11 +135,11 @@ class TestGetCrawlerLog:
         # Assert
         assert result["content"] == "해당 날짜의 로그가 없습니다."
 
-    @patch("app.backend.page_contexts.logs_context.get_log_data")
-    def test_get_crawler_log_exception(self, mock_get_log_data):
+    @patch("app.backend.page_contexts.logs_context.get_crawler_log_file_path")
+    def test_get_crawler_log_exception(self, mock_file_path):
         """예외 발생 시"""
         # Arrange
-        mock_get_log_data.side_effect = Exception("File read error")
+        mock_file_path.side_effect = Exception("File read error")
 
         # Act
         result = get_crawler_log("2025-01-23")
@@ -132,8 +149,7 @@ class TestGetCrawlerLog:
         assert result["path"] == ""
         assert result["filename"] == ""
 
-    @patch("app.backend.page_contexts.logs_context.get_log_data")
-    def test_get_crawler_log_invalid_date_format(self, mock_get_log_data):
+    def test_get_crawler_log_invalid_date_format(self):
         """잘못된 날짜 형식"""
         # Act
         result = get_crawler_log("invalid-date")
@@ -146,13 +162,14 @@ class TestGetUiLog:
     """get_ui_log 함수 테스트"""
 
     @patch("app.backend.core.config.config")
-    @patch("app.backend.page_contexts.logs_context.os.path.exists")
-    @patch("builtins.open", new_callable=mock_open, read_data="UI Log Line 1\nUI Log Line 2\nUI Log Line 3\n")
-    def test_get_ui_log_success(self, mock_file, mock_exists, mock_config):
+    def test_get_ui_log_success(self, mock_config, tmp_path):
         """정상적으로 UI 로그 반환"""
         # Arrange
-        mock_config.UI_LOG_DIR = "c:/logs"
-        mock_exists.return_value = True
+        mock_config.UI_LOG_DIR = str(tmp_path)
+        mock_config.LOG_PAGE_LINES = 500
+        (tmp_path / "law_crawler.log").write_text(
+            "UI Log Line 1\nUI Log Line 2\nUI Log Line 3\n", encoding="utf-8"
+        )
 
         # Act
         result = get_ui_log()
@@ -163,12 +180,29 @@ class TestGetUiLog:
         assert result["filename"] == "law_crawler.log"
 
     @patch("app.backend.core.config.config")
-    @patch("app.backend.page_contexts.logs_context.os.path.exists")
-    def test_get_ui_log_file_not_exists(self, mock_exists, mock_config):
+    def test_get_ui_log_paging(self, mock_config, tmp_path):
+        """offset/limit 로 앞으로, before 로 뒤로 페이지 이동"""
+        # Arrange
+        mock_config.UI_LOG_DIR = str(tmp_path)
+        mock_config.LOG_PAGE_LINES = 500
+        _write_log(tmp_path / "law_crawler.log", 10)
+
+        # Act
+        first = get_ui_log(offset=0, limit=3)
+        second = get_ui_log(offset=first["end"], limit=3)
+        back = get_ui_log(before=second["start"], limit=3)
+
+        # Assert
+        assert first["content"] == "Line 1\nLine 2\nLine 3"
+        assert second["content"] == "Line 4\nLine 5\nLine 6"
+        assert second["has_after"] is True
+        assert back["content"] == first["content"]
+
+    @patch("app.backend.core.config.config")
+    def test_get_ui_log_file_not_exists(self, mock_config, tmp_path):
         """로그 파일이 없는 경우"""
         # Arrange
-        mock_config.UI_LOG_DIR = "c:/logs"
-        mock_exists.return_value = False
+        mock_config.UI_LOG_DIR = str(tmp_path)
 
         # Act
         result = get_ui_log()
@@ -179,13 +213,11 @@ class TestGetUiLog:
         assert result["filename"] == ""
 
     @patch("app.backend.core.config.config")
-    @patch("app.backend.page_contexts.logs_context.os.path.exists")
-    @patch("builtins.open", new_callable=mock_open, read_data="")
-    def test_get_ui_log_empty_file(self, mock_file, mock_exists, mock_config):
+    def test_get_ui_log_empty_file(self, mock_config, tmp_path):
         """빈 로그 파일"""
         # Arrange
-        mock_config.UI_LOG_DIR = "c:/logs"
-        mock_exists.return_value = True
+        mock_config.UI_LOG_DIR = str(tmp_path)
+        (tmp_path / "law_crawler.log").write_text("")
 
         # Act
         result = get_ui_log()
@@ -194,14 +226,14 @@ class TestGetUiLog:
         assert result["content"] == "UI 로그가 없습니다."
 
     @patch("app.backend.core.config.config")
-    @patch("app.backend.page_contexts.logs_context.os.path.exists")
-    @patch("builtins.open")
-    def test_get_ui_log_exception(self, mock_file, mock_exists, mock_config):
+    @patch("app.backend.page_contexts.logs_context.read_lines_before")
+    def test_get_ui_log_exception(self, mock_read, mock_config, tmp_path):
         """예외 발생 시"""
         # Arrange
-        mock_config.UI_LOG_DIR = "c:/logs"
-        mock_exists.return_value = True
-        mock_file.side_effect = IOError("Cannot read file")
+        mock_config.UI_LOG_DIR = str(tmp_path)
+        mock_config.LOG_PAGE_LINES = 500
+        _write_log(tmp_path / "law_crawler.log", 1)
+        mock_read.side_effect = IOError("Cannot read file")
 
         # Act
         result = get_ui_log()
@@ -301,13 +333,14 @@ class TestGetCrawlerLogByFilename:
     """get_crawler_log_by_filename 함수 테스트"""
 
     @patch("app.backend.core.config.config")
-    @patch("app.backend.page_contexts.logs_context.os.path.exists")
-    @patch("builtins.open", new_callable=mock_open, read_data="Log Line 1\nLog Line 2\nLog Line 3\n")
-    def test_get_crawler_log_by_filename_success(self, mock_file, mock_exists, mock_config):
+    def test_get_crawler_log_by_filename_success(self, mock_config, tmp_path):
         """정상적으로 로그 파일 내용 반환"""
         # Arrange
-        mock_config.CRAWLER_LOG_DIR = "c:/logs"
-        mock_exists.return_value = True
+        mock_config.CRAWLER_LOG_DIR = str(tmp_path)
+        mock_config.LOG_PAGE_LINES = 500
+        (tmp_path / "law_crawler_2025-01-23.log").write_text(
+            "Log Line 1\nLog Line 2\nLog Line 3\n", encoding="utf-8"
+        )
 
         # Act
         result = get_crawler_log_by_filename("law_crawler_2025-01-23.log")
@@ -318,12 +351,10 @@ class TestGetCrawlerLogByFilename:
         assert result["filename"] == "law_crawler_2025-01-23.log"
 
     @patch("app.backend.core.config.config")
-    @patch("app.backend.page_contexts.logs_context.os.path.exists")
-    def test_get_crawler_log_by_filename_not_exists(self, mock_exists, mock_config):
+    def test_get_crawler_log_by_filename_not_exists(self, mock_config, tmp_path):
         """파일이 없는 경우"""
         # Arrange
-        mock_config.CRAWLER_LOG_DIR = "c:/logs"
-        mock_exists.return_value = False
+        mock_config.CRAWLER_LOG_DIR = str(tmp_path)
 
         # Act
         result = get_crawler_log_by_filename("nonexistent.log")
@@ -334,13 +365,26 @@ class TestGetCrawlerLogByFilename:
         assert result["filename"] == ""
 
     @patch("app.backend.core.config.config")
-    @patch("app.backend.page_contexts.logs_context.os.path.exists")
-    @patch("builtins.open", new_callable=mock_open, read_data="")
-    def test_get_crawler_log_by_filename_empty_file(self, mock_file, mock_exists, mock_config):
+    def test_get_crawler_log_by_filename_rejects_path(self, mock_config, tmp_path):
+        """디렉터리 밖을 가리키는 파일명은 거부"""
+        # Arrange
+        log_dir = tmp_path / "logs"
+        log_dir.mkdir()
+        (tmp_path / "secret.log").write_text("secret\n")
+        mock_config.CRAWLER_LOG_DIR = str(log_dir)
+
+        # Act
+        result = get_crawler_log_by_filename("../secret.log")
+
+        # Assert
+        assert result["content"] == "해당 로그 파일이 없습니다."
+
+    @patch("app.backend.core.config.config")
+    def test_get_crawler_log_by_filename_empty_file(self, mock_config, tmp_path):
         """빈 파일인 경우"""
         # Arrange
-        mock_config.CRAWLER_LOG_DIR = "c:/logs"
-        mock_exists.return_value = True
+        mock_config.CRAWLER_LOG_DIR = str(tmp_path)
+        (tmp_path / "empty.log").write_text("")
 
         # Act
         result = get_crawler_log_by_filename("empty.log")
@@ -350,14 +394,14 @@ class TestGetCrawlerLogByFilename:
         assert result["filename"] == "empty.log"
 
     @patch("app.backend.core.config.config")
-    @patch("app.backend.page_contexts.logs_context.os.path.exists")
-    @patch("builtins.open")
-    def test_get_crawler_log_by_filename_exception(self, mock_file, mock_exists, mock_config):
+    @patch("app.backend.page_contexts.logs_context.read_lines_before")
+    def test_get_crawler_log_by_filename_exception(self, mock_read, mock_config, tmp_path):
         """예외 발생 시"""
         # Arrange
-        mock_config.CRAWLER_LOG_DIR = "c:/logs"
-        mock_exists.return_value = True
-        mock_file.side_effect = IOError("Cannot read file")
+        mock_config.CRAWLER_LOG_DIR = str(tmp_path)
+        mock_config.LOG_PAGE_LINES = 500
+        (tmp_path / "test.log").write_text("Log Line 1\n")
+        mock_read.side_effect = IOError("Cannot read file")
 
         # Act
         result = get_crawler_log_by_filename("test.log")
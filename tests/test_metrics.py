@@ -0,0 +1,207 @@
+"""
+metrics.py 모듈 및 TimingMiddleware / /metrics 엔드포인트 테스트
+"""
+
+import threading
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.backend.core.metrics import Histogram, MetricsRegistry, get_metrics, timed_query
+from app.backend.core.middleware import TimingMiddleware
+
+
+class TestHistogram:
+    """Histogram 클래스 테스트"""
+
+    def test_cumulative_buckets(self):
+        """버킷 건수는 누적, 마지막은 +Inf"""
+        # Arrange
+        histogram = Histogram((0.1, 1.0))
+
+        # Act
+        for value in (0.05, 0.1, 0.5, 3.0):
+            histogram.observe(value)
+
+        # Assert
+        assert histogram.cumulative() == [(0.1, 2), (1.0, 3), (float("inf"), 4)]
+        assert histogram.sum == 3.65
+
+
+class TestMetricsRegistry:
+    """MetricsRegistry 클래스 테스트"""
+
+    def test_render_prometheus_text(self):
+        """히스토그램·카운터·게이지를 exposition 형식으로 출력"""
+        # Arrange
+        registry = MetricsRegistry(buckets=(0.5,))
+        registry.observe("db_query_duration_seconds", 0.2, "DB 조회 시간(초)", query="site_static")
+        registry.inc("db_query_rows_total", 7, query="site_static")
+
+        # Act
+        text = registry.render({"result_cache_hit_ratio": ("적중률", 0.75)})
+
+        # Assert
+        assert "# TYPE law_ui_db_query_duration_seconds histogram" in text
+        assert 'law_ui_db_query_duration_seconds_bucket{query="site_static",le="0.5"} 1' in text
+        assert 'law_ui_db_query_duration_seconds_bucket{query="site_static",le="+Inf"} 1' in text
+        assert 'law_ui_db_query_duration_seconds_count{query="site_static"} 1' in text
+        assert 'law_ui_db_query_rows_total{query="site_static"} 7' in text
+        assert "# TYPE law_ui_result_cache_hit_ratio gauge" in text
+        assert "law_ui_result_cache_hit_ratio 0.75" in text
+
+    def test_render_counters(self):
+        """외부에서 누적한 값은 counter 형식으로 출력"""
+        # Arrange
+        registry = MetricsRegistry(buckets=(0.5,))
+
+        # Act
+        text = registry.render(counters={"result_cache_hits_total": ("적중 수", 12)})
+
+        # Assert
+        assert "# TYPE law_ui_result_cache_hits_total counter" in text
+        assert "law_ui_result_cache_hits_total 12" in text
+
+    def test_escapes_label_values(self):
+        """라벨 값의 따옴표·역슬래시 이스케이프"""
+        # Arrange
+        registry = MetricsRegistry(buckets=(1.0,))
+        registry.inc("x_total", route='a"b\\c')
+
+        # Act
+        text = registry.render()
+
+        # Assert
+        assert 'law_ui_x_total{route="a\\"b\\\\c"} 1' in text
+
+
+class TestTimedQuery:
+    """timed_query 데코레이터 테스트"""
+
+    def test_records_duration_and_rows(self):
+        """쿼리 이름별 호출 수와 반환 행 수 기록"""
+        # Arrange
+        get_metrics().reset()
+
+        @timed_query("sample_query")
+        def sample_query():
+            return [{"a": 1}, {"a": 2}, {"a": 3}]
+
+        # Act
+        sample_query()
+        sample_query()
+        snapshot = get_metrics().snapshot()
+
+        # Assert
+        durations = snapshot["db_query_duration_seconds"]
+        assert durations[0]["labels"] == {"query": "sample_query"}
+        assert durations[0]["count"] == 2
+        assert snapshot["db_query_rows_total"][0]["value"] == 6
+
+    def test_single_row_results(self):
+        """한 행 dict·집계 튜플은 1행, None 은 0행, 페이지 dict 는 rows 길이"""
+        # Arrange
+        get_metrics().reset()
+        results = {
+            "row_query": {"site_name": "a", "page_id": "b", "total": 3},
+            "tuple_query": ("2025-01-01", "2025-01-31"),
+            "none_query": None,
+            "page_query": {"rows": [{"a": 1}, {"a": 2}], "next_cursor": "x", "has_next": True},
+        }
+        for name, value in results.items():
+            timed_query(name)(lambda value=value: value)()
+
+        # Act
+        rows = {
+            series["labels"]["query"]: series["value"]
+            for series in get_metrics().snapshot()["db_query_rows_total"]
+        }
+
+        # Assert
+        assert rows.get("row_query") == 1
+        assert rows.get("tuple_query") == 1
+        assert rows.get("none_query", 0) == 0
+        assert rows.get("page_query") == 2
+
+
+class TestTimingMiddleware:
+    """TimingMiddleware 테스트"""
+
+    def _client(self):
+        app = FastAPI()
+        app.add_middleware(TimingMiddleware)
+
+        @app.get("/items/{item_id}")
+        async def item(item_id: int):
+            return {"id": item_id}
+
+        return TestClient(app)
+
+    def test_records_route_template(self):
+        """경로 원문이 아니라 라우트 템플릿으로 기록"""
+        # Arrange
+        get_metrics().reset()
+        client = self._client()
+
+        # Act
+        client.get("/items/1")
+        client.get("/items/2")
+        client.get("/nothing")
+        series = get_metrics().snapshot()["http_request_duration_seconds"]
+
+        # Assert
+        labels = {(s["labels"]["route"], s["labels"]["status"]): s["count"] for s in series}
+        assert labels == {("/items/{item_id}", "200"): 2, ("unmatched", "404"): 1}
+
+
+class TestMetricsEndpoint:
+    """/metrics 엔드포인트 테스트"""
+
+    def test_exposes_runtime_gauges(self):
+        """런타임 게이지 포함, Prometheus content-type"""
+        # Arrange
+        from app.backend.api.v1.diagnostics import metrics_router
+
+        app = FastAPI()
+        app.include_router(metrics_router)
+
+        # Act
+        response = TestClient(app).get("/metrics")
+
+        # Assert
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+        assert "law_ui_result_cache_hit_ratio" in response.text
+        assert 'law_ui_db_pool_connections{state="in_use"}' in response.text
+        assert 'law_ui_event_loop_lag_seconds{stat="max"}' in response.text
+        assert "# TYPE law_ui_result_cache_hits_total counter" in response.text
+        assert "# TYPE law_ui_result_cache_misses_total counter" in response.text
+
+    def test_cache_stats_run_in_db_executor(self, monkeypatch):
+        """공유 캐시 잠금·SQLite 조회가 있는 캐시 통계는 이벤트 루프가 아닌 db 스레드 풀에서"""
+        # Arrange
+        from app.backend.api.v1 import diagnostics
+        from app.backend.data.result_cache import get_result_cache
+
+        cache = get_result_cache()
+        stats = cache.stats
+        threads = []
+
+        def recording_stats():
+            threads.append(threading.current_thread().name)
+            return stats()
+
+        monkeypatch.setattr(cache, "stats", recording_stats)
+        app = FastAPI()
+        app.include_router(diagnostics.metrics_router)
+        app.include_router(diagnostics.router, prefix="/api/v1")
+        client = TestClient(app)
+
+        # Act
+        client.get("/metrics")
+        client.get("/api/v1/diagnostics/cache")
+        client.post("/api/v1/diagnostics/cache/clear")
+
+        # Assert
+        assert len(threads) == 3
+        assert all(name.startswith("db-io") for name in threads)
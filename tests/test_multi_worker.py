@@ -0,0 +1,108 @@
+"""
+멀티 워커 실행 지원 테스트 (프로세스 잠금, 공유 결과 캐시)
+"""
+
+import sqlite3
+from unittest.mock import Mock
+
+from app.backend.core.process_lock import ProcessLock
+from app.backend.data.result_cache import ResultCache
+from app.backend.data.shared_cache import MISS, SharedResultStore
+
+
+class TestProcessLock:
+    """ProcessLock 테스트"""
+
+    def test_exclusive_until_released(self, tmp_path):
+        """잡고 있는 동안 다른 잠금은 실패하고, 해제 후에는 성공"""
+        # Arrange
+        first = ProcessLock("leader", lock_dir=str(tmp_path))
+        second = ProcessLock("leader", lock_dir=str(tmp_path))
+
+        # Act
+        assert first.acquire(timeout=0)
+        blocked = second.acquire(timeout=0.2, poll_interval=0.05)
+        first.release()
+        acquired = second.acquire(timeout=0)
+
+        # Assert
+        assert blocked is False
+        assert acquired is True
+        assert second.locked and not first.locked
+        second.release()
+
+    def test_context_manager(self, tmp_path):
+        """with 블록을 벗어나면 해제"""
+        # Arrange
+        lock = ProcessLock("startup", lock_dir=str(tmp_path))
+
+        # Act
+        with lock:
+            inside = lock.locked
+
+        # Assert
+        assert inside is True
+        assert lock.locked is False
+        assert ProcessLock("startup", lock_dir=str(tmp_path)).acquire(timeout=0)
+
+
+class TestSharedResultCache:
+    """워커 간 공유 결과 캐시 테스트"""
+
+    def test_second_worker_reuses_result(self, law_db, tmp_path):
+        """한 워커가 계산한 결과를 다른 워커(다른 ResultCache)가 재사용"""
+        # Arrange
+        path = str(tmp_path / "result_cache.db")
+        worker1 = ResultCache(check_interval=0, db_path_getter=lambda: law_db,
+                              shared=SharedResultStore(path))
+        worker2 = ResultCache(check_interval=0, db_path_getter=lambda: law_db,
+                              shared=SharedResultStore(path))
+        compute = Mock(return_value={"total": 3})
+
+        # Act
+        first = worker1.get_or_compute(("stats", ()), compute)
+        second = worker2.get_or_compute(("stats", ()), compute)
+
+        # Assert
+        assert first == second == {"total": 3}
+        compute.assert_called_once()
+        assert worker2.stats()["shared"]["hits"] == 1
+        worker1.close()
+        worker2.close()
+
+    def test_db_write_invalidates_shared_entry(self, law_db, tmp_path):
+        """DB 가 바뀌면 공유 항목도 쓰지 않음"""
+        # Arrange
+        path = str(tmp_path / "result_cache.db")
+        worker1 = ResultCache(check_interval=0, db_path_getter=lambda: law_db,
+                              shared=SharedResultStore(path))
+        worker2 = ResultCache(check_interval=0, db_path_getter=lambda: law_db,
+                              shared=SharedResultStore(path))
+        worker1.get_or_compute("k", Mock(return_value="before"))
+
+        # Act
+        conn = sqlite3.connect(law_db)
+        conn.execute("INSERT INTO law_summary (site_name, page_id, real_seq, title) VALUES ('site1', 'page1', '9', '신규')")
+        conn.commit()
+        conn.close()
+        result = worker2.get_or_compute("k", Mock(return_value="after"))
+
+        # Assert
+        assert result == "after"
+        worker1.close()
+        worker2.close()
+
+    def test_unusable_store_falls_back(self, tmp_path):
+        """캐시 파일을 열 수 없으면 MISS 로 처리하고 오류 수만 센다"""
+        # Arrange
+        (tmp_path / "not_a_db").write_bytes(b"garbage" * 100)
+        store = SharedResultStore(str(tmp_path / "not_a_db"))
+
+        # Act
+        value = store.get("k", "v")
+        store.put("k", "v", [1], ttl=60)
+
+        # Assert
+        assert value is MISS
+        assert store.stats()["errors"] == 2
+        store.close()
@@ -0,0 +1,140 @@
+"""
+result_cache.py 모듈에 대한 테스트
+"""
+
+from unittest.mock import Mock
+
+from app.backend.data.result_cache import ResultCache, cached_result, get_result_cache
+from app.backend.page_contexts.statistics_context import get_site_statistics
+from tests.conftest import insert_summary
+
+
+class TestResultCache:
+    """ResultCache 테스트"""
+
+    def test_hit_and_miss_counters(self, law_db):
+        """같은 키는 두 번째부터 캐시 적중"""
+        # Arrange
+        cache = ResultCache(check_interval=0, db_path_getter=lambda: law_db)
+        compute = Mock(return_value=[1, 2])
+
+        # Act
+        first = cache.get_or_compute("k", compute)
+        second = cache.get_or_compute("k", compute)
+
+        # Assert
+        assert first == second == [1, 2]
+        compute.assert_called_once()
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+        cache.close()
+
+    def test_invalidated_on_db_write(self, law_db):
+        """DB 에 행이 추가되면 다시 계산"""
+        # Arrange
+        cache = ResultCache(check_interval=0, db_path_getter=lambda: law_db)
+        compute = Mock(side_effect=["before", "after"])
+        cache.get_or_compute("k", compute)
+
+        # Act
+        insert_summary(law_db)
+        result = cache.get_or_compute("k", compute)
+
+        # Assert
+        assert result == "after"
+        assert cache.stats()["invalidations"] == 1
+        cache.close()
+
+    def test_ttl_expiry(self, law_db):
+        """TTL 이 지나면 변경이 없어도 다시 계산"""
+        # Arrange
+        cache = ResultCache(ttl=0, check_interval=0, db_path_getter=lambda: law_db)
+        compute = Mock(side_effect=["a", "b"])
+
+        # Act / Assert
+        assert cache.get_or_compute("k", compute) == "a"
+        assert cache.get_or_compute("k", compute) == "b"
+        cache.close()
+
+    def test_lru_eviction(self, law_db):
+        """최대 항목 수를 넘으면 가장 오래 안 쓴 항목 제거"""
+        # Arrange
+        cache = ResultCache(maxsize=2, check_interval=0, db_path_getter=lambda: law_db)
+        cache.get_or_compute("a", lambda: 1)
+        cache.get_or_compute("b", lambda: 2)
+        cache.get_or_compute("a", lambda: 1)  # a 를 최근 사용으로
+
+        # Act
+        cache.get_or_compute("c", lambda: 3)
+
+        # Assert
+        assert cache.stats()["evictions"] == 1
+        assert cache.get_or_compute("a", lambda: "new") == 1
+        assert cache.get_or_compute("b", lambda: "new") == "new"
+        cache.close()
+
+    def test_no_db_bypasses_cache(self, tmp_path):
+        """DB 파일이 없으면 캐시하지 않음"""
+        # Arrange
+        cache = ResultCache(check_interval=0, db_path_getter=lambda: str(tmp_path / "none.db"))
+        compute = Mock(return_value=1)
+
+        # Act
+        cache.get_or_compute("k", compute)
+        cache.get_or_compute("k", compute)
+
+        # Assert
+        assert compute.call_count == 2
+        assert cache.stats()["size"] == 0
+
+
+class TestCachedResult:
+    """cached_result 데코레이터 테스트"""
+
+    def test_keyed_by_arguments(self, law_db):
+        """인자가 다르면 별도 항목"""
+        # Arrange
+        calls = []
+
+        @cached_result("test.square")
+        def square(x, power=2):
+            calls.append(x)
+            return x ** power
+
+        # Act
+        results = [square(2), square(2), square(3), square(2, power=3)]
+
+        # Assert
+        assert results == [4, 4, 9, 8]
+        assert calls == [2, 3, 2]
+
+    def test_exception_not_cached(self, law_db):
+        """예외가 난 호출은 캐시하지 않음"""
+        # Arrange
+        compute = Mock(side_effect=[RuntimeError("boom"), "ok"])
+
+        @cached_result("test.flaky")
+        def flaky():
+            return compute()
+
+        # Act
+        try:
+            flaky()
+        except RuntimeError:
+            pass
+
+        # Assert
+        assert flaky() == "ok"
+
+    def test_statistics_context_is_cached(self, law_db):
+        """통계 컨텍스트는 DB 가 바뀔 때까지 같은 결과를 재사용"""
+        # Act
+        first = get_site_statistics()
+        second = get_site_statistics()
+        insert_summary(law_db)
+        third = get_site_statistics()
+
+        # Assert
+        assert first is second
+        assert {"site": "사이트1", "count": 3} in third
+        assert get_result_cache().stats()["hits"] == 1
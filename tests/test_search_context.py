@@ -3,7 +3,6 @@ search_context.py 모듈에 대한 단위 테스트
 """
 
 import pytest
-import pandas as pd
 from unittest.mock import Mock, patch, MagicMock
 
 from app.backend.page_contexts.search_context import (
@@ -49,15 +48,13 @@ class TestGetSitesList:
 
     @patch("app.backend.page_contexts.search_context.get_site_and_code_dict")
     def test_get_sites_list_exception(self, mock_get_site_dict):
-        """예외 발생 시 빈 리스트 반환"""
+        """예외는 라우터로 전달"""
         # Arrange
         mock_get_site_dict.side_effect = Exception("Database error")
 
-        # Act
-        result = get_sites_list()
-
-        # Assert
-        assert result == []
+        # Act / Assert
+        with pytest.raises(Exception, match="Database error"):
+            get_sites_list()
 
     @patch("app.backend.page_contexts.search_context.get_site_and_code_dict")
     def test_get_sites_list_single_site(self, mock_get_site_dict):
@@ -72,15 +69,57 @@ class TestGetSitesList:
         assert len(result) == 1
         assert result[0] == {"code": "site1", "name": "사이트1"}
 
+    def test_get_sites_list_real_db(self, law_db):
+        """실제 DB: yaml_info 의 사이트 코드/명칭"""
+        # Act
+        result = get_sites_list()
+
+        # Assert
+        assert result == [
+            {"code": "site1", "name": "사이트1"},
+            {"code": "site2", "name": "사이트2"},
+        ]
+
+
+def _page_result(rows, total=None, next_cursor=None):
+    """search_law_summary_page 반환값 형태로 감싸기"""
+    return {
+        "rows": rows,
+        "total": len(rows) if total is None else total,
+        "next_cursor": next_cursor,
+    }
+
+
+def _large_rows(start, stop):
+    """start~stop-1 번 행으로 구성된 검색 결과 행"""
+    return [
+        {
+            "id": i,
+            "site_name": f"사이트{i}",
+            "page_id": f"페이지{i}",
+            "title": f"제목{i}",
+            "registration_date": "2025-01-01",
+            "collection_date": "2025-01-01 10:00:00",
+            "site_url": f"http://site{i}.com",
+            "detail_url": f"http://site{i}.com/detail",
+            "org_url": f"http://site{i}.com/org",
+            "summary": f"요약{i}",
+            "real_seq": str(i),
+            "site_code": f"site{i}",
+            "page_code": f"page{i}",
+        }
+        for i in range(start, stop)
+    ]
+
 
 class TestSearchData:
     """search_data 함수 테스트"""
 
-    @patch("app.backend.page_contexts.search_context.search_law_summary")
-    def test_search_data_with_keyword_and_sites(self, mock_search, sample_dataframe):
+    @patch("app.backend.page_contexts.search_context.search_law_summary_page")
+    def test_search_data_with_keyword_and_sites(self, mock_search, sample_rows):
         """키워드와 사이트 선택으로 검색"""
         # Arrange
-        mock_search.return_value = sample_dataframe
+        mock_search.return_value = _page_result(sample_rows)
 
         # Act
         result = search_data(
@@ -95,21 +134,25 @@ class TestSearchData:
         assert result["page"] == 1
         assert result["pagesize"] == 30
         assert result["total_pages"] == 1
+        assert result["next_cursor"] is None
         assert len(result["items"]) == 3
         assert result["items"][0]["site_name"] == "사이트1"
         assert result["items"][0]["title"] == "제목1"
 
-        # search_law_summary가 올바른 파라미터로 호출되었는지 확인
+        # search_law_summary_page가 올바른 파라미터로 호출되었는지 확인
         mock_search.assert_called_once_with(
             site_names=["site1", "site2"],
-            keyword="검색어"
+            keyword="검색어",
+            page=1,
+            pagesize=30,
+            cursor=None,
         )
 
-    @patch("app.backend.page_contexts.search_context.search_law_summary")
-    def test_search_data_keyword_only(self, mock_search, sample_dataframe):
+    @patch("app.backend.page_contexts.search_context.search_law_summary_page")
+    def test_search_data_keyword_only(self, mock_search, sample_rows):
         """키워드만으로 검색 (전체 사이트)"""
         # Arrange
-        mock_search.return_value = sample_dataframe
+        mock_search.return_value = _page_result(sample_rows)
 
         # Act
         result = search_data(
@@ -122,13 +165,15 @@ class TestSearchData:
         # Assert
         assert result["total"] == 3
         assert len(result["items"]) == 3
-        mock_search.assert_called_once_with(site_names=[], keyword="검색어")
+        mock_search.assert_called_once_with(
+            site_names=[], keyword="검색어", page=1, pagesize=30, cursor=None
+        )
 
-    @patch("app.backend.page_contexts.search_context.search_law_summary")
-    def test_search_data_sites_only(self, mock_search, sample_dataframe):
+    @patch("app.backend.page_contexts.search_context.search_law_summary_page")
+    def test_search_data_sites_only(self, mock_search, sample_rows):
         """사이트 선택만으로 검색 (키워드 없음)"""
         # Arrange
-        mock_search.return_value = sample_dataframe
+        mock_search.return_value = _page_result(sample_rows)
 
         # Act
         result = search_data(
@@ -140,7 +185,9 @@ class TestSearchData:
 
         # Assert
         assert result["total"] == 3
-        mock_search.assert_called_once_with(site_names=["site1"], keyword="")
+        mock_search.assert_called_once_with(
+            site_names=["site1"], keyword="", page=1, pagesize=30, cursor=None
+        )
 
     def test_search_data_no_criteria(self):
         """키워드도 사이트도 없으면 빈 결과"""
@@ -172,26 +219,13 @@ class TestSearchData:
         assert result["total"] == 0
         assert result["items"] == []
 
-    @patch("app.backend.page_contexts.search_context.search_law_summary")
+    @patch("app.backend.page_contexts.search_context.search_law_summary_page")
     def test_search_data_pagination_page1(self, mock_search):
-        """페이징 테스트 - 첫 페이지"""
+        """페이징 테스트 - 첫 페이지 (DB가 돌려준 페이지 행만 변환)"""
         # Arrange
-        # 100개 데이터 생성
-        large_df = pd.DataFrame({
-            "site_name": [f"site{i}" for i in range(100)],
-            "page_id": [f"page{i}" for i in range(100)],
-            "사이트": [f"사이트{i}" for i in range(100)],
-            "페이지": [f"페이지{i}" for i in range(100)],
-            "제목": [f"제목{i}" for i in range(100)],
-            "등록일": ["2025-01-01"] * 100,
-            "수집일시": ["2025-01-01 10:00:00"] * 100,
-            "site_url": [f"http://site{i}.com" for i in range(100)],
-            "detail_url": [f"http://site{i}.com/detail" for i in range(100)],
-            "org_url": [f"http://site{i}.com/org" for i in range(100)],
-            "summary": [f"요약{i}" for i in range(100)],
-            "real_seq": list(range(100)),
-        })
-        mock_search.return_value = large_df
+        mock_search.return_value = _page_result(
+            _large_rows(0, 30), total=100, next_cursor="CURSOR1"
+        )
 
         # Act
         result = search_data(
@@ -205,63 +239,42 @@ class TestSearchData:
         assert result["total"] == 100
         assert result["total_pages"] == 4  # ceil(100/30) = 4
         assert result["page"] == 1
+        assert result["next_cursor"] == "CURSOR1"
         assert len(result["items"]) == 30
         assert result["items"][0]["site_name"] == "사이트0"
         assert result["items"][29]["site_name"] == "사이트29"
 
-    @patch("app.backend.page_contexts.search_context.search_law_summary")
-    def test_search_data_pagination_page2(self, mock_search):
-        """페이징 테스트 - 두 번째 페이지"""
+    @patch("app.backend.page_contexts.search_context.search_law_summary_page")
+    def test_search_data_pagination_with_cursor(self, mock_search):
+        """페이징 테스트 - 커서로 두 번째 페이지 조회"""
         # Arrange
-        large_df = pd.DataFrame({
-            "site_name": [f"site{i}" for i in range(100)],
-            "page_id": [f"page{i}" for i in range(100)],
-            "사이트": [f"사이트{i}" for i in range(100)],
-            "페이지": [f"페이지{i}" for i in range(100)],
-            "제목": [f"제목{i}" for i in range(100)],
-            "등록일": ["2025-01-01"] * 100,
-            "수집일시": ["2025-01-01 10:00:00"] * 100,
-            "site_url": [f"http://site{i}.com" for i in range(100)],
-            "detail_url": [f"http://site{i}.com/detail" for i in range(100)],
-            "org_url": [f"http://site{i}.com/org" for i in range(100)],
-            "summary": [f"요약{i}" for i in range(100)],
-            "real_seq": list(range(100)),
-        })
-        mock_search.return_value = large_df
+        mock_search.return_value = _page_result(
+            _large_rows(30, 60), total=100, next_cursor="CURSOR2"
+        )
 
         # Act
         result = search_data(
             site_names=["site1"],
             keyword="test",
             page=2,
-            pagesize=30
+            pagesize=30,
+            cursor="CURSOR1",
         )
 
         # Assert
         assert result["page"] == 2
         assert len(result["items"]) == 30
         assert result["items"][0]["site_name"] == "사이트30"
-        assert result["items"][29]["site_name"] == "사이트59"
+        assert result["next_cursor"] == "CURSOR2"
+        mock_search.assert_called_once_with(
+            site_names=["site1"], keyword="test", page=2, pagesize=30, cursor="CURSOR1"
+        )
 
-    @patch("app.backend.page_contexts.search_context.search_law_summary")
+    @patch("app.backend.page_contexts.search_context.search_law_summary_page")
     def test_search_data_pagination_last_page(self, mock_search):
         """페이징 테스트 - 마지막 페이지 (부분)"""
         # Arrange
-        large_df = pd.DataFrame({
-            "site_name": [f"site{i}" for i in range(100)],
-            "page_id": [f"page{i}" for i in range(100)],
-            "사이트": [f"사이트{i}" for i in range(100)],
-            "페이지": [f"페이지{i}" for i in range(100)],
-            "제목": [f"제목{i}" for i in range(100)],
-            "등록일": ["2025-01-01"] * 100,
-            "수집일시": ["2025-01-01 10:00:00"] * 100,
-            "site_url": [f"http://site{i}.com" for i in range(100)],
-            "detail_url": [f"http://site{i}.com/detail" for i in range(100)],
-            "org_url": [f"http://site{i}.com/org" for i in range(100)],
-            "summary": [f"요약{i}" for i in range(100)],
-            "real_seq": list(range(100)),
-        })
-        mock_search.return_value = large_df
+        mock_search.return_value = _page_result(_large_rows(90, 100), total=100)
 
         # Act
         result = search_data(
@@ -276,12 +289,13 @@ class TestSearchData:
         assert len(result["items"]) == 10  # 마지막 페이지는 10개만
         assert result["items"][0]["site_name"] == "사이트90"
         assert result["items"][9]["site_name"] == "사이트99"
+        assert result["next_cursor"] is None
 
-    @patch("app.backend.page_contexts.search_context.search_law_summary")
-    def test_search_data_custom_pagesize(self, mock_search, sample_dataframe):
+    @patch("app.backend.page_contexts.search_context.search_law_summary_page")
+    def test_search_data_custom_pagesize(self, mock_search, sample_rows):
         """커스텀 페이지 크기"""
         # Arrange
-        mock_search.return_value = sample_dataframe
+        mock_search.return_value = _page_result(sample_rows[:2], total=3)
 
         # Act
         result = search_data(
@@ -296,11 +310,11 @@ class TestSearchData:
         assert result["total_pages"] == 2  # ceil(3/2) = 2
         assert len(result["items"]) == 2
 
-    @patch("app.backend.page_contexts.search_context.search_law_summary")
+    @patch("app.backend.page_contexts.search_context.search_law_summary_page")
     def test_search_data_empty_result(self, mock_search):
         """검색 결과가 없는 경우"""
         # Arrange
-        mock_search.return_value = pd.DataFrame()
+        mock_search.return_value = _page_result([])
 
         # Act
         result = search_data(
@@ -315,7 +329,7 @@ class TestSearchData:
         assert result["items"] == []
         assert result["total_pages"] == 0
 
-    @patch("app.backend.page_contexts.search_context.search_law_summary")
+    @patch("app.backend.page_contexts.search_context.search_law_summary_page")
     def test_search_data_exception(self, mock_search):
         """예외 발생 시 빈 결과 반환"""
         # Arrange
@@ -335,29 +349,17 @@ class TestSearchData:
         assert result["page"] == 1
         assert result["total_pages"] == 0
 
-    @patch("app.backend.page_contexts.search_context.search_law_summary")
-    def test_search_data_missing_columns(self, mock_search):
-        """일부 컬럼이 없는 DataFrame"""
+    @patch("app.backend.page_contexts.search_context.search_law_summary_page")
+    def test_search_data_snippet_highlight(self, mock_search, sample_rows):
+        """FTS snippet 은 escape 후 mark 태그로 변환"""
         # Arrange
-        partial_df = pd.DataFrame({
-            "site_name": ["site1"],
-            "사이트": ["사이트1"],
-            "제목": ["제목1"],
-        })
-        mock_search.return_value = partial_df
+        sample_rows[0]["snippet"] = "<\x02요약\x03>"
+        sample_rows[1]["snippet"] = None
+        mock_search.return_value = _page_result(sample_rows)
 
         # Act
-        result = search_data(
-            site_names=["site1"],
-            keyword="test",
-            page=1,
-            pagesize=30
-        )
+        result = search_data(site_names=["site1"], keyword="요약1", page=1, pagesize=30)
 
         # Assert
-        assert len(result["items"]) == 1
-        assert result["items"][0]["site_name"] == "사이트1"
-        assert result["items"][0]["title"] == "제목1"
-        # 없는 컬럼은 빈 문자열로 처리
-        assert result["items"][0]["page_id"] == ""
-        assert result["items"][0]["site_code"] == "site1"
+        assert result["items"][0]["snippet"] == "&lt;<mark>요약</mark>&gt;"
+        assert result["items"][1]["snippet"] == ""
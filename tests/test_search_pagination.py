@@ -0,0 +1,125 @@
+"""
+search_law_summary_page 의 SQL 페이징 / keyset 커서 테스트
+"""
+
+from app.backend.data.db_util import (
+    search_law_summary_page,
+    encode_search_cursor,
+    decode_search_cursor,
+)
+from app.backend.data.fts_index import sync_fts_index
+from tests.conftest import insert_summary
+
+
+class TestSearchCursor:
+    """검색 커서 인코딩 테스트"""
+
+    def test_round_trip(self):
+        """encode 후 decode 하면 원래 값"""
+        cursor = encode_search_cursor("site1", "page1", "2025-01-20", 7)
+        assert decode_search_cursor(cursor) == ("site1", "page1", "2025-01-20", 7)
+
+    def test_invalid_cursor(self):
+        """잘못된 커서는 None"""
+        assert decode_search_cursor("not-a-cursor") is None
+
+
+class TestSearchPagination:
+    """search_law_summary_page 페이징 테스트"""
+
+    def test_offset_pages(self, law_db):
+        """total 은 전체 건수, rows 는 해당 페이지 행만"""
+        # Act
+        first = search_law_summary_page(site_names=["site1", "site2"], page=1, pagesize=3)
+        second = search_law_summary_page(site_names=["site1", "site2"], page=2, pagesize=3)
+
+        # Assert
+        assert first["total"] == 4
+        assert second["total"] == 4
+        assert [row["id"] for row in first["rows"]] == [4, 3, 2]
+        assert [row["id"] for row in second["rows"]] == [1]
+        assert first["next_cursor"] is not None
+        assert second["next_cursor"] is None
+
+    def test_cursor_matches_offset_page(self, law_db):
+        """커서로 조회한 다음 페이지는 OFFSET 조회 결과와 같다"""
+        # Arrange
+        first = search_law_summary_page(site_names=["site1", "site2"], page=1, pagesize=2)
+
+        # Act
+        by_cursor = search_law_summary_page(
+            site_names=["site1", "site2"], page=2, pagesize=2, cursor=first["next_cursor"]
+        )
+        by_offset = search_law_summary_page(site_names=["site1", "site2"], page=2, pagesize=2)
+
+        # Assert
+        assert [row["id"] for row in by_cursor["rows"]] == [row["id"] for row in by_offset["rows"]] == [2, 1]
+        assert by_cursor["total"] == 4
+
+    def test_cursor_keeps_rows_without_register_date(self, law_db):
+        """등록일 NULL 행은 같은 페이지 맨 뒤에 오고 커서로 넘겨도 빠지지 않는다"""
+        # Arrange
+        insert_summary(law_db)
+        insert_summary(law_db)
+        sites = ["site1", "site2"]
+
+        # Act
+        ids = []
+        cursor = None
+        for page in range(1, 4):
+            result = search_law_summary_page(site_names=sites, page=page, pagesize=2, cursor=cursor)
+            ids += [row["id"] for row in result["rows"]]
+            cursor = result["next_cursor"]
+
+        # Assert
+        assert ids == [4, 3, 2, 1, 6, 5]
+        assert cursor is None
+
+    def test_no_cursor_after_row_without_register_date(self, law_db):
+        """마지막 행의 등록일이 NULL 이면 커서 없이 page 로 다음 페이지 조회"""
+        # Arrange
+        insert_summary(law_db)
+        insert_summary(law_db)
+
+        # Act
+        first = search_law_summary_page(site_names=["site1", "site2"], page=1, pagesize=5)
+        second = search_law_summary_page(site_names=["site1", "site2"], page=2, pagesize=5)
+
+        # Assert
+        assert [row["id"] for row in first["rows"]] == [4, 3, 2, 1, 6]
+        assert first["next_cursor"] is None
+        assert [row["id"] for row in second["rows"]] == [5]
+
+    def test_invalid_cursor_falls_back_to_offset(self, law_db):
+        """해석할 수 없는 커서는 무시하고 page 로 조회"""
+        # Act
+        result = search_law_summary_page(
+            site_names=["site1", "site2"], page=2, pagesize=2, cursor="broken"
+        )
+
+        # Assert
+        assert [row["id"] for row in result["rows"]] == [2, 1]
+
+    def test_fts_pagination(self, law_db):
+        """FTS 경로도 total 과 페이지 행을 SQL 에서 구한다"""
+        # Arrange
+        sync_fts_index(law_db)
+
+        # Act
+        result = search_law_summary_page(site_names=[], keyword="요약", page=1, pagesize=2)
+        result_3 = search_law_summary_page(site_names=[], keyword="규정 요약", page=1, pagesize=1)
+
+        # Assert
+        assert result["total"] == 3  # 2글자 키워드는 LIKE 경로
+        assert len(result["rows"]) == 2
+        assert result_3["total"] == 1
+        assert [row["id"] for row in result_3["rows"]] == [1]
+        assert result_3["next_cursor"] is None
+
+    def test_rows_include_attach_count(self, law_db):
+        """행마다 첨부파일 수 (없으면 0)"""
+        # Act
+        rows = search_law_summary_page(site_names=["site1", "site2"], page=1, pagesize=10)["rows"]
+
+        # Assert
+        assert {row["id"]: row["attach_count"] for row in rows} == {1: 2, 2: 0, 3: 1, 4: 0}
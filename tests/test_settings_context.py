@@ -351,15 +351,13 @@ class TestGetSiteListHtml:
 
     @patch("app.backend.page_contexts.settings_context.yaml_info_to_html")
     def test_get_site_list_html_exception(self, mock_yaml_to_html):
-        """예외 발생 시"""
+        """예외는 라우터로 전달"""
         # Arrange
         mock_yaml_to_html.side_effect = Exception("Database error")
 
-        # Act
-        result = get_site_list_html()
-
-        # Assert
-        assert "사이트 목록을 불러올 수 없습니다" in result
+        # Act / Assert
+        with pytest.raises(Exception, match="Database error"):
+            get_site_list_html()
 
     @patch("app.backend.page_contexts.settings_context.yaml_info_to_html")
     def test_get_site_list_html_empty(self, mock_yaml_to_html):
@@ -0,0 +1,136 @@
+"""
+slow_query_log.py 모듈 및 /diagnostics/slow-queries 엔드포인트 테스트
+"""
+
+import sqlite3
+from unittest.mock import patch
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.backend.data.slow_query_log import SlowQueryLog, profiled_fetchall
+
+
+def _memory_db():
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE t (id INTEGER PRIMARY KEY, name TEXT)")
+    conn.executemany("INSERT INTO t (name) VALUES (?)", [("a",), ("b",), ("c",)])
+    return conn
+
+
+class TestSlowQueryLog:
+    """SlowQueryLog 클래스 테스트"""
+
+    def test_record_captures_plan_and_full_scan(self):
+        """EXPLAIN QUERY PLAN 과 전체 테이블 스캔 표시"""
+        # Arrange
+        conn = _memory_db()
+        slow_log = SlowQueryLog(threshold_ms=1)
+
+        # Act
+        entry = slow_log.record(
+            conn, "by_name", "SELECT *\n  FROM t WHERE name = ?", ("a",), 12.3456, 1
+        )
+
+        # Assert
+        assert entry["sql"] == "SELECT * FROM t WHERE name = ?"
+        assert entry["params"] == ["a"]
+        assert entry["duration_ms"] == 12.35
+        assert entry["full_scans"] == ["SCAN t"]
+        assert slow_log.entries() == [entry]
+
+    def test_indexed_query_has_no_full_scan(self):
+        """기본 키 조회는 SEARCH 이므로 full_scans 가 비어 있음"""
+        # Arrange
+        conn = _memory_db()
+        slow_log = SlowQueryLog(threshold_ms=1)
+
+        # Act
+        entry = slow_log.record(conn, "by_id", "SELECT * FROM t WHERE id = ?", (1,), 5, 1)
+
+        # Assert
+        assert entry["full_scans"] == []
+        assert any(detail.startswith("SEARCH t") for detail in entry["plan"])
+
+    def test_rotates_oldest_first(self):
+        """maxlen 을 넘으면 오래된 기록부터 밀려나고, 최근 순으로 반환"""
+        # Arrange
+        conn = _memory_db()
+        slow_log = SlowQueryLog(threshold_ms=1, maxlen=2)
+
+        # Act
+        for name in ("q1", "q2", "q3"):
+            slow_log.record(conn, name, "SELECT * FROM t", (), 5, 3)
+
+        # Assert
+        assert [entry["query"] for entry in slow_log.entries()] == ["q3", "q2"]
+        assert [entry["query"] for entry in slow_log.entries(query="q2")] == ["q2"]
+        assert slow_log.stats()["recorded"] == 3
+
+    def test_disabled_threshold(self):
+        """기준 시간이 0 이면 기록하지 않음"""
+        assert SlowQueryLog(threshold_ms=0).is_slow(10_000) is False
+
+
+class TestProfiledFetchall:
+    """profiled_fetchall 함수 테스트"""
+
+    def test_records_only_above_threshold(self):
+        """기준보다 빠른 쿼리는 기록하지 않고, 느린 쿼리만 기록"""
+        # Arrange
+        conn = _memory_db()
+        fast_log = SlowQueryLog(threshold_ms=60_000)
+        slow_log = SlowQueryLog(threshold_ms=0.000001)
+
+        # Act
+        with patch("app.backend.data.slow_query_log.get_slow_query_log", return_value=fast_log):
+            fast_rows = profiled_fetchall(conn, "all", "SELECT * FROM t")
+        with patch("app.backend.data.slow_query_log.get_slow_query_log", return_value=slow_log):
+            slow_rows = profiled_fetchall(conn, "all", "SELECT * FROM t")
+
+        # Assert
+        assert len(fast_rows) == len(slow_rows) == 3
+        assert fast_log.entries() == []
+        assert slow_log.entries()[0]["rows"] == 3
+
+    def test_db_util_queries_are_named(self, law_db):
+        """db_util 진입점의 쿼리는 함수 이름으로 기록"""
+        # Arrange
+        from app.backend.data.db_util import get_summary_list
+
+        slow_log = SlowQueryLog(threshold_ms=0.000001)
+
+        # Act
+        with patch("app.backend.data.slow_query_log.get_slow_query_log", return_value=slow_log):
+            get_summary_list("2025-01-20", "2025-01-23")
+
+        # Assert
+        entry = slow_log.entries()[0]
+        assert entry["query"] == "get_summary_list"
+        assert entry["params"] == ["2025-01-20", "2025-01-24"] * 2
+        assert entry["plan"]
+
+
+class TestSlowQueriesEndpoint:
+    """/diagnostics/slow-queries 엔드포인트 테스트"""
+
+    def test_lists_entries(self):
+        """기록과 상태를 함께 반환"""
+        # Arrange
+        from app.backend.api.v1.diagnostics import router
+
+        slow_log = SlowQueryLog(threshold_ms=1)
+        slow_log.record(_memory_db(), "q1", "SELECT * FROM t", (), 5, 3)
+        app = FastAPI()
+        app.include_router(router, prefix="/api/v1")
+
+        # Act
+        with patch("app.backend.api.v1.diagnostics.get_slow_query_log", return_value=slow_log):
+            response = TestClient(app).get("/api/v1/diagnostics/slow-queries?limit=10")
+
+        # Assert
+        body = response.json()
+        assert response.status_code == 200
+        assert body["stats"]["size"] == 1
+        assert body["entries"][0]["query"] == "q1"
+        assert body["entries"][0]["full_scans"] == ["SCAN t"]
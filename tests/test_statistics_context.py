@@ -3,7 +3,6 @@ statistics_context.py 모듈에 대한 단위 테스트
 """
 
 import pytest
-import pandas as pd
 import sqlite3
 from unittest.mock import Mock, patch, MagicMock
 
@@ -19,15 +18,13 @@ from app.backend.page_contexts.statistics_context import (
 class TestGetStatisticsMetrics:
     """get_statistics_metrics 함수 테스트"""
 
-    @patch("app.backend.data.db_util.get_summary_db_file")
-    @patch("sqlite3.connect")
-    def test_get_statistics_metrics_success(self, mock_connect, mock_get_db):
+    @patch("app.backend.page_contexts.statistics_context.get_connection")
+    def test_get_statistics_metrics_success(self, mock_get_connection):
         """정상적으로 통계 메트릭 반환"""
         # Arrange
-        mock_get_db.return_value = "test.db"
         mock_conn = MagicMock()
         mock_cursor = MagicMock()
-        mock_connect.return_value = mock_conn
+        mock_get_connection.return_value.__enter__.return_value = mock_conn
         mock_conn.cursor.return_value = mock_cursor
 
         # 각 쿼리에 대한 반환값 설정
@@ -47,17 +44,15 @@ class TestGetStatisticsMetrics:
         assert result["total_posts"] == 1000
         assert result["total_attachments"] == 500
         assert mock_cursor.execute.call_count == 4
-        mock_conn.close.assert_called_once()
+        mock_get_connection.return_value.__exit__.assert_called_once()
 
-    @patch("app.backend.data.db_util.get_summary_db_file")
-    @patch("sqlite3.connect")
-    def test_get_statistics_metrics_zero_values(self, mock_connect, mock_get_db):
+    @patch("app.backend.page_contexts.statistics_context.get_connection")
+    def test_get_statistics_metrics_zero_values(self, mock_get_connection):
         """모든 값이 0인 경우"""
         # Arrange
-        mock_get_db.return_value = "test.db"
         mock_conn = MagicMock()
         mock_cursor = MagicMock()
-        mock_connect.return_value = mock_conn
+        mock_get_connection.return_value.__enter__.return_value = mock_conn
         mock_conn.cursor.return_value = mock_cursor
         mock_cursor.fetchone.side_effect = [(0,), (0,), (0,), (0,)]
 
@@ -70,15 +65,13 @@ class TestGetStatisticsMetrics:
         assert result["total_posts"] == 0
         assert result["total_attachments"] == 0
 
-    @patch("app.backend.data.db_util.get_summary_db_file")
-    @patch("sqlite3.connect")
-    def test_get_statistics_metrics_verify_queries(self, mock_connect, mock_get_db):
+    @patch("app.backend.page_contexts.statistics_context.get_connection")
+    def test_get_statistics_metrics_verify_queries(self, mock_get_connection):
         """올바른 SQL 쿼리가 실행되는지 확인"""
         # Arrange
-        mock_get_db.return_value = "test.db"
         mock_conn = MagicMock()
         mock_cursor = MagicMock()
-        mock_connect.return_value = mock_conn
+        mock_get_connection.return_value.__enter__.return_value = mock_conn
         mock_conn.cursor.return_value = mock_cursor
         mock_cursor.fetchone.side_effect = [(5,), (10,), (100,), (50,)]
 
@@ -102,11 +95,12 @@ class TestGetSiteStatistics:
     def test_get_site_statistics_success(self, mock_site_static):
         """정상적으로 사이트별 통계 반환"""
         # Arrange
-        df = pd.DataFrame({
-            "사이트": ["사이트1", "사이트2", "사이트3"],
-            "게시글수": [100, 200, 300],
-        })
-        mock_site_static.return_value = df
+        rows = [
+            {"site": "사이트1", "count": 100},
+            {"site": "사이트2", "count": 200},
+            {"site": "사이트3", "count": 300},
+        ]
+        mock_site_static.return_value = rows
 
         # Act
         result = get_site_statistics()
@@ -119,9 +113,9 @@ class TestGetSiteStatistics:
 
     @patch("app.backend.page_contexts.statistics_context.site_static")
     def test_get_site_statistics_empty(self, mock_site_static):
-        """빈 DataFrame"""
+        """조회 결과 없음"""
         # Arrange
-        mock_site_static.return_value = pd.DataFrame()
+        mock_site_static.return_value = []
 
         # Act
         result = get_site_statistics()
@@ -131,48 +125,24 @@ class TestGetSiteStatistics:
 
     @patch("app.backend.page_contexts.statistics_context.site_static")
     def test_get_site_statistics_exception(self, mock_site_static):
-        """예외 발생 시"""
+        """예외는 라우터로 전달 (빈 결과를 ETag 와 함께 보내지 않도록)"""
         # Arrange
         mock_site_static.side_effect = Exception("Database error")
 
-        # Act
-        result = get_site_statistics()
-
-        # Assert
-        assert result == []
-
-    @patch("app.backend.page_contexts.statistics_context.site_static")
-    def test_get_site_statistics_missing_columns(self, mock_site_static):
-        """일부 컬럼이 없는 경우"""
-        # Arrange
-        df = pd.DataFrame({
-            "사이트": ["사이트1"],
-        })
-        mock_site_static.return_value = df
+        # Act / Assert
+        with pytest.raises(Exception, match="Database error"):
+            get_site_statistics()
 
+    def test_get_site_statistics_real_db(self, law_db):
+        """실제 DB: SQL 별칭이 응답 필드명"""
         # Act
         result = get_site_statistics()
 
         # Assert
-        assert len(result) == 1
-        assert result[0]["site"] == "사이트1"
-        assert result[0]["count"] == 0  # 없는 컬럼은 0으로 처리
-
-    @patch("app.backend.page_contexts.statistics_context.site_static")
-    def test_get_site_statistics_float_values(self, mock_site_static):
-        """float 값도 int로 변환"""
-        # Arrange
-        df = pd.DataFrame({
-            "사이트": ["사이트1"],
-            "게시글수": [100.5],
-        })
-        mock_site_static.return_value = df
-
-        # Act
-        result = get_site_statistics()
-
-        # Assert
-        assert result[0]["count"] == 100
+        assert sorted(result, key=lambda r: r["site"]) == [
+            {"site": "사이트1", "count": 2},
+            {"site": "사이트2", "count": 2},
+        ]
 
 
 class TestGetSiteFileStatistics:
@@ -182,11 +152,11 @@ class TestGetSiteFileStatistics:
     def test_get_site_file_statistics_success(self, mock_file_count):
         """정상적으로 첨부파일 통계 반환"""
         # Arrange
-        df = pd.DataFrame({
-            "사이트": ["사이트1", "사이트2"],
-            "첨부파일수": [50, 100],
-        })
-        mock_file_count.return_value = df
+        rows = [
+            {"site": "사이트1", "file_count": 50},
+            {"site": "사이트2", "file_count": 100},
+        ]
+        mock_file_count.return_value = rows
 
         # Act
         result = get_site_file_statistics()
@@ -198,9 +168,9 @@ class TestGetSiteFileStatistics:
 
     @patch("app.backend.page_contexts.statistics_context.site_static_filecount")
     def test_get_site_file_statistics_empty(self, mock_file_count):
-        """빈 DataFrame"""
+        """조회 결과 없음"""
         # Arrange
-        mock_file_count.return_value = pd.DataFrame()
+        mock_file_count.return_value = []
 
         # Act
         result = get_site_file_statistics()
@@ -210,31 +180,24 @@ class TestGetSiteFileStatistics:
 
     @patch("app.backend.page_contexts.statistics_context.site_static_filecount")
     def test_get_site_file_statistics_exception(self, mock_file_count):
-        """예외 발생 시"""
+        """예외는 라우터로 전달"""
         # Arrange
         mock_file_count.side_effect = Exception("Database error")
 
-        # Act
-        result = get_site_file_statistics()
-
-        # Assert
-        assert result == []
-
-    @patch("app.backend.page_contexts.statistics_context.site_static_filecount")
-    def test_get_site_file_statistics_zero_files(self, mock_file_count):
-        """첨부파일이 0인 경우"""
-        # Arrange
-        df = pd.DataFrame({
-            "사이트": ["사이트1"],
-            "첨부파일수": [0],
-        })
-        mock_file_count.return_value = df
+        # Act / Assert
+        with pytest.raises(Exception, match="Database error"):
+            get_site_file_statistics()
 
+    def test_get_site_file_statistics_real_db(self, law_db):
+        """실제 DB: 사이트별 첨부파일 수"""
         # Act
         result = get_site_file_statistics()
 
         # Assert
-        assert result[0]["file_count"] == 0
+        assert sorted(result, key=lambda r: r["site"]) == [
+            {"site": "사이트1", "file_count": 2},
+            {"site": "사이트2", "file_count": 1},
+        ]
 
 
 class TestGetDetailStatistics:
@@ -244,13 +207,12 @@ class TestGetDetailStatistics:
     def test_get_detail_statistics_success(self, mock_detail_static):
         """정상적으로 상세 통계 반환"""
         # Arrange
-        df = pd.DataFrame({
-            "사이트": ["사이트1", "사이트1", "사이트2"],
-            "페이지": ["페이지1", "페이지2", "페이지1"],
-            "게시글수": [100, 150, 200],
-            "첨부파일수": [50, 75, 100],
-        })
-        mock_detail_static.return_value = df
+        rows = [
+            {"site": "사이트1", "page": "페이지1", "posts": 100, "files": 50},
+            {"site": "사이트1", "page": "페이지2", "posts": 150, "files": 75},
+            {"site": "사이트2", "page": "페이지1", "posts": 200, "files": 100},
+        ]
+        mock_detail_static.return_value = rows
 
         # Act
         result = get_detail_statistics()
@@ -278,9 +240,9 @@ class TestGetDetailStatistics:
 
     @patch("app.backend.page_contexts.statistics_context.detail_static")
     def test_get_detail_statistics_empty(self, mock_detail_static):
-        """빈 DataFrame"""
+        """조회 결과 없음"""
         # Arrange
-        mock_detail_static.return_value = pd.DataFrame()
+        mock_detail_static.return_value = []
 
         # Act
         result = get_detail_statistics()
@@ -290,54 +252,37 @@ class TestGetDetailStatistics:
 
     @patch("app.backend.page_contexts.statistics_context.detail_static")
     def test_get_detail_statistics_exception(self, mock_detail_static):
-        """예외 발생 시"""
+        """예외는 라우터로 전달"""
         # Arrange
         mock_detail_static.side_effect = Exception("Database error")
 
-        # Act
-        result = get_detail_statistics()
+        # Act / Assert
+        with pytest.raises(Exception, match="Database error"):
+            get_detail_statistics()
 
-        # Assert
-        assert result == []
-
-    @patch("app.backend.page_contexts.statistics_context.detail_static")
-    def test_get_detail_statistics_missing_columns(self, mock_detail_static):
-        """일부 컬럼이 없는 경우"""
+    def test_get_detail_statistics_real_db(self, law_db):
+        """실제 DB: 게시글 수와 첨부파일 수를 SQL 에서 합침 (첨부 없으면 0)"""
         # Arrange
-        df = pd.DataFrame({
-            "사이트": ["사이트1"],
-            "페이지": ["페이지1"],
-        })
-        mock_detail_static.return_value = df
+        conn = sqlite3.connect(law_db)
+        conn.execute(
+            "INSERT INTO yaml_info VALUES ('site1', 'page9', '사이트1', '페이지9', '', '')"
+        )
+        conn.execute(
+            "INSERT INTO law_summary (site_name, page_id, real_seq, title) "
+            "VALUES ('site1', 'page9', '9', '첨부 없음')"
+        )
+        conn.commit()
+        conn.close()
 
         # Act
         result = get_detail_statistics()
 
         # Assert
-        assert len(result) == 1
-        assert result[0]["site"] == "사이트1"
-        assert result[0]["page"] == "페이지1"
-        assert result[0]["posts"] == 0
-        assert result[0]["files"] == 0
-
-    @patch("app.backend.page_contexts.statistics_context.detail_static")
-    def test_get_detail_statistics_zero_values(self, mock_detail_static):
-        """게시글과 첨부파일이 0인 경우"""
-        # Arrange
-        df = pd.DataFrame({
-            "사이트": ["사이트1"],
-            "페이지": ["페이지1"],
-            "게시글수": [0],
-            "첨부파일수": [0],
-        })
-        mock_detail_static.return_value = df
-
-        # Act
-        result = get_detail_statistics()
-
-        # Assert
-        assert result[0]["posts"] == 0
-        assert result[0]["files"] == 0
+        assert result == [
+            {"site": "사이트1", "page": "페이지1", "posts": 2, "files": 2},
+            {"site": "사이트1", "page": "페이지9", "posts": 1, "files": 0},
+            {"site": "사이트2", "page": "페이지2", "posts": 2, "files": 1},
+        ]
 
 
 class TestGetCollectionPeriodInfo:
@@ -372,16 +317,13 @@ class TestGetCollectionPeriodInfo:
 
     @patch("app.backend.page_contexts.statistics_context.get_collection_period")
     def test_get_collection_period_info_exception(self, mock_get_period):
-        """예외 발생 시"""
+        """예외는 라우터로 전달"""
         # Arrange
         mock_get_period.side_effect = Exception("Database error")
 
-        # Act
-        result = get_collection_period_info()
-
-        # Assert
-        assert result["first_date"] is None
-        assert result["last_date"] is None
+        # Act / Assert
+        with pytest.raises(Exception, match="Database error"):
+            get_collection_period_info()
 
     @patch("app.backend.page_contexts.statistics_context.get_collection_period")
     def test_get_collection_period_info_none_values(self, mock_get_period):
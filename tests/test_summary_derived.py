@@ -0,0 +1,150 @@
+"""
+summary_derived.py 모듈 및 정제 HTML 에 대한 테스트
+"""
+
+import multiprocessing
+import sqlite3
+from concurrent.futures import ProcessPoolExecutor
+
+from app.backend.data.db_util import (
+    get_summary_item,
+    get_summary_list,
+    search_law_summary_page,
+)
+from app.backend.data.summary_derived import (
+    DERIVED_TABLE,
+    rebuild_summary_derived,
+    sync_summary_derived,
+)
+from app.backend.data.text_util import sanitize_html
+
+
+def _insert_summary_html(db_path, summary, real_seq="9"):
+    conn = sqlite3.connect(db_path)
+    conn.execute(
+        """INSERT INTO law_summary (site_name, page_id, real_seq, title, summary, upd_time)
+           VALUES ('site1', 'page1', ?, '새 글', ?, '2025-01-22 12:00:00')""",
+        (real_seq, summary),
+    )
+    conn.commit()
+    conn.close()
+
+
+def _derived_rows(db_path):
+    conn = sqlite3.connect(db_path)
+    rows = conn.execute(
+        f"SELECT id, safe_html, plain_text, excerpt, content_length FROM {DERIVED_TABLE} ORDER BY id"
+    ).fetchall()
+    conn.close()
+    return rows
+
+
+class TestSanitizeHtml:
+    """sanitize_html 테스트"""
+
+    def test_removes_scripts_handlers_and_unsafe_urls(self):
+        """script 내용·on* 속성·javascript: URL 제거, 허용 태그는 유지"""
+        # Arrange
+        html = (
+            '<p onclick="x()" style="color:red">규정 <b>개정</b></p>'
+            '<script>alert(1)</script><a href="javascript:alert(1)">링크</a>'
+            '<iframe src="http://x">숨김</iframe><img src="/i.png" onerror="alert(1)">'
+        )
+
+        # Act
+        result = sanitize_html(html)
+
+        # Assert
+        assert result == (
+            '<p>규정 <b>개정</b></p>'
+            '<a target="_blank" rel="noopener noreferrer">링크</a><img src="/i.png">'
+        )
+
+    def test_closes_unclosed_tags_and_escapes_text(self):
+        # Act
+        result = sanitize_html("<div><table><tr><td colspan=2>a &lt; b")
+
+        # Assert
+        assert result == '<div><table><tr><td colspan="2">a &lt; b</td></tr></table></div>'
+
+
+class TestSyncSummaryDerived:
+    """sync_summary_derived 테스트"""
+
+    def test_incremental_sync(self, law_db):
+        """처음엔 전체, 이후엔 새 행만 반영"""
+        # Act
+        first = sync_summary_derived(law_db)
+        _insert_summary_html(law_db, "<p>새 요약</p><script>x()</script>")
+        second = sync_summary_derived(law_db)
+        third = sync_summary_derived(law_db)
+
+        # Assert
+        assert (first, second, third) == (4, 1, 0)
+        rows = _derived_rows(law_db)
+        assert rows[0] == (1, "<p>규정 요약</p>", "규정 요약", "규정 요약", 5)
+        assert rows[-1] == (5, "<p>새 요약</p>", "새 요약", "새 요약", 4)
+
+    def test_process_pool_matches_in_thread(self, law_db):
+        """spawn 프로세스 풀로 파싱해도 결과가 같음"""
+        # Arrange
+        sync_summary_derived(law_db)
+        expected = _derived_rows(law_db)
+
+        # Act
+        spawn = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=2, mp_context=spawn) as executor:
+            count = rebuild_summary_derived(law_db, executor=executor)
+
+        # Assert
+        assert count == 4
+        assert _derived_rows(law_db) == expected
+
+
+class TestDerivedReads:
+    """목록·검색·상세 조회가 파생 컬럼을 읽는지 테스트"""
+
+    def test_list_and_search_use_precomputed_excerpt(self, law_db):
+        """반영된 행은 미리 만든 발췌문, 미반영 행은 원문에서 생성"""
+        # Arrange
+        sync_summary_derived(law_db)
+        conn = sqlite3.connect(law_db)
+        conn.execute(f"UPDATE {DERIVED_TABLE} SET excerpt = '미리 만든 발췌문' WHERE id = 2")
+        conn.commit()
+        conn.close()
+        _insert_summary_html(law_db, "<p>아직 정리 전</p>")
+
+        # Act
+        listed = {row["id"]: row for row in get_summary_list("2025-01-22")}
+        searched = search_law_summary_page(site_names=["site1"], page=1, pagesize=10)["rows"]
+
+        # Assert
+        assert listed[2]["excerpt"] == "미리 만든 발췌문"
+        assert listed[5]["excerpt"] == "아직 정리 전"
+        assert "excerpt_source" not in listed[2]
+        assert {row["id"]: row["excerpt"] for row in searched}[2] == "미리 만든 발췌문"
+
+    def test_like_search_matches_plain_text_not_markup(self, law_db):
+        """짧은 키워드 LIKE 검색은 태그 속성이 아닌 평문에서 찾음"""
+        # Arrange
+        _insert_summary_html(law_db, '<p class="ab">본문</p>')
+        sync_summary_derived(law_db)
+
+        # Act
+        rows = search_law_summary_page(site_names=["site1"], keyword="ab")["rows"]
+
+        # Assert
+        assert rows == []
+
+    def test_item_returns_sanitized_html(self, law_db):
+        """상세 조회는 정제된 HTML (미반영 행도 바로 정제)"""
+        # Arrange
+        _insert_summary_html(law_db, '<p onclick="x()">요약</p><script>x()</script>')
+
+        # Act
+        before = get_summary_item(5)
+        sync_summary_derived(law_db)
+        after = get_summary_item(5)
+
+        # Assert
+        assert before == after == {"id": 5, "summary": "<p>요약</p>"}
@@ -0,0 +1,128 @@
+"""
+yaml_sync.py 모듈에 대한 테스트
+"""
+
+import sqlite3
+
+import yaml
+
+from app.backend.data.db_util import create_and_fill_yaml_table
+from app.backend.data.meta_table import get_meta_value
+from app.backend.data.yaml_sync import (
+    YAML_HASH_KEY,
+    diff_yaml_rows,
+    sync_yaml_info,
+    yaml_file_hash,
+)
+
+
+def _write_yaml(path, desc="페이지1", with_site2=True):
+    data = {
+        "site1": {
+            "h_name": "사이트1",
+            "url": "http://site1.com",
+            "pages": [{"id": "page1", "desc": desc, "detail_url": "http://site1.com/d1"}],
+        },
+    }
+    if with_site2:
+        data["site2"] = {
+            "h_name": "사이트2",
+            "url": "http://site2.com",
+            "pages": [{"id": "page2", "desc": "페이지2", "detail_url": "http://site2.com/d2"}],
+        }
+    path.write_text(yaml.safe_dump(data, allow_unicode=True), encoding="utf-8")
+    return str(path)
+
+
+def _data_version(conn):
+    return conn.execute("PRAGMA data_version").fetchone()[0]
+
+
+class TestDiffYamlRows:
+    """diff_yaml_rows 테스트"""
+
+    def test_upserts_changed_and_deletes_removed(self):
+        """바뀐 행·새 행은 upsert, 없어진 키는 delete"""
+        # Arrange
+        existing = [("s", "p1", "h", "a", "u", "d"), ("s", "p2", "h", "b", "u", "d")]
+        rows = [("s", "p1", "h", "a", "u", "d"), ("s", "p3", "h", "c", "u", "d"),
+                ("s", "p2", "h", "B", "u", "d")]
+
+        # Act
+        upserts, deletes = diff_yaml_rows(existing, rows)
+
+        # Assert
+        assert sorted(upserts) == [("s", "p2", "h", "B", "u", "d"), ("s", "p3", "h", "c", "u", "d")]
+        assert deletes == []
+
+        # Act
+        _, deletes = diff_yaml_rows(existing, rows[:1])
+
+        # Assert
+        assert deletes == [("s", "p2")]
+
+
+class TestSyncYamlInfo:
+    """sync_yaml_info 테스트"""
+
+    def test_same_rows_only_store_hash(self, law_db, tmp_path):
+        """행이 같으면 해시만 저장하고 yaml_info 는 바꾸지 않음"""
+        # Arrange
+        yaml_path = _write_yaml(tmp_path / "sites.yaml")
+
+        # Act
+        result = sync_yaml_info(law_db, yaml_path)
+
+        # Assert
+        assert result == {"changed": True, "upserted": 0, "deleted": 0}
+        conn = sqlite3.connect(law_db)
+        assert get_meta_value(conn, YAML_HASH_KEY) == yaml_file_hash(yaml_path)
+        conn.close()
+
+    def test_unchanged_hash_does_not_write(self, law_db, tmp_path):
+        """해시가 같으면 DB 에 쓰지 않음"""
+        # Arrange
+        yaml_path = _write_yaml(tmp_path / "sites.yaml")
+        sync_yaml_info(law_db, yaml_path)
+        observer = sqlite3.connect(law_db)
+        before = _data_version(observer)
+
+        # Act
+        result = sync_yaml_info(law_db, yaml_path)
+        changed = create_and_fill_yaml_table(law_db, yaml_path)
+
+        # Assert
+        assert result["changed"] is False
+        assert changed is False
+        assert _data_version(observer) == before
+        observer.close()
+
+    def test_changed_yaml_applies_diff(self, law_db, tmp_path):
+        """바뀐 페이지만 쓰고 없어진 페이지는 지움"""
+        # Arrange
+        yaml_path = _write_yaml(tmp_path / "sites.yaml", desc="바뀐 설명", with_site2=False)
+
+        # Act
+        result = sync_yaml_info(law_db, yaml_path)
+
+        # Assert
+        assert result == {"changed": True, "upserted": 1, "deleted": 1}
+        conn = sqlite3.connect(law_db)
+        rows = conn.execute("SELECT site_name, page_id, desc FROM yaml_info").fetchall()
+        conn.close()
+        assert rows == [("site1", "page1", "바뀐 설명")]
+
+    def test_creates_table_in_empty_db(self, tmp_path):
+        """yaml_info 가 없는 DB 에서도 테이블을 만들고 채움"""
+        # Arrange
+        db_path = str(tmp_path / "empty.db")
+        yaml_path = _write_yaml(tmp_path / "sites.yaml")
+
+        # Act
+        changed = create_and_fill_yaml_table(db_path, yaml_path)
+
+        # Assert
+        assert changed is True
+        conn = sqlite3.connect(db_path)
+        assert conn.execute("SELECT COUNT(*) FROM yaml_info").fetchone()[0] == 2
+        conn.close()
@@ -7,7 +7,7 @@ import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
 from ui.utils.logger import get_ui_log_contents, setup_logger
-from ui.utils.misc_utils import configure_aggrid, configure_search_aggrid, get_log_data
+from ui.utils.misc_utils import configure_aggrid, configure_search_aggrid, get_log_data, rendered_summary_html
 from ui.utils.db_util import attach_list, detail_static, error_count_of_last_24h, get_site_and_code_dict, get_summary_list, search_law_summary, site_static, site_static_filecount, total_site_attach_counts, yaml_info_to_html
 from ui.utils.db_manager import DbManager
 from ui.utils.ui_settings import UiConfig
@@ -172,7 +172,8 @@ if menu == "📊 대시보드":
         tab1, tab2, tab3 = st.tabs(["📄 렌더링 보기", "🧾 HTML 코드 보기", f"📥 첨부파일({attach_len})"])
 
         with tab1:
-            st.markdown(html_content, unsafe_allow_html=True)
+            # 정제된 HTML 만 렌더링 (summary_derived 에 없으면 원문을 바로 정제)
+            st.markdown(rendered_summary_html(selected_row), unsafe_allow_html=True)
 
         with tab2:
             st.code(html_content, language="html")        
@@ -322,7 +323,8 @@ elif menu == "🔍 데이터 조회":
                 tab1, tab2 = st.tabs(["📄 렌더링 보기", "🧾 HTML 코드 보기"])
 
                 with tab1:
-                    st.markdown(html_content, unsafe_allow_html=True)
+                    # 정제된 HTML 만 렌더링 (summary_derived 에 없으면 원문을 바로 정제)
+                    st.markdown(rendered_summary_html(selected_row), unsafe_allow_html=True)
 
                 with tab2:
                     st.code(html_content, language="html")
@@ -1,3 +1,4 @@
+import hashlib
 import sqlite3
 import yaml
 import threading
@@ -11,6 +12,9 @@ class DbManager:
     _instance = None
     _lock = threading.Lock()
 
+    # 백엔드(app/backend/data/yaml_sync.py)와 같은 ui_meta 키
+    YAML_HASH_KEY = "yaml_info_hash"
+
     def __new__(cls, config: Settings):
         with cls._lock:
             if cls._instance is None:
@@ -28,6 +32,7 @@ class DbManager:
             raise ValueError("DB_BASE_DIR 설정이 필요합니다.")
         self.summary_path = self.config.DB_BASE_DIR + "/law_summary.db"
         self.yaml_info = "yaml_info"
+        self.meta_table = "ui_meta"
         
         # 캐시된 데이터
         self._yaml_data_cache = None
@@ -60,59 +65,106 @@ class DbManager:
             if conn:
                 conn.close()
 
-    def fill_yaml(self):        
+    def fill_yaml(self):
+        """
+        YAML 파일이 바뀌었을 때만 yaml_info 에 차이를 반영
+
+        파일 해시를 ui_meta(yaml_info_hash)에 저장해 두고 같으면 바로 끝낸다
+        (스크립트가 다시 실행될 때마다 DB 에 쓰지 않음). 다르면 바뀐 페이지만
+        INSERT OR REPLACE, 없어진 페이지만 DELETE 한다 (한 트랜잭션).
+        백엔드(app/backend/data/yaml_sync.py)와 같은 ui_meta 키를 쓴다.
+        """
+        conn = None
         try:
-            with sqlite3.connect(self.summary_path) as conn:
-                cursor = conn.cursor()
-                
-                # 기존 데이터 삭제
-                cursor.execute(f"DELETE FROM {self.yaml_info}")
-                
-                # YAML 파일 읽기
-                with open(self.config.YAML_PATH, 'r', encoding='utf-8') as f:
-                    data = yaml.safe_load(f)
-                
-                # 데이터 파싱 및 삽입
-                site_count = 0
-                page_count = 0
-                
-                for site_name, site_info in data.items():
-                    h_name = site_info.get('h_name', '')
-                    base_url = site_info.get('url', '')
-                    site_count += 1
-                    
-                    # pages 배열 처리
-                    pages = site_info.get('pages', [])
-                    for page in pages:
-                        cursor.execute(f"""
-                            INSERT INTO {self.yaml_info}
-                            (site_name, page_id, h_name, "desc", url, detail_url)
-                            VALUES (?, ?, ?, ?, ?, ?)
-                        """, (
-                            site_name,
-                            page.get('id', ''),
-                            h_name,
-                            page.get('desc', ''),
-                            base_url,
-                            page.get('detail_url', '')
-                        ))
-                        page_count += 1
-                        
-                conn.commit()
-                logger.info("YAML 데이터 로딩 완료")
-                
-                # 카운트 저장
-                self._site_count = site_count
-                self._page_count = page_count
-                logger.info(f"사이트 수: {self._site_count}, 페이지 수: {self._page_count}")
-                
-                # 캐시 초기화 (다시 로드되도록)
-                self._yaml_data_cache = None
+            with open(self.config.YAML_PATH, 'rb') as f:
+                raw = f.read()
+            file_hash = hashlib.sha256(raw).hexdigest()
+
+            conn = sqlite3.connect(self.summary_path, timeout=30, isolation_level=None)
+            if self._stored_yaml_hash(conn) == file_hash:
+                logger.info("YAML 데이터 변경 없음 (해시 동일)")
+                return
+
+            # 데이터 파싱
+            data = yaml.safe_load(raw.decode('utf-8')) or {}
+            wanted = {}
+            for site_name, site_info in data.items():
+                h_name = site_info.get('h_name', '')
+                base_url = site_info.get('url', '')
+
+                # pages 배열 처리
+                for page in site_info.get('pages', []):
+                    row = (
+                        site_name,
+                        page.get('id', ''),
+                        h_name,
+                        page.get('desc', ''),
+                        base_url,
+                        page.get('detail_url', '')
+                    )
+                    wanted[row[:2]] = row
+
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.execute(f"""
+                    CREATE TABLE IF NOT EXISTS {self.meta_table} (
+                        key TEXT PRIMARY KEY,
+                        value TEXT
+                    )
+                """)
+                current = {
+                    tuple(row[:2]): tuple(row)
+                    for row in conn.execute(f"""
+                        SELECT site_name, page_id, h_name, "desc", url, detail_url
+                        FROM {self.yaml_info}
+                    """)
+                }
+                upserts = [row for key, row in wanted.items() if current.get(key) != row]
+                deletes = [key for key in current if key not in wanted]
+
+                conn.executemany(
+                    f"DELETE FROM {self.yaml_info} WHERE site_name = ? AND page_id = ?",
+                    deletes,
+                )
+                conn.executemany(f"""
+                    INSERT OR REPLACE INTO {self.yaml_info}
+                    (site_name, page_id, h_name, "desc", url, detail_url)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                """, upserts)
+                conn.execute(
+                    f"INSERT OR REPLACE INTO {self.meta_table} (key, value) VALUES (?, ?)",
+                    (self.YAML_HASH_KEY, file_hash),
+                )
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+
+            logger.info(f"YAML 데이터 로딩 완료 (변경 {len(upserts)}건, 삭제 {len(deletes)}건)")
+
+            # 카운트 저장
+            self._site_count = len(data)
+            self._page_count = len(wanted)
+            logger.info(f"사이트 수: {self._site_count}, 페이지 수: {self._page_count}")
+
+            # 캐시 초기화 (다시 로드되도록)
+            self._yaml_data_cache = None
 
         except Exception as e:
             logger.error(f"YAML 로딩 중 오류: {e}")
-            if 'conn' in locals():
-                conn.rollback()
+        finally:
+            if conn:
+                conn.close()
+
+    def _stored_yaml_hash(self, conn):
+        """ui_meta 에 저장된 YAML 해시 (테이블이 없으면 None)"""
+        try:
+            row = conn.execute(
+                f"SELECT value FROM {self.meta_table} WHERE key = ?", (self.YAML_HASH_KEY,)
+            ).fetchone()
+        except sqlite3.OperationalError:
+            return None
+        return row[0] if row else None
 
     def load_yaml_data_to_dict(self, refresh_cache=False):
         """
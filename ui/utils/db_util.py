@@ -54,9 +54,30 @@ def get_data_frame_summary(sql: str, params: tuple = ()) -> pd.DataFrame:
     finally:
         conn.close()
 
+DERIVED_TABLE = "summary_derived"
+
+
+def derived_columns():
+    """
+    summary_derived(백엔드가 만드는 정제 HTML·평문) 가 있으면
+    (정제 HTML 컬럼, 본문 검색 컬럼, 조인 절), 없으면 원문만 사용
+    """
+    conn = connect(UiConfig.get_summary_db_file())
+    try:
+        exists = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (DERIVED_TABLE,)
+        ).fetchone()
+    finally:
+        conn.close()
+    if not exists:
+        return "NULL", "a.summary", ""
+    return "d.safe_html", "COALESCE(d.plain_text, a.summary)", f"LEFT JOIN {DERIVED_TABLE} d ON d.id = a.id"
+
+
 def get_summary_list(from_date: str) -> str:
             # a.site_name, a.page_id, b.detail_url, a.org_url,
-    sql = """
+    safe_html, _, derived_join = derived_columns()
+    sql = f"""
         SELECT 
             b.h_name as "사이트", 
             b.desc as "페이지", 
@@ -69,7 +90,8 @@ def get_summary_list(from_date: str) -> str:
             b.url as "site_url",
             b.detail_url as "detail_url",
             a.org_url as "org_url",
-            a.summary
+            a.summary,
+            {safe_html} as safe_html
 
         FROM 
             law_summary a 
@@ -77,6 +99,7 @@ def get_summary_list(from_date: str) -> str:
             yaml_info b 
         ON 
             a.site_name = b.site_name AND a.page_id = b.page_id
+        {derived_join}
         WHERE 
             a.upd_time > ?
         ORDER BY 
@@ -233,7 +256,8 @@ def get_site_and_code_dict():
 def search_law_summary(site_names=None, keyword=None):
     """법령 요약 검색 함수"""
     try:
-        base_query = """
+        safe_html, body, derived_join = derived_columns()
+        base_query = f"""
         SELECT 
             b.h_name as "사이트", 
             b.desc as "페이지", 
@@ -246,13 +270,15 @@ def search_law_summary(site_names=None, keyword=None):
             b.url as "site_url",
             b.detail_url as "detail_url",
             a.org_url as "org_url",
-            a.summary
+            a.summary,
+            {safe_html} as safe_html
         FROM 
             law_summary a 
         INNER JOIN 
             yaml_info b 
         ON 
             a.site_name = b.site_name AND a.page_id = b.page_id
+        {derived_join}
         WHERE 1=1
         """
         
@@ -267,7 +293,7 @@ def search_law_summary(site_names=None, keyword=None):
         
         # 키워드 조건 추가
         if keyword and keyword.strip():
-            conditions.append("(a.title like ? or a.summary like ?)")
+            conditions.append(f"(a.title like ? or {body} like ?)")
             keyword_param = f"%{keyword.strip()}%"
             params.extend([keyword_param, keyword_param])
         
@@ -1,6 +1,7 @@
 import os
 from st_aggrid import GridOptionsBuilder
 
+from app.backend.data.text_util import sanitize_html
 from ui.utils.logger import setup_logger
 from ui.utils.ui_settings import UiConfig
 
@@ -19,6 +20,20 @@ def wrap_with_div(html, style=""):
     return f"<div style='{style}'>{html}</div>"
 
 
+def rendered_summary_html(row):
+    """
+    렌더링 보기 탭에 넣을 HTML
+
+    백엔드가 만든 정제 HTML(summary_derived.safe_html)이 있으면 그것을,
+    아직 없으면(백엔드 없이 실행했거나 최신 행) 같은 허용 목록으로 원문을 바로 정제한다.
+    """
+    safe_html = row.get("safe_html")
+    if isinstance(safe_html, str):
+        return safe_html
+    summary = row.get("summary")
+    return sanitize_html(summary if isinstance(summary, str) else "")
+
+
 # AgGrid 설정 함수
 def configure_aggrid(df, selection_mode='single'):
     gb = GridOptionsBuilder.from_dataframe(df)
@@ -54,6 +69,7 @@ def configure_aggrid(df, selection_mode='single'):
     gb.configure_column('detail_url', header_name='게시판url', width=50, hide=True)
     gb.configure_column('org_url', header_name='상세url', width=50, hide=True)
     gb.configure_column('summary', header_name='요약', width=50, hide=True)
+    gb.configure_column('safe_html', header_name='safe_html', width=50, hide=True)
     gb.configure_column('site_name', header_name='site_name', width=50, hide=True)
     gb.configure_column('page_id', header_name='page_id', width=50, hide=True)
     return gb.build()
@@ -116,6 +132,7 @@ def configure_search_aggrid(df, selection_mode='single'):
     gb.configure_column('detail_url', header_name='detail_url', width=50, hide=True)
     gb.configure_column('org_url', header_name='org_url', width=50, hide=True)
     gb.configure_column('summary', header_name='summary', width=50, hide=True)
+    gb.configure_column('safe_html', header_name='safe_html', width=50, hide=True)
     # gb.configure_column('site_name', header_name='site_name', width=50, hide=True)
     # gb.configure_column('page_id', header_name='page_id', width=50, hide=True)
     return gb.build()
\ No newline at end of file